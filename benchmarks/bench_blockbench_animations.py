@@ -0,0 +1,116 @@
+"""Compares eager and lazy animation loading of a heavy Blockbench model.
+
+Builds a synthetic .bbmodel animation list (80 animations over 40 bones with dense
+keyframes on every channel), then measures loading the model and queueing a
+handful of animations, the way most projects use their mob models.
+
+Usage:
+    python benchmarks/bench_blockbench_animations.py [--animations 80] [--queued 4] [--repeat 5]
+"""
+
+import argparse
+import random
+import timeit
+from unittest.mock import MagicMock
+
+import anvil.lib.config
+
+anvil.lib.config.CONFIG = MagicMock()
+anvil.lib.config.CONFIG.NAMESPACE = "bench"
+
+from anvil.lib.blockbench import Animation, _AnimationsManager
+
+
+def build_animations(animations: int, bones: int = 40, keyframes: int = 24) -> dict:
+    """Builds the animation section of a heavy .bbmodel file."""
+    rng = random.Random(0)
+    interpolations = ["linear", "linear", "catmullrom", "step", "bezier"]
+
+    def channel(name: str) -> list[dict]:
+        return [
+            {
+                "channel": name,
+                "time": index / keyframes * 2,
+                "interpolation": rng.choice(interpolations),
+                "data_points": [
+                    {
+                        "x": round(rng.uniform(-90, 90), 3),
+                        "y": round(rng.uniform(-90, 90), 3),
+                        "z": round(rng.uniform(-90, 90), 3),
+                    }
+                ],
+            }
+            for index in range(keyframes)
+        ]
+
+    return {
+        "model_identifier": "heavy_mob",
+        "animations": [
+            {
+                "name": f"animation_{index}",
+                "loop": "loop",
+                "length": 2.0,
+                "animators": {
+                    f"uuid_{bone}": {
+                        "name": f"bone_{bone}",
+                        "keyframes": channel("rotation")
+                        + channel("position")
+                        + channel("scale"),
+                    }
+                    for bone in range(bones)
+                },
+            }
+            for index in range(animations)
+        ],
+    }
+
+
+def eager_load(bbmodel: dict, queued: list[str]) -> dict:
+    """Parses every animation on load, as done before lazy loading."""
+    animations = {}
+    for anim_dict in bbmodel["animations"]:
+        anim = Animation.from_dict(anim_dict, "heavy_mob")
+        animations[anim.name] = anim
+
+    content = {}
+    for name in queued:
+        full_name = f"animation.bench.heavy_mob.{name}"
+        content.update(animations[name].compile(full_name))
+    return content
+
+
+def lazy_load(bbmodel: dict, queued: list[str]) -> dict:
+    manager = _AnimationsManager("heavy_mob", "actors", bbmodel)
+    for name in queued:
+        manager.queue_animation(name)
+    return manager._content["animations"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--animations", type=int, default=80)
+    parser.add_argument("--queued", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bbmodel = build_animations(args.animations)
+    queued = [f"animation_{index}" for index in range(args.queued)]
+
+    if eager_load(bbmodel, queued) != lazy_load(bbmodel, queued):
+        raise SystemExit("Compiled animations differ between eager and lazy loading.")
+
+    eager_time = min(
+        timeit.repeat(lambda: eager_load(bbmodel, queued), number=1, repeat=args.repeat)
+    )
+    lazy_time = min(
+        timeit.repeat(lambda: lazy_load(bbmodel, queued), number=1, repeat=args.repeat)
+    )
+
+    print(f"Animations: {args.animations}, queued: {args.queued}")
+    print(f"Eager parsing: {eager_time * 1000:8.1f} ms")
+    print(f"Lazy parsing:  {lazy_time * 1000:8.1f} ms")
+    print(f"Speedup:       {eager_time / lazy_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
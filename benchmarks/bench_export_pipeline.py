@@ -0,0 +1,116 @@
+"""Compares a serial export against the export pipeline with several write workers.
+
+Builds a synthetic pack of server entity files, exports every file with
+`AnvilIO.file` serially, then through `AnvilExportPipeline` for each job count,
+and checks that the written trees are byte-identical.
+
+Usage:
+    python benchmarks/bench_export_pipeline.py [--files 400] [--jobs 2 4 8] [--repeat 3]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+import anvil.lib.config
+
+anvil.lib.config.CONFIG = MagicMock()
+anvil.lib.config.CONFIG._MINIFY = False
+anvil.lib.config.CONFIG.COMPANY = "StarkTMA"
+
+from anvil.api.actors.components import (
+    EntityCollisionBox,
+    EntityHealth,
+    EntityPhysics,
+    EntityTypeFamily,
+)
+from anvil.lib.lib import AnvilExportPipeline, AnvilIO
+
+
+def build_pack(files: int, groups: int = 10) -> list[dict]:
+    """Builds server entity files of `groups` component groups each."""
+    return [
+        {
+            "format_version": "1.21.90",
+            "minecraft:entity": {
+                "description": {"identifier": f"test:entity_{index}"},
+                "component_groups": {
+                    f"test:group_{group}": {
+                        "minecraft:health": EntityHealth(20 + group, max=40),
+                        "minecraft:collision_box": EntityCollisionBox(1, 0.5),
+                        "minecraft:physics": EntityPhysics(True, group % 2 == 0),
+                        "minecraft:type_family": EntityTypeFamily(["mob"]),
+                        "minecraft:custom": {"path": "textures\\entity\\mob"},
+                    }
+                    for group in range(groups)
+                },
+            },
+        }
+        for index in range(files)
+    ]
+
+
+def export(pack: list[dict], directory: str, jobs: int) -> float:
+    shutil.rmtree(directory, ignore_errors=True)
+    start = time.perf_counter()
+    if jobs > 1:
+        AnvilExportPipeline.begin(jobs)
+    for index, content in enumerate(pack):
+        AnvilIO.file(
+            f"entity_{index}.json",
+            content,
+            os.path.join(directory, f"group_{index % 8}"),
+            "w",
+            True,
+        )
+    if jobs > 1:
+        AnvilExportPipeline.flush()
+    return time.perf_counter() - start
+
+
+def read_tree(directory: str) -> dict[str, bytes]:
+    files = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            with open(os.path.join(root, name), "rb") as file:
+                files[os.path.relpath(os.path.join(root, name), directory)] = (
+                    file.read()
+                )
+    return files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=400)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pack = build_pack(args.files)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        # Export directories are relative to the project.
+        os.chdir(root)
+        serial_dir = "serial"
+        serial = min(export(pack, serial_dir, 1) for _ in range(args.repeat))
+        expected = read_tree(serial_dir)
+        size = sum(len(data) for data in expected.values())
+
+        print(f"Files: {args.files}, output: {size:,} bytes, CPUs: {os.cpu_count()}")
+        print(f"Serial:          {serial * 1000:8.1f} ms")
+        for jobs in args.jobs:
+            directory = f"jobs_{jobs}"
+            elapsed = min(export(pack, directory, jobs) for _ in range(args.repeat))
+            if read_tree(directory) != expected:
+                raise SystemExit(f"Output with --jobs {jobs} differs from serial.")
+            print(
+                f"--jobs {jobs:<2}:      {elapsed * 1000:8.1f} ms  ({serial / elapsed:.2f}x)"
+            )
+        os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Compares the single-pass JSON normalizer against the previous recursive implementation.
+
+Builds a synthetic pack of 10,000 entity components spread over server entity
+files, serializes every file with both implementations and checks that the
+output is byte-identical.
+
+Usage:
+    python benchmarks/bench_json_serializer.py [--components 10000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+from enum import StrEnum
+from typing import Any
+from unittest.mock import MagicMock
+
+import anvil.lib.config
+
+anvil.lib.config.CONFIG = MagicMock()
+
+import orjson
+from anvil.api.actors.components import (
+    EntityCollisionBox,
+    EntityHealth,
+    EntityPhysics,
+    EntityTypeFamily,
+)
+from anvil.api.core.components import Component
+from anvil.api.core.filters import Filter
+from anvil.lib.lib import AnvilIO
+
+
+def legacy_normalize(value: Any) -> Any:
+    """The recursive normalizer used before the single-pass implementation."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+
+    if isinstance(value, dict):
+        shortened = {}
+        for key, item in value.items():
+            key_str = key if isinstance(key, str) else str(key)
+            shortened_value = legacy_normalize(item)
+            if ":" in key_str or shortened_value not in ({}, [], None, "None", ""):
+                shortened[key_str] = shortened_value
+        return shortened
+
+    if isinstance(value, list):
+        shortened = []
+        for item in value:
+            shortened_value = legacy_normalize(item)
+            if shortened_value != []:
+                shortened.append(shortened_value)
+        return shortened
+
+    if isinstance(value, tuple):
+        return [legacy_normalize(item) for item in value]
+
+    if isinstance(value, StrEnum):
+        return value.value
+
+    if isinstance(value, str):
+        return value.replace("\\", "/")
+
+    if isinstance(value, Filter):
+        return legacy_normalize(value.__export_dict__())
+
+    if isinstance(value, Component):
+        return legacy_normalize(value.__export__())
+
+    if isinstance(value, type) and issubclass(value, Component):
+        return legacy_normalize(value.__component_identifier__())
+
+    class_name = value.__class__.__name__
+
+    if class_name in AnvilIO._BLOCK_DESCRIPTOR_NAMES:
+        return legacy_normalize(value.descriptor())
+
+    if class_name in AnvilIO._IDENTIFIER_NAMES:
+        return legacy_normalize(value.identifier)
+
+    if class_name == "LootTable":
+        return legacy_normalize(value.table_path)
+
+    if class_name == "_UIElement":
+        return legacy_normalize(value.queue())
+
+    return value
+
+
+def build_pack(components: int) -> list[dict]:
+    """Builds server entity files holding the requested number of components."""
+    per_entity = 50
+    files = []
+
+    for entity_index in range(max(1, components // per_entity)):
+        groups = {}
+        for group_index in range(per_entity // 5):
+            base = group_index * 0.5
+            groups[f"test:group_{group_index}"] = {
+                "minecraft:health": EntityHealth(20 + group_index, max=40),
+                "minecraft:collision_box": EntityCollisionBox(base + 1, base + 0.5),
+                "minecraft:physics": EntityPhysics(True, group_index % 2 == 0),
+                "minecraft:type_family": EntityTypeFamily(
+                    ["mob", f"family_{group_index}"]
+                ),
+                "minecraft:custom": {"path": "textures\\entity\\mob", "empty": []},
+            }
+
+        files.append(
+            {
+                "format_version": "1.21.90",
+                "minecraft:entity": {
+                    "description": {
+                        "identifier": f"test:entity_{entity_index}",
+                        "is_spawnable": True,
+                        "properties": {},
+                    },
+                    "component_groups": groups,
+                    "components": {},
+                    "events": {
+                        f"test:add_{name}": {"add": {"component_groups": [name]}}
+                        for name in groups
+                    },
+                },
+            }
+        )
+
+    return files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pack = build_pack(args.components)
+    option = orjson.OPT_INDENT_2
+
+    legacy = [orjson.dumps(legacy_normalize(file), option=option) for file in pack]
+    current = [AnvilIO._dump_json_like(file) for file in pack]
+    if legacy != current:
+        raise SystemExit("Serialized output differs between implementations.")
+
+    legacy_time = min(
+        timeit.repeat(
+            lambda: [orjson.dumps(legacy_normalize(f), option=option) for f in pack],
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+    current_time = min(
+        timeit.repeat(
+            lambda: [AnvilIO._dump_json_like(f) for f in pack],
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+
+    size = sum(len(data) for data in current)
+    print(f"Files: {len(pack)}, components: {args.components}, output: {size:,} bytes")
+    print(f"Recursive normalizer + orjson: {legacy_time * 1000:8.1f} ms")
+    print(f"Single-pass normalizer:        {current_time * 1000:8.1f} ms")
+    print(f"Speedup:                       {legacy_time / current_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""Compares the previous and current mesh to cuboid decomposition.
+
+Builds a synthetic free format mesh of about 10k faces, made of separate boxes, of
+a subdivided sheet and of a high poly cylinder whose caps are triangle fans around
+a single vertex, then times `Mesh.extract_cuboids` against the previous
+implementation.
+
+Usage:
+    python benchmarks/bench_mesh_cuboids.py [--faces 10000] [--repeat 3]
+"""
+
+import argparse
+import math
+import random
+import timeit
+from collections import defaultdict
+from unittest.mock import MagicMock
+
+import anvil.lib.config
+
+anvil.lib.config.CONFIG = MagicMock()
+
+from anvil.lib.blockbench import Mesh
+
+
+def build_mesh(faces: int) -> dict:
+    """Builds a mesh of boxes, a subdivided sheet and a cylinder with fan caps."""
+    rng = random.Random(0)
+    vertices = {}
+    mesh_faces = {}
+
+    def vertex(position: tuple) -> str:
+        key = f"v{len(vertices)}"
+        vertices[key] = list(position)
+        return key
+
+    def face(keys: list[str]) -> None:
+        keys = list(keys)
+        # Blockbench does not store face vertices in winding order.
+        rng.shuffle(keys)
+        mesh_faces[f"f{len(mesh_faces)}"] = {
+            "vertices": keys,
+            "uv": {key: [0, 0] for key in keys},
+        }
+
+    boxes = faces // 18
+    for index in range(boxes):
+        x, z = (index % 40) * 8, (index // 40) * 8
+        corners = {
+            (dx, dy, dz): vertex((x + dx * 4, dy * 4, z + dz * 4))
+            for dx in (0, 1)
+            for dy in (0, 1)
+            for dz in (0, 1)
+        }
+        for axis in range(3):
+            for side in (0, 1):
+                face([key for corner, key in corners.items() if corner[axis] == side])
+
+    segments = faces // 9
+    top, bottom = vertex((0, 40, -40)), vertex((0, 20, -40))
+    ring = [
+        (
+            vertex((math.cos(angle) * 10, 40, math.sin(angle) * 10 - 40)),
+            vertex((math.cos(angle) * 10, 20, math.sin(angle) * 10 - 40)),
+        )
+        for angle in (index / segments * math.tau for index in range(segments))
+    ]
+    for index, (upper, lower) in enumerate(ring):
+        next_upper, next_lower = ring[(index + 1) % segments]
+        face([upper, lower, next_upper, next_lower])
+        face([top, upper, next_upper])
+        face([bottom, lower, next_lower])
+
+    side = int((faces - len(mesh_faces)) ** 0.5)
+    grid = {
+        (i, j): vertex((i * 2, -10, j * 2))
+        for i in range(side + 1)
+        for j in range(side + 1)
+    }
+    for i in range(side):
+        for j in range(side):
+            face(
+                [grid[(i, j)], grid[(i + 1, j)], grid[(i, j + 1)], grid[(i + 1, j + 1)]]
+            )
+
+    return {"name": "heavy_mesh", "vertices": vertices, "faces": mesh_faces}
+
+
+def legacy_extract_cuboids(mesh: Mesh) -> list[dict]:
+    """The decomposition as it was before, kept as the baseline."""
+    face_verts = {fid: set(face["vertices"]) for fid, face in mesh.faces.items()}
+
+    vertex_to_faces = defaultdict(list)
+    for fid, face in mesh.faces.items():
+        for vid in face["vertices"]:
+            vertex_to_faces[vid].append(fid)
+
+    shared_counts = defaultdict(int)
+    for face_list in vertex_to_faces.values():
+        for i in range(len(face_list)):
+            for j in range(i + 1, len(face_list)):
+                f1, f2 = face_list[i], face_list[j]
+                if f1 > f2:
+                    f1, f2 = f2, f1
+                shared_counts[(f1, f2)] += 1
+
+    face_neighbors = {fid: set() for fid in mesh.faces}
+    for (f1, f2), count in shared_counts.items():
+        if count >= 2:
+            face_neighbors[f1].add(f2)
+            face_neighbors[f2].add(f1)
+
+    all_visited = set()
+    cuboids = []
+    for fid in mesh.faces:
+        if fid in all_visited:
+            continue
+
+        original_component = set()
+        stack = [fid]
+        while stack:
+            current = stack.pop()
+            if current not in original_component:
+                original_component.add(current)
+                stack.extend(face_neighbors[current] - original_component)
+
+        unvisited = original_component - all_visited
+        while unvisited:
+            seed = next(iter(unvisited))
+            working_faces = set()
+            working_verts = set()
+            working_stack = [seed]
+
+            while working_stack:
+                current = working_stack.pop()
+                if current in working_faces:
+                    continue
+
+                new_verts = working_verts.union(face_verts[current])
+                if len(new_verts) > 8:
+                    continue
+
+                xs, ys, zs = zip(*[mesh.vertices[vid] for vid in new_verts])
+                if (
+                    max(xs) - min(xs) > 24
+                    or max(ys) - min(ys) > 24
+                    or max(zs) - min(zs) > 24
+                ):
+                    continue
+
+                working_faces.add(current)
+                working_verts = new_verts
+                neighbors = face_neighbors[current] & unvisited
+                working_stack.extend(neighbors - working_faces)
+
+            if working_faces:
+                cuboids.append({"faces": working_faces, "vertices": working_verts})
+                all_visited.update(working_faces)
+                unvisited.difference_update(working_faces)
+            else:
+                all_visited.add(seed)
+                unvisited.discard(seed)
+
+    return cuboids
+
+
+def check(mesh: Mesh, cuboids: list[dict]) -> None:
+    covered = [fid for cuboid in cuboids for fid in cuboid["faces"]]
+    if sorted(covered) != sorted(mesh.faces):
+        raise SystemExit("Every face must belong to exactly one cuboid.")
+    if any(len(cuboid["vertices"]) > 8 for cuboid in cuboids):
+        raise SystemExit("A cuboid uses more than 8 vertices.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--faces", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    mesh = Mesh.from_dict(build_mesh(args.faces))
+    cuboids = mesh.extract_cuboids()
+    check(mesh, cuboids)
+    check(mesh, legacy_extract_cuboids(mesh))
+
+    # Separate boxes are decomposed the same way whatever the traversal order.
+    box_faces = set(list(mesh.faces)[: args.faces // 18 * 6])
+
+    def boxes(cuboids: list[dict]) -> set[frozenset]:
+        return {
+            frozenset(cuboid["faces"])
+            for cuboid in cuboids
+            if box_faces.issuperset(cuboid["faces"])
+        }
+
+    if boxes(cuboids) != boxes(legacy_extract_cuboids(mesh)):
+        raise SystemExit("Boxes are decomposed differently.")
+
+    legacy_time = min(
+        timeit.repeat(
+            lambda: legacy_extract_cuboids(mesh), number=1, repeat=args.repeat
+        )
+    )
+    current_time = min(
+        timeit.repeat(mesh.extract_cuboids, number=1, repeat=args.repeat)
+    )
+
+    print(f"Faces: {len(mesh.faces)}, vertices: {len(mesh.vertices)}")
+    print(f"Cuboids:  {len(cuboids)}")
+    print(f"Previous: {legacy_time * 1000:8.1f} ms")
+    print(f"Current:  {current_time * 1000:8.1f} ms")
+    print(f"Speedup:  {legacy_time / current_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Measures the import time of the vanilla namespaces and the modules using them.
+
+Every case runs in a fresh interpreter, so nothing is shared between two runs but the
+bytecode cache. `MinecraftBlockTypes` and `MinecraftItemTypes` only import their
+factory modules on first use, the cases using a factory show that cost separately.
+
+Usage:
+    python benchmarks/bench_vanilla_imports.py [--repeat 7]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SNIPPET = """
+import time
+from unittest.mock import MagicMock
+
+start = time.perf_counter()
+import anvil.lib.config
+
+anvil.lib.config.CONFIG = MagicMock()
+anvil.lib.config.CONFIG.NAMESPACE = "bench"
+{statement}
+print(time.perf_counter() - start)
+"""
+
+CASES = {
+    "vanilla.blocks": "from anvil.api.vanilla.blocks import MinecraftBlockTypes",
+    "vanilla.blocks, Stone()": "from anvil.api.vanilla.blocks import MinecraftBlockTypes\nMinecraftBlockTypes.Stone()",
+    "vanilla.items": "from anvil.api.vanilla.items import MinecraftItemTypes",
+    "vanilla.items, Stick()": "from anvil.api.vanilla.items import MinecraftItemTypes\nMinecraftItemTypes.Stick()",
+    "actors.components": "import anvil.api.actors.components",
+    "core.core": "import anvil.api.core.core",
+}
+
+
+def measure(statement: str, repeat: int) -> float:
+    """Returns the median import time of a statement in seconds."""
+    # Builds load the API from the bytecode cache, make sure it gets written.
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key != "PYTHONDONTWRITEBYTECODE"
+    }
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", SNIPPET.format(statement=statement)],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        ).stdout
+        times.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    # Populate the bytecode cache first, builds never compile the API from source.
+    for statement in CASES.values():
+        measure(statement, 1)
+
+    for name, statement in CASES.items():
+        print(f"{name:<28} {measure(statement, args.repeat) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -439,6 +439,7 @@ class _RP_Controller(_BP_Controller):
 
 class BPAnimationControllers(AddonObject):
     _extension = ".bp_ac.json"
+    _consolidate = "animation_controllers"
     _path = os.path.join(
         CONFIG.BP_PATH,
         "animation_controllers",
@@ -479,6 +480,8 @@ class BPAnimationControllers(AddonObject):
 
 class RPAnimationControllers(AddonObject):
     _extension = ".rp_ac.json"
+    _consolidate = "animation_controllers"
+    _deduplicate = "definitions"
     _path = os.path.join(CONFIG.RP_PATH, "animation_controllers")
     _object_type = "Resource Pack Animation Controller"
 
@@ -84,6 +84,7 @@ class _BPAnimation:
 
 class BPAnimations(AddonObject):
     _extension = ".animation.json"
+    _consolidate = "animations"
     _path = os.path.join(CONFIG.BP_PATH, "animations")
     _object_type = "behavior Pack Animation"
 
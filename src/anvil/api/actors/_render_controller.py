@@ -202,6 +202,8 @@ class _RenderController:
 
 class RenderControllers(AddonObject):
     _extension = ".rc.json"
+    _consolidate = "render_controllers"
+    _deduplicate = "definitions"
     _path = os.path.join(
         CONFIG.RP_PATH,
         "render_controllers",
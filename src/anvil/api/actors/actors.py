@@ -16,6 +16,7 @@ from anvil.api.actors.components import (
     EntityPushableByEntity,
     EntityRideable,
 )
+from anvil.api.actors.tick_cost import AnvilTickCost
 from anvil.api.core.components import (
     ComponentGroup,
     RootComponent,
@@ -27,6 +28,7 @@ from anvil.api.core.sounds import EntitySoundEvent, SoundCategory
 from anvil.api.core.textures import ItemTexturesObject
 from anvil.api.core.types import Vector2D
 from anvil.api.logic.molang import Molang, Variable, molang_conditions
+from anvil.api.logic.molang_hoist import MolangHoister
 from anvil.api.pbr.texture_set import TextureComponents, TextureSet
 from anvil.api.vanilla.entities import vanilla_entity_ids
 from anvil.lib.blockbench import BlockBenchSource, _Blockbench
@@ -709,8 +711,47 @@ class _ActorClientDescription(_ActorDescription):
                     )
                     anims.remove(d)
 
+        if MolangHoister.is_enabled():
+            MolangHoister.hoist(
+                self.identifier,
+                self._molang_sites(),
+                self._description["description"]["scripts"]["pre_animation"],
+            )
+
         return super().__export__()
 
+    def _molang_sites(self):
+        """Returns the `(container, key)` pairs of the Molang expressions evaluated after `pre_animation`."""
+        description = self._description["description"]
+        conditions = (
+            description["scripts"]["animate"] + description["render_controllers"]
+        )
+        sites = []
+
+        if not self._is_dummy:
+            for controller in self._render_controllers._controllers:
+                render_controller = controller._controller[
+                    controller.controller_identifier
+                ]
+                conditions += render_controller["materials"]
+                conditions += render_controller["part_visibility"]
+                sites.append((render_controller, "geometry"))
+                sites.extend(
+                    (render_controller["textures"], index)
+                    for index in range(len(render_controller["textures"]))
+                )
+
+            for controller in self._animation_controllers._controllers_list:
+                for state in controller._controller_states:
+                    state_body = state._controller_state[state._state_name]
+                    conditions += state_body["animations"]
+                    conditions += state_body["transitions"]
+
+        for condition in conditions:
+            if isinstance(condition, dict):
+                sites.extend((condition, key) for key in condition)
+        return sites
+
 
 class _EntityClientDescription(_ActorClientDescription):
     """Base class for all client entity descriptions."""
@@ -1169,6 +1210,7 @@ class _EntityServer(AddonObject):
         self._spawn_rule.queue(directory=self._directory)
 
         components_validations(self, self._components, self._component_groups)
+        AnvilTickCost.record(self.identifier, self._components, self._component_groups)
 
         self._server_entity["minecraft:entity"].update(self.description.__export__())
         self._server_entity["minecraft:entity"]["components"].update(
@@ -1214,6 +1256,7 @@ class _EntityClient(AddonObject):
 
     _extension = ".entity.json"
     _path = os.path.join(CONFIG.RP_PATH, "entity")
+    _deduplicate = "references"
     _object_type = "Client Entity"
 
     def __init__(self, name: str, is_vanilla: bool = False) -> None:
@@ -1303,6 +1346,7 @@ class Entity(MinecraftEntityDescriptor):
 class Attachable(AddonObject):
     _extension = ".attachable.json"
     _path = os.path.join(CONFIG.RP_PATH, "attachables")
+    _deduplicate = "references"
     _object_type = "Attachable"
 
     def __init__(self, name: str, is_vanilla: bool = False) -> None:
@@ -7118,7 +7118,7 @@ class EntityTrail(Component):
 
     def __init__(
         self,
-        block_type: MinecraftBlockDescriptor | Identifier = MinecraftBlockTypes.Air(),
+        block_type: MinecraftBlockDescriptor | Identifier = "minecraft:air",
         spawn_filter: Filter = None,
         spawn_offset: tuple[float, float, float] = (0, 0, 0),
     ) -> None:
@@ -7133,7 +7133,7 @@ class EntityTrail(Component):
             https://learn.microsoft.com/en-us/minecraft/creator/reference/content/entityreference/examples/entitycomponents/minecraftcomponent_trail
         """
         super().__init__("trail")
-        if str(block_type) != str(MinecraftBlockTypes.Air()):
+        if str(block_type) != "minecraft:air":
             self._add_field("block_type", str(block_type))
         if spawn_filter is not None:
             self._add_field("spawn_filter", spawn_filter)
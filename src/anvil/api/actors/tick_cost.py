@@ -0,0 +1,242 @@
+"""Static estimate of the server work entity components cause every tick.
+
+Scores are relative units where 1 is roughly one filter test per tick. They only
+rank entities and component groups against each other, they do not predict a tick
+time. Sensors and target searches scale with the volume they scan and the interval
+between two scans, filters add one unit per test.
+"""
+
+from typing import Any, Iterable
+
+import click
+
+from anvil.api.core.components import Component, RootComponent
+from anvil.api.core.filters import Filter
+
+TICKS_PER_SECOND = 20
+
+# Cost of components whose work does not depend on their settings.
+_BASE_COST: dict[str, float] = {
+    "minecraft:physics": 1.0,
+    "minecraft:pushable": 0.5,
+    "minecraft:pushable_by_block": 0.5,
+    "minecraft:pushable_by_entity": 0.5,
+    "minecraft:breathable": 0.2,
+    "minecraft:timer": 0.1,
+    "minecraft:ambient_sound_interval": 0.05,
+    "minecraft:despawn": 0.5,
+    "minecraft:block_sensor": 0.5,
+    "minecraft:rail_sensor": 0.2,
+    "minecraft:inside_block_notifier": 1.0,
+    "minecraft:burns_in_daylight": 0.3,
+    "minecraft:flocking": 3.0,
+    "minecraft:item_hopper": 1.0,
+    "minecraft:vibration_listener": 1.0,
+    "minecraft:game_event_movement_tracking": 0.3,
+    "minecraft:heartbeat": 0.1,
+    "minecraft:scheduler": 1.0,
+    "minecraft:hurt_on_condition": 1.0,
+    "minecraft:break_blocks": 1.0,
+    "minecraft:grows_crop": 0.5,
+    "minecraft:suspect_tracking": 1.0,
+}
+_PREFIX_COST: dict[str, float] = {
+    "minecraft:navigation.": 2.0,
+    "minecraft:movement.": 1.0,
+    "minecraft:behavior.": 1.0,
+}
+# Goals that search for a target around the entity.
+_TARGETING_GOALS = (
+    "minecraft:behavior.nearest_attackable_target",
+    "minecraft:behavior.nearest_prioritized_attackable_target",
+)
+# Each chunk kept ticking by `minecraft:tick_world`.
+_TICKING_CHUNK_COST = 10.0
+
+
+def filter_tests(filters: Any) -> int:
+    """Counts the tests of a filter tree."""
+    if isinstance(filters, Filter):
+        for group in (filters.is_all_of, filters.is_any_of, filters.is_none_of):
+            if group is not None:
+                return filter_tests(group)
+        return 1 if filters.test is not None else 0
+    if isinstance(filters, dict):
+        if "test" in filters:
+            return 1
+        return sum(
+            filter_tests(filters.get(group, []))
+            for group in ("all_of", "any_of", "none_of")
+        )
+    if isinstance(filters, (list, tuple)):
+        return sum(filter_tests(child) for child in filters)
+    return 0
+
+
+def _number(value: Any, default: float) -> float:
+    return float(value) if isinstance(value, (int, float)) else default
+
+
+def _volume(horizontal: float, vertical: float, reference: float = 10.0) -> float:
+    """Scanned volume relative to a `reference` block cube."""
+    return (horizontal / reference) ** 2 * (vertical / reference)
+
+
+def component_cost(component: Component) -> float:
+    """Estimates the work a component causes every tick.
+
+    Parameters:
+        component (Component): The component, with its exported fields.
+
+    Returns:
+        float: The estimated cost in relative units.
+    """
+    identifier = component.identifier
+    fields = component._component
+
+    if identifier == "minecraft:tick_world":
+        radius = _number(fields.get("radius"), 2)
+        return _TICKING_CHUNK_COST * (2 * radius + 1) ** 2
+
+    if identifier == "minecraft:environment_sensor":
+        return float(
+            sum(
+                1 + filter_tests(trigger.get("filters"))
+                for trigger in fields.get("triggers", [])
+            )
+        )
+
+    if identifier == "minecraft:entity_sensor":
+        cost = 0.0
+        for sensor in fields.get("subsensors", []):
+            horizontal, vertical = sensor.get("range", (10, 10))
+            cooldown = _number(sensor.get("cooldown"), -1)
+            # The cooldown is in seconds, on top of the base one tick delay.
+            interval = 1 + max(cooldown, 0) * TICKS_PER_SECOND
+            tests = 2 + filter_tests(sensor.get("event_filters"))
+            cost += 5 * _volume(horizontal, vertical) * tests / interval
+        return cost
+
+    if identifier == "minecraft:target_nearby_sensor":
+        radius = max(
+            _number(fields.get("inside_range"), 1),
+            _number(fields.get("outside_range"), 5),
+        )
+        return 3 * _volume(radius, radius) + (2 if fields.get("must_see") else 0)
+
+    if identifier in ("minecraft:looked_at", "minecraft:mob_effect"):
+        radius = _number(fields.get("search_radius", fields.get("effect_range")), 10)
+        filters = fields.get("filters", fields.get("entity_filter"))
+        return 3 * _volume(radius, radius) + filter_tests(filters)
+
+    if identifier == "minecraft:area_attack":
+        radius = _number(fields.get("damage_range"), 0.2)
+        return (
+            1 + 3 * _volume(radius, radius) + filter_tests(fields.get("entity_filter"))
+        )
+
+    if identifier in _TARGETING_GOALS:
+        interval = max(_number(fields.get("scan_interval"), 10), 1)
+        radius = _number(fields.get("within_radius"), 0) or 16
+        targets = fields.get("entity_types", [])
+        tests = sum(
+            2 + filter_tests(target.get("filters"))
+            for target in targets
+            if isinstance(target, dict)
+        )
+        return 1 + 10 * _volume(radius, radius, 16) * max(tests, 1) / interval
+
+    if identifier in _BASE_COST:
+        return _BASE_COST[identifier]
+    for prefix, cost in _PREFIX_COST.items():
+        if identifier.startswith(prefix):
+            return cost
+    # Flags, attributes and event triggers only cost when something reads them.
+    return 0.0
+
+
+def group_cost(components: Iterable[Component]) -> float:
+    return sum(component_cost(component) for component in components)
+
+
+class AnvilTickCost:
+    """Collects the estimated per tick cost of every exported entity.
+
+    The cost of an entity is its root components plus its heaviest component group,
+    groups being usually swapped rather than all added at once.
+    """
+
+    _entities: dict[str, dict[str, float]] = {}
+
+    @classmethod
+    def record(
+        cls,
+        identifier: str,
+        root_components: RootComponent,
+        component_groups: list[RootComponent],
+    ) -> None:
+        costs = {"components": group_cost(root_components)}
+        for group in component_groups:
+            costs[group._component_group_name] = group_cost(group)
+        cls._entities[identifier] = costs
+
+    @classmethod
+    def entity_cost(cls, identifier: str) -> float:
+        costs = cls._entities[identifier]
+        groups = [cost for name, cost in costs.items() if name != "components"]
+        return costs["components"] + max(groups, default=0.0)
+
+    @classmethod
+    def ranking(cls) -> list[tuple[str, float]]:
+        """Returns the entities from the most to the least expensive."""
+        return sorted(
+            ((identifier, cls.entity_cost(identifier)) for identifier in cls._entities),
+            key=lambda entry: entry[1],
+            reverse=True,
+        )
+
+    @classmethod
+    def group_ranking(cls) -> list[tuple[str, str, float]]:
+        """Returns the component groups of every entity, from the most to the least expensive."""
+        return sorted(
+            (
+                (identifier, group, cost)
+                for identifier, costs in cls._entities.items()
+                for group, cost in costs.items()
+                if group != "components"
+            ),
+            key=lambda entry: entry[2],
+            reverse=True,
+        )
+
+    @classmethod
+    def over_budget(cls, budget: float) -> list[tuple[str, float]]:
+        if budget <= 0:
+            return []
+        return [
+            (identifier, cost) for identifier, cost in cls.ranking() if cost > budget
+        ]
+
+    @classmethod
+    def report(cls, budget: float, top: int = 10) -> str:
+        """Formats the most expensive entities and component groups as a table."""
+        lines = [f"{'Entity':<48} {'Cost':>10}"]
+        for identifier, cost in cls.ranking()[:top]:
+            flag = " over budget" if 0 < budget < cost else ""
+            lines.append(f"{identifier:<48} {cost:>10.1f}{flag}")
+
+        lines.append("")
+        lines.append(f"{'Component group':<48} {'Cost':>10}")
+        for identifier, group, cost in cls.group_ranking()[:top]:
+            lines.append(f"{f'{identifier} / {group}':<48} {cost:>10.1f}")
+        return "\n".join(lines)
+
+    @classmethod
+    def warn(cls, budget: float) -> None:
+        for identifier, cost in cls.over_budget(budget):
+            click.echo(
+                click.style(
+                    f"\r[WARN]: Entity {identifier} is estimated at {cost:.1f} tick cost units, over the budget of {budget:g}. Run `anvil build --tick-report` for details.",
+                    fg="yellow",
+                )
+            )
@@ -2,6 +2,7 @@ import os
 from typing import Literal, Mapping
 
 from anvil.api.blocks.components import BlockDisplayName
+from anvil.api.blocks.permutations import AnvilBlockPermutations
 from anvil.api.core.components import (
     PermutationGroup,
     RootComponent,
@@ -253,6 +254,12 @@ class BlockServer(AddonObject):
         component_block_visuals(self, self._components, self._permutations)
 
         self._server_block["minecraft:block"].update(self.description.__export__())
+        AnvilBlockPermutations.record(
+            self.identifier,
+            self.description._description["description"]["states"],
+            self.description._traits.export,
+            [permutation._condition for permutation in self._permutations],
+        )
         self._server_block["minecraft:block"].update(self._components.__export__())
         self._server_block["minecraft:block"]["permutations"] = [
             permutation.__export__() for permutation in self._permutations
@@ -21,6 +21,7 @@ from anvil.api.vanilla.blocks import MinecraftBlockTags
 from anvil.api.world.loot_tables import LootTable
 from anvil.lib.blockbench import BlockBenchSource, _Blockbench, blockbench_geometry_name
 from anvil.lib.config import CONFIG
+from anvil.lib.dedupe import AnvilDefinitionDedupe
 from anvil.lib.format_versions import (
     BLOCK_JSON_FORMAT_VERSION,
     BLOCK_SERVER_VERSION,
@@ -278,6 +279,7 @@ class BlockEmbeddedVisual(Component):
                 "geometry",
                 {"identifier": f"geometry.{CONFIG.NAMESPACE}.{blockbench_name}"},
             )
+            AnvilDefinitionDedupe.keep(f"geometry.{CONFIG.NAMESPACE}.{blockbench_name}")
 
         self._add_field("material_instances", {})
 
@@ -702,6 +704,7 @@ class BlockGeometry(Component):
             self._add_field(
                 "identifier", f"geometry.{CONFIG.NAMESPACE}.{geometry_name}"
             )
+            AnvilDefinitionDedupe.keep(f"geometry.{CONFIG.NAMESPACE}.{geometry_name}")
 
             self._geometry_name = geometry_name
             if uv_lock:
@@ -1012,6 +1015,7 @@ class BlockItemVisual(Component):
                 "geometry",
                 {"identifier": f"geometry.{CONFIG.NAMESPACE}.{blockbench_name}"},
             )
+            AnvilDefinitionDedupe.keep(f"geometry.{CONFIG.NAMESPACE}.{blockbench_name}")
 
         self._add_field("material_instances", {})
 
@@ -0,0 +1,271 @@
+"""Runtime state space of custom blocks and the permutations matching it.
+
+The game registers one runtime state per combination of block state values, custom
+states and trait states alike, whatever permutations the block declares. Permutation
+conditions are evaluated with the offline Molang evaluator against every combination
+of the states they read, `q.block_state` returning the value of the combination.
+Conditions reading other queries or variables are only known at runtime and are
+skipped.
+"""
+
+import re
+from dataclasses import dataclass, field
+from itertools import product
+from math import prod
+from typing import Any
+
+import click
+import numpy as np
+
+from anvil.api.core.enums import (
+    BlockCardinalConnection,
+    BlockFacesTrait,
+    CardinalDirectionsTrait,
+    FacingDirectionsTrait,
+    VerticalHalfTrait,
+)
+from anvil.api.logic.molang_ast import MolangSyntaxError, parse
+from anvil.api.logic.molang_eval import (
+    MolangContext,
+    MolangEvaluationError,
+    MolangInterpreter,
+)
+
+# Combinations of the states read by the conditions of a block evaluated at most.
+MAX_COMBINATIONS = 65536
+
+_CORNER_AND_CARDINAL = [
+    "north",
+    "south",
+    "east",
+    "west",
+    "northeast",
+    "northwest",
+    "southeast",
+    "southwest",
+]
+_TRAIT_STATES: dict[str, list[Any]] = {
+    "minecraft:cardinal_direction": list(CardinalDirectionsTrait),
+    "minecraft:facing_direction": list(FacingDirectionsTrait),
+    "minecraft:corner_and_cardinal_direction": _CORNER_AND_CARDINAL,
+    "minecraft:sixteen_way_rotation": list(range(16)),
+    "minecraft:block_face": list(BlockFacesTrait),
+    "minecraft:vertical_half": list(VerticalHalfTrait),
+    "minecraft:corner_and_cardinal": _CORNER_AND_CARDINAL,
+}
+
+_BLOCK_STATE = re.compile(
+    r"\b(?:q|query)\.block_state\s*\(\s*'([^']*)'\s*\)", re.IGNORECASE
+)
+_NAME = re.compile(r"\b(q|query|v|variable|c|context|t|temp)\.(\w+)", re.IGNORECASE)
+
+
+def block_states(states: dict[str, Any], traits: dict[str, Any]) -> dict[str, list]:
+    """Lists the values of every state of a block, the trait states included.
+
+    Parameters:
+        states (dict[str, Any]): The `states` of the block description.
+        traits (dict[str, Any]): The `traits` of the block description.
+
+    Returns:
+        dict[str, list]: The values of each state.
+    """
+    values = {}
+    for name, state in states.items():
+        if isinstance(state, dict) and "values" in state:
+            bounds = state["values"]
+            values[name] = list(range(bounds["min"], bounds["max"] + 1))
+        else:
+            values[name] = list(state)
+
+    for trait, settings in traits.items():
+        if trait == "minecraft:multi_block":
+            values["minecraft:multi_block_part"] = list(range(settings["parts"]))
+            continue
+        for state in settings.get("enabled_states") or []:
+            if state == "minecraft:cardinal_connections":
+                for connection in BlockCardinalConnection:
+                    values[str(connection)] = [False, True]
+            elif str(state) in _TRAIT_STATES:
+                values[str(state)] = _TRAIT_STATES[str(state)]
+    return values
+
+
+def _is_static(condition: str) -> bool:
+    """Checks whether a condition only reads block states."""
+    return all(
+        name.lower() in ("block_state", "has_block_state")
+        for _, name in _NAME.findall(condition)
+    )
+
+
+@dataclass
+class BlockPermutations:
+    """The state space of a block and how its permutations cover it.
+
+    Attributes:
+        identifier (str): The identifier of the block.
+        states (int): Runtime states registered for the block.
+        permutations (int): Permutations declared by the block.
+        unreachable (list[int]): Indices of the permutations no state matches.
+        overlapping (list[tuple[int, int]]): Pairs of permutations matching a common state.
+        overlapping_states (int): States matched by more than one permutation.
+        skipped (list[int]): Indices of the permutations depending on runtime values.
+        analyzed (bool): Whether the conditions were evaluated, False when they read too many states.
+    """
+
+    identifier: str
+    states: int
+    permutations: int
+    unreachable: list[int] = field(default_factory=list)
+    overlapping: list[tuple[int, int]] = field(default_factory=list)
+    overlapping_states: int = 0
+    skipped: list[int] = field(default_factory=list)
+    analyzed: bool = True
+
+
+def analyze(
+    identifier: str, values: dict[str, list], conditions: list[Any]
+) -> BlockPermutations:
+    """Evaluates the permutation conditions of a block against its state space.
+
+    Parameters:
+        identifier (str): The identifier of the block.
+        values (dict[str, list]): The values of each state, see `block_states`.
+        conditions (list[Any]): The condition of each permutation.
+
+    Returns:
+        BlockPermutations: The analysis of the block.
+    """
+    result = BlockPermutations(
+        identifier, prod(len(state) for state in values.values()), len(conditions)
+    )
+
+    checked: list[tuple[int, Any]] = []
+    read: set[str] = set()
+    for index, condition in enumerate(conditions):
+        condition = str(condition) if condition is not None else "1"
+        if not _is_static(condition):
+            result.skipped.append(index)
+            continue
+        try:
+            checked.append((index, parse(condition)))
+        except (MolangSyntaxError, RecursionError):
+            result.skipped.append(index)
+            continue
+        read.update(name for name in _BLOCK_STATE.findall(condition) if name in values)
+
+    # States no condition reads only repeat every combination of the other ones.
+    read_states = sorted(read)
+    combinations = prod(len(values[name]) for name in read_states)
+    if not checked:
+        return result
+    if combinations > MAX_COMBINATIONS:
+        result.analyzed = False
+        return result
+    repeats = result.states // combinations
+
+    state: dict[str, Any] = {}
+    context = MolangContext(
+        queries={
+            "block_state": lambda name: state.get(name, 0.0),
+            "has_block_state": lambda name: float(name in values),
+        }
+    )
+    interpreter = MolangInterpreter(context)
+
+    matches = np.zeros((len(checked), combinations), dtype=bool)
+    for column, combination in enumerate(
+        product(*(values[name] for name in read_states))
+    ):
+        state.clear()
+        state.update(zip(read_states, combination))
+        for row, (_, tree) in enumerate(checked):
+            try:
+                value = interpreter.evaluate(tree)
+            except (MolangEvaluationError, TypeError, ValueError):
+                continue
+            matches[row, column] = bool(value) and value == value
+
+    indices = [index for index, _ in checked]
+    result.unreachable = [indices[row] for row in np.flatnonzero(~matches.any(axis=1))]
+    shared = matches.astype(np.int64) @ matches.T.astype(np.int64)
+    result.overlapping = [
+        (indices[i], indices[j]) for i, j in zip(*np.nonzero(np.triu(shared, k=1)))
+    ]
+    result.overlapping_states = int((matches.sum(axis=0) > 1).sum()) * repeats
+    return result
+
+
+class AnvilBlockPermutations:
+    """Collects the permutation analysis of every exported block."""
+
+    _blocks: dict[str, BlockPermutations] = {}
+    _enabled: bool = False
+
+    @classmethod
+    def enable(cls, enabled: bool = True) -> None:
+        """Resets the recorded blocks, the conditions are only evaluated when enabled.
+
+        Parameters:
+            enabled (bool, optional): Whether the permutation conditions are evaluated. Defaults to True.
+        """
+        cls._enabled = enabled
+        cls._blocks = {}
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def record(
+        cls,
+        identifier: str,
+        states: dict[str, Any],
+        traits: dict[str, Any],
+        conditions: list[Any],
+    ) -> BlockPermutations:
+        values = block_states(states, traits)
+        if cls._enabled:
+            result = analyze(identifier, values, conditions)
+        else:
+            # Evaluating every combination is too slow for ordinary builds.
+            result = BlockPermutations(
+                identifier,
+                prod(len(state) for state in values.values()),
+                len(conditions),
+                analyzed=False,
+            )
+        cls._blocks[identifier] = result
+        return result
+
+    @classmethod
+    def total_states(cls) -> int:
+        return sum(block.states for block in cls._blocks.values())
+
+    @classmethod
+    def report(cls, top: int = 20) -> str:
+        """Formats the blocks with the most runtime states as a table."""
+        lines = [
+            f"{'Block':<48} {'States':>8} {'Perms':>6} {'Unreachable':>12} {'Overlaps':>9}"
+        ]
+        blocks = sorted(cls._blocks.values(), key=lambda b: b.states, reverse=True)
+        for block in blocks[:top]:
+            unreachable = len(block.unreachable) if block.analyzed else "?"
+            overlapping = len(block.overlapping) if block.analyzed else "?"
+            lines.append(
+                f"{block.identifier:<48} {block.states:>8} {block.permutations:>6} {unreachable:>12} {overlapping:>9}"
+            )
+        lines.append(f"{'Total runtime states':<48} {cls.total_states():>8}")
+        return "\n".join(lines)
+
+    @classmethod
+    def warn(cls) -> None:
+        for block in cls._blocks.values():
+            if block.unreachable:
+                click.echo(
+                    click.style(
+                        f"\r[WARN]: Block {block.identifier} has permutations no state can match: {', '.join(map(str, block.unreachable))}.",
+                        fg="yellow",
+                    )
+                )
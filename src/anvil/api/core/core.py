@@ -11,6 +11,8 @@ from typing import Optional
 
 import click
 from anvil.api.actors.materials import MaterialsObject
+from anvil.api.actors.tick_cost import AnvilTickCost
+from anvil.api.blocks.permutations import AnvilBlockPermutations
 from anvil.api.core.sounds import (
     BlocksJSONObject,
     MusicDefinition,
@@ -22,6 +24,8 @@ from anvil.api.core.textures import (
     ItemTexturesObject,
     TerrainTexturesObject,
 )
+from anvil.api.logic.molang_ast import MolangOptimizer
+from anvil.api.logic.molang_hoist import MolangHoister
 from anvil.lib.blockbench import _Blockbench
 from anvil.lib.config import (
     CONFIG,
@@ -41,11 +45,17 @@ from anvil.lib.lib import (
     PREVIEW_COM_MOJANG,
     RELEASE_COM_MOJANG,
     AnvilArchive,
+    AnvilExportError,
+    AnvilExportPipeline,
     AnvilIO,
     AnvilValidator,
+    BackgroundSubcommand,
     Directory,
-    process_subcommand,
 )
+from anvil.lib.consolidation import AnvilPackConsolidation
+from anvil.lib.dedupe import AnvilDefinitionDedupe
+from anvil.lib.incremental import AnvilAssetSync, AnvilBuildManifest
+from anvil.lib.profiler import AnvilProfiler
 from anvil.lib.reports import ReportType
 from anvil.lib.schemas import AddonObject, JsonSchemes
 from anvil.lib.translator import AnvilTranslator
@@ -251,6 +261,48 @@ def addon_object_exception(object: AddonObject, e: Exception):
     click.echo(click.style(f"\r{'='*60}", fg="red"), err=True)
 
 
+def export_object_exception(object: AddonObject, e: Exception):
+    if CONFIG._DEBUG:
+        addon_object_exception(object, e)
+    else:
+        click.echo(
+            click.style(
+                f"\rERROR EXPORTING OBJECT: {getattr(object, '_name', 'Unknown')} ({object.__class__.__name__}): {e}",
+                fg="red",
+            ),
+            err=True,
+        )
+
+
+def export_jobs() -> int:
+    """Returns the number of export workers requested with `--jobs N`."""
+    if "--jobs" not in sys.argv:
+        return 1
+
+    index = sys.argv.index("--jobs")
+    try:
+        jobs = int(sys.argv[index + 1])
+    except (IndexError, ValueError):
+        raise ValueError("--jobs expects a positive number of workers.")
+
+    if jobs < 1:
+        raise ValueError("--jobs expects a positive number of workers.")
+
+    return jobs
+
+
+def profile_format() -> str | None:
+    """Returns the report format requested with `--profile [json|speedscope]`, if any."""
+    if "--profile" not in sys.argv:
+        return None
+
+    index = sys.argv.index("--profile")
+    if index + 1 < len(sys.argv) and not sys.argv[index + 1].startswith("-"):
+        return sys.argv[index + 1]
+
+    return "json"
+
+
 def pack_art(apply_overlay: bool = False):
     source = os.path.join("marketing")
     pack_icon_size = (256, 256)
@@ -605,15 +657,22 @@ def compile_objects(
     if not js_only and not no_compile:
         click.echo(click.style(f"\r[INFO]: Compiling projects...", fg="cyan"))
 
-    extract_world_pack(extract_world)
-    scriptapi()
+    if not js_only:
+        with AnvilProfiler.stage("extract world"):
+            extract_world_pack(extract_world)
 
-    ManifestBP().queue()
-    ManifestRP().queue()
+    with AnvilProfiler.stage("scriptapi"):
+        scriptapi()
 
-    if CONFIG._TARGET == ConfigPackageTarget.WORLD:
-        manifests()
+    with AnvilProfiler.stage("manifests"):
+        ManifestBP().queue()
+        ManifestRP().queue()
+
+        if CONFIG._TARGET == ConfigPackageTarget.WORLD:
+            manifests()
 
+    # The bundle only writes to BP/scripts, it runs while the objects are exported.
+    bundle = None
     if CONFIG._SCRIPT_API:
         args = [
             CONFIG._SCRIPT_BUNDLE_SCRIPT,
@@ -621,32 +680,70 @@ def compile_objects(
         ]
         if "--minify" in sys.argv:
             args.append("--minify")
+        bundle = BackgroundSubcommand(
+            " ".join(args), "Building scripts error", "[JS]: "
+        )
 
-        process_subcommand(
-            " ".join(args),
-            "Building scripts error",
+    try:
+        if js_only:
+            with AnvilProfiler.stage("manifests"):
+                ManifestBP().__export__()
+                ManifestRP().__export__()
+        elif not no_compile:
+            export_objects(anvil, workflow, apply_overlay)
+
+        # Assets are also copied while objects are defined, such as UI textures.
+        with AnvilProfiler.stage("assets"):
+            copied, unchanged = AnvilAssetSync.flush(CONFIG._ASSET_LINK)
+        # Links fall back to copies where the file system does not support them.
+        verb = "copied" if CONFIG._ASSET_LINK == "copy" else "linked or copied"
+        click.echo(
+            click.style(
+                f"\r[INFO]: Assets: {copied} {verb}, {unchanged} unchanged.",
+                fg="green",
+            )
         )
+    finally:
+        if bundle is not None:
+            with AnvilProfiler.stage("script bundle"):
+                bundle.wait()
 
-    if js_only:
-        ManifestBP().__export__()
-        ManifestRP().__export__()
-        return
 
-    if no_compile:
-        return
+def export_objects(anvil: "_Anvil", workflow: bool, apply_overlay: bool):
+    import click
+
+    MolangOptimizer.enable(CONFIG._OPTIMIZE_MOLANG or "--optimize-molang" in sys.argv)
+    MolangHoister.enable(CONFIG._HOIST_MOLANG is True or "--hoist-molang" in sys.argv)
+    AnvilPackConsolidation.begin(
+        CONFIG._CONSOLIDATE is True or "--consolidate" in sys.argv
+    )
+    AnvilDefinitionDedupe.begin(CONFIG._DEDUPLICATE is True or "--dedupe" in sys.argv)
+    AnvilBlockPermutations.enable("--permutation-report" in sys.argv)
+
+    incremental = CONFIG._INCREMENTAL or "--incremental" in sys.argv
+    if incremental:
+        AnvilBuildManifest.begin([CONFIG.BP_PATH, CONFIG.RP_PATH])
+
+    with AnvilProfiler.stage("textures"):
+        ItemTexturesObject().queue()
+        TerrainTexturesObject().queue()
+        FlipBookTexturesObject().queue()
+
+    with AnvilProfiler.stage("sounds"):
+        SoundDefinition().queue()
+        SoundEvent().queue()
+        MusicDefinition().queue()
 
-    ItemTexturesObject().queue()
-    TerrainTexturesObject().queue()
-    FlipBookTexturesObject().queue()
-    SoundDefinition().queue()
-    SoundEvent().queue()
-    MusicDefinition().queue()
     BlocksJSONObject().queue()
     MaterialsObject().queue()
-    _Blockbench.__export__()
+
+    with AnvilProfiler.stage("blockbench"):
+        _Blockbench.__export__()
+
     anvil.__queue__(AnvilTranslator())
 
-    pack_art(apply_overlay=apply_overlay)
+    with AnvilProfiler.stage("pack art"):
+        pack_art(apply_overlay=apply_overlay)
 
     if workflow:
         AnvilIO.file(
@@ -674,21 +771,78 @@ def compile_objects(
                 )
             )
 
-    for object in anvil._objects_list:
-        try:
-            object.__export__()
-        except Exception as e:
-            if CONFIG._DEBUG:
-                addon_object_exception(object, e)
-            else:
-                click.echo(
-                    click.style(
-                        f"\rERROR EXPORTING OBJECT: {getattr(object, '_name', 'Unknown')} ({object.__class__.__name__}): {e}",
-                        fg="red",
-                    ),
-                    err=True,
+    jobs = export_jobs()
+    if jobs > 1:
+        AnvilExportPipeline.begin(jobs)
+
+    with AnvilProfiler.stage("export"):
+        for object in anvil._objects_list:
+            try:
+                AnvilExportPipeline.set_owner(object)
+                with AnvilProfiler.object(object):
+                    object.__export__()
+            except Exception as e:
+                export_object_exception(object, e)
+                raise
+
+        if AnvilDefinitionDedupe.is_enabled():
+            definitions, files = AnvilDefinitionDedupe.flush()
+            click.echo(
+                click.style(
+                    f"\r[INFO]: Deduplication: {definitions} duplicate definitions dropped, {files} files removed.",
+                    fg="green",
                 )
-            raise
+            )
+
+        if AnvilPackConsolidation.is_enabled():
+            merged, written = AnvilPackConsolidation.flush()
+            click.echo(
+                click.style(
+                    f"\r[INFO]: Consolidation: {merged} files merged into {written}, {merged - written} files removed.",
+                    fg="green",
+                )
+            )
+
+    if jobs > 1:
+        try:
+            with AnvilProfiler.stage("write"):
+                AnvilExportPipeline.flush()
+        except AnvilExportError as e:
+            export_object_exception(e.object, e.error)
+            raise e.error from None
+
+    if MolangHoister.is_enabled():
+        hoisted, saved, actors = MolangHoister.summary()
+        click.echo(
+            click.style(
+                f"\r[INFO]: Molang hoisting: {hoisted} subexpressions moved to pre_animation in {actors} actors, about {saved} evaluations saved per frame.",
+                fg="green",
+            )
+        )
+
+    if AnvilBlockPermutations.is_enabled():
+        click.echo(AnvilBlockPermutations.report())
+        AnvilBlockPermutations.warn()
+
+    if "--worldgen-report" in sys.argv:
+        from anvil.api.features.density import worldgen_report
+
+        click.echo(worldgen_report(anvil._objects_list))
+
+    tick_budget = float(CONFIG._ENTITY_TICK_BUDGET)
+    if "--tick-report" in sys.argv:
+        click.echo(AnvilTickCost.report(tick_budget))
+    AnvilTickCost.warn(tick_budget)
+
+    if incremental:
+        with AnvilProfiler.stage("incremental"):
+            written, unchanged, removed = AnvilBuildManifest.finalize()
+        click.echo(
+            click.style(
+                f"\r[INFO]: Incremental build: {written} written, {unchanged} unchanged, {removed} removed.",
+                fg="green",
+            )
+        )
 
     if CONFIG._TARGET == ConfigPackageTarget.ADDON:
         if len(CONFIG._RP_UUID) > 1:
@@ -707,7 +861,8 @@ def translate(languages: Optional[list[str]] = None) -> None:
 
     click.echo(click.style(f"\r[INFO]: Translating in progress...", fg="cyan"))
 
-    AnvilTranslator().auto_translate_all(languages)
+    with AnvilProfiler.stage("translation"):
+        AnvilTranslator().auto_translate_all(languages)
 
 
 def clean_old_dev(config: _AnvilConfig):
@@ -946,6 +1101,11 @@ class _Anvil:
         if "--clean" in sys.argv:
             clean_old_dev(CONFIG)
 
+        if profile_format() is not None:
+            AnvilProfiler.begin()
+        # Collects the assets copied from now on, `compile` copies them once.
+        AnvilAssetSync.begin()
+
     def translate(self, languages: Optional[list[str]] = None) -> None:
         """Translates the project."""
         translate(languages)
@@ -972,6 +1132,7 @@ class _Anvil:
             generate_technical_notes or "--tech-notes" in sys.argv
         )
         clean_dev = "--clean" in sys.argv
+        profile = profile_format()
 
         if clean_dev and js_only:
             raise ValueError(
@@ -987,20 +1148,25 @@ class _Anvil:
             apply_overlay=apply_overlay,
         )
 
-        if no_arch:
-            return
+        if not no_arch:
+            with AnvilProfiler.stage("archives"):
+                if mcaddon:
+                    mcaddon_core(self.config)
+
+                if mcworld:
+                    mcworld_core(self.config)
 
-        if mcaddon:
-            mcaddon_core(self.config)
+                if zip:
+                    package_zip_core(self.config, apply_overlay)
 
-        if mcworld:
-            mcworld_core(self.config)
+                AnvilArchive.clear_cache()
 
-        if zip:
-            package_zip_core(self.config, apply_overlay)
+            if generate_technical_notes:
+                with AnvilProfiler.stage("technical notes"):
+                    generate_technical_notes_pdf(self.config)
 
-        if generate_technical_notes:
-            generate_technical_notes_pdf(self.config)
+        if profile is not None and AnvilProfiler.is_active():
+            AnvilProfiler.finish(profile)
 
     def __queue__(self, object: object):
         """Queues an object to be compiled."""
@@ -0,0 +1,306 @@
+"""Monte Carlo estimate of how many placements feature rules attempt per chunk.
+
+Every rule is simulated over a batch of chunks at once with NumPy: the scatter chance
+decides whether a chunk runs the rule at all, `iterations` how many positions it
+tries, and the coordinate distributions where those positions land. When the placed
+feature is a scatter feature of the project its own distribution is sampled for
+each attempt and summed per chunk, so nested scatters multiply.
+
+Molang iterations and coordinates are evaluated with the offline evaluator, queries
+reading 0 and `math.random` drawing from the simulation seed. Gaussian, inverse
+gaussian and triangle distributions are approximated by averaging uniform draws.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+import numpy as np
+
+from anvil.api.features.feature_rule import FeatureRule
+from anvil.api.features.features import ScatterFeature
+from anvil.api.logic.molang_ast import MolangSyntaxError, parse
+from anvil.api.logic.molang_eval import (
+    MolangContext,
+    MolangEvaluationError,
+    MolangInterpreter,
+)
+
+CHUNK_SIZE = 16
+# Coordinate draws kept per rule, enough for a stable in chunk ratio.
+_MAX_POSITIONS = 200_000
+# Molang coordinates and iterations are evaluated this many times and resampled.
+_MAX_MOLANG_SAMPLES = 1_000
+# Nested scatter draws per rule, beyond which the sum per chunk is approximated.
+_MAX_NESTED_DRAWS = 10_000_000
+
+
+@dataclass
+class FeatureDensity:
+    """Simulated placement attempts of a feature rule.
+
+    Attributes:
+        identifier (str): The identifier of the feature rule.
+        placement_pass (str): The placement pass of the rule.
+        attempts (float): Mean placement attempts per chunk.
+        deviation (float): Standard deviation of the attempts per chunk.
+        peak (float): Attempts of the busiest simulated chunk.
+        outside_chunk (float): Share of the positions landing outside the chunk on x or z.
+    """
+
+    identifier: str
+    placement_pass: str
+    attempts: float
+    deviation: float
+    peak: float
+    outside_chunk: float
+
+
+def _scatter_chance(value: Any) -> float:
+    if isinstance(value, dict):
+        return value.get("numerator", 1) / value.get("denominator", 1)
+    if isinstance(value, (int, float)):
+        return min(max(value / 100, 0.0), 1.0)
+    return 1.0
+
+
+def _molang(expression: Any, count: int, rng: np.random.Generator) -> np.ndarray:
+    """Evaluates a Molang expression once per simulated chunk."""
+    try:
+        tree = parse(str(expression))
+    except (MolangSyntaxError, RecursionError):
+        return np.zeros(count)
+
+    interpreter = MolangInterpreter(MolangContext(seed=int(rng.integers(2**31))))
+    values = np.empty(count)
+    for index in range(count):
+        try:
+            values[index] = float(interpreter.evaluate(tree))
+        except (MolangEvaluationError, TypeError, ValueError):
+            values[index] = 0.0
+    return values
+
+
+def _iterations(value: Any, count: int, rng: np.random.Generator) -> np.ndarray:
+    if isinstance(value, (int, float)):
+        return np.full(count, float(value))
+    values = _molang(value, min(count, _MAX_MOLANG_SAMPLES), rng)
+    return np.maximum(np.floor(rng.choice(values, count)), 0.0)
+
+
+def _sample_uniform(
+    rng: np.random.Generator, low: int, high: int, count: int, draws: int = 1
+) -> np.ndarray:
+    """Averages `draws` uniform values of `[low, high]`, rounded to blocks."""
+    samples = rng.random((draws, count)).mean(axis=0)
+    return np.floor(low + samples * (high - low + 1))
+
+
+def _grid_cells(coordinate: dict[str, Any]) -> int:
+    low, high = coordinate["extent"]
+    step = max(coordinate.get("step_size", 1), 1)
+    offset = coordinate.get("grid_offset", 0)
+    return max((high - low - offset) // step + 1, 1)
+
+
+def _coordinates(
+    coordinate: Any,
+    iteration: np.ndarray,
+    stride: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Samples one axis for every attempt.
+
+    Parameters:
+        coordinate (Any): The exported axis, a number, a Molang expression or a coordinate range.
+        iteration (np.ndarray): The iteration index of every attempt within its chunk.
+        stride (int): Iterations spent on each grid cell, grids evaluated earlier varying faster.
+        rng (np.random.Generator): The simulation random generator.
+    """
+    count = len(iteration)
+    if isinstance(coordinate, (int, float)):
+        return np.full(count, float(coordinate))
+    if not isinstance(coordinate, dict):
+        values = _molang(coordinate, min(count, _MAX_MOLANG_SAMPLES), rng)
+        return np.floor(rng.choice(values, count))
+
+    low, high = coordinate["extent"]
+    match coordinate["distribution"]:
+        case "uniform":
+            return _sample_uniform(rng, low, high, count)
+        case "triangle":
+            return _sample_uniform(rng, low, high, count, 2)
+        case "gaussian":
+            return _sample_uniform(rng, low, high, count, 4)
+        case "inverse_gaussian":
+            # A gaussian folded around the middle of the extent peaks on its edges.
+            centered = _sample_uniform(rng, low, high, count, 4) - (low + high) / 2
+            folded = np.where(centered < 0, high, low) + centered
+            return np.clip(np.floor(folded), low, high)
+        case "fixed_grid" | "jittered_grid":
+            step = max(coordinate.get("step_size", 1), 1)
+            offset = coordinate.get("grid_offset", 0)
+            cell = (iteration // stride) % _grid_cells(coordinate)
+            position = low + offset + cell * step
+            if coordinate["distribution"] == "jittered_grid":
+                position = position + rng.integers(0, step, count)
+            return np.minimum(position, high).astype(float)
+    raise ValueError(f"Unknown distribution '{coordinate['distribution']}'.")
+
+
+def _attempts(
+    distribution: dict[str, Any] | None, count: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Samples the attempts of a distribution in `count` chunks."""
+    if distribution is None:
+        return np.ones(count)
+    iterations = _iterations(distribution.get("iterations", 1), count, rng)
+    runs = rng.random(count) < _scatter_chance(distribution.get("scatter_chance"))
+    return iterations * runs
+
+
+def _nested_attempts(
+    distribution: dict[str, Any] | None, attempts: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    """Sums the attempts of a nested distribution, sampled for every outer attempt."""
+    counts = attempts.astype(np.int64)
+    total = int(counts.sum())
+    if total <= _MAX_NESTED_DRAWS:
+        sums = np.concatenate(([0.0], np.cumsum(_attempts(distribution, total, rng))))
+        ends = np.cumsum(counts)
+        return sums[ends] - sums[ends - counts]
+
+    # The sum of many draws is close to a normal distribution of the summed mean and
+    # variance.
+    draws = _attempts(distribution, _MAX_POSITIONS, rng)
+    mean, deviation = counts * draws.mean(), np.sqrt(counts * draws.var())
+    return np.maximum(np.rint(rng.normal(mean, deviation)), 0.0)
+
+
+def _outside_chunk(
+    distribution: dict[str, Any] | None, attempts: np.ndarray, rng: np.random.Generator
+) -> float:
+    """Share of the sampled positions that land outside the chunk on x or z."""
+    if distribution is None or not attempts.any():
+        return 0.0
+
+    attempts = attempts.astype(np.int64)
+    scale = min(1.0, _MAX_POSITIONS / attempts.sum())
+    if scale < 1.0:
+        attempts = np.floor(attempts * scale).astype(np.int64)
+    total = int(attempts.sum())
+    if total == 0:
+        return 0.0
+
+    # Index of every attempt within its chunk.
+    starts = np.repeat(np.cumsum(attempts) - attempts, attempts)
+    iteration = np.arange(total) - starts
+
+    stride = 1
+    outside = np.zeros(total, dtype=bool)
+    for axis in distribution.get("coordinate_eval_order", "xyz"):
+        coordinate = distribution.get(axis, 0)
+        values = _coordinates(coordinate, iteration, stride, rng)
+        if axis in "xz":
+            outside |= (values < 0) | (values >= CHUNK_SIZE)
+        if isinstance(coordinate, dict) and coordinate["distribution"].endswith("grid"):
+            stride *= _grid_cells(coordinate)
+    return float(outside.mean())
+
+
+def _rule_content(rule: FeatureRule) -> dict[str, Any]:
+    return rule._content["minecraft:feature_rules"]
+
+
+def _scatter_content(feature: ScatterFeature) -> dict[str, Any]:
+    return feature._content[ScatterFeature._feature_name]
+
+
+def simulate(
+    rules: Iterable[FeatureRule],
+    scatter_features: Iterable[ScatterFeature] = (),
+    chunks: int = 10_000,
+    seed: int = 0,
+) -> list[FeatureDensity]:
+    """Simulates the placement attempts of feature rules.
+
+    Parameters:
+        rules (Iterable[FeatureRule]): The feature rules to simulate.
+        scatter_features (Iterable[ScatterFeature], optional): Scatter features the rules may place, their distributions are simulated too. Defaults to ().
+        chunks (int, optional): The number of simulated chunks. Defaults to 10000.
+        seed (int, optional): The seed of the simulation. Defaults to 0.
+
+    Returns:
+        list[FeatureDensity]: The rules from the most to the least attempts per chunk.
+    """
+    rng = np.random.default_rng(seed)
+    scatters = {
+        str(feature.identifier): _scatter_content(feature)
+        for feature in scatter_features
+    }
+
+    results = []
+    for rule in rules:
+        content = _rule_content(rule)
+        distribution = content.get("distribution")
+        attempts = _attempts(distribution, chunks, rng)
+        outside = _outside_chunk(distribution, attempts, rng)
+
+        # Each attempt places the feature once, a scatter feature places its own
+        # distribution instead. A cycle of scatter features is only followed once.
+        placed = content["description"]["places_feature"]
+        seen = set()
+        while placed in scatters and placed not in seen:
+            seen.add(placed)
+            nested = scatters[placed]
+            attempts = _nested_attempts(nested.get("distribution"), attempts, rng)
+            placed = nested["places_feature"]
+
+        results.append(
+            FeatureDensity(
+                identifier=content["description"]["identifier"],
+                placement_pass=content.get("conditions", {}).get("placement_pass", ""),
+                attempts=float(attempts.mean()),
+                deviation=float(attempts.std()),
+                peak=float(attempts.max(initial=0)),
+                outside_chunk=outside,
+            )
+        )
+    return sorted(results, key=lambda result: result.attempts, reverse=True)
+
+
+def pass_totals(results: Iterable[FeatureDensity]) -> dict[str, float]:
+    """Sums the mean attempts per chunk of every placement pass."""
+    totals: dict[str, float] = {}
+    for result in results:
+        totals[result.placement_pass] = (
+            totals.get(result.placement_pass, 0.0) + result.attempts
+        )
+    return dict(sorted(totals.items(), key=lambda entry: entry[1], reverse=True))
+
+
+def report(results: list[FeatureDensity]) -> str:
+    """Formats the simulated rules and placement passes as a table."""
+    lines = [
+        f"{'Feature rule':<48} {'Attempts':>10} {'Std':>8} {'Peak':>8} {'Outside':>8}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.identifier:<48} {result.attempts:>10.2f} {result.deviation:>8.2f} "
+            f"{result.peak:>8.0f} {result.outside_chunk:>8.1%}"
+        )
+
+    lines.append("")
+    lines.append(f"{'Placement pass':<48} {'Attempts':>10}")
+    for placement_pass, attempts in pass_totals(results).items():
+        lines.append(f"{placement_pass:<48} {attempts:>10.2f}")
+    return "\n".join(lines)
+
+
+def worldgen_report(objects: Iterable[Any], chunks: int = 10_000) -> str:
+    """Simulates the feature rules among the objects of a project and formats the result."""
+    objects = list(objects)
+    rules = [obj for obj in objects if isinstance(obj, FeatureRule)]
+    if not rules:
+        return "No feature rules to simulate."
+    scatters = [obj for obj in objects if isinstance(obj, ScatterFeature)]
+    return report(simulate(rules, scatters, chunks))
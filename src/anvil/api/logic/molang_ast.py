@@ -0,0 +1,694 @@
+"""Molang expression trees.
+
+Parses Molang expressions into a small syntax tree, folds constant subexpressions
+and emits the shortest equivalent text: parentheses are only kept where operator
+precedence needs them, and `query.`, `variable.`, `context.` and `temp.` are
+shortened to their one letter aliases.
+
+Expressions that cannot be parsed, or whose meaning depends on an ambiguous
+precedence, are emitted unchanged.
+"""
+
+import math
+import re
+import struct
+from dataclasses import dataclass, field
+from decimal import Decimal
+from functools import lru_cache
+from typing import Callable, Optional
+
+
+class MolangSyntaxError(ValueError):
+    """Raised when an expression cannot be parsed safely."""
+
+
+# region Nodes
+
+
+@dataclass
+class Node:
+    parenthesized: bool = field(default=False, init=False, compare=False)
+
+
+@dataclass
+class Number(Node):
+    value: float
+    text: str
+
+
+@dataclass
+class String(Node):
+    value: str
+
+
+@dataclass
+class Name(Node):
+    """An identifier path such as `q.is_baby`, `v.x.y`, `math.pi` or `this`."""
+
+    name: str
+
+
+@dataclass
+class Call(Node):
+    function: Node
+    arguments: list[Node]
+
+
+@dataclass
+class Index(Node):
+    target: Node
+    index: Node
+
+
+@dataclass
+class Member(Node):
+    target: Node
+    member: str
+
+
+@dataclass
+class Arrow(Node):
+    left: Node
+    right: Node
+
+
+@dataclass
+class Unary(Node):
+    operator: str
+    operand: Node
+
+
+@dataclass
+class Binary(Node):
+    operator: str
+    left: Node
+    right: Node
+
+
+@dataclass
+class Conditional(Node):
+    """A ternary `c ? a : b`, or a binary conditional `c ? a` when `otherwise` is None."""
+
+    condition: Node
+    then: Node
+    otherwise: Optional[Node]
+
+
+@dataclass
+class Assign(Node):
+    target: Node
+    value: Node
+
+
+@dataclass
+class Return(Node):
+    value: Node
+
+
+@dataclass
+class Keyword(Node):
+    """`break` or `continue`."""
+
+    keyword: str
+
+
+@dataclass
+class Block(Node):
+    statements: list[Node]
+
+
+@dataclass
+class Program(Node):
+    """A list of statements, `terminated` when they end with a semicolon."""
+
+    statements: list[Node]
+    terminated: bool
+
+
+# endregion
+
+# region Parser
+
+_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(?P<number>(?:\d+\.?\d*|\.\d+)f?)"
+    r"|(?P<string>'[^']*')"
+    r"|(?P<name>[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)"
+    r"|(?P<op>&&|\|\||\?\?|==|!=|<=|>=|->|[-+*/!<>?:=()\[\]{},;.])"
+    r")"
+)
+
+_BINARY_PRECEDENCE = {
+    "||": 2,
+    "&&": 3,
+    "==": 4,
+    "!=": 4,
+    "<": 5,
+    "<=": 5,
+    ">": 5,
+    ">=": 5,
+    "+": 6,
+    "-": 6,
+    "*": 7,
+    "/": 7,
+}
+_KEYWORDS = ("return", "break", "continue")
+
+
+def _tokenize(expression: str) -> list[tuple[str, str]]:
+    tokens = []
+    position = 0
+    length = len(expression)
+    while position < length:
+        match = _TOKEN.match(expression, position)
+        if match is None or match.end() == position:
+            if expression[position:].strip() == "":
+                break
+            raise MolangSyntaxError(
+                f"Unexpected character at {position} in Molang expression: {expression}"
+            )
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, expression: str) -> None:
+        self._tokens = _tokenize(expression)
+        self._position = 0
+
+    def _peek(self, offset: int = 0) -> tuple[str, str] | None:
+        index = self._position + offset
+        return self._tokens[index] if index < len(self._tokens) else None
+
+    def _at(self, value: str) -> bool:
+        token = self._peek()
+        return token is not None and token[0] == "op" and token[1] == value
+
+    def _next(self) -> tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise MolangSyntaxError("Unexpected end of Molang expression.")
+        self._position += 1
+        return token
+
+    def _expect(self, value: str) -> None:
+        token = self._next()
+        if token != ("op", value):
+            raise MolangSyntaxError(f"Expected '{value}', found '{token[1]}'.")
+
+    def parse(self) -> Node:
+        statements = [self._statement()]
+        terminated = False
+        while self._at(";"):
+            self._next()
+            terminated = True
+            if self._peek() is None:
+                break
+            statements.append(self._statement())
+            terminated = False
+
+        if self._peek() is not None:
+            raise MolangSyntaxError(f"Unexpected token '{self._peek()[1]}'.")
+        if len(statements) == 1 and not terminated:
+            return statements[0]
+        return Program(statements, terminated)
+
+    def _statement(self) -> Node:
+        token = self._peek()
+        if token is not None and token[0] == "name" and token[1].lower() in _KEYWORDS:
+            keyword = token[1].lower()
+            self._next()
+            if keyword == "return":
+                return Return(self._expression())
+            return Keyword(keyword)
+        return self._expression()
+
+    def _block(self) -> Block:
+        self._expect("{")
+        statements = []
+        while not self._at("}"):
+            statements.append(self._statement())
+            if not self._at("}"):
+                self._expect(";")
+        self._expect("}")
+        return Block(statements)
+
+    def _expression(self) -> Node:
+        node = self._conditional()
+        if self._at("="):
+            self._next()
+            return Assign(node, self._expression())
+        return node
+
+    def _conditional(self) -> Node:
+        condition = self._nullish()
+        if not self._at("?"):
+            return condition
+
+        self._next()
+        # Branches may be statements, as in `t.i > 4 ? break;`.
+        then = self._statement()
+        otherwise = None
+        if self._at(":"):
+            self._next()
+            otherwise = self._statement()
+
+        # `??` and `?:` are not documented relative to each other, mixing them
+        # without parentheses is left untouched.
+        for child in (condition, then, otherwise):
+            if isinstance(child, Binary) and child.operator == "??":
+                if not child.parenthesized:
+                    raise MolangSyntaxError("Ambiguous mix of '??' and '?:'.")
+        return Conditional(condition, then, otherwise)
+
+    def _nullish(self) -> Node:
+        node = self._binary(2)
+        while self._at("??"):
+            self._next()
+            node = Binary("??", node, self._binary(2))
+        return node
+
+    def _binary(self, precedence: int) -> Node:
+        if precedence > 7:
+            return self._unary()
+
+        node = self._binary(precedence + 1)
+        while True:
+            token = self._peek()
+            if (
+                token is None
+                or token[0] != "op"
+                or _BINARY_PRECEDENCE.get(token[1]) != precedence
+            ):
+                return node
+            self._next()
+            node = Binary(token[1], node, self._binary(precedence + 1))
+
+    def _unary(self) -> Node:
+        if self._at("!") or self._at("-"):
+            operator = self._next()[1]
+            return Unary(operator, self._unary())
+        if self._at("+"):
+            self._next()
+            return self._unary()
+        return self._postfix()
+
+    def _postfix(self, arrows: bool = True) -> Node:
+        node = self._primary()
+        while True:
+            if self._at("("):
+                self._next()
+                arguments = []
+                while not self._at(")"):
+                    arguments.append(self._expression())
+                    if not self._at(")"):
+                        self._expect(",")
+                self._expect(")")
+                node = Call(node, arguments)
+            elif self._at("["):
+                self._next()
+                index = self._expression()
+                self._expect("]")
+                node = Index(node, index)
+            elif self._at("."):
+                self._next()
+                kind, text = self._next()
+                if kind != "name":
+                    raise MolangSyntaxError(f"Expected a member name, found '{text}'.")
+                for member in text.split("."):
+                    node = Member(node, member)
+            elif arrows and self._at("->"):
+                self._next()
+                node = Arrow(node, self._postfix(arrows=False))
+            else:
+                return node
+
+    def _primary(self) -> Node:
+        token = self._peek()
+        if token is None:
+            raise MolangSyntaxError("Unexpected end of Molang expression.")
+
+        kind, text = token
+        if kind == "number":
+            self._next()
+            value = float(text.rstrip("f"))
+            return Number(value, _format_number(value))
+        if kind == "string":
+            self._next()
+            return String(text[1:-1])
+        if kind == "name":
+            if text.lower() in _KEYWORDS:
+                raise MolangSyntaxError(f"Unexpected keyword '{text}'.")
+            self._next()
+            return Name(text)
+        if text == "(":
+            self._next()
+            node = self._expression()
+            self._expect(")")
+            node.parenthesized = True
+            return node
+        if text == "{":
+            return self._block()
+        raise MolangSyntaxError(f"Unexpected token '{text}'.")
+
+
+def parse(expression: str) -> Node:
+    """Parses a Molang expression or a list of statements.
+
+    Parameters:
+        expression (str): The Molang source.
+
+    Raises:
+        MolangSyntaxError: If the expression cannot be parsed.
+
+    Returns:
+        Node: The root of the syntax tree.
+    """
+    return _Parser(expression).parse()
+
+
+# endregion
+
+# region Folding
+
+
+def _truth(value: float) -> float:
+    return 1.0 if value else 0.0
+
+
+_FOLDED_BINARY: dict[str, Callable[[float, float], Optional[float]]] = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "/": lambda a, b: a / b if b != 0 else None,
+    "<": lambda a, b: _truth(a < b),
+    "<=": lambda a, b: _truth(a <= b),
+    ">": lambda a, b: _truth(a > b),
+    ">=": lambda a, b: _truth(a >= b),
+    "==": lambda a, b: _truth(a == b),
+    "!=": lambda a, b: _truth(a != b),
+    "&&": lambda a, b: _truth(a and b),
+    "||": lambda a, b: _truth(a or b),
+}
+
+_FOLDED_MATH: dict[str, Callable[..., Optional[float]]] = {
+    "abs": abs,
+    "ceil": lambda a: float(math.ceil(a)),
+    "floor": lambda a: float(math.floor(a)),
+    "min": min,
+    "max": max,
+    "clamp": lambda a, low, high: min(max(a, low), high),
+    "sqrt": lambda a: math.sqrt(a) if a >= 0 else None,
+}
+_FOLDED_ARITY = {"min": 2, "max": 2, "clamp": 3}
+
+
+def _number(value: Optional[float]) -> Optional[Number]:
+    if value is None or math.isinf(value) or math.isnan(value):
+        return None
+    value = float(value)
+    return Number(value, _format_number(value))
+
+
+def _format_number(value: float) -> str:
+    """Shortest text that reads back as the same 32 bit float, Molang's precision."""
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+
+    single = struct.unpack("f", struct.pack("f", value))[0]
+    for digits in range(1, 18):
+        text = f"{value:.{digits}g}"
+        if struct.unpack("f", struct.pack("f", float(text)))[0] == single:
+            break
+    if "e" in text:
+        # Molang has no exponent notation, write the same digits positionally.
+        text = format(Decimal(text), "f")
+    return text
+
+
+def fold(node: Node) -> Node:
+    """Folds constant subexpressions of a syntax tree.
+
+    Parameters:
+        node (Node): The syntax tree, modified in place.
+
+    Returns:
+        Node: The folded tree, a new node if the root itself was folded.
+    """
+    if isinstance(node, Binary):
+        node.left = fold(node.left)
+        node.right = fold(node.right)
+        if (
+            isinstance(node.left, Number)
+            and isinstance(node.right, Number)
+            and node.operator in _FOLDED_BINARY
+        ):
+            return (
+                _number(
+                    _FOLDED_BINARY[node.operator](node.left.value, node.right.value)
+                )
+                or node
+            )
+        return node
+
+    if isinstance(node, Unary):
+        node.operand = fold(node.operand)
+        if isinstance(node.operand, Number):
+            if node.operator == "-":
+                return _number(-node.operand.value) or node
+            return _number(_truth(not node.operand.value)) or node
+        return node
+
+    if isinstance(node, Conditional):
+        node.condition = fold(node.condition)
+        node.then = fold(node.then)
+        if node.otherwise is not None:
+            node.otherwise = fold(node.otherwise)
+        if isinstance(node.condition, Number) and node.otherwise is not None:
+            branch = node.then if node.condition.value else node.otherwise
+            if not isinstance(branch, (Assign, Block, Keyword, Return)):
+                return branch
+        return node
+
+    if isinstance(node, Call):
+        node.arguments = [fold(argument) for argument in node.arguments]
+        if (
+            isinstance(node.function, Name)
+            and node.function.name.lower().startswith("math.")
+            and all(isinstance(argument, Number) for argument in node.arguments)
+        ):
+            function = node.function.name.lower()[len("math.") :]
+            operation = _FOLDED_MATH.get(function)
+            if operation is not None and len(node.arguments) == _FOLDED_ARITY.get(
+                function, 1
+            ):
+                return (
+                    _number(operation(*(argument.value for argument in node.arguments)))
+                    or node
+                )
+        return node
+
+    if isinstance(node, Index):
+        node.target = fold(node.target)
+        node.index = fold(node.index)
+    elif isinstance(node, Member):
+        node.target = fold(node.target)
+    elif isinstance(node, Arrow):
+        node.left = fold(node.left)
+        node.right = fold(node.right)
+    elif isinstance(node, Assign):
+        node.value = fold(node.value)
+    elif isinstance(node, Return):
+        node.value = fold(node.value)
+    elif isinstance(node, (Block, Program)):
+        node.statements = [fold(statement) for statement in node.statements]
+    return node
+
+
+# endregion
+
+# region Emission
+
+_SHORT_PREFIXES = {
+    "query.": "q.",
+    "variable.": "v.",
+    "context.": "c.",
+    "temp.": "t.",
+}
+
+# Precedence of emitted nodes, higher binds tighter.
+_ATOM = 9
+_UNARY = 8
+_CONDITIONAL = 1
+_ASSIGN = 0
+
+
+def _short_name(name: str) -> str:
+    lowered = name.lower()
+    for prefix, short in _SHORT_PREFIXES.items():
+        if lowered.startswith(prefix):
+            return short + name[len(prefix) :]
+    return name
+
+
+def _wrap(text: str, wrap: bool) -> str:
+    return f"({text})" if wrap else text
+
+
+def _emit(node: Node) -> tuple[str, int]:
+    if isinstance(node, Number):
+        if node.value < 0:
+            return node.text, _UNARY
+        return node.text, _ATOM
+    if isinstance(node, String):
+        return f"'{node.value}'", _ATOM
+    if isinstance(node, Name):
+        return _short_name(node.name), _ATOM
+    if isinstance(node, Keyword):
+        return node.keyword, _ATOM
+
+    if isinstance(node, Call):
+        function, precedence = _emit(node.function)
+        arguments = ",".join(_emit(argument)[0] for argument in node.arguments)
+        return f"{_wrap(function, precedence < _ATOM)}({arguments})", _ATOM
+    if isinstance(node, Index):
+        target, precedence = _emit(node.target)
+        return f"{_wrap(target, precedence < _ATOM)}[{_emit(node.index)[0]}]", _ATOM
+    if isinstance(node, Member):
+        target, precedence = _emit(node.target)
+        return f"{_wrap(target, precedence < _ATOM)}.{node.member}", _ATOM
+    if isinstance(node, Arrow):
+        left, left_precedence = _emit(node.left)
+        right, right_precedence = _emit(node.right)
+        return (
+            f"{_wrap(left, left_precedence < _ATOM)}->"
+            f"{_wrap(right, right_precedence < _ATOM)}",
+            _ATOM,
+        )
+
+    if isinstance(node, Unary):
+        operand, precedence = _emit(node.operand)
+        # Avoids `--x` and `-(-1)` reading as another token.
+        wrap = precedence < _UNARY or (node.operator == "-" and operand.startswith("-"))
+        return f"{node.operator}{_wrap(operand, wrap)}", _UNARY
+
+    if isinstance(node, Binary):
+        if node.operator == "??":
+            # The precedence of `??` is not documented, its operands are only left
+            # bare when they bind tighter than any operator.
+            left, left_precedence = _emit(node.left)
+            right, right_precedence = _emit(node.right)
+            return (
+                f"{_wrap(left, left_precedence < _UNARY)}??"
+                f"{_wrap(right, right_precedence < _UNARY)}",
+                _CONDITIONAL,
+            )
+
+        precedence = _BINARY_PRECEDENCE[node.operator]
+        associative = node.operator in ("&&", "||")
+        left, left_precedence = _emit(node.left)
+        right, right_precedence = _emit(node.right)
+        wrap_left = left_precedence < precedence or (
+            left_precedence == precedence and precedence in (4, 5)
+        )
+        wrap_right = (
+            right_precedence < precedence
+            or (
+                right_precedence == precedence
+                and not (
+                    associative
+                    and isinstance(node.right, Binary)
+                    and node.right.operator == node.operator
+                )
+            )
+            # Avoids `a--1`.
+            or (node.operator == "-" and right.startswith("-"))
+        )
+        return (
+            f"{_wrap(left, wrap_left)}{node.operator}{_wrap(right, wrap_right)}",
+            precedence,
+        )
+
+    if isinstance(node, Conditional):
+        condition, condition_precedence = _emit(node.condition)
+        text = _wrap(condition, condition_precedence <= _CONDITIONAL) + "?"
+        for index, branch in enumerate((node.then, node.otherwise)):
+            if branch is None:
+                continue
+            branch_text, branch_precedence = _emit(branch)
+            if index:
+                text += ":"
+            text += _wrap(branch_text, branch_precedence == _CONDITIONAL)
+        return text, _CONDITIONAL
+
+    if isinstance(node, Assign):
+        target, _ = _emit(node.target)
+        return f"{target}={_emit(node.value)[0]}", _ASSIGN
+    if isinstance(node, Return):
+        return f"return {_emit(node.value)[0]}", _ASSIGN
+    if isinstance(node, Block):
+        return "{" + "".join(_emit(s)[0] + ";" for s in node.statements) + "}", _ATOM
+    if isinstance(node, Program):
+        text = ";".join(_emit(statement)[0] for statement in node.statements)
+        return text + (";" if node.terminated else ""), _ASSIGN
+
+    raise MolangSyntaxError(f"Unknown Molang node {node.__class__.__name__}.")
+
+
+def emit(node: Node) -> str:
+    """Emits the shortest text of a syntax tree.
+
+    Parameters:
+        node (Node): The syntax tree.
+
+    Returns:
+        str: The Molang expression.
+    """
+    return _emit(node)[0]
+
+
+# endregion
+
+
+@lru_cache(maxsize=4096)
+def optimize(expression: str) -> str:
+    """Folds and minifies a Molang expression, leaving it unchanged if it cannot be parsed.
+
+    Parameters:
+        expression (str): The Molang expression.
+
+    Returns:
+        str: The shortest equivalent expression.
+    """
+    try:
+        optimized = emit(fold(parse(expression)))
+    except (MolangSyntaxError, RecursionError):
+        return expression
+    return optimized if len(optimized) <= len(expression) else expression
+
+
+class MolangOptimizer:
+    """Optional optimization of the Molang expressions written to the packs.
+
+    Off by default, `Molang` values are then exported exactly as they were built.
+    """
+
+    _enabled: bool = False
+
+    @classmethod
+    def enable(cls, enabled: bool = True) -> None:
+        cls._enabled = enabled
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def export(cls, molang: str) -> str:
+        """Returns the exported form of a Molang value."""
+        text = str.replace(molang, "\\", "/")
+        if not cls._enabled:
+            return text
+        return optimize(text)
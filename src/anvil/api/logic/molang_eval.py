@@ -0,0 +1,678 @@
+"""Offline evaluation of Molang expressions.
+
+Expressions built with `Molang`, `Query`, `Variable` and `Math` are parsed with
+`molang_ast` and interpreted against a `MolangContext` holding mock query values and
+variables, so they can be tested without the game. Every evaluation counts the
+operations executed and the queries read, a deterministic cost that can be compared
+between builds, and `cost` estimates the same figures statically.
+"""
+
+import json
+import math
+import os
+import random
+import timeit
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from anvil.api.logic.molang_ast import (
+    Arrow,
+    Assign,
+    Binary,
+    Block,
+    Call,
+    Conditional,
+    Index,
+    Keyword,
+    Member,
+    MolangSyntaxError,
+    Name,
+    Node,
+    Number,
+    Program,
+    Return,
+    String,
+    Unary,
+    _short_name,
+    parse,
+)
+
+__all__ = [
+    "MolangContext",
+    "MolangCost",
+    "MolangEvaluationError",
+    "MolangInterpreter",
+    "benchmark",
+    "cost",
+    "evaluate",
+    "pack_costs",
+]
+
+# The game stops loops after 1024 iterations.
+MAX_LOOP_ITERATIONS = 1024
+
+
+class MolangEvaluationError(ValueError):
+    """Raised when an expression cannot be evaluated."""
+
+
+@dataclass
+class MolangCost:
+    """Operations executed and queries read by an expression."""
+
+    operations: int = 0
+    queries: int = 0
+
+    def __add__(self, other: "MolangCost") -> "MolangCost":
+        return MolangCost(
+            self.operations + other.operations, self.queries + other.queries
+        )
+
+    def __mul__(self, times: int) -> "MolangCost":
+        return MolangCost(self.operations * times, self.queries * times)
+
+
+@dataclass
+class MolangBenchmark:
+    value: Any
+    cost: MolangCost
+    seconds: float
+
+
+class MolangContext:
+    """The mock entity an expression is evaluated on.
+
+    Query values may be numbers, strings, lists, other contexts (the targets of `->`)
+    or callables receiving the query arguments. Unknown queries and variables read 0.
+    """
+
+    def __init__(
+        self,
+        queries: Optional[dict[str, Any]] = None,
+        variables: Optional[dict[str, Any]] = None,
+        context: Optional[dict[str, Any]] = None,
+        arrays: Optional[dict[str, list]] = None,
+        seed: Optional[int] = 0,
+    ) -> None:
+        """Creates a mock entity.
+
+        Parameters:
+            queries (dict[str, Any], optional): Query values, keyed with or without the `q.` prefix. Defaults to None.
+            variables (dict[str, Any], optional): Variable values, keyed with or without the `v.` prefix. Defaults to None.
+            context (dict[str, Any], optional): Context values, keyed with or without the `c.` prefix. Defaults to None.
+            arrays (dict[str, list], optional): Render controller arrays, such as `Array.skins`. Defaults to None.
+            seed (int, optional): The seed of the random math functions. Defaults to 0.
+        """
+        self.queries = {
+            _key(name, "q."): value for name, value in (queries or {}).items()
+        }
+        self.variables = {
+            _key(name, "v."): value for name, value in (variables or {}).items()
+        }
+        self.context = {
+            _key(name, "c."): value for name, value in (context or {}).items()
+        }
+        self.arrays = {name.lower(): value for name, value in (arrays or {}).items()}
+        self.random = random.Random(seed)
+
+
+def _key(name: str, prefix: str) -> str:
+    return _short_name(name).lower().removeprefix(prefix)
+
+
+def _number(value: Any) -> float:
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    raise MolangEvaluationError(f"Expected a number, found {value!r}.")
+
+
+def _truthy(value: Any) -> bool:
+    if isinstance(value, (int, float)):
+        return value != 0
+    return bool(value)
+
+
+def _divide(a: float, b: float) -> float:
+    # Molang runs on 32 bit floats, dividing by zero does not fail.
+    if b == 0:
+        return math.nan if a == 0 else math.copysign(math.inf, a) * math.copysign(1, b)
+    return a / b
+
+
+def _min_angle(value: float) -> float:
+    value = math.fmod(value + 180, 360)
+    return (value + 360 if value < 0 else value) - 180
+
+
+def _bounce_out(t: float) -> float:
+    if t < 1 / 2.75:
+        return 7.5625 * t * t
+    if t < 2 / 2.75:
+        t -= 1.5 / 2.75
+        return 7.5625 * t * t + 0.75
+    if t < 2.5 / 2.75:
+        t -= 2.25 / 2.75
+        return 7.5625 * t * t + 0.9375
+    t -= 2.625 / 2.75
+    return 7.5625 * t * t + 0.984375
+
+
+def _elastic_in(t: float) -> float:
+    if t in (0, 1):
+        return t
+    return -(2 ** (10 * t - 10)) * math.sin((t * 10 - 10.75) * (2 * math.pi / 3))
+
+
+def _in_out(ease_in: Callable[[float], float]) -> Callable[[float], float]:
+    return lambda t: (ease_in(t * 2) / 2 if t < 0.5 else 1 - ease_in((1 - t) * 2) / 2)
+
+
+def _out(ease_in: Callable[[float], float]) -> Callable[[float], float]:
+    return lambda t: 1 - ease_in(1 - t)
+
+
+_EASE_IN: dict[str, Callable[[float], float]] = {
+    "quad": lambda t: t**2,
+    "cubic": lambda t: t**3,
+    "quart": lambda t: t**4,
+    "quint": lambda t: t**5,
+    "sine": lambda t: 1 - math.cos(t * math.pi / 2),
+    "expo": lambda t: 0.0 if t == 0 else 2 ** (10 * t - 10),
+    "circ": lambda t: 1 - math.sqrt(max(0.0, 1 - t * t)),
+    "bounce": lambda t: 1 - _bounce_out(1 - t),
+    "back": lambda t: 2.70158 * t**3 - 1.70158 * t**2,
+    "elastic": _elastic_in,
+}
+
+_EASINGS: dict[str, Callable[[float], float]] = {}
+for _name, _ease_in in _EASE_IN.items():
+    _EASINGS[f"ease_in_{_name}"] = _ease_in
+    _EASINGS[f"ease_out_{_name}"] = _out(_ease_in)
+    _EASINGS[f"ease_in_out_{_name}"] = _in_out(_ease_in)
+
+
+def _die_roll(rng: random.Random, count: float, low: float, high: float) -> float:
+    return sum(rng.uniform(low, high) for _ in range(int(count)))
+
+
+def _die_roll_integer(rng: random.Random, count: float, low: float, high: float):
+    return float(sum(rng.randint(int(low), int(high)) for _ in range(int(count))))
+
+
+# Trigonometry works in degrees.
+_MATH: dict[str, Callable[..., float]] = {
+    "abs": abs,
+    "acos": lambda a: math.degrees(math.acos(a)),
+    "asin": lambda a: math.degrees(math.asin(a)),
+    "atan": lambda a: math.degrees(math.atan(a)),
+    "atan2": lambda y, x: math.degrees(math.atan2(y, x)),
+    "ceil": lambda a: float(math.ceil(a)),
+    "clamp": lambda a, low, high: min(max(a, low), high),
+    "cos": lambda a: math.cos(math.radians(a)),
+    "exp": math.exp,
+    "floor": lambda a: float(math.floor(a)),
+    "hermite_blend": lambda t: 3 * t * t - 2 * t * t * t,
+    "lerp": lambda start, end, t: start + (end - start) * t,
+    "lerprotate": lambda start, end, t: start + _min_angle(end - start) * t,
+    "inverse_lerp": lambda start, end, value: (
+        0.0 if start == end else (value - start) / (end - start)
+    ),
+    "ln": math.log,
+    "max": max,
+    "min": min,
+    "min_angle": _min_angle,
+    "mod": math.fmod,
+    "pow": math.pow,
+    "round": lambda a: float(math.floor(a + 0.5)),
+    "sin": lambda a: math.sin(math.radians(a)),
+    "sqrt": math.sqrt,
+    "trunc": lambda a: float(math.trunc(a)),
+    **{
+        name: (lambda ease: lambda start, end, t: start + (end - start) * ease(t))(ease)
+        for name, ease in _EASINGS.items()
+    },
+}
+_RANDOM_MATH: dict[str, Callable[..., float]] = {
+    "random": lambda rng, low, high: rng.uniform(low, high),
+    "random_integer": lambda rng, low, high: float(rng.randint(int(low), int(high))),
+    "die_roll": _die_roll,
+    "die_roll_integer": _die_roll_integer,
+}
+
+
+class _Return(Exception):
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+class _Break(Exception):
+    pass
+
+
+class _Continue(Exception):
+    pass
+
+
+_MISSING = object()
+
+
+class MolangInterpreter:
+    """Evaluates syntax trees and counts the operations and queries they execute."""
+
+    def __init__(self, context: Optional[MolangContext] = None) -> None:
+        self.context = context or MolangContext()
+        self.cost = MolangCost()
+        self._temps: dict[str, Any] = {}
+
+    def evaluate(self, node: Node) -> Any:
+        """Evaluates an expression, counting its cost from zero.
+
+        Temporary variables only live during the call, variables are kept on the context.
+        """
+        self._temps = {}
+        self.cost = MolangCost()
+        if isinstance(node, Program):
+            try:
+                for statement in node.statements:
+                    self._eval(statement)
+            except _Return as result:
+                return result.value
+            except (_Break, _Continue):
+                raise MolangEvaluationError("'break' or 'continue' outside a loop.")
+            return 0.0
+        try:
+            return self._value(node)
+        except _Return as result:
+            return result.value
+
+    # region Names
+
+    def _read(self, name: str) -> Any:
+        short = _short_name(name).lower()
+        prefix, _, rest = short.partition(".")
+
+        if prefix == "q":
+            self.cost.queries += 1
+            value = self.context.queries.get(rest, 0.0)
+            return value() if callable(value) else value
+        if prefix == "v":
+            return self.context.variables.get(rest, _MISSING)
+        if prefix == "t":
+            return self._temps.get(rest, _MISSING)
+        if prefix == "c":
+            return self.context.context.get(rest, _MISSING)
+        if short == "math.pi":
+            return math.pi
+        # Python booleans are written as JSON literals by the builder.
+        if short == "true":
+            return 1.0
+        if short == "false":
+            return 0.0
+        if prefix == "array":
+            return self.context.arrays.get(short, [])
+        if short == "this":
+            return self.context.context.get("this", 0.0)
+        # Geometry., Texture. and Material. references evaluate to themselves.
+        return name
+
+    def _assign(self, target: Node, value: Any) -> None:
+        if not isinstance(target, Name):
+            raise MolangEvaluationError("Only variables can be assigned.")
+        short = _short_name(target.name).lower()
+        prefix, _, rest = short.partition(".")
+        if prefix == "v":
+            self.context.variables[rest] = value
+        elif prefix == "t":
+            self._temps[rest] = value
+        elif prefix == "c":
+            self.context.context[rest] = value
+        else:
+            raise MolangEvaluationError(f"'{target.name}' cannot be assigned.")
+
+    def _value(self, node: Node) -> Any:
+        value = self._eval(node)
+        return 0.0 if value is _MISSING else value
+
+    # endregion
+
+    def _eval(self, node: Node) -> Any:
+        if isinstance(node, Number):
+            return node.value
+        if isinstance(node, String):
+            return node.value
+        if isinstance(node, Name):
+            return self._read(node.name)
+
+        if isinstance(node, Block):
+            for statement in node.statements:
+                self._eval(statement)
+            return 0.0
+
+        if isinstance(node, Return):
+            raise _Return(self._value(node.value))
+
+        if isinstance(node, Keyword):
+            raise _Break() if node.keyword == "break" else _Continue()
+
+        if isinstance(node, Program):
+            raise MolangEvaluationError("Statements cannot be nested.")
+
+        self.cost.operations += 1
+
+        if isinstance(node, Unary):
+            operand = self._value(node.operand)
+            if node.operator == "-":
+                return -_number(operand)
+            return float(not _truthy(operand))
+
+        if isinstance(node, Binary):
+            return self._binary(node)
+
+        if isinstance(node, Conditional):
+            if _truthy(self._value(node.condition)):
+                return self._value(node.then)
+            if node.otherwise is None:
+                return 0.0
+            return self._value(node.otherwise)
+
+        if isinstance(node, Assign):
+            value = self._value(node.value)
+            self._assign(node.target, value)
+            return value
+
+        if isinstance(node, Call):
+            return self._call(node)
+
+        if isinstance(node, Index):
+            array = self._value(node.target)
+            if not isinstance(array, list) or not array:
+                return 0.0
+            index = int(_number(self._value(node.index)))
+            return array[min(max(index, 0), len(array) - 1)]
+
+        if isinstance(node, Member):
+            target = self._value(node.target)
+            if isinstance(target, dict):
+                return target.get(node.member.lower(), 0.0)
+            return 0.0
+
+        if isinstance(node, Arrow):
+            target = self._value(node.left)
+            if not isinstance(target, MolangContext):
+                return 0.0
+            context, self.context = self.context, target
+            try:
+                return self._value(node.right)
+            finally:
+                self.context = context
+
+        raise MolangEvaluationError(f"Cannot evaluate {type(node).__name__}.")
+
+    def _binary(self, node: Binary) -> Any:
+        operator = node.operator
+        if operator == "&&":
+            return float(
+                _truthy(self._value(node.left)) and _truthy(self._value(node.right))
+            )
+        if operator == "||":
+            return float(
+                _truthy(self._value(node.left)) or _truthy(self._value(node.right))
+            )
+        if operator == "??":
+            left = self._eval(node.left)
+            return self._value(node.right) if left is _MISSING else left
+
+        left = self._value(node.left)
+        right = self._value(node.right)
+        if operator == "==":
+            return float(left == right)
+        if operator == "!=":
+            return float(left != right)
+
+        left, right = _number(left), _number(right)
+        if operator == "+":
+            return left + right
+        if operator == "-":
+            return left - right
+        if operator == "*":
+            return left * right
+        if operator == "/":
+            return _divide(left, right)
+        if operator == "<":
+            return float(left < right)
+        if operator == "<=":
+            return float(left <= right)
+        if operator == ">":
+            return float(left > right)
+        return float(left >= right)
+
+    def _call(self, node: Call) -> Any:
+        if not isinstance(node.function, Name):
+            raise MolangEvaluationError("Only named functions can be called.")
+        name = _short_name(node.function.name).lower()
+
+        if name == "loop":
+            if len(node.arguments) != 2:
+                raise MolangEvaluationError("'loop' expects a count and a body.")
+            count = int(_number(self._value(node.arguments[0])))
+            self._loop(node.arguments[1], range(min(count, MAX_LOOP_ITERATIONS)))
+            return 0.0
+
+        if name == "for_each":
+            if len(node.arguments) != 3:
+                raise MolangEvaluationError(
+                    "'for_each' expects a variable, an array and a body."
+                )
+            target, array, body = node.arguments
+            items = self._value(array)
+            if not isinstance(items, list):
+                raise MolangEvaluationError("'for_each' expects an array.")
+            self._loop(body, items, target)
+            return 0.0
+
+        arguments = [self._value(argument) for argument in node.arguments]
+        prefix, _, function = name.partition(".")
+        if prefix == "q":
+            self.cost.queries += 1
+            value = self.context.queries.get(function, 0.0)
+            return value(*arguments) if callable(value) else value
+        if prefix == "math":
+            arguments = [_number(argument) for argument in arguments]
+            try:
+                if function in _RANDOM_MATH:
+                    return _RANDOM_MATH[function](self.context.random, *arguments)
+                if function in _MATH:
+                    return float(_MATH[function](*arguments))
+            except (TypeError, ValueError, OverflowError) as error:
+                raise MolangEvaluationError(f"'{name}': {error}") from None
+        raise MolangEvaluationError(f"Unknown function '{node.function.name}'.")
+
+    def _loop(self, body: Node, items, target: Optional[Node] = None) -> None:
+        for item in items:
+            if target is not None:
+                self._assign(target, item)
+            try:
+                self._eval(body)
+            except _Break:
+                break
+            except _Continue:
+                continue
+
+
+def evaluate(expression: str, context: Optional[MolangContext] = None) -> Any:
+    """Evaluates a Molang expression.
+
+    Parameters:
+        expression (str): The Molang expression, such as a `Molang` instance.
+        context (MolangContext, optional): The mock entity. Defaults to an entity whose queries all read 0.
+
+    Raises:
+        MolangSyntaxError: If the expression cannot be parsed.
+        MolangEvaluationError: If the expression cannot be evaluated.
+
+    Returns:
+        Any: The value of the expression, usually a float.
+    """
+    return MolangInterpreter(context).evaluate(parse(str(expression)))
+
+
+def benchmark(
+    expression: str, context: Optional[MolangContext] = None, repeat: int = 1000
+) -> MolangBenchmark:
+    """Evaluates an expression, counting its operations and timing it.
+
+    Parameters:
+        expression (str): The Molang expression.
+        context (MolangContext, optional): The mock entity. Defaults to an entity whose queries all read 0.
+        repeat (int, optional): The number of timed evaluations. Defaults to 1000.
+
+    Returns:
+        MolangBenchmark: The value, the cost of one evaluation and the mean evaluation time in seconds.
+    """
+    tree = parse(str(expression))
+    interpreter = MolangInterpreter(context)
+    value = interpreter.evaluate(tree)
+    measured = interpreter.cost
+
+    seconds = timeit.timeit(lambda: interpreter.evaluate(tree), number=repeat)
+    return MolangBenchmark(value, measured, seconds / max(repeat, 1))
+
+
+def _static_cost(node: Node) -> MolangCost:
+    if isinstance(node, (Number, String)):
+        return MolangCost()
+    if isinstance(node, Name):
+        return MolangCost(0, int(_short_name(node.name).lower().startswith("q.")))
+
+    if isinstance(node, Call) and isinstance(node.function, Name):
+        name = _short_name(node.function.name).lower()
+        arguments = [_static_cost(argument) for argument in node.arguments]
+        if name == "loop" and len(node.arguments) == 2:
+            count = node.arguments[0]
+            # Loops with a computed count are counted once.
+            times = 1
+            if isinstance(count, Number):
+                times = max(0, min(int(count.value), MAX_LOOP_ITERATIONS))
+            return MolangCost(1) + arguments[0] + arguments[1] * times
+        total = MolangCost(1, int(name.startswith("q.")))
+        for argument in arguments:
+            total += argument
+        return total
+
+    if isinstance(node, Conditional):
+        branches = [_static_cost(node.then)]
+        if node.otherwise is not None:
+            branches.append(_static_cost(node.otherwise))
+        heaviest = max(branches, key=lambda branch: (branch.operations, branch.queries))
+        return MolangCost(1) + _static_cost(node.condition) + heaviest
+
+    total = MolangCost(0 if isinstance(node, (Block, Keyword, Program, Return)) else 1)
+    for child in _children(node):
+        total += _static_cost(child)
+    return total
+
+
+def _children(node: Node) -> list[Node]:
+    if isinstance(node, Unary):
+        return [node.operand]
+    if isinstance(node, (Binary, Arrow)):
+        return [node.left, node.right]
+    if isinstance(node, Assign):
+        return [node.target, node.value]
+    if isinstance(node, Call):
+        return [node.function, *node.arguments]
+    if isinstance(node, Index):
+        return [node.target, node.index]
+    if isinstance(node, Member):
+        return [node.target]
+    if isinstance(node, Return):
+        return [node.value]
+    if isinstance(node, (Block, Program)):
+        return node.statements
+    return []
+
+
+def cost(expression: str) -> MolangCost:
+    """Estimates the operations and queries of an expression without evaluating it.
+
+    Both branches of `&&` and `||` are counted and the heaviest branch of a
+    conditional, so the estimate is the worst case. Loops with a literal count are
+    unrolled, other loops and `for_each` are counted once.
+
+    Parameters:
+        expression (str): The Molang expression.
+
+    Raises:
+        MolangSyntaxError: If the expression cannot be parsed.
+
+    Returns:
+        MolangCost: The estimated cost of one evaluation.
+    """
+    return _static_cost(parse(str(expression)))
+
+
+def _strings(value: Any, location: str) -> list[tuple[str, str]]:
+    if isinstance(value, str):
+        return [(location, value)]
+    if isinstance(value, dict):
+        return [
+            found
+            for key, child in value.items()
+            for found in _strings(child, f"{location}/{key}")
+        ]
+    if isinstance(value, list):
+        return [
+            found
+            for index, child in enumerate(value)
+            for found in _strings(child, f"{location}/{index}")
+        ]
+    return []
+
+
+def pack_costs(paths: list[str]) -> list[tuple[str, str, MolangCost]]:
+    """Estimates the cost of every Molang expression of the animation and render controllers of packs.
+
+    Parameters:
+        paths (list[str]): Pack directories or controller files.
+
+    Returns:
+        list[tuple[str, str, MolangCost]]: The location, expression and cost of each expression, heaviest first.
+    """
+    files = []
+    for path in paths:
+        if os.path.isfile(path):
+            files.append(path)
+            continue
+        for directory, _, names in os.walk(path):
+            files.extend(
+                os.path.join(directory, name)
+                for name in sorted(names)
+                if name.endswith(".json")
+            )
+
+    costs = []
+    for file in files:
+        try:
+            with open(file, "r", encoding="utf-8") as handle:
+                content = json.load(handle)
+        except (OSError, ValueError):
+            continue
+        if not isinstance(content, dict):
+            continue
+
+        for section in ("animation_controllers", "render_controllers"):
+            for location, expression in _strings(
+                content.get(section, {}), f"{file}:{section}"
+            ):
+                try:
+                    estimated = cost(expression)
+                except (MolangSyntaxError, RecursionError):
+                    # Commands, events and plain names.
+                    continue
+                if estimated.operations or estimated.queries:
+                    costs.append((location, expression, estimated))
+
+    costs.sort(key=lambda found: (found[2].operations, found[2].queries), reverse=True)
+    return costs
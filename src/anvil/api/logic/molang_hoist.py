@@ -0,0 +1,244 @@
+"""Pack wide interning and hoisting of repeated Molang subexpressions.
+
+Render controllers, animation controllers and the `animate` conditions of a client
+actor are all evaluated every frame. When the same query based subexpression appears
+in several of them it is computed once per use. The hoister moves such
+subexpressions into `pre_animation` variables, so the client evaluates them once per
+frame and the other expressions read the variable.
+
+Only subexpressions made of queries, math functions and literals are hoisted, and only
+from positions that are always evaluated: never from the right side of `&&`, `||`
+and `??`, nor from the branches of a conditional.
+"""
+
+from collections import Counter
+from typing import Any, Iterator
+
+from anvil.api.logic.molang import Molang
+from anvil.api.logic.molang_ast import (
+    Binary,
+    Call,
+    Conditional,
+    Index,
+    MolangSyntaxError,
+    Name,
+    Node,
+    Number,
+    String,
+    Unary,
+    _short_name,
+    emit,
+    parse,
+)
+
+# Queries whose value depends on the animation or state evaluating them, or that
+# change between two reads of the same frame.
+_VOLATILE_QUERIES = frozenset(
+    {
+        "q.anim_time",
+        "q.key_frame_lerp_time",
+        "q.all_animations_finished",
+        "q.any_animation_finished",
+        "q.state_time",
+        "math.random",
+        "math.random_integer",
+        "math.die_roll",
+        "math.die_roll_integer",
+    }
+)
+_MIN_SIZE = 3
+
+
+def _is_stable_name(name: str) -> bool:
+    name = _short_name(name).lower()
+    if not name.startswith(("q.", "math.")):
+        return False
+    return name not in _VOLATILE_QUERIES and not name.startswith("q.bone_")
+
+
+def _is_pure(node: Node) -> bool:
+    """Checks whether a subexpression has the same value everywhere in a frame."""
+    if isinstance(node, (Number, String)):
+        return True
+    if isinstance(node, Name):
+        return _is_stable_name(node.name)
+    if isinstance(node, Call):
+        return (
+            isinstance(node.function, Name)
+            and _is_stable_name(node.function.name)
+            and all(_is_pure(argument) for argument in node.arguments)
+        )
+    if isinstance(node, Unary):
+        return _is_pure(node.operand)
+    if isinstance(node, Binary):
+        return _is_pure(node.left) and _is_pure(node.right)
+    if isinstance(node, Conditional):
+        return (
+            node.otherwise is not None
+            and _is_pure(node.condition)
+            and _is_pure(node.then)
+            and _is_pure(node.otherwise)
+        )
+    return False
+
+
+def _size(node: Node) -> int:
+    return 1 + sum(_size(child) for child in _children(node))
+
+
+def _children(node: Node) -> list[Node]:
+    if isinstance(node, Call):
+        return list(node.arguments)
+    if isinstance(node, Unary):
+        return [node.operand]
+    if isinstance(node, Binary):
+        return [node.left, node.right]
+    if isinstance(node, Conditional):
+        return [node.condition, node.then] + (
+            [node.otherwise] if node.otherwise is not None else []
+        )
+    if isinstance(node, Index):
+        return [node.target, node.index]
+    return []
+
+
+def _evaluated(node: Node) -> list[tuple[str, Node]]:
+    """The child fields of a node that are evaluated whenever the node is."""
+    if isinstance(node, Binary):
+        if node.operator in ("&&", "||", "??"):
+            return [("left", node.left)]
+        return [("left", node.left), ("right", node.right)]
+    if isinstance(node, Unary):
+        return [("operand", node.operand)]
+    if isinstance(node, Conditional):
+        return [("condition", node.condition)]
+    if isinstance(node, Index):
+        return [("target", node.target), ("index", node.index)]
+    if isinstance(node, Call):
+        return [(index, argument) for index, argument in enumerate(node.arguments)]
+    return []
+
+
+def _walk(node: Node) -> Iterator[Node]:
+    yield node
+    for _, child in _evaluated(node):
+        yield from _walk(child)
+
+
+def _replace(node: Node, key: str, replacement: str) -> Node:
+    if emit(node) == key:
+        return Name(replacement)
+    for field, child in _evaluated(node):
+        child = _replace(child, key, replacement)
+        if isinstance(field, int):
+            node.arguments[field] = child
+        else:
+            setattr(node, field, child)
+    return node
+
+
+class MolangHoister:
+    """Hoists the Molang subexpressions a client actor evaluates several times per frame.
+
+    Off by default, enabled by the `hoist_molang` config option or `--hoist-molang`.
+    """
+
+    _enabled: bool = False
+    _pool: dict[str, str] = {}
+    _usage: dict[str, Counter] = {}
+    _hoisted: dict[str, list[tuple[str, str, int]]] = {}
+
+    @classmethod
+    def enable(cls, enabled: bool = True) -> None:
+        """Enables or disables hoisting for a build and resets the summary of the previous one."""
+        cls._enabled = enabled
+        cls._pool = {}
+        cls._usage = {}
+        cls._hoisted = {}
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def intern(cls, expression: str) -> str:
+        """Returns the single instance shared by every identical expression of the pack."""
+        return cls._pool.setdefault(expression, expression)
+
+    @classmethod
+    def usage(cls, identifier: str) -> Counter:
+        """How many times each subexpression is evaluated per frame by an actor."""
+        return cls._usage.get(identifier, Counter())
+
+    @classmethod
+    def hoist(
+        cls,
+        identifier: str,
+        sites: list[tuple[Any, Any]],
+        pre_animation: list[str],
+    ) -> None:
+        """Hoists the repeated subexpressions of an actor.
+
+        Parameters:
+            identifier (str): The identifier of the actor.
+            sites (list[tuple[Any, Any]]): The `(container, key)` pairs holding the Molang expressions evaluated after `pre_animation`.
+            pre_animation (list[str]): The `pre_animation` scripts of the actor, the hoisted variables are appended to it.
+        """
+        trees: list[tuple[Any, Any, Node]] = []
+        for container, key in sites:
+            value = container[key]
+            if not isinstance(value, str):
+                continue
+            try:
+                trees.append((container, key, parse(value)))
+            except (MolangSyntaxError, RecursionError):
+                continue
+
+        hoisted = []
+        changed = set()
+        while True:
+            counts = Counter()
+            sizes = {}
+            for _, _, tree in trees:
+                for node in _walk(tree):
+                    if isinstance(node, (Number, String, Name)) or not _is_pure(node):
+                        continue
+                    key = cls.intern(emit(node))
+                    counts[key] += 1
+                    sizes.setdefault(key, _size(node))
+
+            if not hoisted:
+                cls._usage[identifier] = counts
+
+            repeated = [
+                key
+                for key, count in counts.items()
+                if count > 1 and sizes[key] >= _MIN_SIZE
+            ]
+            if not repeated:
+                break
+
+            key = max(repeated, key=lambda k: ((counts[k] - 1) * sizes[k], sizes[k]))
+            variable = f"v.anvil_cse_{len(hoisted)}"
+            for index, (container, site, tree) in enumerate(trees):
+                before = emit(tree)
+                tree = _replace(tree, key, variable)
+                trees[index] = (container, site, tree)
+                if emit(tree) != before:
+                    changed.add(index)
+            pre_animation.append(f"{variable}={key};")
+            hoisted.append((variable, key, counts[key]))
+
+        for index in changed:
+            container, key, tree = trees[index]
+            container[key] = Molang(cls.intern(emit(tree)))
+
+        if hoisted:
+            cls._hoisted[identifier] = hoisted
+
+    @classmethod
+    def summary(cls) -> tuple[int, int, int]:
+        """Returns the hoisted subexpressions, the evaluations saved per frame and the actors changed."""
+        entries = [entry for hoisted in cls._hoisted.values() for entry in hoisted]
+        saved = sum(count - 1 for _, _, count in entries)
+        return len(entries), saved, len(cls._hoisted)
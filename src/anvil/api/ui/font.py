@@ -1,10 +1,111 @@
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import orjson
 
 from anvil.api.core.core import ANVIL
 from anvil.lib.config import CONFIG
 from anvil.lib.lib import Directory
 from PIL import Image, ImageDraw, ImageFont
 
+_UI_TEXTURES = os.path.join("assets", "textures", "ui")
+_PARTICLES = os.path.join("assets", "particles")
+# Generated images and the key they were generated from, see `_atlas_key`.
+_CACHE_FILE = os.path.join(".anvil", "fonts.json")
+_BACKUP_FONT = "arial.ttf"
+
+DEFAULT8_ASCII = "ÀÁÂÈÉÊÍÓÔÕÚßãõǧÎ¹ŒœŞşŴŵŽê§©      !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~⌂"
+DEFAULT8_EXTENDED_ASCII = "ÇüéâäàåçêëèïîìÄÅÉ§ÆôöòûùÿÖÜ¢£¥₧ƒáíóúñÑªº¿⌐¬½¼¡«»░▒▓│┤╡╢╖╕╣║╗╝╜╛┐└┴├├─┼╞╟╚╔╩╦╠═╬╧╨╤╥╙╘╒╓╫╪┘┌█▄▌▐▀αßΓπΣσµτΦΘΩδ∞φε∩≡±≥≤⌠⌡÷≈°∙·√ⁿ²■	"
+
+# (font path, font size, text) -> bounding box
+_glyph_boxes: dict[tuple[str, int, str], tuple[int, int, int, int]] = {}
+
+
+def _glyph_box(font: ImageFont.FreeTypeFont, text: str) -> tuple[int, int, int, int]:
+    key = (str(font.path), font.size, text)
+    if key not in _glyph_boxes:
+        _glyph_boxes[key] = font.getbbox(text)
+    return _glyph_boxes[key]
+
+
+def _file_digest(path: str) -> str:
+    """Hashes a font file, fonts resolved by the system are hashed by name."""
+    hasher = hashlib.blake2b(digest_size=16)
+    if os.path.isfile(path):
+        with open(path, "rb") as file:
+            hasher.update(file.read())
+    else:
+        hasher.update(path.encode())
+    return hasher.hexdigest()
+
+
+def _atlas_key(fonts: list[str], cell: tuple[int, int], charset: str) -> str:
+    return hashlib.blake2b(
+        orjson.dumps([[_file_digest(font) for font in fonts], cell, charset]),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _load_cache() -> dict[str, str]:
+    try:
+        with open(_CACHE_FILE, "rb") as file:
+            return orjson.loads(file.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def _save_cache(cache: dict[str, str]) -> None:
+    os.makedirs(os.path.dirname(_CACHE_FILE), exist_ok=True)
+    with open(_CACHE_FILE, "wb") as file:
+        file.write(orjson.dumps(cache, option=orjson.OPT_SORT_KEYS))
+
+
+def _write_atlas(
+    path: str, key: str, render: Callable[[], Image.Image], cache: dict[str, str]
+) -> bool:
+    """Renders and encodes an atlas once, unless the cache holds it for the same key.
+
+    Returns:
+        bool: Whether the atlas was written.
+    """
+    if cache.get(path) == key and os.path.exists(path):
+        return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    render().save(path)
+    return True
+
+
+def render_atlas(
+    glyphs: list[tuple[str, ImageFont.FreeTypeFont]],
+    cell: tuple[int, int],
+    columns: int,
+    rows: int,
+    align_to_box: bool = True,
+) -> Image.Image:
+    """Draws glyphs on a grid, row by row, in a single image.
+
+    Parameters:
+        glyphs (list[tuple[str, ImageFont.FreeTypeFont]]): The text of each cell and the font to draw it with.
+        cell (tuple[int, int]): The width and height of a cell.
+        columns (int): The number of cells per row.
+        rows (int): The number of rows.
+        align_to_box (bool, optional): Whether glyphs are shifted left by their bounding box. Defaults to True.
+
+    Returns:
+        Image.Image: The atlas.
+    """
+    image = Image.new("RGBA", (cell[0] * columns, cell[1] * rows))
+    draw = ImageDraw.Draw(image)
+    for index, (text, font) in enumerate(glyphs):
+        column, row = index % columns, index // columns
+        x = column * cell[0]
+        if align_to_box:
+            x -= _glyph_box(font, text)[0]
+        draw.text((x, row * cell[1]), text, fill=(255, 255, 255), font=font)
+    return image
+
 
 class Fonts:
     """A class representing a Fonts."""
@@ -24,82 +125,89 @@ class Fonts:
 
         try:
             self.font = ImageFont.truetype(
-                f"assets/textures/ui/{font_name}.ttf", font_size
+                os.path.join(_UI_TEXTURES, f"{font_name}.ttf"), font_size
             )
         except FileNotFoundError:
             self.font = ImageFont.truetype(
-                f"assets/textures/ui/{font_name}.otf", font_size
+                os.path.join(_UI_TEXTURES, f"{font_name}.otf"), font_size
             )
         except:
             self.font = ImageFont.truetype(f"{font_name}.ttf", font_size)
 
         self.character_size = character_size
         self._path = os.path.join(CONFIG.RP_PATH, "font")
+        self._glyph_pages: list[str] = []
 
     def generate_font(self):
         """Generates a default8 font image"""
-
         font_size = round(self.character_size * 0.8)
-        image_size = self.character_size * 16
-
-        image = Image.new("RGBA", (image_size, image_size))
-        backup_font = ImageFont.truetype("arial.ttf", font_size)
-
-        ascii = "ÀÁÂÈÉÊÍÓÔÕÚßãõǧÎ¹ŒœŞşŴŵŽê§©      !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~⌂"
-        extended_ascii = "ÇüéâäàåçêëèïîìÄÅÉ§ÆôöòûùÿÖÜ¢£¥₧ƒáíóúñÑªº¿⌐¬½¼¡«»░▒▓│┤╡╢╖╕╣║╗╝╜╛┐└┴├├─┼╞╟╚╔╩╦╠═╬╧╨╤╥╙╘╒╓╫╪┘┌█▄▌▐▀αßΓπΣσµτΦΘΩδ∞φε∩≡±≥≤⌠⌡÷≈°∙·√ⁿ²■	"
-        default8 = ascii + extended_ascii
-
-        offset = [0, 0]
-
-        img_draw = ImageDraw.Draw(image)
-        for i in default8:
-            font_target = self.font if i in ascii else backup_font
-
-            bbox = font_target.getbbox(i)
-
-            char_height = bbox[3] - bbox[1]
-
-            x = offset[0] * self.character_size - bbox[0]
-            y = offset[1] * self.character_size
-
-            img_draw.text((x, y), i, fill=(255, 255, 255), font=font_target)
-
-            offset[0] += 1
-            if offset[0] >= 16:
-                offset[0] = 0
-                offset[1] += 1
+        backup_font = ImageFont.truetype(_BACKUP_FONT, font_size)
+        default8 = DEFAULT8_ASCII + DEFAULT8_EXTENDED_ASCII
+
+        path = os.path.join(_UI_TEXTURES, "default8.png")
+        cell = (self.character_size, self.character_size)
+        key = _atlas_key([str(self.font.path), str(backup_font.path)], cell, default8)
+
+        cache = _load_cache()
+        glyphs = [
+            (i, self.font if i in DEFAULT8_ASCII else backup_font) for i in default8
+        ]
+        if _write_atlas(path, key, lambda: render_atlas(glyphs, cell, 16, 16), cache):
+            cache[path] = key
+            _save_cache(cache)
+        return self
 
-            image.save(os.path.join("assets", "textures", "ui", "default8.png"))
+    def generate_glyph_pages(self, pages: list[int], jobs: int = 4):
+        """Generates `glyph_XX.png` pages, the 256 characters from `U+XX00` to `U+XXFF` each.
 
+        Parameters:
+            pages (list[int]): The pages to generate, such as `0xE1` for the private use characters of `glyph_E1.png`.
+            jobs (int, optional): The number of pages rendered at once. Defaults to 4.
+        """
+        cache = _load_cache()
+        cell = (self.character_size, self.character_size)
+
+        def generate(page: int) -> tuple[str, str, bool]:
+            # Font faces are not thread safe, every page loads its own.
+            font = ImageFont.truetype(self.font.path, self.font.size)
+            charset = "".join(chr((page << 8) | code) for code in range(256))
+            path = os.path.join(_UI_TEXTURES, f"glyph_{page:02X}.png")
+            key = _atlas_key([str(font.path)], cell, charset)
+            glyphs = [(i, font) for i in charset]
+            render = lambda: render_atlas(glyphs, cell, 16, 16)
+            return path, key, _write_atlas(path, key, render, cache)
+
+        with ThreadPoolExecutor(max(jobs, 1)) as pool:
+            results = list(pool.map(generate, pages))
+        if any(written for _, _, written in results):
+            cache.update({path: key for path, key, _ in results})
+            _save_cache(cache)
+
+        for page in pages:
+            name = f"glyph_{page:02X}.png"
+            if name not in self._glyph_pages:
+                self._glyph_pages.append(name)
         return self
 
     def generate_numbers_particle(self):
         """Generates a numbers particle from 0 to 999."""
-        img_path = os.path.join("assets", "particles", "numbers.png")
-        particle_path = os.path.join("assets", "particles", "numbers.particle.json")
+        img_path = os.path.join(_PARTICLES, "numbers.png")
+        particle_path = os.path.join(_PARTICLES, "numbers.particle.json")
 
         max_size = int(self.font.getlength("999"))
         image_size = (max_size * 10, self.character_size * 100)
 
-        if not os.path.exists(img_path):
-            image = Image.new("RGBA", image_size)
-            offset = [0, 0]
-
-            img_draw = ImageDraw.Draw(image)
-            for i in range(0, 1000):
-                bbox = self.font.getbbox(str(i))
-
-                x = offset[0] * max_size
-                y = offset[1] * self.character_size
-
-                img_draw.text((x, y), str(i), fill=(255, 255, 255), font=self.font)
-
-                offset[0] += 1
-                if offset[0] >= 10:
-                    offset[0] = 0
-                    offset[1] += 1
+        cell = (max_size, self.character_size)
+        key = _atlas_key([str(self.font.path)], cell, "0-999")
+        glyphs = [(str(i), self.font) for i in range(1000)]
 
-                image.save(img_path)
+        cache = _load_cache()
+        # A numbers image Anvil did not generate is never replaced.
+        if not os.path.exists(img_path) or img_path in cache:
+            render = lambda: render_atlas(glyphs, cell, 10, 100, align_to_box=False)
+            if _write_atlas(img_path, key, render, cache):
+                cache[img_path] = key
+                _save_cache(cache)
 
         # if not os.path.exists(particle_path):
         #    AnvilIO.file(
@@ -145,8 +253,8 @@ class Fonts:
 
     def __export__(self):
         """Exports the font configuration."""
-        for file in ["glyph_E1.png", "default8.png"]:
-            if os.path.exists(os.path.join("assets", "textures", "ui", file)):
-                Directory.copy_files(
-                    os.path.join("assets", "textures", "ui"), self._path, file
-                )
+        files = ["glyph_E1.png", "default8.png"]
+        files += [page for page in self._glyph_pages if page not in files]
+        for file in files:
+            if os.path.exists(os.path.join(_UI_TEXTURES, file)):
+                Directory.copy_files(_UI_TEXTURES, self._path, file)
@@ -1,6 +1,12 @@
 from enum import StrEnum
+from typing import TYPE_CHECKING
 
-from .factories import minecraft_blocks as MinecraftBlockTypes
+from .factories import LazyFactories
+
+if TYPE_CHECKING:
+    from .factories import minecraft_blocks as MinecraftBlockTypes
+else:
+    MinecraftBlockTypes = LazyFactories(f"{__package__}.factories.minecraft_blocks")
 
 
 class MinecraftBlockTags(StrEnum):
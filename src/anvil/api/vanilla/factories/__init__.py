@@ -0,0 +1,34 @@
+import importlib
+from types import ModuleType
+
+
+class LazyFactories:
+    """A generated factory module, imported on first attribute access.
+
+    The block and item factory modules hold thousands of generated functions and type
+    aliases, importing them eagerly would slow down every build using any part of
+    the API.
+    """
+
+    def __init__(self, module: str) -> None:
+        self._name = module
+        self._module: ModuleType | None = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = getattr(self._load(), name)
+        # Later lookups of the same factory skip `__getattr__`.
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        return f"<lazy factories {self._name!r}>"
@@ -612,9 +612,8 @@ def AcaciaButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AcaciaButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:acacia_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -629,9 +628,8 @@ def AcaciaDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AcaciaDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:acacia_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -645,16 +643,15 @@ def AcaciaDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AcaciaDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:acacia_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def AcaciaFence() -> MinecraftBlockDescriptor:
     """Factory for AcaciaFence"""
-    return MinecraftBlockDescriptor("minecraft:acacia_fence", True)
+    return MinecraftBlockDescriptor.interned("minecraft:acacia_fence")
 
 
 def AcaciaFenceGate(
@@ -663,9 +660,8 @@ def AcaciaFenceGate(
     open_bit: Optional[OpenBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AcaciaFenceGate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:acacia_fence_gate",
-        True,
         {
             BlockStateKeys.InWallBit: in_wall_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -681,9 +677,8 @@ def AcaciaHangingSign(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AcaciaHangingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:acacia_hanging_sign",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -698,9 +693,8 @@ def AcaciaLeaves(
     update_bit: Optional[UpdateBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AcaciaLeaves"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:acacia_leaves",
-        True,
         {
             BlockStateKeys.PersistentBit: persistent_bit,
             BlockStateKeys.UpdateBit: update_bit,
@@ -710,31 +704,30 @@ def AcaciaLeaves(
 
 def AcaciaLog(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for AcaciaLog"""
-    return MinecraftBlockDescriptor(
-        "minecraft:acacia_log", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:acacia_log", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def AcaciaPlanks() -> MinecraftBlockDescriptor:
     """Factory for AcaciaPlanks"""
-    return MinecraftBlockDescriptor("minecraft:acacia_planks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:acacia_planks")
 
 
 def AcaciaPressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AcaciaPressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:acacia_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
 
 def AcaciaSapling(age_bit: Optional[AgeBit] = None) -> MinecraftBlockDescriptor:
     """Factory for AcaciaSapling"""
-    return MinecraftBlockDescriptor(
-        "minecraft:acacia_sapling", True, {BlockStateKeys.AgeBit: age_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:acacia_sapling", {BlockStateKeys.AgeBit: age_bit}
     )
 
 
@@ -744,9 +737,8 @@ def AcaciaShelf(
     powered_shelf_type: Optional[int] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AcaciaShelf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:acacia_shelf",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: cardinal_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -759,9 +751,8 @@ def AcaciaSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AcaciaSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:acacia_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -771,9 +762,8 @@ def AcaciaStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AcaciaStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:acacia_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -785,9 +775,8 @@ def AcaciaStandingSign(
     ground_sign_direction: Optional[GroundSignDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AcaciaStandingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:acacia_standing_sign",
-        True,
         {BlockStateKeys.GroundSignDirection: ground_sign_direction},
     )
 
@@ -798,9 +787,8 @@ def AcaciaTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AcaciaTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:acacia_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -813,17 +801,16 @@ def AcaciaWallSign(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AcaciaWallSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:acacia_wall_sign",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def AcaciaWood(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for AcaciaWood"""
-    return MinecraftBlockDescriptor(
-        "minecraft:acacia_wood", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:acacia_wood", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -832,9 +819,8 @@ def ActivatorRail(
     rail_direction: Optional[RailDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ActivatorRail"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:activator_rail",
-        True,
         {
             BlockStateKeys.RailDataBit: rail_data_bit,
             BlockStateKeys.RailDirection: rail_direction,
@@ -844,52 +830,50 @@ def ActivatorRail(
 
 def Air() -> MinecraftBlockDescriptor:
     """Factory for Air"""
-    return MinecraftBlockDescriptor("minecraft:air", True)
+    return MinecraftBlockDescriptor.interned("minecraft:air")
 
 
 def Allium() -> MinecraftBlockDescriptor:
     """Factory for Allium"""
-    return MinecraftBlockDescriptor("minecraft:allium", True)
+    return MinecraftBlockDescriptor.interned("minecraft:allium")
 
 
 def Allow() -> MinecraftBlockDescriptor:
     """Factory for Allow"""
-    return MinecraftBlockDescriptor("minecraft:allow", True)
+    return MinecraftBlockDescriptor.interned("minecraft:allow")
 
 
 def AmethystBlock() -> MinecraftBlockDescriptor:
     """Factory for AmethystBlock"""
-    return MinecraftBlockDescriptor("minecraft:amethyst_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:amethyst_block")
 
 
 def AmethystCluster(
     minecraft_block_face: Optional[BlockFace] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AmethystCluster"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:amethyst_cluster",
-        True,
         {BlockStateKeys.MinecraftBlockFace: minecraft_block_face},
     )
 
 
 def AncientDebris() -> MinecraftBlockDescriptor:
     """Factory for AncientDebris"""
-    return MinecraftBlockDescriptor("minecraft:ancient_debris", True)
+    return MinecraftBlockDescriptor.interned("minecraft:ancient_debris")
 
 
 def Andesite() -> MinecraftBlockDescriptor:
     """Factory for Andesite"""
-    return MinecraftBlockDescriptor("minecraft:andesite", True)
+    return MinecraftBlockDescriptor.interned("minecraft:andesite")
 
 
 def AndesiteDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AndesiteDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:andesite_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -898,9 +882,8 @@ def AndesiteSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AndesiteSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:andesite_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -910,9 +893,8 @@ def AndesiteStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AndesiteStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:andesite_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -928,9 +910,8 @@ def AndesiteWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AndesiteWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:andesite_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -945,16 +926,15 @@ def Anvil(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Anvil"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:anvil",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
 
 def Azalea() -> MinecraftBlockDescriptor:
     """Factory for Azalea"""
-    return MinecraftBlockDescriptor("minecraft:azalea", True)
+    return MinecraftBlockDescriptor.interned("minecraft:azalea")
 
 
 def AzaleaLeaves(
@@ -962,9 +942,8 @@ def AzaleaLeaves(
     update_bit: Optional[UpdateBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AzaleaLeaves"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:azalea_leaves",
-        True,
         {
             BlockStateKeys.PersistentBit: persistent_bit,
             BlockStateKeys.UpdateBit: update_bit,
@@ -977,9 +956,8 @@ def AzaleaLeavesFlowered(
     update_bit: Optional[UpdateBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for AzaleaLeavesFlowered"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:azalea_leaves_flowered",
-        True,
         {
             BlockStateKeys.PersistentBit: persistent_bit,
             BlockStateKeys.UpdateBit: update_bit,
@@ -989,7 +967,7 @@ def AzaleaLeavesFlowered(
 
 def AzureBluet() -> MinecraftBlockDescriptor:
     """Factory for AzureBluet"""
-    return MinecraftBlockDescriptor("minecraft:azure_bluet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:azure_bluet")
 
 
 def Bamboo(
@@ -998,9 +976,8 @@ def Bamboo(
     bamboo_stalk_thickness: Optional[BambooStalkThickness] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Bamboo"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo",
-        True,
         {
             BlockStateKeys.AgeBit: age_bit,
             BlockStateKeys.BambooLeafSize: bamboo_leaf_size,
@@ -1011,8 +988,8 @@ def Bamboo(
 
 def BambooBlock(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for BambooBlock"""
-    return MinecraftBlockDescriptor(
-        "minecraft:bamboo_block", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:bamboo_block", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -1021,9 +998,8 @@ def BambooButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -1038,9 +1014,8 @@ def BambooDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -1054,16 +1029,15 @@ def BambooDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def BambooFence() -> MinecraftBlockDescriptor:
     """Factory for BambooFence"""
-    return MinecraftBlockDescriptor("minecraft:bamboo_fence", True)
+    return MinecraftBlockDescriptor.interned("minecraft:bamboo_fence")
 
 
 def BambooFenceGate(
@@ -1072,9 +1046,8 @@ def BambooFenceGate(
     open_bit: Optional[OpenBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooFenceGate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_fence_gate",
-        True,
         {
             BlockStateKeys.InWallBit: in_wall_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -1090,9 +1063,8 @@ def BambooHangingSign(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooHangingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_hanging_sign",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -1104,16 +1076,15 @@ def BambooHangingSign(
 
 def BambooMosaic() -> MinecraftBlockDescriptor:
     """Factory for BambooMosaic"""
-    return MinecraftBlockDescriptor("minecraft:bamboo_mosaic", True)
+    return MinecraftBlockDescriptor.interned("minecraft:bamboo_mosaic")
 
 
 def BambooMosaicDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooMosaicDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_mosaic_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -1122,9 +1093,8 @@ def BambooMosaicSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooMosaicSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_mosaic_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -1134,9 +1104,8 @@ def BambooMosaicStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooMosaicStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_mosaic_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -1146,24 +1115,23 @@ def BambooMosaicStairs(
 
 def BambooPlanks() -> MinecraftBlockDescriptor:
     """Factory for BambooPlanks"""
-    return MinecraftBlockDescriptor("minecraft:bamboo_planks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:bamboo_planks")
 
 
 def BambooPressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooPressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
 
 def BambooSapling(age_bit: Optional[AgeBit] = None) -> MinecraftBlockDescriptor:
     """Factory for BambooSapling"""
-    return MinecraftBlockDescriptor(
-        "minecraft:bamboo_sapling", True, {BlockStateKeys.AgeBit: age_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:bamboo_sapling", {BlockStateKeys.AgeBit: age_bit}
     )
 
 
@@ -1173,9 +1141,8 @@ def BambooShelf(
     powered_shelf_type: Optional[int] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooShelf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_shelf",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: cardinal_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -1188,9 +1155,8 @@ def BambooSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -1200,9 +1166,8 @@ def BambooStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -1214,9 +1179,8 @@ def BambooStandingSign(
     ground_sign_direction: Optional[GroundSignDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooStandingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_standing_sign",
-        True,
         {BlockStateKeys.GroundSignDirection: ground_sign_direction},
     )
 
@@ -1227,9 +1191,8 @@ def BambooTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -1242,9 +1205,8 @@ def BambooWallSign(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BambooWallSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bamboo_wall_sign",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
@@ -1254,9 +1216,8 @@ def Barrel(
     open_bit: Optional[OpenBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Barrel"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:barrel",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -1266,19 +1227,19 @@ def Barrel(
 
 def Barrier() -> MinecraftBlockDescriptor:
     """Factory for Barrier"""
-    return MinecraftBlockDescriptor("minecraft:barrier", True)
+    return MinecraftBlockDescriptor.interned("minecraft:barrier")
 
 
 def Basalt(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for Basalt"""
-    return MinecraftBlockDescriptor(
-        "minecraft:basalt", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:basalt", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def Beacon() -> MinecraftBlockDescriptor:
     """Factory for Beacon"""
-    return MinecraftBlockDescriptor("minecraft:beacon", True)
+    return MinecraftBlockDescriptor.interned("minecraft:beacon")
 
 
 def Bed(
@@ -1287,9 +1248,8 @@ def Bed(
     occupied_bit: Optional[OccupiedBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Bed"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bed",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.HeadPieceBit: head_piece_bit,
@@ -1300,8 +1260,8 @@ def Bed(
 
 def Bedrock(infiniburn_bit: Optional[InfiniburnBit] = None) -> MinecraftBlockDescriptor:
     """Factory for Bedrock"""
-    return MinecraftBlockDescriptor(
-        "minecraft:bedrock", True, {BlockStateKeys.InfiniburnBit: infiniburn_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:bedrock", {BlockStateKeys.InfiniburnBit: infiniburn_bit}
     )
 
 
@@ -1309,9 +1269,8 @@ def BeeNest(
     direction: Optional[Direction] = None, honey_level: Optional[HoneyLevel] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for BeeNest"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bee_nest",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.HoneyLevel: honey_level,
@@ -1323,9 +1282,8 @@ def Beehive(
     direction: Optional[Direction] = None, honey_level: Optional[HoneyLevel] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for Beehive"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:beehive",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.HoneyLevel: honey_level,
@@ -1335,8 +1293,8 @@ def Beehive(
 
 def Beetroot(growth: Optional[Growth] = None) -> MinecraftBlockDescriptor:
     """Factory for Beetroot"""
-    return MinecraftBlockDescriptor(
-        "minecraft:beetroot", True, {BlockStateKeys.Growth: growth}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:beetroot", {BlockStateKeys.Growth: growth}
     )
 
 
@@ -1346,9 +1304,8 @@ def Bell(
     toggle_bit: Optional[ToggleBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Bell"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bell",
-        True,
         {
             BlockStateKeys.Attachment: attachment,
             BlockStateKeys.Direction: direction,
@@ -1363,9 +1320,8 @@ def BigDripleaf(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BigDripleaf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:big_dripleaf",
-        True,
         {
             BlockStateKeys.BigDripleafHead: big_dripleaf_head,
             BlockStateKeys.BigDripleafTilt: big_dripleaf_tilt,
@@ -1379,9 +1335,8 @@ def BirchButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BirchButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:birch_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -1396,9 +1351,8 @@ def BirchDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BirchDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:birch_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -1412,16 +1366,15 @@ def BirchDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BirchDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:birch_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def BirchFence() -> MinecraftBlockDescriptor:
     """Factory for BirchFence"""
-    return MinecraftBlockDescriptor("minecraft:birch_fence", True)
+    return MinecraftBlockDescriptor.interned("minecraft:birch_fence")
 
 
 def BirchFenceGate(
@@ -1430,9 +1383,8 @@ def BirchFenceGate(
     open_bit: Optional[OpenBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BirchFenceGate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:birch_fence_gate",
-        True,
         {
             BlockStateKeys.InWallBit: in_wall_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -1448,9 +1400,8 @@ def BirchHangingSign(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BirchHangingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:birch_hanging_sign",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -1465,9 +1416,8 @@ def BirchLeaves(
     update_bit: Optional[UpdateBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BirchLeaves"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:birch_leaves",
-        True,
         {
             BlockStateKeys.PersistentBit: persistent_bit,
             BlockStateKeys.UpdateBit: update_bit,
@@ -1477,31 +1427,30 @@ def BirchLeaves(
 
 def BirchLog(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for BirchLog"""
-    return MinecraftBlockDescriptor(
-        "minecraft:birch_log", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:birch_log", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def BirchPlanks() -> MinecraftBlockDescriptor:
     """Factory for BirchPlanks"""
-    return MinecraftBlockDescriptor("minecraft:birch_planks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:birch_planks")
 
 
 def BirchPressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BirchPressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:birch_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
 
 def BirchSapling(age_bit: Optional[AgeBit] = None) -> MinecraftBlockDescriptor:
     """Factory for BirchSapling"""
-    return MinecraftBlockDescriptor(
-        "minecraft:birch_sapling", True, {BlockStateKeys.AgeBit: age_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:birch_sapling", {BlockStateKeys.AgeBit: age_bit}
     )
 
 
@@ -1511,9 +1460,8 @@ def BirchShelf(
     powered_shelf_type: Optional[int] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BirchShelf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:birch_shelf",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: cardinal_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -1526,9 +1474,8 @@ def BirchSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BirchSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:birch_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -1538,9 +1485,8 @@ def BirchStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BirchStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:birch_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -1552,9 +1498,8 @@ def BirchStandingSign(
     ground_sign_direction: Optional[GroundSignDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BirchStandingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:birch_standing_sign",
-        True,
         {BlockStateKeys.GroundSignDirection: ground_sign_direction},
     )
 
@@ -1565,9 +1510,8 @@ def BirchTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BirchTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:birch_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -1580,17 +1524,16 @@ def BirchWallSign(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BirchWallSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:birch_wall_sign",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def BirchWood(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for BirchWood"""
-    return MinecraftBlockDescriptor(
-        "minecraft:birch_wood", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:birch_wood", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -1598,83 +1541,80 @@ def BlackCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for BlackCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:black_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def BlackCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for BlackCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:black_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:black_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def BlackCarpet() -> MinecraftBlockDescriptor:
     """Factory for BlackCarpet"""
-    return MinecraftBlockDescriptor("minecraft:black_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:black_carpet")
 
 
 def BlackConcrete() -> MinecraftBlockDescriptor:
     """Factory for BlackConcrete"""
-    return MinecraftBlockDescriptor("minecraft:black_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:black_concrete")
 
 
 def BlackConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for BlackConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:black_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:black_concrete_powder")
 
 
 def BlackGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BlackGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:black_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def BlackShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for BlackShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:black_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:black_shulker_box")
 
 
 def BlackStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for BlackStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:black_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:black_stained_glass")
 
 
 def BlackStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for BlackStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:black_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:black_stained_glass_pane")
 
 
 def BlackTerracotta() -> MinecraftBlockDescriptor:
     """Factory for BlackTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:black_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:black_terracotta")
 
 
 def BlackWool() -> MinecraftBlockDescriptor:
     """Factory for BlackWool"""
-    return MinecraftBlockDescriptor("minecraft:black_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:black_wool")
 
 
 def Blackstone() -> MinecraftBlockDescriptor:
     """Factory for Blackstone"""
-    return MinecraftBlockDescriptor("minecraft:blackstone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:blackstone")
 
 
 def BlackstoneDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BlackstoneDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:blackstone_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -1683,9 +1623,8 @@ def BlackstoneSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BlackstoneSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:blackstone_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -1695,9 +1634,8 @@ def BlackstoneStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BlackstoneStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:blackstone_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -1713,9 +1651,8 @@ def BlackstoneWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BlackstoneWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:blackstone_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -1730,9 +1667,8 @@ def BlastFurnace(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BlastFurnace"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:blast_furnace",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
@@ -1741,88 +1677,85 @@ def BlueCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for BlueCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:blue_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def BlueCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for BlueCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:blue_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:blue_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def BlueCarpet() -> MinecraftBlockDescriptor:
     """Factory for BlueCarpet"""
-    return MinecraftBlockDescriptor("minecraft:blue_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:blue_carpet")
 
 
 def BlueConcrete() -> MinecraftBlockDescriptor:
     """Factory for BlueConcrete"""
-    return MinecraftBlockDescriptor("minecraft:blue_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:blue_concrete")
 
 
 def BlueConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for BlueConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:blue_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:blue_concrete_powder")
 
 
 def BlueGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BlueGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:blue_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def BlueIce() -> MinecraftBlockDescriptor:
     """Factory for BlueIce"""
-    return MinecraftBlockDescriptor("minecraft:blue_ice", True)
+    return MinecraftBlockDescriptor.interned("minecraft:blue_ice")
 
 
 def BlueOrchid() -> MinecraftBlockDescriptor:
     """Factory for BlueOrchid"""
-    return MinecraftBlockDescriptor("minecraft:blue_orchid", True)
+    return MinecraftBlockDescriptor.interned("minecraft:blue_orchid")
 
 
 def BlueShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for BlueShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:blue_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:blue_shulker_box")
 
 
 def BlueStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for BlueStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:blue_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:blue_stained_glass")
 
 
 def BlueStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for BlueStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:blue_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:blue_stained_glass_pane")
 
 
 def BlueTerracotta() -> MinecraftBlockDescriptor:
     """Factory for BlueTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:blue_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:blue_terracotta")
 
 
 def BlueWool() -> MinecraftBlockDescriptor:
     """Factory for BlueWool"""
-    return MinecraftBlockDescriptor("minecraft:blue_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:blue_wool")
 
 
 def BoneBlock(
     deprecated: Optional[Deprecated] = None, pillar_axis: Optional[PillarAxis] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for BoneBlock"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bone_block",
-        True,
         {
             BlockStateKeys.Deprecated: deprecated,
             BlockStateKeys.PillarAxis: pillar_axis,
@@ -1832,7 +1765,7 @@ def BoneBlock(
 
 def Bookshelf() -> MinecraftBlockDescriptor:
     """Factory for Bookshelf"""
-    return MinecraftBlockDescriptor("minecraft:bookshelf", True)
+    return MinecraftBlockDescriptor.interned("minecraft:bookshelf")
 
 
 def BorderBlock(
@@ -1843,9 +1776,8 @@ def BorderBlock(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BorderBlock"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:border_block",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -1858,21 +1790,20 @@ def BorderBlock(
 
 def BrainCoral() -> MinecraftBlockDescriptor:
     """Factory for BrainCoral"""
-    return MinecraftBlockDescriptor("minecraft:brain_coral", True)
+    return MinecraftBlockDescriptor.interned("minecraft:brain_coral")
 
 
 def BrainCoralBlock() -> MinecraftBlockDescriptor:
     """Factory for BrainCoralBlock"""
-    return MinecraftBlockDescriptor("minecraft:brain_coral_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:brain_coral_block")
 
 
 def BrainCoralFan(
     coral_fan_direction: Optional[CoralFanDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BrainCoralFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:brain_coral_fan",
-        True,
         {BlockStateKeys.CoralFanDirection: coral_fan_direction},
     )
 
@@ -1881,9 +1812,8 @@ def BrainCoralWallFan(
     coral_direction: Optional[CoralDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BrainCoralWallFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:brain_coral_wall_fan",
-        True,
         {BlockStateKeys.CoralDirection: coral_direction},
     )
 
@@ -1894,9 +1824,8 @@ def BrewingStand(
     brewing_stand_slot_c_bit: Optional[BrewingStandSlotCBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BrewingStand"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:brewing_stand",
-        True,
         {
             BlockStateKeys.BrewingStandSlotABit: brewing_stand_slot_a_bit,
             BlockStateKeys.BrewingStandSlotBBit: brewing_stand_slot_b_bit,
@@ -1907,16 +1836,15 @@ def BrewingStand(
 
 def BrickBlock() -> MinecraftBlockDescriptor:
     """Factory for BrickBlock"""
-    return MinecraftBlockDescriptor("minecraft:brick_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:brick_block")
 
 
 def BrickDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BrickDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:brick_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -1925,9 +1853,8 @@ def BrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -1937,9 +1864,8 @@ def BrickStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BrickStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:brick_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -1955,9 +1881,8 @@ def BrickWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BrickWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:brick_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -1972,111 +1897,107 @@ def BrownCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for BrownCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:brown_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def BrownCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for BrownCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:brown_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:brown_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def BrownCarpet() -> MinecraftBlockDescriptor:
     """Factory for BrownCarpet"""
-    return MinecraftBlockDescriptor("minecraft:brown_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:brown_carpet")
 
 
 def BrownConcrete() -> MinecraftBlockDescriptor:
     """Factory for BrownConcrete"""
-    return MinecraftBlockDescriptor("minecraft:brown_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:brown_concrete")
 
 
 def BrownConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for BrownConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:brown_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:brown_concrete_powder")
 
 
 def BrownGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BrownGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:brown_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def BrownMushroom() -> MinecraftBlockDescriptor:
     """Factory for BrownMushroom"""
-    return MinecraftBlockDescriptor("minecraft:brown_mushroom", True)
+    return MinecraftBlockDescriptor.interned("minecraft:brown_mushroom")
 
 
 def BrownMushroomBlock(
     huge_mushroom_bits: Optional[HugeMushroomBits] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BrownMushroomBlock"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:brown_mushroom_block",
-        True,
         {BlockStateKeys.HugeMushroomBits: huge_mushroom_bits},
     )
 
 
 def BrownShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for BrownShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:brown_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:brown_shulker_box")
 
 
 def BrownStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for BrownStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:brown_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:brown_stained_glass")
 
 
 def BrownStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for BrownStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:brown_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:brown_stained_glass_pane")
 
 
 def BrownTerracotta() -> MinecraftBlockDescriptor:
     """Factory for BrownTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:brown_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:brown_terracotta")
 
 
 def BrownWool() -> MinecraftBlockDescriptor:
     """Factory for BrownWool"""
-    return MinecraftBlockDescriptor("minecraft:brown_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:brown_wool")
 
 
 def BubbleColumn(drag_down: Optional[DragDown] = None) -> MinecraftBlockDescriptor:
     """Factory for BubbleColumn"""
-    return MinecraftBlockDescriptor(
-        "minecraft:bubble_column", True, {BlockStateKeys.DragDown: drag_down}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:bubble_column", {BlockStateKeys.DragDown: drag_down}
     )
 
 
 def BubbleCoral() -> MinecraftBlockDescriptor:
     """Factory for BubbleCoral"""
-    return MinecraftBlockDescriptor("minecraft:bubble_coral", True)
+    return MinecraftBlockDescriptor.interned("minecraft:bubble_coral")
 
 
 def BubbleCoralBlock() -> MinecraftBlockDescriptor:
     """Factory for BubbleCoralBlock"""
-    return MinecraftBlockDescriptor("minecraft:bubble_coral_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:bubble_coral_block")
 
 
 def BubbleCoralFan(
     coral_fan_direction: Optional[CoralFanDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BubbleCoralFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bubble_coral_fan",
-        True,
         {BlockStateKeys.CoralFanDirection: coral_fan_direction},
     )
 
@@ -2085,43 +2006,44 @@ def BubbleCoralWallFan(
     coral_direction: Optional[CoralDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for BubbleCoralWallFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:bubble_coral_wall_fan",
-        True,
         {BlockStateKeys.CoralDirection: coral_direction},
     )
 
 
 def BuddingAmethyst() -> MinecraftBlockDescriptor:
     """Factory for BuddingAmethyst"""
-    return MinecraftBlockDescriptor("minecraft:budding_amethyst", True)
+    return MinecraftBlockDescriptor.interned("minecraft:budding_amethyst")
 
 
 def Bush() -> MinecraftBlockDescriptor:
     """Factory for Bush"""
-    return MinecraftBlockDescriptor("minecraft:bush", True)
+    return MinecraftBlockDescriptor.interned("minecraft:bush")
 
 
 def Cactus(age: Optional[Age] = None) -> MinecraftBlockDescriptor:
     """Factory for Cactus"""
-    return MinecraftBlockDescriptor("minecraft:cactus", True, {BlockStateKeys.Age: age})
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:cactus", {BlockStateKeys.Age: age}
+    )
 
 
 def CactusFlower() -> MinecraftBlockDescriptor:
     """Factory for CactusFlower"""
-    return MinecraftBlockDescriptor("minecraft:cactus_flower", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cactus_flower")
 
 
 def Cake(bite_counter: Optional[BiteCounter] = None) -> MinecraftBlockDescriptor:
     """Factory for Cake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:cake", True, {BlockStateKeys.BiteCounter: bite_counter}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:cake", {BlockStateKeys.BiteCounter: bite_counter}
     )
 
 
 def Calcite() -> MinecraftBlockDescriptor:
     """Factory for Calcite"""
-    return MinecraftBlockDescriptor("minecraft:calcite", True)
+    return MinecraftBlockDescriptor.interned("minecraft:calcite")
 
 
 def CalibratedSculkSensor(
@@ -2129,9 +2051,8 @@ def CalibratedSculkSensor(
     sculk_sensor_phase: Optional[SculkSensorPhase] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CalibratedSculkSensor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:calibrated_sculk_sensor",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
             BlockStateKeys.SculkSensorPhase: sculk_sensor_phase,
@@ -2141,7 +2062,7 @@ def CalibratedSculkSensor(
 
 def Camera() -> MinecraftBlockDescriptor:
     """Factory for Camera"""
-    return MinecraftBlockDescriptor("minecraft:camera", True)
+    return MinecraftBlockDescriptor.interned("minecraft:camera")
 
 
 def Campfire(
@@ -2149,9 +2070,8 @@ def Campfire(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Campfire"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:campfire",
-        True,
         {
             BlockStateKeys.Extinguished: extinguished,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -2163,39 +2083,37 @@ def Candle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for Candle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def CandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for CandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def Carrots(growth: Optional[Growth] = None) -> MinecraftBlockDescriptor:
     """Factory for Carrots"""
-    return MinecraftBlockDescriptor(
-        "minecraft:carrots", True, {BlockStateKeys.Growth: growth}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:carrots", {BlockStateKeys.Growth: growth}
     )
 
 
 def CartographyTable() -> MinecraftBlockDescriptor:
     """Factory for CartographyTable"""
-    return MinecraftBlockDescriptor("minecraft:cartography_table", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cartography_table")
 
 
 def CarvedPumpkin(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CarvedPumpkin"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:carved_pumpkin",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
@@ -2205,9 +2123,8 @@ def Cauldron(
     fill_level: Optional[FillLevel] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Cauldron"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cauldron",
-        True,
         {
             BlockStateKeys.CauldronLiquid: cauldron_liquid,
             BlockStateKeys.FillLevel: fill_level,
@@ -2219,9 +2136,8 @@ def CaveVines(
     growing_plant_age: Optional[GrowingPlantAge] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CaveVines"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cave_vines",
-        True,
         {BlockStateKeys.GrowingPlantAge: growing_plant_age},
     )
 
@@ -2230,9 +2146,8 @@ def CaveVinesBodyWithBerries(
     growing_plant_age: Optional[GrowingPlantAge] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CaveVinesBodyWithBerries"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cave_vines_body_with_berries",
-        True,
         {BlockStateKeys.GrowingPlantAge: growing_plant_age},
     )
 
@@ -2241,9 +2156,8 @@ def CaveVinesHeadWithBerries(
     growing_plant_age: Optional[GrowingPlantAge] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CaveVinesHeadWithBerries"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cave_vines_head_with_berries",
-        True,
         {BlockStateKeys.GrowingPlantAge: growing_plant_age},
     )
 
@@ -2251,7 +2165,7 @@ def CaveVinesHeadWithBerries(
 #
 # def Chain(pillar_axis: PillarAxis) -> MinecraftBlockDescriptor:
 #    """Factory for Chain"""
-#    return MinecraftBlockDescriptor("minecraft:chain", True, {BlockStateKeys.PillarAxis: pillar_axis})
+#    return MinecraftBlockDescriptor.interned("minecraft:chain", {BlockStateKeys.PillarAxis: pillar_axis})
 
 
 def ChainCommandBlock(
@@ -2259,9 +2173,8 @@ def ChainCommandBlock(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ChainCommandBlock"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:chain_command_block",
-        True,
         {
             BlockStateKeys.ConditionalBit: conditional_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -2271,7 +2184,7 @@ def ChainCommandBlock(
 
 def ChemicalHeat() -> MinecraftBlockDescriptor:
     """Factory for ChemicalHeat"""
-    return MinecraftBlockDescriptor("minecraft:chemical_heat", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chemical_heat")
 
 
 def CherryButton(
@@ -2279,9 +2192,8 @@ def CherryButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CherryButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cherry_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -2296,9 +2208,8 @@ def CherryDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CherryDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cherry_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -2312,16 +2223,15 @@ def CherryDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CherryDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cherry_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def CherryFence() -> MinecraftBlockDescriptor:
     """Factory for CherryFence"""
-    return MinecraftBlockDescriptor("minecraft:cherry_fence", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cherry_fence")
 
 
 def CherryFenceGate(
@@ -2330,9 +2240,8 @@ def CherryFenceGate(
     open_bit: Optional[OpenBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CherryFenceGate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cherry_fence_gate",
-        True,
         {
             BlockStateKeys.InWallBit: in_wall_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -2348,9 +2257,8 @@ def CherryHangingSign(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CherryHangingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cherry_hanging_sign",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -2365,9 +2273,8 @@ def CherryLeaves(
     update_bit: Optional[UpdateBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CherryLeaves"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cherry_leaves",
-        True,
         {
             BlockStateKeys.PersistentBit: persistent_bit,
             BlockStateKeys.UpdateBit: update_bit,
@@ -2377,31 +2284,30 @@ def CherryLeaves(
 
 def CherryLog(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for CherryLog"""
-    return MinecraftBlockDescriptor(
-        "minecraft:cherry_log", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:cherry_log", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def CherryPlanks() -> MinecraftBlockDescriptor:
     """Factory for CherryPlanks"""
-    return MinecraftBlockDescriptor("minecraft:cherry_planks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cherry_planks")
 
 
 def CherryPressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CherryPressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cherry_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
 
 def CherrySapling(age_bit: Optional[AgeBit] = None) -> MinecraftBlockDescriptor:
     """Factory for CherrySapling"""
-    return MinecraftBlockDescriptor(
-        "minecraft:cherry_sapling", True, {BlockStateKeys.AgeBit: age_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:cherry_sapling", {BlockStateKeys.AgeBit: age_bit}
     )
 
 
@@ -2411,9 +2317,8 @@ def CherryShelf(
     powered_shelf_type: Optional[int] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CherryShelf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cherry_shelf",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: cardinal_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -2426,9 +2331,8 @@ def CherrySlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CherrySlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cherry_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -2438,9 +2342,8 @@ def CherryStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CherryStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cherry_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -2452,9 +2355,8 @@ def CherryStandingSign(
     ground_sign_direction: Optional[GroundSignDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CherryStandingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cherry_standing_sign",
-        True,
         {BlockStateKeys.GroundSignDirection: ground_sign_direction},
     )
 
@@ -2465,9 +2367,8 @@ def CherryTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CherryTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cherry_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -2480,17 +2381,16 @@ def CherryWallSign(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CherryWallSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cherry_wall_sign",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def CherryWood(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for CherryWood"""
-    return MinecraftBlockDescriptor(
-        "minecraft:cherry_wood", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:cherry_wood", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -2498,9 +2398,8 @@ def Chest(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Chest"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:chest",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
@@ -2509,9 +2408,8 @@ def ChippedAnvil(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ChippedAnvil"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:chipped_anvil",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
@@ -2520,9 +2418,8 @@ def ChiseledBookshelf(
     books_stored: Optional[BooksStored] = None, direction: Optional[Direction] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for ChiseledBookshelf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:chiseled_bookshelf",
-        True,
         {
             BlockStateKeys.BooksStored: books_stored,
             BlockStateKeys.Direction: direction,
@@ -2532,99 +2429,97 @@ def ChiseledBookshelf(
 
 def ChiseledCinnabar() -> MinecraftBlockDescriptor:
     """Factory for ChiseledCinnabar"""
-    return MinecraftBlockDescriptor("minecraft:chiseled_cinnabar", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chiseled_cinnabar")
 
 
 def ChiseledCopper() -> MinecraftBlockDescriptor:
     """Factory for ChiseledCopper"""
-    return MinecraftBlockDescriptor("minecraft:chiseled_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chiseled_copper")
 
 
 def ChiseledDeepslate() -> MinecraftBlockDescriptor:
     """Factory for ChiseledDeepslate"""
-    return MinecraftBlockDescriptor("minecraft:chiseled_deepslate", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chiseled_deepslate")
 
 
 def ChiseledNetherBricks() -> MinecraftBlockDescriptor:
     """Factory for ChiseledNetherBricks"""
-    return MinecraftBlockDescriptor("minecraft:chiseled_nether_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chiseled_nether_bricks")
 
 
 def ChiseledPolishedBlackstone() -> MinecraftBlockDescriptor:
     """Factory for ChiseledPolishedBlackstone"""
-    return MinecraftBlockDescriptor("minecraft:chiseled_polished_blackstone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chiseled_polished_blackstone")
 
 
 def ChiseledQuartzBlock(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ChiseledQuartzBlock"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:chiseled_quartz_block",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
 
 def ChiseledRedSandstone() -> MinecraftBlockDescriptor:
     """Factory for ChiseledRedSandstone"""
-    return MinecraftBlockDescriptor("minecraft:chiseled_red_sandstone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chiseled_red_sandstone")
 
 
 def ChiseledResinBricks() -> MinecraftBlockDescriptor:
     """Factory for ChiseledResinBricks"""
-    return MinecraftBlockDescriptor("minecraft:chiseled_resin_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chiseled_resin_bricks")
 
 
 def ChiseledSandstone() -> MinecraftBlockDescriptor:
     """Factory for ChiseledSandstone"""
-    return MinecraftBlockDescriptor("minecraft:chiseled_sandstone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chiseled_sandstone")
 
 
 def ChiseledStoneBricks() -> MinecraftBlockDescriptor:
     """Factory for ChiseledStoneBricks"""
-    return MinecraftBlockDescriptor("minecraft:chiseled_stone_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chiseled_stone_bricks")
 
 
 def ChiseledSulfur() -> MinecraftBlockDescriptor:
     """Factory for ChiseledSulfur"""
-    return MinecraftBlockDescriptor("minecraft:chiseled_sulfur", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chiseled_sulfur")
 
 
 def ChiseledTuff() -> MinecraftBlockDescriptor:
     """Factory for ChiseledTuff"""
-    return MinecraftBlockDescriptor("minecraft:chiseled_tuff", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chiseled_tuff")
 
 
 def ChiseledTuffBricks() -> MinecraftBlockDescriptor:
     """Factory for ChiseledTuffBricks"""
-    return MinecraftBlockDescriptor("minecraft:chiseled_tuff_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chiseled_tuff_bricks")
 
 
 def ChorusFlower(age: Optional[Age] = None) -> MinecraftBlockDescriptor:
     """Factory for ChorusFlower"""
-    return MinecraftBlockDescriptor(
-        "minecraft:chorus_flower", True, {BlockStateKeys.Age: age}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:chorus_flower", {BlockStateKeys.Age: age}
     )
 
 
 def ChorusPlant() -> MinecraftBlockDescriptor:
     """Factory for ChorusPlant"""
-    return MinecraftBlockDescriptor("minecraft:chorus_plant", True)
+    return MinecraftBlockDescriptor.interned("minecraft:chorus_plant")
 
 
 def Cinnabar() -> MinecraftBlockDescriptor:
     """Factory for Cinnabar"""
-    return MinecraftBlockDescriptor("minecraft:cinnabar", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cinnabar")
 
 
 def CinnabarBrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CinnabarBrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cinnabar_brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -2634,9 +2529,8 @@ def CinnabarBrickStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CinnabarBrickStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cinnabar_brick_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -2652,9 +2546,8 @@ def CinnabarBrickWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CinnabarBrickWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cinnabar_brick_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -2667,16 +2560,15 @@ def CinnabarBrickWall(
 
 def CinnabarBricks() -> MinecraftBlockDescriptor:
     """Factory for CinnabarBricks"""
-    return MinecraftBlockDescriptor("minecraft:cinnabar_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cinnabar_bricks")
 
 
 def CinnabarSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CinnabarSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cinnabar_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -2686,9 +2578,8 @@ def CinnabarStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CinnabarStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cinnabar_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -2704,9 +2595,8 @@ def CinnabarWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CinnabarWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cinnabar_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -2719,36 +2609,35 @@ def CinnabarWall(
 
 def Clay() -> MinecraftBlockDescriptor:
     """Factory for Clay"""
-    return MinecraftBlockDescriptor("minecraft:clay", True)
+    return MinecraftBlockDescriptor.interned("minecraft:clay")
 
 
 def ClosedEyeblossom() -> MinecraftBlockDescriptor:
     """Factory for ClosedEyeblossom"""
-    return MinecraftBlockDescriptor("minecraft:closed_eyeblossom", True)
+    return MinecraftBlockDescriptor.interned("minecraft:closed_eyeblossom")
 
 
 def CoalBlock() -> MinecraftBlockDescriptor:
     """Factory for CoalBlock"""
-    return MinecraftBlockDescriptor("minecraft:coal_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:coal_block")
 
 
 def CoalOre() -> MinecraftBlockDescriptor:
     """Factory for CoalOre"""
-    return MinecraftBlockDescriptor("minecraft:coal_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:coal_ore")
 
 
 def CobbledDeepslate() -> MinecraftBlockDescriptor:
     """Factory for CobbledDeepslate"""
-    return MinecraftBlockDescriptor("minecraft:cobbled_deepslate", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cobbled_deepslate")
 
 
 def CobbledDeepslateDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CobbledDeepslateDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cobbled_deepslate_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -2757,9 +2646,8 @@ def CobbledDeepslateSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CobbledDeepslateSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cobbled_deepslate_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -2769,9 +2657,8 @@ def CobbledDeepslateStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CobbledDeepslateStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cobbled_deepslate_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -2787,9 +2674,8 @@ def CobbledDeepslateWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CobbledDeepslateWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cobbled_deepslate_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -2802,16 +2688,15 @@ def CobbledDeepslateWall(
 
 def Cobblestone() -> MinecraftBlockDescriptor:
     """Factory for Cobblestone"""
-    return MinecraftBlockDescriptor("minecraft:cobblestone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cobblestone")
 
 
 def CobblestoneDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CobblestoneDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cobblestone_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -2820,9 +2705,8 @@ def CobblestoneSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CobblestoneSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cobblestone_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -2835,9 +2719,8 @@ def CobblestoneWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CobblestoneWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cobblestone_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -2852,9 +2735,8 @@ def Cocoa(
     age: Optional[Age] = None, direction: Optional[Direction] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for Cocoa"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cocoa",
-        True,
         {BlockStateKeys.Age: age, BlockStateKeys.Direction: direction},
     )
 
@@ -2863,9 +2745,8 @@ def ColoredTorchBlue(
     torch_facing_direction: Optional[TorchFacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ColoredTorchBlue"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:colored_torch_blue",
-        True,
         {BlockStateKeys.TorchFacingDirection: torch_facing_direction},
     )
 
@@ -2874,9 +2755,8 @@ def ColoredTorchGreen(
     torch_facing_direction: Optional[TorchFacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ColoredTorchGreen"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:colored_torch_green",
-        True,
         {BlockStateKeys.TorchFacingDirection: torch_facing_direction},
     )
 
@@ -2885,9 +2765,8 @@ def ColoredTorchPurple(
     torch_facing_direction: Optional[TorchFacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ColoredTorchPurple"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:colored_torch_purple",
-        True,
         {BlockStateKeys.TorchFacingDirection: torch_facing_direction},
     )
 
@@ -2896,9 +2775,8 @@ def ColoredTorchRed(
     torch_facing_direction: Optional[TorchFacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ColoredTorchRed"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:colored_torch_red",
-        True,
         {BlockStateKeys.TorchFacingDirection: torch_facing_direction},
     )
 
@@ -2908,9 +2786,8 @@ def CommandBlock(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CommandBlock"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:command_block",
-        True,
         {
             BlockStateKeys.ConditionalBit: conditional_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -2922,50 +2799,48 @@ def Composter(
     composter_fill_level: Optional[ComposterFillLevel] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Composter"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:composter",
-        True,
         {BlockStateKeys.ComposterFillLevel: composter_fill_level},
     )
 
 
 def CompoundCreator(direction: Optional[Direction] = None) -> MinecraftBlockDescriptor:
     """Factory for CompoundCreator"""
-    return MinecraftBlockDescriptor(
-        "minecraft:compound_creator", True, {BlockStateKeys.Direction: direction}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:compound_creator", {BlockStateKeys.Direction: direction}
     )
 
 
 def Conduit() -> MinecraftBlockDescriptor:
     """Factory for Conduit"""
-    return MinecraftBlockDescriptor("minecraft:conduit", True)
+    return MinecraftBlockDescriptor.interned("minecraft:conduit")
 
 
 def CopperBars() -> MinecraftBlockDescriptor:
     """Factory for CopperBars"""
-    return MinecraftBlockDescriptor("minecraft:copper_bars", True)
+    return MinecraftBlockDescriptor.interned("minecraft:copper_bars")
 
 
 def CopperBlock() -> MinecraftBlockDescriptor:
     """Factory for CopperBlock"""
-    return MinecraftBlockDescriptor("minecraft:copper_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:copper_block")
 
 
 def CopperBulb(
     lit: Optional[Lit] = None, powered_bit: Optional[PoweredBit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for CopperBulb"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:copper_bulb",
-        True,
         {BlockStateKeys.Lit: lit, BlockStateKeys.PoweredBit: powered_bit},
     )
 
 
 def CopperChain(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for CopperChain"""
-    return MinecraftBlockDescriptor(
-        "minecraft:copper_chain", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:copper_chain", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -2976,9 +2851,8 @@ def CopperDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CopperDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:copper_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -2992,37 +2866,35 @@ def CopperGolemStatue(
     cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CopperGolemStatue"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:copper_golem_statue",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: cardinal_direction},
     )
 
 
 def CopperGrate() -> MinecraftBlockDescriptor:
     """Factory for CopperGrate"""
-    return MinecraftBlockDescriptor("minecraft:copper_grate", True)
+    return MinecraftBlockDescriptor.interned("minecraft:copper_grate")
 
 
 def CopperLantern(hanging: Optional[Hanging] = None) -> MinecraftBlockDescriptor:
     """Factory for CopperLantern"""
-    return MinecraftBlockDescriptor(
-        "minecraft:copper_lantern", True, {BlockStateKeys.Hanging: hanging}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:copper_lantern", {BlockStateKeys.Hanging: hanging}
     )
 
 
 def CopperOre() -> MinecraftBlockDescriptor:
     """Factory for CopperOre"""
-    return MinecraftBlockDescriptor("minecraft:copper_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:copper_ore")
 
 
 def CopperTorch(
     torch_facing_direction: Optional[TorchFacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CopperTorch"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:copper_torch",
-        True,
         {BlockStateKeys.TorchFacingDirection: torch_facing_direction},
     )
 
@@ -3033,9 +2905,8 @@ def CopperTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CopperTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:copper_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -3046,34 +2917,34 @@ def CopperTrapdoor(
 
 def Cornflower() -> MinecraftBlockDescriptor:
     """Factory for Cornflower"""
-    return MinecraftBlockDescriptor("minecraft:cornflower", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cornflower")
 
 
 def CrackedDeepslateBricks() -> MinecraftBlockDescriptor:
     """Factory for CrackedDeepslateBricks"""
-    return MinecraftBlockDescriptor("minecraft:cracked_deepslate_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cracked_deepslate_bricks")
 
 
 def CrackedDeepslateTiles() -> MinecraftBlockDescriptor:
     """Factory for CrackedDeepslateTiles"""
-    return MinecraftBlockDescriptor("minecraft:cracked_deepslate_tiles", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cracked_deepslate_tiles")
 
 
 def CrackedNetherBricks() -> MinecraftBlockDescriptor:
     """Factory for CrackedNetherBricks"""
-    return MinecraftBlockDescriptor("minecraft:cracked_nether_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cracked_nether_bricks")
 
 
 def CrackedPolishedBlackstoneBricks() -> MinecraftBlockDescriptor:
     """Factory for CrackedPolishedBlackstoneBricks"""
-    return MinecraftBlockDescriptor(
-        "minecraft:cracked_polished_blackstone_bricks", True
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:cracked_polished_blackstone_bricks"
     )
 
 
 def CrackedStoneBricks() -> MinecraftBlockDescriptor:
     """Factory for CrackedStoneBricks"""
-    return MinecraftBlockDescriptor("minecraft:cracked_stone_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cracked_stone_bricks")
 
 
 def Crafter(
@@ -3082,9 +2953,8 @@ def Crafter(
     triggered_bit: Optional[TriggeredBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Crafter"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:crafter",
-        True,
         {
             BlockStateKeys.Crafting: crafting,
             BlockStateKeys.Orientation: orientation,
@@ -3095,7 +2965,7 @@ def Crafter(
 
 def CraftingTable() -> MinecraftBlockDescriptor:
     """Factory for CraftingTable"""
-    return MinecraftBlockDescriptor("minecraft:crafting_table", True)
+    return MinecraftBlockDescriptor.interned("minecraft:crafting_table")
 
 
 def CreakingHeart(
@@ -3104,9 +2974,8 @@ def CreakingHeart(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CreakingHeart"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:creaking_heart",
-        True,
         {
             BlockStateKeys.CreakingHeartState: creaking_heart_state,
             BlockStateKeys.Natural: natural,
@@ -3119,9 +2988,8 @@ def CreeperHead(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CreeperHead"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:creeper_head",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
@@ -3131,9 +2999,8 @@ def CrimsonButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CrimsonButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:crimson_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -3148,9 +3015,8 @@ def CrimsonDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CrimsonDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:crimson_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -3164,16 +3030,15 @@ def CrimsonDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CrimsonDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:crimson_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def CrimsonFence() -> MinecraftBlockDescriptor:
     """Factory for CrimsonFence"""
-    return MinecraftBlockDescriptor("minecraft:crimson_fence", True)
+    return MinecraftBlockDescriptor.interned("minecraft:crimson_fence")
 
 
 def CrimsonFenceGate(
@@ -3182,9 +3047,8 @@ def CrimsonFenceGate(
     open_bit: Optional[OpenBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CrimsonFenceGate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:crimson_fence_gate",
-        True,
         {
             BlockStateKeys.InWallBit: in_wall_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -3195,7 +3059,7 @@ def CrimsonFenceGate(
 
 def CrimsonFungus() -> MinecraftBlockDescriptor:
     """Factory for CrimsonFungus"""
-    return MinecraftBlockDescriptor("minecraft:crimson_fungus", True)
+    return MinecraftBlockDescriptor.interned("minecraft:crimson_fungus")
 
 
 def CrimsonHangingSign(
@@ -3205,9 +3069,8 @@ def CrimsonHangingSign(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CrimsonHangingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:crimson_hanging_sign",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -3219,35 +3082,34 @@ def CrimsonHangingSign(
 
 def CrimsonHyphae(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for CrimsonHyphae"""
-    return MinecraftBlockDescriptor(
-        "minecraft:crimson_hyphae", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:crimson_hyphae", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def CrimsonNylium() -> MinecraftBlockDescriptor:
     """Factory for CrimsonNylium"""
-    return MinecraftBlockDescriptor("minecraft:crimson_nylium", True)
+    return MinecraftBlockDescriptor.interned("minecraft:crimson_nylium")
 
 
 def CrimsonPlanks() -> MinecraftBlockDescriptor:
     """Factory for CrimsonPlanks"""
-    return MinecraftBlockDescriptor("minecraft:crimson_planks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:crimson_planks")
 
 
 def CrimsonPressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CrimsonPressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:crimson_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
 
 def CrimsonRoots() -> MinecraftBlockDescriptor:
     """Factory for CrimsonRoots"""
-    return MinecraftBlockDescriptor("minecraft:crimson_roots", True)
+    return MinecraftBlockDescriptor.interned("minecraft:crimson_roots")
 
 
 def CrimsonShelf(
@@ -3256,9 +3118,8 @@ def CrimsonShelf(
     powered_shelf_type: Optional[int] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CrimsonShelf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:crimson_shelf",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: cardinal_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -3271,9 +3132,8 @@ def CrimsonSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CrimsonSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:crimson_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -3283,9 +3143,8 @@ def CrimsonStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CrimsonStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:crimson_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -3297,17 +3156,16 @@ def CrimsonStandingSign(
     ground_sign_direction: Optional[GroundSignDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CrimsonStandingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:crimson_standing_sign",
-        True,
         {BlockStateKeys.GroundSignDirection: ground_sign_direction},
     )
 
 
 def CrimsonStem(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for CrimsonStem"""
-    return MinecraftBlockDescriptor(
-        "minecraft:crimson_stem", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:crimson_stem", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -3317,9 +3175,8 @@ def CrimsonTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CrimsonTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:crimson_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -3332,30 +3189,28 @@ def CrimsonWallSign(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CrimsonWallSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:crimson_wall_sign",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def CryingObsidian() -> MinecraftBlockDescriptor:
     """Factory for CryingObsidian"""
-    return MinecraftBlockDescriptor("minecraft:crying_obsidian", True)
+    return MinecraftBlockDescriptor.interned("minecraft:crying_obsidian")
 
 
 def CutCopper() -> MinecraftBlockDescriptor:
     """Factory for CutCopper"""
-    return MinecraftBlockDescriptor("minecraft:cut_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cut_copper")
 
 
 def CutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -3365,9 +3220,8 @@ def CutCopperStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CutCopperStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cut_copper_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -3377,16 +3231,15 @@ def CutCopperStairs(
 
 def CutRedSandstone() -> MinecraftBlockDescriptor:
     """Factory for CutRedSandstone"""
-    return MinecraftBlockDescriptor("minecraft:cut_red_sandstone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cut_red_sandstone")
 
 
 def CutRedSandstoneDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CutRedSandstoneDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cut_red_sandstone_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -3395,25 +3248,23 @@ def CutRedSandstoneSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CutRedSandstoneSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cut_red_sandstone_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def CutSandstone() -> MinecraftBlockDescriptor:
     """Factory for CutSandstone"""
-    return MinecraftBlockDescriptor("minecraft:cut_sandstone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cut_sandstone")
 
 
 def CutSandstoneDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CutSandstoneDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cut_sandstone_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -3422,9 +3273,8 @@ def CutSandstoneSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CutSandstoneSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cut_sandstone_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -3433,85 +3283,82 @@ def CyanCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for CyanCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cyan_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def CyanCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for CyanCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:cyan_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:cyan_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def CyanCarpet() -> MinecraftBlockDescriptor:
     """Factory for CyanCarpet"""
-    return MinecraftBlockDescriptor("minecraft:cyan_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cyan_carpet")
 
 
 def CyanConcrete() -> MinecraftBlockDescriptor:
     """Factory for CyanConcrete"""
-    return MinecraftBlockDescriptor("minecraft:cyan_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cyan_concrete")
 
 
 def CyanConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for CyanConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:cyan_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cyan_concrete_powder")
 
 
 def CyanGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for CyanGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:cyan_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def CyanShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for CyanShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:cyan_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cyan_shulker_box")
 
 
 def CyanStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for CyanStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:cyan_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cyan_stained_glass")
 
 
 def CyanStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for CyanStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:cyan_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cyan_stained_glass_pane")
 
 
 def CyanTerracotta() -> MinecraftBlockDescriptor:
     """Factory for CyanTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:cyan_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cyan_terracotta")
 
 
 def CyanWool() -> MinecraftBlockDescriptor:
     """Factory for CyanWool"""
-    return MinecraftBlockDescriptor("minecraft:cyan_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:cyan_wool")
 
 
 def DamagedAnvil(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DamagedAnvil"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:damaged_anvil",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
 
 def Dandelion() -> MinecraftBlockDescriptor:
     """Factory for Dandelion"""
-    return MinecraftBlockDescriptor("minecraft:dandelion", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dandelion")
 
 
 def DarkOakButton(
@@ -3519,9 +3366,8 @@ def DarkOakButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkOakButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_oak_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -3536,9 +3382,8 @@ def DarkOakDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkOakDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_oak_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -3552,16 +3397,15 @@ def DarkOakDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkOakDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_oak_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def DarkOakFence() -> MinecraftBlockDescriptor:
     """Factory for DarkOakFence"""
-    return MinecraftBlockDescriptor("minecraft:dark_oak_fence", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dark_oak_fence")
 
 
 def DarkOakFenceGate(
@@ -3570,9 +3414,8 @@ def DarkOakFenceGate(
     open_bit: Optional[OpenBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkOakFenceGate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_oak_fence_gate",
-        True,
         {
             BlockStateKeys.InWallBit: in_wall_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -3588,9 +3431,8 @@ def DarkOakHangingSign(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkOakHangingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_oak_hanging_sign",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -3605,9 +3447,8 @@ def DarkOakLeaves(
     update_bit: Optional[UpdateBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkOakLeaves"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_oak_leaves",
-        True,
         {
             BlockStateKeys.PersistentBit: persistent_bit,
             BlockStateKeys.UpdateBit: update_bit,
@@ -3617,31 +3458,30 @@ def DarkOakLeaves(
 
 def DarkOakLog(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for DarkOakLog"""
-    return MinecraftBlockDescriptor(
-        "minecraft:dark_oak_log", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:dark_oak_log", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def DarkOakPlanks() -> MinecraftBlockDescriptor:
     """Factory for DarkOakPlanks"""
-    return MinecraftBlockDescriptor("minecraft:dark_oak_planks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dark_oak_planks")
 
 
 def DarkOakPressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkOakPressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_oak_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
 
 def DarkOakSapling(age_bit: Optional[AgeBit] = None) -> MinecraftBlockDescriptor:
     """Factory for DarkOakSapling"""
-    return MinecraftBlockDescriptor(
-        "minecraft:dark_oak_sapling", True, {BlockStateKeys.AgeBit: age_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:dark_oak_sapling", {BlockStateKeys.AgeBit: age_bit}
     )
 
 
@@ -3651,9 +3491,8 @@ def DarkOakShelf(
     powered_shelf_type: Optional[int] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkOakShelf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_oak_shelf",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: cardinal_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -3666,9 +3505,8 @@ def DarkOakSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkOakSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_oak_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -3678,9 +3516,8 @@ def DarkOakStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkOakStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_oak_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -3694,9 +3531,8 @@ def DarkOakTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkOakTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_oak_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -3707,23 +3543,22 @@ def DarkOakTrapdoor(
 
 def DarkOakWood(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for DarkOakWood"""
-    return MinecraftBlockDescriptor(
-        "minecraft:dark_oak_wood", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:dark_oak_wood", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def DarkPrismarine() -> MinecraftBlockDescriptor:
     """Factory for DarkPrismarine"""
-    return MinecraftBlockDescriptor("minecraft:dark_prismarine", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dark_prismarine")
 
 
 def DarkPrismarineDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkPrismarineDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_prismarine_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -3732,9 +3567,8 @@ def DarkPrismarineSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkPrismarineSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_prismarine_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -3744,9 +3578,8 @@ def DarkPrismarineStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkPrismarineStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dark_prismarine_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -3758,9 +3591,8 @@ def DarkoakStandingSign(
     ground_sign_direction: Optional[GroundSignDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkoakStandingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:darkoak_standing_sign",
-        True,
         {BlockStateKeys.GroundSignDirection: ground_sign_direction},
     )
 
@@ -3769,9 +3601,8 @@ def DarkoakWallSign(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DarkoakWallSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:darkoak_wall_sign",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
@@ -3780,9 +3611,8 @@ def DaylightDetector(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DaylightDetector"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:daylight_detector",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
@@ -3791,30 +3621,28 @@ def DaylightDetectorInverted(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DaylightDetectorInverted"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:daylight_detector_inverted",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
 
 def DeadBrainCoral() -> MinecraftBlockDescriptor:
     """Factory for DeadBrainCoral"""
-    return MinecraftBlockDescriptor("minecraft:dead_brain_coral", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dead_brain_coral")
 
 
 def DeadBrainCoralBlock() -> MinecraftBlockDescriptor:
     """Factory for DeadBrainCoralBlock"""
-    return MinecraftBlockDescriptor("minecraft:dead_brain_coral_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dead_brain_coral_block")
 
 
 def DeadBrainCoralFan(
     coral_fan_direction: Optional[CoralFanDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeadBrainCoralFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dead_brain_coral_fan",
-        True,
         {BlockStateKeys.CoralFanDirection: coral_fan_direction},
     )
 
@@ -3823,30 +3651,28 @@ def DeadBrainCoralWallFan(
     coral_direction: Optional[CoralDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeadBrainCoralWallFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dead_brain_coral_wall_fan",
-        True,
         {BlockStateKeys.CoralDirection: coral_direction},
     )
 
 
 def DeadBubbleCoral() -> MinecraftBlockDescriptor:
     """Factory for DeadBubbleCoral"""
-    return MinecraftBlockDescriptor("minecraft:dead_bubble_coral", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dead_bubble_coral")
 
 
 def DeadBubbleCoralBlock() -> MinecraftBlockDescriptor:
     """Factory for DeadBubbleCoralBlock"""
-    return MinecraftBlockDescriptor("minecraft:dead_bubble_coral_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dead_bubble_coral_block")
 
 
 def DeadBubbleCoralFan(
     coral_fan_direction: Optional[CoralFanDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeadBubbleCoralFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dead_bubble_coral_fan",
-        True,
         {BlockStateKeys.CoralFanDirection: coral_fan_direction},
     )
 
@@ -3855,30 +3681,28 @@ def DeadBubbleCoralWallFan(
     coral_direction: Optional[CoralDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeadBubbleCoralWallFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dead_bubble_coral_wall_fan",
-        True,
         {BlockStateKeys.CoralDirection: coral_direction},
     )
 
 
 def DeadFireCoral() -> MinecraftBlockDescriptor:
     """Factory for DeadFireCoral"""
-    return MinecraftBlockDescriptor("minecraft:dead_fire_coral", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dead_fire_coral")
 
 
 def DeadFireCoralBlock() -> MinecraftBlockDescriptor:
     """Factory for DeadFireCoralBlock"""
-    return MinecraftBlockDescriptor("minecraft:dead_fire_coral_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dead_fire_coral_block")
 
 
 def DeadFireCoralFan(
     coral_fan_direction: Optional[CoralFanDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeadFireCoralFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dead_fire_coral_fan",
-        True,
         {BlockStateKeys.CoralFanDirection: coral_fan_direction},
     )
 
@@ -3887,30 +3711,28 @@ def DeadFireCoralWallFan(
     coral_direction: Optional[CoralDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeadFireCoralWallFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dead_fire_coral_wall_fan",
-        True,
         {BlockStateKeys.CoralDirection: coral_direction},
     )
 
 
 def DeadHornCoral() -> MinecraftBlockDescriptor:
     """Factory for DeadHornCoral"""
-    return MinecraftBlockDescriptor("minecraft:dead_horn_coral", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dead_horn_coral")
 
 
 def DeadHornCoralBlock() -> MinecraftBlockDescriptor:
     """Factory for DeadHornCoralBlock"""
-    return MinecraftBlockDescriptor("minecraft:dead_horn_coral_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dead_horn_coral_block")
 
 
 def DeadHornCoralFan(
     coral_fan_direction: Optional[CoralFanDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeadHornCoralFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dead_horn_coral_fan",
-        True,
         {BlockStateKeys.CoralFanDirection: coral_fan_direction},
     )
 
@@ -3919,30 +3741,28 @@ def DeadHornCoralWallFan(
     coral_direction: Optional[CoralDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeadHornCoralWallFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dead_horn_coral_wall_fan",
-        True,
         {BlockStateKeys.CoralDirection: coral_direction},
     )
 
 
 def DeadTubeCoral() -> MinecraftBlockDescriptor:
     """Factory for DeadTubeCoral"""
-    return MinecraftBlockDescriptor("minecraft:dead_tube_coral", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dead_tube_coral")
 
 
 def DeadTubeCoralBlock() -> MinecraftBlockDescriptor:
     """Factory for DeadTubeCoralBlock"""
-    return MinecraftBlockDescriptor("minecraft:dead_tube_coral_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dead_tube_coral_block")
 
 
 def DeadTubeCoralFan(
     coral_fan_direction: Optional[CoralFanDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeadTubeCoralFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dead_tube_coral_fan",
-        True,
         {BlockStateKeys.CoralFanDirection: coral_fan_direction},
     )
 
@@ -3951,29 +3771,28 @@ def DeadTubeCoralWallFan(
     coral_direction: Optional[CoralDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeadTubeCoralWallFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dead_tube_coral_wall_fan",
-        True,
         {BlockStateKeys.CoralDirection: coral_direction},
     )
 
 
 def Deadbush() -> MinecraftBlockDescriptor:
     """Factory for Deadbush"""
-    return MinecraftBlockDescriptor("minecraft:deadbush", True)
+    return MinecraftBlockDescriptor.interned("minecraft:deadbush")
 
 
 def DecoratedPot(direction: Optional[Direction] = None) -> MinecraftBlockDescriptor:
     """Factory for DecoratedPot"""
-    return MinecraftBlockDescriptor(
-        "minecraft:decorated_pot", True, {BlockStateKeys.Direction: direction}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:decorated_pot", {BlockStateKeys.Direction: direction}
     )
 
 
 def Deepslate(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for Deepslate"""
-    return MinecraftBlockDescriptor(
-        "minecraft:deepslate", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:deepslate", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -3981,9 +3800,8 @@ def DeepslateBrickDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeepslateBrickDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:deepslate_brick_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -3992,9 +3810,8 @@ def DeepslateBrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeepslateBrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:deepslate_brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -4004,9 +3821,8 @@ def DeepslateBrickStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeepslateBrickStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:deepslate_brick_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -4022,9 +3838,8 @@ def DeepslateBrickWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeepslateBrickWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:deepslate_brick_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -4037,56 +3852,55 @@ def DeepslateBrickWall(
 
 def DeepslateBricks() -> MinecraftBlockDescriptor:
     """Factory for DeepslateBricks"""
-    return MinecraftBlockDescriptor("minecraft:deepslate_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:deepslate_bricks")
 
 
 def DeepslateCoalOre() -> MinecraftBlockDescriptor:
     """Factory for DeepslateCoalOre"""
-    return MinecraftBlockDescriptor("minecraft:deepslate_coal_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:deepslate_coal_ore")
 
 
 def DeepslateCopperOre() -> MinecraftBlockDescriptor:
     """Factory for DeepslateCopperOre"""
-    return MinecraftBlockDescriptor("minecraft:deepslate_copper_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:deepslate_copper_ore")
 
 
 def DeepslateDiamondOre() -> MinecraftBlockDescriptor:
     """Factory for DeepslateDiamondOre"""
-    return MinecraftBlockDescriptor("minecraft:deepslate_diamond_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:deepslate_diamond_ore")
 
 
 def DeepslateEmeraldOre() -> MinecraftBlockDescriptor:
     """Factory for DeepslateEmeraldOre"""
-    return MinecraftBlockDescriptor("minecraft:deepslate_emerald_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:deepslate_emerald_ore")
 
 
 def DeepslateGoldOre() -> MinecraftBlockDescriptor:
     """Factory for DeepslateGoldOre"""
-    return MinecraftBlockDescriptor("minecraft:deepslate_gold_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:deepslate_gold_ore")
 
 
 def DeepslateIronOre() -> MinecraftBlockDescriptor:
     """Factory for DeepslateIronOre"""
-    return MinecraftBlockDescriptor("minecraft:deepslate_iron_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:deepslate_iron_ore")
 
 
 def DeepslateLapisOre() -> MinecraftBlockDescriptor:
     """Factory for DeepslateLapisOre"""
-    return MinecraftBlockDescriptor("minecraft:deepslate_lapis_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:deepslate_lapis_ore")
 
 
 def DeepslateRedstoneOre() -> MinecraftBlockDescriptor:
     """Factory for DeepslateRedstoneOre"""
-    return MinecraftBlockDescriptor("minecraft:deepslate_redstone_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:deepslate_redstone_ore")
 
 
 def DeepslateTileDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeepslateTileDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:deepslate_tile_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -4095,9 +3909,8 @@ def DeepslateTileSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeepslateTileSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:deepslate_tile_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -4107,9 +3920,8 @@ def DeepslateTileStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeepslateTileStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:deepslate_tile_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -4125,9 +3937,8 @@ def DeepslateTileWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DeepslateTileWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:deepslate_tile_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -4140,12 +3951,12 @@ def DeepslateTileWall(
 
 def DeepslateTiles() -> MinecraftBlockDescriptor:
     """Factory for DeepslateTiles"""
-    return MinecraftBlockDescriptor("minecraft:deepslate_tiles", True)
+    return MinecraftBlockDescriptor.interned("minecraft:deepslate_tiles")
 
 
 def Deny() -> MinecraftBlockDescriptor:
     """Factory for Deny"""
-    return MinecraftBlockDescriptor("minecraft:deny", True)
+    return MinecraftBlockDescriptor.interned("minecraft:deny")
 
 
 def DetectorRail(
@@ -4153,9 +3964,8 @@ def DetectorRail(
     rail_direction: Optional[RailDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DetectorRail"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:detector_rail",
-        True,
         {
             BlockStateKeys.RailDataBit: rail_data_bit,
             BlockStateKeys.RailDirection: rail_direction,
@@ -4165,26 +3975,25 @@ def DetectorRail(
 
 def DiamondBlock() -> MinecraftBlockDescriptor:
     """Factory for DiamondBlock"""
-    return MinecraftBlockDescriptor("minecraft:diamond_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:diamond_block")
 
 
 def DiamondOre() -> MinecraftBlockDescriptor:
     """Factory for DiamondOre"""
-    return MinecraftBlockDescriptor("minecraft:diamond_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:diamond_ore")
 
 
 def Diorite() -> MinecraftBlockDescriptor:
     """Factory for Diorite"""
-    return MinecraftBlockDescriptor("minecraft:diorite", True)
+    return MinecraftBlockDescriptor.interned("minecraft:diorite")
 
 
 def DioriteDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DioriteDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:diorite_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -4193,9 +4002,8 @@ def DioriteSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DioriteSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:diorite_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -4205,9 +4013,8 @@ def DioriteStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DioriteStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:diorite_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -4223,9 +4030,8 @@ def DioriteWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DioriteWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:diorite_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -4238,14 +4044,14 @@ def DioriteWall(
 
 def Dirt(dirt_type: Optional[DirtType | None] = None) -> MinecraftBlockDescriptor:
     """Factory for Dirt"""
-    return MinecraftBlockDescriptor(
-        "minecraft:dirt", True, {BlockStateKeys.DirtType: dirt_type}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:dirt", {BlockStateKeys.DirtType: dirt_type}
     )
 
 
 def DirtWithRoots() -> MinecraftBlockDescriptor:
     """Factory for DirtWithRoots"""
-    return MinecraftBlockDescriptor("minecraft:dirt_with_roots", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dirt_with_roots")
 
 
 def Dispenser(
@@ -4253,9 +4059,8 @@ def Dispenser(
     triggered_bit: Optional[TriggeredBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Dispenser"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dispenser",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.TriggeredBit: triggered_bit,
@@ -4267,25 +4072,23 @@ def DoubleCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DoubleCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:double_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def DragonEgg() -> MinecraftBlockDescriptor:
     """Factory for DragonEgg"""
-    return MinecraftBlockDescriptor("minecraft:dragon_egg", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dragon_egg")
 
 
 def DragonHead(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DragonHead"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dragon_head",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
@@ -4295,9 +4098,8 @@ def DriedGhast(
     rehydration_level: Optional[RehydrationLevel] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for DriedGhast"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dried_ghast",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
             BlockStateKeys.RehydrationLevel: rehydration_level,
@@ -4307,12 +4109,12 @@ def DriedGhast(
 
 def DriedKelpBlock() -> MinecraftBlockDescriptor:
     """Factory for DriedKelpBlock"""
-    return MinecraftBlockDescriptor("minecraft:dried_kelp_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dried_kelp_block")
 
 
 def DripstoneBlock() -> MinecraftBlockDescriptor:
     """Factory for DripstoneBlock"""
-    return MinecraftBlockDescriptor("minecraft:dripstone_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:dripstone_block")
 
 
 def Dropper(
@@ -4320,9 +4122,8 @@ def Dropper(
     triggered_bit: Optional[TriggeredBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Dropper"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:dropper",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.TriggeredBit: triggered_bit,
@@ -4332,623 +4133,622 @@ def Dropper(
 
 def Element0() -> MinecraftBlockDescriptor:
     """Factory for Element0"""
-    return MinecraftBlockDescriptor("minecraft:element_0", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_0")
 
 
 def Element1() -> MinecraftBlockDescriptor:
     """Factory for Element1"""
-    return MinecraftBlockDescriptor("minecraft:element_1", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_1")
 
 
 def Element10() -> MinecraftBlockDescriptor:
     """Factory for Element10"""
-    return MinecraftBlockDescriptor("minecraft:element_10", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_10")
 
 
 def Element100() -> MinecraftBlockDescriptor:
     """Factory for Element100"""
-    return MinecraftBlockDescriptor("minecraft:element_100", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_100")
 
 
 def Element101() -> MinecraftBlockDescriptor:
     """Factory for Element101"""
-    return MinecraftBlockDescriptor("minecraft:element_101", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_101")
 
 
 def Element102() -> MinecraftBlockDescriptor:
     """Factory for Element102"""
-    return MinecraftBlockDescriptor("minecraft:element_102", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_102")
 
 
 def Element103() -> MinecraftBlockDescriptor:
     """Factory for Element103"""
-    return MinecraftBlockDescriptor("minecraft:element_103", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_103")
 
 
 def Element104() -> MinecraftBlockDescriptor:
     """Factory for Element104"""
-    return MinecraftBlockDescriptor("minecraft:element_104", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_104")
 
 
 def Element105() -> MinecraftBlockDescriptor:
     """Factory for Element105"""
-    return MinecraftBlockDescriptor("minecraft:element_105", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_105")
 
 
 def Element106() -> MinecraftBlockDescriptor:
     """Factory for Element106"""
-    return MinecraftBlockDescriptor("minecraft:element_106", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_106")
 
 
 def Element107() -> MinecraftBlockDescriptor:
     """Factory for Element107"""
-    return MinecraftBlockDescriptor("minecraft:element_107", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_107")
 
 
 def Element108() -> MinecraftBlockDescriptor:
     """Factory for Element108"""
-    return MinecraftBlockDescriptor("minecraft:element_108", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_108")
 
 
 def Element109() -> MinecraftBlockDescriptor:
     """Factory for Element109"""
-    return MinecraftBlockDescriptor("minecraft:element_109", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_109")
 
 
 def Element11() -> MinecraftBlockDescriptor:
     """Factory for Element11"""
-    return MinecraftBlockDescriptor("minecraft:element_11", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_11")
 
 
 def Element110() -> MinecraftBlockDescriptor:
     """Factory for Element110"""
-    return MinecraftBlockDescriptor("minecraft:element_110", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_110")
 
 
 def Element111() -> MinecraftBlockDescriptor:
     """Factory for Element111"""
-    return MinecraftBlockDescriptor("minecraft:element_111", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_111")
 
 
 def Element112() -> MinecraftBlockDescriptor:
     """Factory for Element112"""
-    return MinecraftBlockDescriptor("minecraft:element_112", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_112")
 
 
 def Element113() -> MinecraftBlockDescriptor:
     """Factory for Element113"""
-    return MinecraftBlockDescriptor("minecraft:element_113", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_113")
 
 
 def Element114() -> MinecraftBlockDescriptor:
     """Factory for Element114"""
-    return MinecraftBlockDescriptor("minecraft:element_114", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_114")
 
 
 def Element115() -> MinecraftBlockDescriptor:
     """Factory for Element115"""
-    return MinecraftBlockDescriptor("minecraft:element_115", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_115")
 
 
 def Element116() -> MinecraftBlockDescriptor:
     """Factory for Element116"""
-    return MinecraftBlockDescriptor("minecraft:element_116", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_116")
 
 
 def Element117() -> MinecraftBlockDescriptor:
     """Factory for Element117"""
-    return MinecraftBlockDescriptor("minecraft:element_117", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_117")
 
 
 def Element118() -> MinecraftBlockDescriptor:
     """Factory for Element118"""
-    return MinecraftBlockDescriptor("minecraft:element_118", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_118")
 
 
 def Element12() -> MinecraftBlockDescriptor:
     """Factory for Element12"""
-    return MinecraftBlockDescriptor("minecraft:element_12", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_12")
 
 
 def Element13() -> MinecraftBlockDescriptor:
     """Factory for Element13"""
-    return MinecraftBlockDescriptor("minecraft:element_13", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_13")
 
 
 def Element14() -> MinecraftBlockDescriptor:
     """Factory for Element14"""
-    return MinecraftBlockDescriptor("minecraft:element_14", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_14")
 
 
 def Element15() -> MinecraftBlockDescriptor:
     """Factory for Element15"""
-    return MinecraftBlockDescriptor("minecraft:element_15", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_15")
 
 
 def Element16() -> MinecraftBlockDescriptor:
     """Factory for Element16"""
-    return MinecraftBlockDescriptor("minecraft:element_16", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_16")
 
 
 def Element17() -> MinecraftBlockDescriptor:
     """Factory for Element17"""
-    return MinecraftBlockDescriptor("minecraft:element_17", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_17")
 
 
 def Element18() -> MinecraftBlockDescriptor:
     """Factory for Element18"""
-    return MinecraftBlockDescriptor("minecraft:element_18", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_18")
 
 
 def Element19() -> MinecraftBlockDescriptor:
     """Factory for Element19"""
-    return MinecraftBlockDescriptor("minecraft:element_19", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_19")
 
 
 def Element2() -> MinecraftBlockDescriptor:
     """Factory for Element2"""
-    return MinecraftBlockDescriptor("minecraft:element_2", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_2")
 
 
 def Element20() -> MinecraftBlockDescriptor:
     """Factory for Element20"""
-    return MinecraftBlockDescriptor("minecraft:element_20", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_20")
 
 
 def Element21() -> MinecraftBlockDescriptor:
     """Factory for Element21"""
-    return MinecraftBlockDescriptor("minecraft:element_21", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_21")
 
 
 def Element22() -> MinecraftBlockDescriptor:
     """Factory for Element22"""
-    return MinecraftBlockDescriptor("minecraft:element_22", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_22")
 
 
 def Element23() -> MinecraftBlockDescriptor:
     """Factory for Element23"""
-    return MinecraftBlockDescriptor("minecraft:element_23", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_23")
 
 
 def Element24() -> MinecraftBlockDescriptor:
     """Factory for Element24"""
-    return MinecraftBlockDescriptor("minecraft:element_24", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_24")
 
 
 def Element25() -> MinecraftBlockDescriptor:
     """Factory for Element25"""
-    return MinecraftBlockDescriptor("minecraft:element_25", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_25")
 
 
 def Element26() -> MinecraftBlockDescriptor:
     """Factory for Element26"""
-    return MinecraftBlockDescriptor("minecraft:element_26", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_26")
 
 
 def Element27() -> MinecraftBlockDescriptor:
     """Factory for Element27"""
-    return MinecraftBlockDescriptor("minecraft:element_27", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_27")
 
 
 def Element28() -> MinecraftBlockDescriptor:
     """Factory for Element28"""
-    return MinecraftBlockDescriptor("minecraft:element_28", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_28")
 
 
 def Element29() -> MinecraftBlockDescriptor:
     """Factory for Element29"""
-    return MinecraftBlockDescriptor("minecraft:element_29", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_29")
 
 
 def Element3() -> MinecraftBlockDescriptor:
     """Factory for Element3"""
-    return MinecraftBlockDescriptor("minecraft:element_3", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_3")
 
 
 def Element30() -> MinecraftBlockDescriptor:
     """Factory for Element30"""
-    return MinecraftBlockDescriptor("minecraft:element_30", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_30")
 
 
 def Element31() -> MinecraftBlockDescriptor:
     """Factory for Element31"""
-    return MinecraftBlockDescriptor("minecraft:element_31", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_31")
 
 
 def Element32() -> MinecraftBlockDescriptor:
     """Factory for Element32"""
-    return MinecraftBlockDescriptor("minecraft:element_32", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_32")
 
 
 def Element33() -> MinecraftBlockDescriptor:
     """Factory for Element33"""
-    return MinecraftBlockDescriptor("minecraft:element_33", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_33")
 
 
 def Element34() -> MinecraftBlockDescriptor:
     """Factory for Element34"""
-    return MinecraftBlockDescriptor("minecraft:element_34", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_34")
 
 
 def Element35() -> MinecraftBlockDescriptor:
     """Factory for Element35"""
-    return MinecraftBlockDescriptor("minecraft:element_35", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_35")
 
 
 def Element36() -> MinecraftBlockDescriptor:
     """Factory for Element36"""
-    return MinecraftBlockDescriptor("minecraft:element_36", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_36")
 
 
 def Element37() -> MinecraftBlockDescriptor:
     """Factory for Element37"""
-    return MinecraftBlockDescriptor("minecraft:element_37", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_37")
 
 
 def Element38() -> MinecraftBlockDescriptor:
     """Factory for Element38"""
-    return MinecraftBlockDescriptor("minecraft:element_38", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_38")
 
 
 def Element39() -> MinecraftBlockDescriptor:
     """Factory for Element39"""
-    return MinecraftBlockDescriptor("minecraft:element_39", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_39")
 
 
 def Element4() -> MinecraftBlockDescriptor:
     """Factory for Element4"""
-    return MinecraftBlockDescriptor("minecraft:element_4", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_4")
 
 
 def Element40() -> MinecraftBlockDescriptor:
     """Factory for Element40"""
-    return MinecraftBlockDescriptor("minecraft:element_40", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_40")
 
 
 def Element41() -> MinecraftBlockDescriptor:
     """Factory for Element41"""
-    return MinecraftBlockDescriptor("minecraft:element_41", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_41")
 
 
 def Element42() -> MinecraftBlockDescriptor:
     """Factory for Element42"""
-    return MinecraftBlockDescriptor("minecraft:element_42", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_42")
 
 
 def Element43() -> MinecraftBlockDescriptor:
     """Factory for Element43"""
-    return MinecraftBlockDescriptor("minecraft:element_43", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_43")
 
 
 def Element44() -> MinecraftBlockDescriptor:
     """Factory for Element44"""
-    return MinecraftBlockDescriptor("minecraft:element_44", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_44")
 
 
 def Element45() -> MinecraftBlockDescriptor:
     """Factory for Element45"""
-    return MinecraftBlockDescriptor("minecraft:element_45", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_45")
 
 
 def Element46() -> MinecraftBlockDescriptor:
     """Factory for Element46"""
-    return MinecraftBlockDescriptor("minecraft:element_46", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_46")
 
 
 def Element47() -> MinecraftBlockDescriptor:
     """Factory for Element47"""
-    return MinecraftBlockDescriptor("minecraft:element_47", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_47")
 
 
 def Element48() -> MinecraftBlockDescriptor:
     """Factory for Element48"""
-    return MinecraftBlockDescriptor("minecraft:element_48", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_48")
 
 
 def Element49() -> MinecraftBlockDescriptor:
     """Factory for Element49"""
-    return MinecraftBlockDescriptor("minecraft:element_49", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_49")
 
 
 def Element5() -> MinecraftBlockDescriptor:
     """Factory for Element5"""
-    return MinecraftBlockDescriptor("minecraft:element_5", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_5")
 
 
 def Element50() -> MinecraftBlockDescriptor:
     """Factory for Element50"""
-    return MinecraftBlockDescriptor("minecraft:element_50", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_50")
 
 
 def Element51() -> MinecraftBlockDescriptor:
     """Factory for Element51"""
-    return MinecraftBlockDescriptor("minecraft:element_51", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_51")
 
 
 def Element52() -> MinecraftBlockDescriptor:
     """Factory for Element52"""
-    return MinecraftBlockDescriptor("minecraft:element_52", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_52")
 
 
 def Element53() -> MinecraftBlockDescriptor:
     """Factory for Element53"""
-    return MinecraftBlockDescriptor("minecraft:element_53", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_53")
 
 
 def Element54() -> MinecraftBlockDescriptor:
     """Factory for Element54"""
-    return MinecraftBlockDescriptor("minecraft:element_54", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_54")
 
 
 def Element55() -> MinecraftBlockDescriptor:
     """Factory for Element55"""
-    return MinecraftBlockDescriptor("minecraft:element_55", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_55")
 
 
 def Element56() -> MinecraftBlockDescriptor:
     """Factory for Element56"""
-    return MinecraftBlockDescriptor("minecraft:element_56", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_56")
 
 
 def Element57() -> MinecraftBlockDescriptor:
     """Factory for Element57"""
-    return MinecraftBlockDescriptor("minecraft:element_57", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_57")
 
 
 def Element58() -> MinecraftBlockDescriptor:
     """Factory for Element58"""
-    return MinecraftBlockDescriptor("minecraft:element_58", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_58")
 
 
 def Element59() -> MinecraftBlockDescriptor:
     """Factory for Element59"""
-    return MinecraftBlockDescriptor("minecraft:element_59", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_59")
 
 
 def Element6() -> MinecraftBlockDescriptor:
     """Factory for Element6"""
-    return MinecraftBlockDescriptor("minecraft:element_6", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_6")
 
 
 def Element60() -> MinecraftBlockDescriptor:
     """Factory for Element60"""
-    return MinecraftBlockDescriptor("minecraft:element_60", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_60")
 
 
 def Element61() -> MinecraftBlockDescriptor:
     """Factory for Element61"""
-    return MinecraftBlockDescriptor("minecraft:element_61", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_61")
 
 
 def Element62() -> MinecraftBlockDescriptor:
     """Factory for Element62"""
-    return MinecraftBlockDescriptor("minecraft:element_62", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_62")
 
 
 def Element63() -> MinecraftBlockDescriptor:
     """Factory for Element63"""
-    return MinecraftBlockDescriptor("minecraft:element_63", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_63")
 
 
 def Element64() -> MinecraftBlockDescriptor:
     """Factory for Element64"""
-    return MinecraftBlockDescriptor("minecraft:element_64", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_64")
 
 
 def Element65() -> MinecraftBlockDescriptor:
     """Factory for Element65"""
-    return MinecraftBlockDescriptor("minecraft:element_65", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_65")
 
 
 def Element66() -> MinecraftBlockDescriptor:
     """Factory for Element66"""
-    return MinecraftBlockDescriptor("minecraft:element_66", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_66")
 
 
 def Element67() -> MinecraftBlockDescriptor:
     """Factory for Element67"""
-    return MinecraftBlockDescriptor("minecraft:element_67", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_67")
 
 
 def Element68() -> MinecraftBlockDescriptor:
     """Factory for Element68"""
-    return MinecraftBlockDescriptor("minecraft:element_68", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_68")
 
 
 def Element69() -> MinecraftBlockDescriptor:
     """Factory for Element69"""
-    return MinecraftBlockDescriptor("minecraft:element_69", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_69")
 
 
 def Element7() -> MinecraftBlockDescriptor:
     """Factory for Element7"""
-    return MinecraftBlockDescriptor("minecraft:element_7", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_7")
 
 
 def Element70() -> MinecraftBlockDescriptor:
     """Factory for Element70"""
-    return MinecraftBlockDescriptor("minecraft:element_70", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_70")
 
 
 def Element71() -> MinecraftBlockDescriptor:
     """Factory for Element71"""
-    return MinecraftBlockDescriptor("minecraft:element_71", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_71")
 
 
 def Element72() -> MinecraftBlockDescriptor:
     """Factory for Element72"""
-    return MinecraftBlockDescriptor("minecraft:element_72", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_72")
 
 
 def Element73() -> MinecraftBlockDescriptor:
     """Factory for Element73"""
-    return MinecraftBlockDescriptor("minecraft:element_73", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_73")
 
 
 def Element74() -> MinecraftBlockDescriptor:
     """Factory for Element74"""
-    return MinecraftBlockDescriptor("minecraft:element_74", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_74")
 
 
 def Element75() -> MinecraftBlockDescriptor:
     """Factory for Element75"""
-    return MinecraftBlockDescriptor("minecraft:element_75", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_75")
 
 
 def Element76() -> MinecraftBlockDescriptor:
     """Factory for Element76"""
-    return MinecraftBlockDescriptor("minecraft:element_76", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_76")
 
 
 def Element77() -> MinecraftBlockDescriptor:
     """Factory for Element77"""
-    return MinecraftBlockDescriptor("minecraft:element_77", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_77")
 
 
 def Element78() -> MinecraftBlockDescriptor:
     """Factory for Element78"""
-    return MinecraftBlockDescriptor("minecraft:element_78", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_78")
 
 
 def Element79() -> MinecraftBlockDescriptor:
     """Factory for Element79"""
-    return MinecraftBlockDescriptor("minecraft:element_79", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_79")
 
 
 def Element8() -> MinecraftBlockDescriptor:
     """Factory for Element8"""
-    return MinecraftBlockDescriptor("minecraft:element_8", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_8")
 
 
 def Element80() -> MinecraftBlockDescriptor:
     """Factory for Element80"""
-    return MinecraftBlockDescriptor("minecraft:element_80", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_80")
 
 
 def Element81() -> MinecraftBlockDescriptor:
     """Factory for Element81"""
-    return MinecraftBlockDescriptor("minecraft:element_81", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_81")
 
 
 def Element82() -> MinecraftBlockDescriptor:
     """Factory for Element82"""
-    return MinecraftBlockDescriptor("minecraft:element_82", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_82")
 
 
 def Element83() -> MinecraftBlockDescriptor:
     """Factory for Element83"""
-    return MinecraftBlockDescriptor("minecraft:element_83", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_83")
 
 
 def Element84() -> MinecraftBlockDescriptor:
     """Factory for Element84"""
-    return MinecraftBlockDescriptor("minecraft:element_84", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_84")
 
 
 def Element85() -> MinecraftBlockDescriptor:
     """Factory for Element85"""
-    return MinecraftBlockDescriptor("minecraft:element_85", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_85")
 
 
 def Element86() -> MinecraftBlockDescriptor:
     """Factory for Element86"""
-    return MinecraftBlockDescriptor("minecraft:element_86", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_86")
 
 
 def Element87() -> MinecraftBlockDescriptor:
     """Factory for Element87"""
-    return MinecraftBlockDescriptor("minecraft:element_87", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_87")
 
 
 def Element88() -> MinecraftBlockDescriptor:
     """Factory for Element88"""
-    return MinecraftBlockDescriptor("minecraft:element_88", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_88")
 
 
 def Element89() -> MinecraftBlockDescriptor:
     """Factory for Element89"""
-    return MinecraftBlockDescriptor("minecraft:element_89", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_89")
 
 
 def Element9() -> MinecraftBlockDescriptor:
     """Factory for Element9"""
-    return MinecraftBlockDescriptor("minecraft:element_9", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_9")
 
 
 def Element90() -> MinecraftBlockDescriptor:
     """Factory for Element90"""
-    return MinecraftBlockDescriptor("minecraft:element_90", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_90")
 
 
 def Element91() -> MinecraftBlockDescriptor:
     """Factory for Element91"""
-    return MinecraftBlockDescriptor("minecraft:element_91", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_91")
 
 
 def Element92() -> MinecraftBlockDescriptor:
     """Factory for Element92"""
-    return MinecraftBlockDescriptor("minecraft:element_92", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_92")
 
 
 def Element93() -> MinecraftBlockDescriptor:
     """Factory for Element93"""
-    return MinecraftBlockDescriptor("minecraft:element_93", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_93")
 
 
 def Element94() -> MinecraftBlockDescriptor:
     """Factory for Element94"""
-    return MinecraftBlockDescriptor("minecraft:element_94", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_94")
 
 
 def Element95() -> MinecraftBlockDescriptor:
     """Factory for Element95"""
-    return MinecraftBlockDescriptor("minecraft:element_95", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_95")
 
 
 def Element96() -> MinecraftBlockDescriptor:
     """Factory for Element96"""
-    return MinecraftBlockDescriptor("minecraft:element_96", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_96")
 
 
 def Element97() -> MinecraftBlockDescriptor:
     """Factory for Element97"""
-    return MinecraftBlockDescriptor("minecraft:element_97", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_97")
 
 
 def Element98() -> MinecraftBlockDescriptor:
     """Factory for Element98"""
-    return MinecraftBlockDescriptor("minecraft:element_98", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_98")
 
 
 def Element99() -> MinecraftBlockDescriptor:
     """Factory for Element99"""
-    return MinecraftBlockDescriptor("minecraft:element_99", True)
+    return MinecraftBlockDescriptor.interned("minecraft:element_99")
 
 
 def ElementConstructor(
     direction: Optional[Direction] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ElementConstructor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:element_constructor",
-        True,
         {BlockStateKeys.Direction: direction},
     )
 
 
 def EmeraldBlock() -> MinecraftBlockDescriptor:
     """Factory for EmeraldBlock"""
-    return MinecraftBlockDescriptor("minecraft:emerald_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:emerald_block")
 
 
 def EmeraldOre() -> MinecraftBlockDescriptor:
     """Factory for EmeraldOre"""
-    return MinecraftBlockDescriptor("minecraft:emerald_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:emerald_ore")
 
 
 def EnchantingTable() -> MinecraftBlockDescriptor:
     """Factory for EnchantingTable"""
-    return MinecraftBlockDescriptor("minecraft:enchanting_table", True)
+    return MinecraftBlockDescriptor.interned("minecraft:enchanting_table")
 
 
 def EndBrickStairs(
@@ -4956,9 +4756,8 @@ def EndBrickStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for EndBrickStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:end_brick_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -4968,12 +4767,12 @@ def EndBrickStairs(
 
 def EndBricks() -> MinecraftBlockDescriptor:
     """Factory for EndBricks"""
-    return MinecraftBlockDescriptor("minecraft:end_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:end_bricks")
 
 
 def EndPortal() -> MinecraftBlockDescriptor:
     """Factory for EndPortal"""
-    return MinecraftBlockDescriptor("minecraft:end_portal", True)
+    return MinecraftBlockDescriptor.interned("minecraft:end_portal")
 
 
 def EndPortalFrame(
@@ -4981,9 +4780,8 @@ def EndPortalFrame(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for EndPortalFrame"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:end_portal_frame",
-        True,
         {
             BlockStateKeys.EndPortalEyeBit: end_portal_eye_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -4995,25 +4793,23 @@ def EndRod(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for EndRod"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:end_rod",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def EndStone() -> MinecraftBlockDescriptor:
     """Factory for EndStone"""
-    return MinecraftBlockDescriptor("minecraft:end_stone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:end_stone")
 
 
 def EndStoneBrickDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for EndStoneBrickDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:end_stone_brick_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -5022,9 +4818,8 @@ def EndStoneBrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for EndStoneBrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:end_stone_brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -5037,9 +4832,8 @@ def EndStoneBrickWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for EndStoneBrickWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:end_stone_brick_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -5054,42 +4848,40 @@ def EnderChest(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for EnderChest"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:ender_chest",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
 
 def ExposedChiseledCopper() -> MinecraftBlockDescriptor:
     """Factory for ExposedChiseledCopper"""
-    return MinecraftBlockDescriptor("minecraft:exposed_chiseled_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:exposed_chiseled_copper")
 
 
 def ExposedCopper() -> MinecraftBlockDescriptor:
     """Factory for ExposedCopper"""
-    return MinecraftBlockDescriptor("minecraft:exposed_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:exposed_copper")
 
 
 def ExposedCopperBars() -> MinecraftBlockDescriptor:
     """Factory for ExposedCopperBars"""
-    return MinecraftBlockDescriptor("minecraft:exposed_copper_bars", True)
+    return MinecraftBlockDescriptor.interned("minecraft:exposed_copper_bars")
 
 
 def ExposedCopperBulb(
     lit: Optional[Lit] = None, powered_bit: Optional[PoweredBit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for ExposedCopperBulb"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:exposed_copper_bulb",
-        True,
         {BlockStateKeys.Lit: lit, BlockStateKeys.PoweredBit: powered_bit},
     )
 
 
 def ExposedCopperChain() -> MinecraftBlockDescriptor:
     """Factory for ExposedCopperChain"""
-    return MinecraftBlockDescriptor("minecraft:exposed_copper_chain", True)
+    return MinecraftBlockDescriptor.interned("minecraft:exposed_copper_chain")
 
 
 def ExposedCopperDoor(
@@ -5099,9 +4891,8 @@ def ExposedCopperDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ExposedCopperDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:exposed_copper_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -5115,22 +4906,21 @@ def ExposedCopperGolemStatue(
     cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ExposedCopperGolemStatue"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:exposed_copper_golem_statue",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: cardinal_direction},
     )
 
 
 def ExposedCopperGrate() -> MinecraftBlockDescriptor:
     """Factory for ExposedCopperGrate"""
-    return MinecraftBlockDescriptor("minecraft:exposed_copper_grate", True)
+    return MinecraftBlockDescriptor.interned("minecraft:exposed_copper_grate")
 
 
 def ExposedCopperLantern(hanging: Optional[Hanging] = None) -> MinecraftBlockDescriptor:
     """Factory for ExposedCopperLantern"""
-    return MinecraftBlockDescriptor(
-        "minecraft:exposed_copper_lantern", True, {BlockStateKeys.Hanging: hanging}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:exposed_copper_lantern", {BlockStateKeys.Hanging: hanging}
     )
 
 
@@ -5140,9 +4930,8 @@ def ExposedCopperTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ExposedCopperTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:exposed_copper_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -5153,16 +4942,15 @@ def ExposedCopperTrapdoor(
 
 def ExposedCutCopper() -> MinecraftBlockDescriptor:
     """Factory for ExposedCutCopper"""
-    return MinecraftBlockDescriptor("minecraft:exposed_cut_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:exposed_cut_copper")
 
 
 def ExposedCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ExposedCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:exposed_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -5172,9 +4960,8 @@ def ExposedCutCopperStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ExposedCutCopperStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:exposed_cut_copper_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -5186,9 +4973,8 @@ def ExposedDoubleCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ExposedDoubleCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:exposed_double_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -5198,9 +4984,8 @@ def ExposedLightningRod(
     powered_bit: Optional[PoweredBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ExposedLightningRod"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:exposed_lightning_rod",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -5212,9 +4997,8 @@ def Farmland(
     moisturized_amount: Optional[MoisturizedAmount] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Farmland"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:farmland",
-        True,
         {BlockStateKeys.MoisturizedAmount: moisturized_amount},
     )
 
@@ -5225,9 +5009,8 @@ def FenceGate(
     open_bit: Optional[OpenBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for FenceGate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:fence_gate",
-        True,
         {
             BlockStateKeys.InWallBit: in_wall_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -5238,31 +5021,32 @@ def FenceGate(
 
 def Fern() -> MinecraftBlockDescriptor:
     """Factory for Fern"""
-    return MinecraftBlockDescriptor("minecraft:fern", True)
+    return MinecraftBlockDescriptor.interned("minecraft:fern")
 
 
 def Fire(age: Optional[Age] = None) -> MinecraftBlockDescriptor:
     """Factory for Fire"""
-    return MinecraftBlockDescriptor("minecraft:fire", True, {BlockStateKeys.Age: age})
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:fire", {BlockStateKeys.Age: age}
+    )
 
 
 def FireCoral() -> MinecraftBlockDescriptor:
     """Factory for FireCoral"""
-    return MinecraftBlockDescriptor("minecraft:fire_coral", True)
+    return MinecraftBlockDescriptor.interned("minecraft:fire_coral")
 
 
 def FireCoralBlock() -> MinecraftBlockDescriptor:
     """Factory for FireCoralBlock"""
-    return MinecraftBlockDescriptor("minecraft:fire_coral_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:fire_coral_block")
 
 
 def FireCoralFan(
     coral_fan_direction: Optional[CoralFanDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for FireCoralFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:fire_coral_fan",
-        True,
         {BlockStateKeys.CoralFanDirection: coral_fan_direction},
     )
 
@@ -5271,39 +5055,38 @@ def FireCoralWallFan(
     coral_direction: Optional[CoralDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for FireCoralWallFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:fire_coral_wall_fan",
-        True,
         {BlockStateKeys.CoralDirection: coral_direction},
     )
 
 
 def FireflyBush() -> MinecraftBlockDescriptor:
     """Factory for FireflyBush"""
-    return MinecraftBlockDescriptor("minecraft:firefly_bush", True)
+    return MinecraftBlockDescriptor.interned("minecraft:firefly_bush")
 
 
 def FletchingTable() -> MinecraftBlockDescriptor:
     """Factory for FletchingTable"""
-    return MinecraftBlockDescriptor("minecraft:fletching_table", True)
+    return MinecraftBlockDescriptor.interned("minecraft:fletching_table")
 
 
 def FlowerPot(update_bit: Optional[UpdateBit] = None) -> MinecraftBlockDescriptor:
     """Factory for FlowerPot"""
-    return MinecraftBlockDescriptor(
-        "minecraft:flower_pot", True, {BlockStateKeys.UpdateBit: update_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:flower_pot", {BlockStateKeys.UpdateBit: update_bit}
     )
 
 
 def FloweringAzalea() -> MinecraftBlockDescriptor:
     """Factory for FloweringAzalea"""
-    return MinecraftBlockDescriptor("minecraft:flowering_azalea", True)
+    return MinecraftBlockDescriptor.interned("minecraft:flowering_azalea")
 
 
 def FlowingLava(liquid_depth: Optional[LiquidDepth] = None) -> MinecraftBlockDescriptor:
     """Factory for FlowingLava"""
-    return MinecraftBlockDescriptor(
-        "minecraft:flowing_lava", True, {BlockStateKeys.LiquidDepth: liquid_depth}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:flowing_lava", {BlockStateKeys.LiquidDepth: liquid_depth}
     )
 
 
@@ -5311,8 +5094,8 @@ def FlowingWater(
     liquid_depth: Optional[LiquidDepth] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for FlowingWater"""
-    return MinecraftBlockDescriptor(
-        "minecraft:flowing_water", True, {BlockStateKeys.LiquidDepth: liquid_depth}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:flowing_water", {BlockStateKeys.LiquidDepth: liquid_depth}
     )
 
 
@@ -5322,9 +5105,8 @@ def Frame(
     item_frame_photo_bit: Optional[ItemFramePhotoBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Frame"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:frame",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.ItemFrameMapBit: item_frame_map_bit,
@@ -5335,13 +5117,13 @@ def Frame(
 
 def FrogSpawn() -> MinecraftBlockDescriptor:
     """Factory for FrogSpawn"""
-    return MinecraftBlockDescriptor("minecraft:frog_spawn", True)
+    return MinecraftBlockDescriptor.interned("minecraft:frog_spawn")
 
 
 def FrostedIce(age: Optional[Age] = None) -> MinecraftBlockDescriptor:
     """Factory for FrostedIce"""
-    return MinecraftBlockDescriptor(
-        "minecraft:frosted_ice", True, {BlockStateKeys.Age: age}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:frosted_ice", {BlockStateKeys.Age: age}
     )
 
 
@@ -5349,26 +5131,25 @@ def Furnace(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Furnace"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:furnace",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
 
 def GildedBlackstone() -> MinecraftBlockDescriptor:
     """Factory for GildedBlackstone"""
-    return MinecraftBlockDescriptor("minecraft:gilded_blackstone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:gilded_blackstone")
 
 
 def Glass() -> MinecraftBlockDescriptor:
     """Factory for Glass"""
-    return MinecraftBlockDescriptor("minecraft:glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:glass")
 
 
 def GlassPane() -> MinecraftBlockDescriptor:
     """Factory for GlassPane"""
-    return MinecraftBlockDescriptor("minecraft:glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:glass_pane")
 
 
 def GlowFrame(
@@ -5377,9 +5158,8 @@ def GlowFrame(
     item_frame_photo_bit: Optional[ItemFramePhotoBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for GlowFrame"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:glow_frame",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.ItemFrameMapBit: item_frame_map_bit,
@@ -5392,31 +5172,30 @@ def GlowLichen(
     multi_face_direction_bits: Optional[MultiFaceDirectionBits] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for GlowLichen"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:glow_lichen",
-        True,
         {BlockStateKeys.MultiFaceDirectionBits: multi_face_direction_bits},
     )
 
 
 def Glowstone() -> MinecraftBlockDescriptor:
     """Factory for Glowstone"""
-    return MinecraftBlockDescriptor("minecraft:glowstone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:glowstone")
 
 
 def GoldBlock() -> MinecraftBlockDescriptor:
     """Factory for GoldBlock"""
-    return MinecraftBlockDescriptor("minecraft:gold_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:gold_block")
 
 
 def GoldOre() -> MinecraftBlockDescriptor:
     """Factory for GoldOre"""
-    return MinecraftBlockDescriptor("minecraft:gold_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:gold_ore")
 
 
 def GoldenDandelion() -> MinecraftBlockDescriptor:
     """Factory for GoldenDandelion"""
-    return MinecraftBlockDescriptor("minecraft:golden_dandelion", True)
+    return MinecraftBlockDescriptor.interned("minecraft:golden_dandelion")
 
 
 def GoldenRail(
@@ -5424,9 +5203,8 @@ def GoldenRail(
     rail_direction: Optional[RailDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for GoldenRail"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:golden_rail",
-        True,
         {
             BlockStateKeys.RailDataBit: rail_data_bit,
             BlockStateKeys.RailDirection: rail_direction,
@@ -5436,16 +5214,15 @@ def GoldenRail(
 
 def Granite() -> MinecraftBlockDescriptor:
     """Factory for Granite"""
-    return MinecraftBlockDescriptor("minecraft:granite", True)
+    return MinecraftBlockDescriptor.interned("minecraft:granite")
 
 
 def GraniteDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for GraniteDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:granite_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -5454,9 +5231,8 @@ def GraniteSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for GraniteSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:granite_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -5466,9 +5242,8 @@ def GraniteStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for GraniteStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:granite_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -5484,9 +5259,8 @@ def GraniteWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for GraniteWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:granite_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -5499,164 +5273,159 @@ def GraniteWall(
 
 def GrassBlock() -> MinecraftBlockDescriptor:
     """Factory for GrassBlock"""
-    return MinecraftBlockDescriptor("minecraft:grass_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:grass_block")
 
 
 def GrassPath() -> MinecraftBlockDescriptor:
     """Factory for GrassPath"""
-    return MinecraftBlockDescriptor("minecraft:grass_path", True)
+    return MinecraftBlockDescriptor.interned("minecraft:grass_path")
 
 
 def Gravel() -> MinecraftBlockDescriptor:
     """Factory for Gravel"""
-    return MinecraftBlockDescriptor("minecraft:gravel", True)
+    return MinecraftBlockDescriptor.interned("minecraft:gravel")
 
 
 def GrayCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for GrayCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:gray_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def GrayCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for GrayCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:gray_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:gray_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def GrayCarpet() -> MinecraftBlockDescriptor:
     """Factory for GrayCarpet"""
-    return MinecraftBlockDescriptor("minecraft:gray_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:gray_carpet")
 
 
 def GrayConcrete() -> MinecraftBlockDescriptor:
     """Factory for GrayConcrete"""
-    return MinecraftBlockDescriptor("minecraft:gray_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:gray_concrete")
 
 
 def GrayConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for GrayConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:gray_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:gray_concrete_powder")
 
 
 def GrayGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for GrayGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:gray_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def GrayShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for GrayShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:gray_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:gray_shulker_box")
 
 
 def GrayStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for GrayStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:gray_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:gray_stained_glass")
 
 
 def GrayStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for GrayStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:gray_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:gray_stained_glass_pane")
 
 
 def GrayTerracotta() -> MinecraftBlockDescriptor:
     """Factory for GrayTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:gray_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:gray_terracotta")
 
 
 def GrayWool() -> MinecraftBlockDescriptor:
     """Factory for GrayWool"""
-    return MinecraftBlockDescriptor("minecraft:gray_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:gray_wool")
 
 
 def GreenCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for GreenCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:green_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def GreenCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for GreenCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:green_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:green_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def GreenCarpet() -> MinecraftBlockDescriptor:
     """Factory for GreenCarpet"""
-    return MinecraftBlockDescriptor("minecraft:green_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:green_carpet")
 
 
 def GreenConcrete() -> MinecraftBlockDescriptor:
     """Factory for GreenConcrete"""
-    return MinecraftBlockDescriptor("minecraft:green_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:green_concrete")
 
 
 def GreenConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for GreenConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:green_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:green_concrete_powder")
 
 
 def GreenGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for GreenGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:green_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def GreenShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for GreenShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:green_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:green_shulker_box")
 
 
 def GreenStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for GreenStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:green_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:green_stained_glass")
 
 
 def GreenStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for GreenStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:green_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:green_stained_glass_pane")
 
 
 def GreenTerracotta() -> MinecraftBlockDescriptor:
     """Factory for GreenTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:green_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:green_terracotta")
 
 
 def GreenWool() -> MinecraftBlockDescriptor:
     """Factory for GreenWool"""
-    return MinecraftBlockDescriptor("minecraft:green_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:green_wool")
 
 
 def Grindstone(
     attachment: Optional[Attachment] = None, direction: Optional[Direction] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for Grindstone"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:grindstone",
-        True,
         {
             BlockStateKeys.Attachment: attachment,
             BlockStateKeys.Direction: direction,
@@ -5666,195 +5435,196 @@ def Grindstone(
 
 def HangingRoots() -> MinecraftBlockDescriptor:
     """Factory for HangingRoots"""
-    return MinecraftBlockDescriptor("minecraft:hanging_roots", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hanging_roots")
 
 
 def HardBlackStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardBlackStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_black_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_black_stained_glass")
 
 
 def HardBlackStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardBlackStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_black_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_black_stained_glass_pane")
 
 
 def HardBlueStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardBlueStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_blue_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_blue_stained_glass")
 
 
 def HardBlueStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardBlueStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_blue_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_blue_stained_glass_pane")
 
 
 def HardBrownStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardBrownStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_brown_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_brown_stained_glass")
 
 
 def HardBrownStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardBrownStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_brown_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_brown_stained_glass_pane")
 
 
 def HardCyanStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardCyanStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_cyan_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_cyan_stained_glass")
 
 
 def HardCyanStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardCyanStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_cyan_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_cyan_stained_glass_pane")
 
 
 def HardGlass() -> MinecraftBlockDescriptor:
     """Factory for HardGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_glass")
 
 
 def HardGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_glass_pane")
 
 
 def HardGrayStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardGrayStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_gray_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_gray_stained_glass")
 
 
 def HardGrayStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardGrayStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_gray_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_gray_stained_glass_pane")
 
 
 def HardGreenStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardGreenStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_green_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_green_stained_glass")
 
 
 def HardGreenStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardGreenStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_green_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_green_stained_glass_pane")
 
 
 def HardLightBlueStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardLightBlueStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_light_blue_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_light_blue_stained_glass")
 
 
 def HardLightBlueStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardLightBlueStainedGlassPane"""
-    return MinecraftBlockDescriptor(
-        "minecraft:hard_light_blue_stained_glass_pane", True
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:hard_light_blue_stained_glass_pane"
     )
 
 
 def HardLightGrayStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardLightGrayStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_light_gray_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_light_gray_stained_glass")
 
 
 def HardLightGrayStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardLightGrayStainedGlassPane"""
-    return MinecraftBlockDescriptor(
-        "minecraft:hard_light_gray_stained_glass_pane", True
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:hard_light_gray_stained_glass_pane"
     )
 
 
 def HardLimeStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardLimeStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_lime_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_lime_stained_glass")
 
 
 def HardLimeStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardLimeStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_lime_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_lime_stained_glass_pane")
 
 
 def HardMagentaStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardMagentaStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_magenta_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_magenta_stained_glass")
 
 
 def HardMagentaStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardMagentaStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_magenta_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:hard_magenta_stained_glass_pane"
+    )
 
 
 def HardOrangeStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardOrangeStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_orange_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_orange_stained_glass")
 
 
 def HardOrangeStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardOrangeStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_orange_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_orange_stained_glass_pane")
 
 
 def HardPinkStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardPinkStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_pink_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_pink_stained_glass")
 
 
 def HardPinkStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardPinkStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_pink_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_pink_stained_glass_pane")
 
 
 def HardPurpleStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardPurpleStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_purple_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_purple_stained_glass")
 
 
 def HardPurpleStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardPurpleStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_purple_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_purple_stained_glass_pane")
 
 
 def HardRedStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardRedStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_red_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_red_stained_glass")
 
 
 def HardRedStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardRedStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_red_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_red_stained_glass_pane")
 
 
 def HardWhiteStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardWhiteStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_white_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_white_stained_glass")
 
 
 def HardWhiteStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardWhiteStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_white_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_white_stained_glass_pane")
 
 
 def HardYellowStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for HardYellowStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:hard_yellow_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_yellow_stained_glass")
 
 
 def HardYellowStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for HardYellowStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:hard_yellow_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hard_yellow_stained_glass_pane")
 
 
 def HardenedClay() -> MinecraftBlockDescriptor:
     """Factory for HardenedClay"""
-    return MinecraftBlockDescriptor("minecraft:hardened_clay", True)
+    return MinecraftBlockDescriptor.interned("minecraft:hardened_clay")
 
 
 def HayBlock(
     deprecated: Optional[Deprecated] = None, pillar_axis: Optional[PillarAxis] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for HayBlock"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:hay_block",
-        True,
         {
             BlockStateKeys.Deprecated: deprecated,
             BlockStateKeys.PillarAxis: pillar_axis,
@@ -5864,28 +5634,27 @@ def HayBlock(
 
 def HeavyCore() -> MinecraftBlockDescriptor:
     """Factory for HeavyCore"""
-    return MinecraftBlockDescriptor("minecraft:heavy_core", True)
+    return MinecraftBlockDescriptor.interned("minecraft:heavy_core")
 
 
 def HeavyWeightedPressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for HeavyWeightedPressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:heavy_weighted_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
 
 def HoneyBlock() -> MinecraftBlockDescriptor:
     """Factory for HoneyBlock"""
-    return MinecraftBlockDescriptor("minecraft:honey_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:honey_block")
 
 
 def HoneycombBlock() -> MinecraftBlockDescriptor:
     """Factory for HoneycombBlock"""
-    return MinecraftBlockDescriptor("minecraft:honeycomb_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:honeycomb_block")
 
 
 def Hopper(
@@ -5893,9 +5662,8 @@ def Hopper(
     toggle_bit: Optional[ToggleBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Hopper"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:hopper",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.ToggleBit: toggle_bit,
@@ -5905,21 +5673,20 @@ def Hopper(
 
 def HornCoral() -> MinecraftBlockDescriptor:
     """Factory for HornCoral"""
-    return MinecraftBlockDescriptor("minecraft:horn_coral", True)
+    return MinecraftBlockDescriptor.interned("minecraft:horn_coral")
 
 
 def HornCoralBlock() -> MinecraftBlockDescriptor:
     """Factory for HornCoralBlock"""
-    return MinecraftBlockDescriptor("minecraft:horn_coral_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:horn_coral_block")
 
 
 def HornCoralFan(
     coral_fan_direction: Optional[CoralFanDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for HornCoralFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:horn_coral_fan",
-        True,
         {BlockStateKeys.CoralFanDirection: coral_fan_direction},
     )
 
@@ -5928,73 +5695,71 @@ def HornCoralWallFan(
     coral_direction: Optional[CoralDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for HornCoralWallFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:horn_coral_wall_fan",
-        True,
         {BlockStateKeys.CoralDirection: coral_direction},
     )
 
 
 def Ice() -> MinecraftBlockDescriptor:
     """Factory for Ice"""
-    return MinecraftBlockDescriptor("minecraft:ice", True)
+    return MinecraftBlockDescriptor.interned("minecraft:ice")
 
 
 def InfestedChiseledStoneBricks() -> MinecraftBlockDescriptor:
     """Factory for InfestedChiseledStoneBricks"""
-    return MinecraftBlockDescriptor("minecraft:infested_chiseled_stone_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:infested_chiseled_stone_bricks")
 
 
 def InfestedCobblestone() -> MinecraftBlockDescriptor:
     """Factory for InfestedCobblestone"""
-    return MinecraftBlockDescriptor("minecraft:infested_cobblestone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:infested_cobblestone")
 
 
 def InfestedCrackedStoneBricks() -> MinecraftBlockDescriptor:
     """Factory for InfestedCrackedStoneBricks"""
-    return MinecraftBlockDescriptor("minecraft:infested_cracked_stone_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:infested_cracked_stone_bricks")
 
 
 def InfestedDeepslate(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for InfestedDeepslate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:infested_deepslate",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
 
 def InfestedMossyStoneBricks() -> MinecraftBlockDescriptor:
     """Factory for InfestedMossyStoneBricks"""
-    return MinecraftBlockDescriptor("minecraft:infested_mossy_stone_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:infested_mossy_stone_bricks")
 
 
 def InfestedStone() -> MinecraftBlockDescriptor:
     """Factory for InfestedStone"""
-    return MinecraftBlockDescriptor("minecraft:infested_stone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:infested_stone")
 
 
 def InfestedStoneBricks() -> MinecraftBlockDescriptor:
     """Factory for InfestedStoneBricks"""
-    return MinecraftBlockDescriptor("minecraft:infested_stone_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:infested_stone_bricks")
 
 
 def IronBars() -> MinecraftBlockDescriptor:
     """Factory for IronBars"""
-    return MinecraftBlockDescriptor("minecraft:iron_bars", True)
+    return MinecraftBlockDescriptor.interned("minecraft:iron_bars")
 
 
 def IronBlock() -> MinecraftBlockDescriptor:
     """Factory for IronBlock"""
-    return MinecraftBlockDescriptor("minecraft:iron_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:iron_block")
 
 
 def IronChain(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for IronChain"""
-    return MinecraftBlockDescriptor(
-        "minecraft:iron_chain", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:iron_chain", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -6005,9 +5770,8 @@ def IronDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for IronDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:iron_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -6019,7 +5783,7 @@ def IronDoor(
 
 def IronOre() -> MinecraftBlockDescriptor:
     """Factory for IronOre"""
-    return MinecraftBlockDescriptor("minecraft:iron_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:iron_ore")
 
 
 def IronTrapdoor(
@@ -6028,9 +5792,8 @@ def IronTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for IronTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:iron_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -6044,9 +5807,8 @@ def Jigsaw(
     rotation: Optional[Rotation] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Jigsaw"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jigsaw",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.Rotation: rotation,
@@ -6056,7 +5818,7 @@ def Jigsaw(
 
 def Jukebox() -> MinecraftBlockDescriptor:
     """Factory for Jukebox"""
-    return MinecraftBlockDescriptor("minecraft:jukebox", True)
+    return MinecraftBlockDescriptor.interned("minecraft:jukebox")
 
 
 def JungleButton(
@@ -6064,9 +5826,8 @@ def JungleButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for JungleButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jungle_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -6081,9 +5842,8 @@ def JungleDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for JungleDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jungle_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -6097,16 +5857,15 @@ def JungleDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for JungleDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jungle_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def JungleFence() -> MinecraftBlockDescriptor:
     """Factory for JungleFence"""
-    return MinecraftBlockDescriptor("minecraft:jungle_fence", True)
+    return MinecraftBlockDescriptor.interned("minecraft:jungle_fence")
 
 
 def JungleFenceGate(
@@ -6115,9 +5874,8 @@ def JungleFenceGate(
     open_bit: Optional[OpenBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for JungleFenceGate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jungle_fence_gate",
-        True,
         {
             BlockStateKeys.InWallBit: in_wall_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -6133,9 +5891,8 @@ def JungleHangingSign(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for JungleHangingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jungle_hanging_sign",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -6150,9 +5907,8 @@ def JungleLeaves(
     update_bit: Optional[UpdateBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for JungleLeaves"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jungle_leaves",
-        True,
         {
             BlockStateKeys.PersistentBit: persistent_bit,
             BlockStateKeys.UpdateBit: update_bit,
@@ -6162,31 +5918,30 @@ def JungleLeaves(
 
 def JungleLog(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for JungleLog"""
-    return MinecraftBlockDescriptor(
-        "minecraft:jungle_log", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:jungle_log", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def JunglePlanks() -> MinecraftBlockDescriptor:
     """Factory for JunglePlanks"""
-    return MinecraftBlockDescriptor("minecraft:jungle_planks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:jungle_planks")
 
 
 def JunglePressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for JunglePressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jungle_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
 
 def JungleSapling(age_bit: Optional[AgeBit] = None) -> MinecraftBlockDescriptor:
     """Factory for JungleSapling"""
-    return MinecraftBlockDescriptor(
-        "minecraft:jungle_sapling", True, {BlockStateKeys.AgeBit: age_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:jungle_sapling", {BlockStateKeys.AgeBit: age_bit}
     )
 
 
@@ -6196,9 +5951,8 @@ def JungleShelf(
     powered_shelf_type: Optional[int] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for JungleShelf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jungle_shelf",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: cardinal_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -6211,9 +5965,8 @@ def JungleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for JungleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jungle_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -6223,9 +5976,8 @@ def JungleStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for JungleStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jungle_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -6237,9 +5989,8 @@ def JungleStandingSign(
     ground_sign_direction: Optional[GroundSignDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for JungleStandingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jungle_standing_sign",
-        True,
         {BlockStateKeys.GroundSignDirection: ground_sign_direction},
     )
 
@@ -6250,9 +6001,8 @@ def JungleTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for JungleTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jungle_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -6265,31 +6015,30 @@ def JungleWallSign(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for JungleWallSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:jungle_wall_sign",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def JungleWood(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for JungleWood"""
-    return MinecraftBlockDescriptor(
-        "minecraft:jungle_wood", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:jungle_wood", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def Kelp(kelp_age: Optional[KelpAge] = None) -> MinecraftBlockDescriptor:
     """Factory for Kelp"""
-    return MinecraftBlockDescriptor(
-        "minecraft:kelp", True, {BlockStateKeys.KelpAge: kelp_age}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:kelp", {BlockStateKeys.KelpAge: kelp_age}
     )
 
 
 def LabTable(direction: Optional[Direction] = None) -> MinecraftBlockDescriptor:
     """Factory for LabTable"""
-    return MinecraftBlockDescriptor(
-        "minecraft:lab_table", True, {BlockStateKeys.Direction: direction}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:lab_table", {BlockStateKeys.Direction: direction}
     )
 
 
@@ -6297,37 +6046,35 @@ def Ladder(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Ladder"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:ladder",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def Lantern(hanging: Optional[Hanging] = None) -> MinecraftBlockDescriptor:
     """Factory for Lantern"""
-    return MinecraftBlockDescriptor(
-        "minecraft:lantern", True, {BlockStateKeys.Hanging: hanging}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:lantern", {BlockStateKeys.Hanging: hanging}
     )
 
 
 def LapisBlock() -> MinecraftBlockDescriptor:
     """Factory for LapisBlock"""
-    return MinecraftBlockDescriptor("minecraft:lapis_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lapis_block")
 
 
 def LapisOre() -> MinecraftBlockDescriptor:
     """Factory for LapisOre"""
-    return MinecraftBlockDescriptor("minecraft:lapis_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lapis_ore")
 
 
 def LargeAmethystBud(
     minecraft_block_face: Optional[BlockFace] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for LargeAmethystBud"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:large_amethyst_bud",
-        True,
         {BlockStateKeys.MinecraftBlockFace: minecraft_block_face},
     )
 
@@ -6336,17 +6083,16 @@ def LargeFern(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for LargeFern"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:large_fern",
-        True,
         {BlockStateKeys.UpperBlockBit: upper_block_bit},
     )
 
 
 def Lava(liquid_depth: Optional[LiquidDepth] = None) -> MinecraftBlockDescriptor:
     """Factory for Lava"""
-    return MinecraftBlockDescriptor(
-        "minecraft:lava", True, {BlockStateKeys.LiquidDepth: liquid_depth}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:lava", {BlockStateKeys.LiquidDepth: liquid_depth}
     )
 
 
@@ -6355,9 +6101,8 @@ def LeafLitter(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for LeafLitter"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:leaf_litter",
-        True,
         {
             BlockStateKeys.Growth: growth,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -6370,9 +6115,8 @@ def Lectern(
     powered_bit: Optional[PoweredBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Lectern"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:lectern",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -6384,9 +6128,8 @@ def Lever(
     lever_direction: Optional[LeverDirection] = None, open_bit: Optional[OpenBit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for Lever"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:lever",
-        True,
         {
             BlockStateKeys.LeverDirection: lever_direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -6396,218 +6139,214 @@ def Lever(
 
 def LightBlock0() -> MinecraftBlockDescriptor:
     """Factory for LightBlock0"""
-    return MinecraftBlockDescriptor("minecraft:light_block_0", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_0")
 
 
 def LightBlock1() -> MinecraftBlockDescriptor:
     """Factory for LightBlock1"""
-    return MinecraftBlockDescriptor("minecraft:light_block_1", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_1")
 
 
 def LightBlock10() -> MinecraftBlockDescriptor:
     """Factory for LightBlock10"""
-    return MinecraftBlockDescriptor("minecraft:light_block_10", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_10")
 
 
 def LightBlock11() -> MinecraftBlockDescriptor:
     """Factory for LightBlock11"""
-    return MinecraftBlockDescriptor("minecraft:light_block_11", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_11")
 
 
 def LightBlock12() -> MinecraftBlockDescriptor:
     """Factory for LightBlock12"""
-    return MinecraftBlockDescriptor("minecraft:light_block_12", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_12")
 
 
 def LightBlock13() -> MinecraftBlockDescriptor:
     """Factory for LightBlock13"""
-    return MinecraftBlockDescriptor("minecraft:light_block_13", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_13")
 
 
 def LightBlock14() -> MinecraftBlockDescriptor:
     """Factory for LightBlock14"""
-    return MinecraftBlockDescriptor("minecraft:light_block_14", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_14")
 
 
 def LightBlock15() -> MinecraftBlockDescriptor:
     """Factory for LightBlock15"""
-    return MinecraftBlockDescriptor("minecraft:light_block_15", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_15")
 
 
 def LightBlock2() -> MinecraftBlockDescriptor:
     """Factory for LightBlock2"""
-    return MinecraftBlockDescriptor("minecraft:light_block_2", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_2")
 
 
 def LightBlock3() -> MinecraftBlockDescriptor:
     """Factory for LightBlock3"""
-    return MinecraftBlockDescriptor("minecraft:light_block_3", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_3")
 
 
 def LightBlock4() -> MinecraftBlockDescriptor:
     """Factory for LightBlock4"""
-    return MinecraftBlockDescriptor("minecraft:light_block_4", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_4")
 
 
 def LightBlock5() -> MinecraftBlockDescriptor:
     """Factory for LightBlock5"""
-    return MinecraftBlockDescriptor("minecraft:light_block_5", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_5")
 
 
 def LightBlock6() -> MinecraftBlockDescriptor:
     """Factory for LightBlock6"""
-    return MinecraftBlockDescriptor("minecraft:light_block_6", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_6")
 
 
 def LightBlock7() -> MinecraftBlockDescriptor:
     """Factory for LightBlock7"""
-    return MinecraftBlockDescriptor("minecraft:light_block_7", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_7")
 
 
 def LightBlock8() -> MinecraftBlockDescriptor:
     """Factory for LightBlock8"""
-    return MinecraftBlockDescriptor("minecraft:light_block_8", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_8")
 
 
 def LightBlock9() -> MinecraftBlockDescriptor:
     """Factory for LightBlock9"""
-    return MinecraftBlockDescriptor("minecraft:light_block_9", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_block_9")
 
 
 def LightBlueCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for LightBlueCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:light_blue_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def LightBlueCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for LightBlueCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:light_blue_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:light_blue_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def LightBlueCarpet() -> MinecraftBlockDescriptor:
     """Factory for LightBlueCarpet"""
-    return MinecraftBlockDescriptor("minecraft:light_blue_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_blue_carpet")
 
 
 def LightBlueConcrete() -> MinecraftBlockDescriptor:
     """Factory for LightBlueConcrete"""
-    return MinecraftBlockDescriptor("minecraft:light_blue_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_blue_concrete")
 
 
 def LightBlueConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for LightBlueConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:light_blue_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_blue_concrete_powder")
 
 
 def LightBlueGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for LightBlueGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:light_blue_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def LightBlueShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for LightBlueShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:light_blue_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_blue_shulker_box")
 
 
 def LightBlueStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for LightBlueStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:light_blue_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_blue_stained_glass")
 
 
 def LightBlueStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for LightBlueStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:light_blue_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_blue_stained_glass_pane")
 
 
 def LightBlueTerracotta() -> MinecraftBlockDescriptor:
     """Factory for LightBlueTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:light_blue_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_blue_terracotta")
 
 
 def LightBlueWool() -> MinecraftBlockDescriptor:
     """Factory for LightBlueWool"""
-    return MinecraftBlockDescriptor("minecraft:light_blue_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_blue_wool")
 
 
 def LightGrayCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for LightGrayCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:light_gray_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def LightGrayCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for LightGrayCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:light_gray_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:light_gray_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def LightGrayCarpet() -> MinecraftBlockDescriptor:
     """Factory for LightGrayCarpet"""
-    return MinecraftBlockDescriptor("minecraft:light_gray_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_gray_carpet")
 
 
 def LightGrayConcrete() -> MinecraftBlockDescriptor:
     """Factory for LightGrayConcrete"""
-    return MinecraftBlockDescriptor("minecraft:light_gray_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_gray_concrete")
 
 
 def LightGrayConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for LightGrayConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:light_gray_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_gray_concrete_powder")
 
 
 def LightGrayShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for LightGrayShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:light_gray_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_gray_shulker_box")
 
 
 def LightGrayStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for LightGrayStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:light_gray_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_gray_stained_glass")
 
 
 def LightGrayStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for LightGrayStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:light_gray_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_gray_stained_glass_pane")
 
 
 def LightGrayTerracotta() -> MinecraftBlockDescriptor:
     """Factory for LightGrayTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:light_gray_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_gray_terracotta")
 
 
 def LightGrayWool() -> MinecraftBlockDescriptor:
     """Factory for LightGrayWool"""
-    return MinecraftBlockDescriptor("minecraft:light_gray_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:light_gray_wool")
 
 
 def LightWeightedPressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for LightWeightedPressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:light_weighted_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
@@ -6616,117 +6355,112 @@ def LightningRod(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for LightningRod"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:lightning_rod",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def Lilac(upper_block_bit: Optional[UpperBlockBit] = None) -> MinecraftBlockDescriptor:
     """Factory for Lilac"""
-    return MinecraftBlockDescriptor(
-        "minecraft:lilac", True, {BlockStateKeys.UpperBlockBit: upper_block_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:lilac", {BlockStateKeys.UpperBlockBit: upper_block_bit}
     )
 
 
 def LilyOfTheValley() -> MinecraftBlockDescriptor:
     """Factory for LilyOfTheValley"""
-    return MinecraftBlockDescriptor("minecraft:lily_of_the_valley", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lily_of_the_valley")
 
 
 def LimeCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for LimeCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:lime_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def LimeCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for LimeCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:lime_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:lime_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def LimeCarpet() -> MinecraftBlockDescriptor:
     """Factory for LimeCarpet"""
-    return MinecraftBlockDescriptor("minecraft:lime_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lime_carpet")
 
 
 def LimeConcrete() -> MinecraftBlockDescriptor:
     """Factory for LimeConcrete"""
-    return MinecraftBlockDescriptor("minecraft:lime_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lime_concrete")
 
 
 def LimeConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for LimeConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:lime_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lime_concrete_powder")
 
 
 def LimeGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for LimeGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:lime_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def LimeShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for LimeShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:lime_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lime_shulker_box")
 
 
 def LimeStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for LimeStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:lime_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lime_stained_glass")
 
 
 def LimeStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for LimeStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:lime_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lime_stained_glass_pane")
 
 
 def LimeTerracotta() -> MinecraftBlockDescriptor:
     """Factory for LimeTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:lime_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lime_terracotta")
 
 
 def LimeWool() -> MinecraftBlockDescriptor:
     """Factory for LimeWool"""
-    return MinecraftBlockDescriptor("minecraft:lime_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lime_wool")
 
 
 def LitBlastFurnace(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for LitBlastFurnace"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:lit_blast_furnace",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
 
 def LitDeepslateRedstoneOre() -> MinecraftBlockDescriptor:
     """Factory for LitDeepslateRedstoneOre"""
-    return MinecraftBlockDescriptor("minecraft:lit_deepslate_redstone_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lit_deepslate_redstone_ore")
 
 
 def LitFurnace(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for LitFurnace"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:lit_furnace",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
@@ -6735,43 +6469,41 @@ def LitPumpkin(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for LitPumpkin"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:lit_pumpkin",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
 
 def LitRedstoneLamp() -> MinecraftBlockDescriptor:
     """Factory for LitRedstoneLamp"""
-    return MinecraftBlockDescriptor("minecraft:lit_redstone_lamp", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lit_redstone_lamp")
 
 
 def LitRedstoneOre() -> MinecraftBlockDescriptor:
     """Factory for LitRedstoneOre"""
-    return MinecraftBlockDescriptor("minecraft:lit_redstone_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lit_redstone_ore")
 
 
 def LitSmoker(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for LitSmoker"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:lit_smoker",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
 
 def Lodestone() -> MinecraftBlockDescriptor:
     """Factory for Lodestone"""
-    return MinecraftBlockDescriptor("minecraft:lodestone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:lodestone")
 
 
 def Loom(direction: Optional[Direction] = None) -> MinecraftBlockDescriptor:
     """Factory for Loom"""
-    return MinecraftBlockDescriptor(
-        "minecraft:loom", True, {BlockStateKeys.Direction: direction}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:loom", {BlockStateKeys.Direction: direction}
     )
 
 
@@ -6779,74 +6511,72 @@ def MagentaCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for MagentaCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:magenta_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def MagentaCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for MagentaCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:magenta_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:magenta_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def MagentaCarpet() -> MinecraftBlockDescriptor:
     """Factory for MagentaCarpet"""
-    return MinecraftBlockDescriptor("minecraft:magenta_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:magenta_carpet")
 
 
 def MagentaConcrete() -> MinecraftBlockDescriptor:
     """Factory for MagentaConcrete"""
-    return MinecraftBlockDescriptor("minecraft:magenta_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:magenta_concrete")
 
 
 def MagentaConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for MagentaConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:magenta_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:magenta_concrete_powder")
 
 
 def MagentaGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MagentaGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:magenta_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def MagentaShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for MagentaShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:magenta_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:magenta_shulker_box")
 
 
 def MagentaStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for MagentaStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:magenta_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:magenta_stained_glass")
 
 
 def MagentaStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for MagentaStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:magenta_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:magenta_stained_glass_pane")
 
 
 def MagentaTerracotta() -> MinecraftBlockDescriptor:
     """Factory for MagentaTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:magenta_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:magenta_terracotta")
 
 
 def MagentaWool() -> MinecraftBlockDescriptor:
     """Factory for MagentaWool"""
-    return MinecraftBlockDescriptor("minecraft:magenta_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:magenta_wool")
 
 
 def Magma() -> MinecraftBlockDescriptor:
     """Factory for Magma"""
-    return MinecraftBlockDescriptor("minecraft:magma", True)
+    return MinecraftBlockDescriptor.interned("minecraft:magma")
 
 
 def MangroveButton(
@@ -6854,9 +6584,8 @@ def MangroveButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MangroveButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -6871,9 +6600,8 @@ def MangroveDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MangroveDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -6887,16 +6615,15 @@ def MangroveDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MangroveDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def MangroveFence() -> MinecraftBlockDescriptor:
     """Factory for MangroveFence"""
-    return MinecraftBlockDescriptor("minecraft:mangrove_fence", True)
+    return MinecraftBlockDescriptor.interned("minecraft:mangrove_fence")
 
 
 def MangroveFenceGate(
@@ -6905,9 +6632,8 @@ def MangroveFenceGate(
     open_bit: Optional[OpenBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MangroveFenceGate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_fence_gate",
-        True,
         {
             BlockStateKeys.InWallBit: in_wall_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -6923,9 +6649,8 @@ def MangroveHangingSign(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MangroveHangingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_hanging_sign",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -6940,9 +6665,8 @@ def MangroveLeaves(
     update_bit: Optional[UpdateBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MangroveLeaves"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_leaves",
-        True,
         {
             BlockStateKeys.PersistentBit: persistent_bit,
             BlockStateKeys.UpdateBit: update_bit,
@@ -6952,23 +6676,22 @@ def MangroveLeaves(
 
 def MangroveLog(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for MangroveLog"""
-    return MinecraftBlockDescriptor(
-        "minecraft:mangrove_log", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:mangrove_log", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def MangrovePlanks() -> MinecraftBlockDescriptor:
     """Factory for MangrovePlanks"""
-    return MinecraftBlockDescriptor("minecraft:mangrove_planks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:mangrove_planks")
 
 
 def MangrovePressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MangrovePressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
@@ -6977,9 +6700,8 @@ def MangrovePropagule(
     hanging: Optional[Hanging] = None, propagule_stage: Optional[PropaguleStage] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for MangrovePropagule"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_propagule",
-        True,
         {
             BlockStateKeys.Hanging: hanging,
             BlockStateKeys.PropaguleStage: propagule_stage,
@@ -6989,7 +6711,7 @@ def MangrovePropagule(
 
 def MangroveRoots() -> MinecraftBlockDescriptor:
     """Factory for MangroveRoots"""
-    return MinecraftBlockDescriptor("minecraft:mangrove_roots", True)
+    return MinecraftBlockDescriptor.interned("minecraft:mangrove_roots")
 
 
 def MangroveShelf(
@@ -6998,9 +6720,8 @@ def MangroveShelf(
     powered_shelf_type: Optional[int] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MangroveShelf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_shelf",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: cardinal_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -7013,9 +6734,8 @@ def MangroveSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MangroveSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -7025,9 +6745,8 @@ def MangroveStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MangroveStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -7039,9 +6758,8 @@ def MangroveStandingSign(
     ground_sign_direction: Optional[GroundSignDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MangroveStandingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_standing_sign",
-        True,
         {BlockStateKeys.GroundSignDirection: ground_sign_direction},
     )
 
@@ -7052,9 +6770,8 @@ def MangroveTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MangroveTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -7067,24 +6784,23 @@ def MangroveWallSign(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MangroveWallSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mangrove_wall_sign",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def MangroveWood(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for MangroveWood"""
-    return MinecraftBlockDescriptor(
-        "minecraft:mangrove_wood", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:mangrove_wood", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def MaterialReducer(direction: Optional[Direction] = None) -> MinecraftBlockDescriptor:
     """Factory for MaterialReducer"""
-    return MinecraftBlockDescriptor(
-        "minecraft:material_reducer", True, {BlockStateKeys.Direction: direction}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:material_reducer", {BlockStateKeys.Direction: direction}
     )
 
 
@@ -7092,25 +6808,23 @@ def MediumAmethystBud(
     minecraft_block_face: Optional[BlockFace] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MediumAmethystBud"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:medium_amethyst_bud",
-        True,
         {BlockStateKeys.MinecraftBlockFace: minecraft_block_face},
     )
 
 
 def MelonBlock() -> MinecraftBlockDescriptor:
     """Factory for MelonBlock"""
-    return MinecraftBlockDescriptor("minecraft:melon_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:melon_block")
 
 
 def MelonStem(
     facing_direction: Optional[FacingDirection] = None, growth: Optional[Growth] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for MelonStem"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:melon_stem",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.Growth: growth,
@@ -7120,31 +6834,30 @@ def MelonStem(
 
 def MobSpawner() -> MinecraftBlockDescriptor:
     """Factory for MobSpawner"""
-    return MinecraftBlockDescriptor("minecraft:mob_spawner", True)
+    return MinecraftBlockDescriptor.interned("minecraft:mob_spawner")
 
 
 def MossBlock() -> MinecraftBlockDescriptor:
     """Factory for MossBlock"""
-    return MinecraftBlockDescriptor("minecraft:moss_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:moss_block")
 
 
 def MossCarpet() -> MinecraftBlockDescriptor:
     """Factory for MossCarpet"""
-    return MinecraftBlockDescriptor("minecraft:moss_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:moss_carpet")
 
 
 def MossyCobblestone() -> MinecraftBlockDescriptor:
     """Factory for MossyCobblestone"""
-    return MinecraftBlockDescriptor("minecraft:mossy_cobblestone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:mossy_cobblestone")
 
 
 def MossyCobblestoneDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MossyCobblestoneDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mossy_cobblestone_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -7153,9 +6866,8 @@ def MossyCobblestoneSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MossyCobblestoneSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mossy_cobblestone_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -7165,9 +6877,8 @@ def MossyCobblestoneStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MossyCobblestoneStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mossy_cobblestone_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -7183,9 +6894,8 @@ def MossyCobblestoneWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MossyCobblestoneWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mossy_cobblestone_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -7200,9 +6910,8 @@ def MossyStoneBrickDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MossyStoneBrickDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mossy_stone_brick_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -7211,9 +6920,8 @@ def MossyStoneBrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MossyStoneBrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mossy_stone_brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -7223,9 +6931,8 @@ def MossyStoneBrickStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MossyStoneBrickStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mossy_stone_brick_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -7241,9 +6948,8 @@ def MossyStoneBrickWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MossyStoneBrickWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mossy_stone_brick_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -7256,21 +6962,20 @@ def MossyStoneBrickWall(
 
 def MossyStoneBricks() -> MinecraftBlockDescriptor:
     """Factory for MossyStoneBricks"""
-    return MinecraftBlockDescriptor("minecraft:mossy_stone_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:mossy_stone_bricks")
 
 
 def Mud() -> MinecraftBlockDescriptor:
     """Factory for Mud"""
-    return MinecraftBlockDescriptor("minecraft:mud", True)
+    return MinecraftBlockDescriptor.interned("minecraft:mud")
 
 
 def MudBrickDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MudBrickDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mud_brick_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -7279,9 +6984,8 @@ def MudBrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MudBrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mud_brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -7291,9 +6995,8 @@ def MudBrickStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MudBrickStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mud_brick_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -7309,9 +7012,8 @@ def MudBrickWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MudBrickWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mud_brick_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -7324,16 +7026,15 @@ def MudBrickWall(
 
 def MudBricks() -> MinecraftBlockDescriptor:
     """Factory for MudBricks"""
-    return MinecraftBlockDescriptor("minecraft:mud_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:mud_bricks")
 
 
 def MuddyMangroveRoots(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MuddyMangroveRoots"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:muddy_mangrove_roots",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -7342,46 +7043,43 @@ def MushroomStem(
     huge_mushroom_bits: Optional[HugeMushroomBits] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for MushroomStem"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:mushroom_stem",
-        True,
         {BlockStateKeys.HugeMushroomBits: huge_mushroom_bits},
     )
 
 
 def Mycelium() -> MinecraftBlockDescriptor:
     """Factory for Mycelium"""
-    return MinecraftBlockDescriptor("minecraft:mycelium", True)
+    return MinecraftBlockDescriptor.interned("minecraft:mycelium")
 
 
 def NetherBrick() -> MinecraftBlockDescriptor:
     """Factory for NetherBrick"""
-    return MinecraftBlockDescriptor("minecraft:nether_brick", True)
+    return MinecraftBlockDescriptor.interned("minecraft:nether_brick")
 
 
 def NetherBrickDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for NetherBrickDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:nether_brick_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def NetherBrickFence() -> MinecraftBlockDescriptor:
     """Factory for NetherBrickFence"""
-    return MinecraftBlockDescriptor("minecraft:nether_brick_fence", True)
+    return MinecraftBlockDescriptor.interned("minecraft:nether_brick_fence")
 
 
 def NetherBrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for NetherBrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:nether_brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -7391,9 +7089,8 @@ def NetherBrickStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for NetherBrickStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:nether_brick_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -7409,9 +7106,8 @@ def NetherBrickWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for NetherBrickWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:nether_brick_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -7424,43 +7120,42 @@ def NetherBrickWall(
 
 def NetherGoldOre() -> MinecraftBlockDescriptor:
     """Factory for NetherGoldOre"""
-    return MinecraftBlockDescriptor("minecraft:nether_gold_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:nether_gold_ore")
 
 
 def NetherSprouts() -> MinecraftBlockDescriptor:
     """Factory for NetherSprouts"""
-    return MinecraftBlockDescriptor("minecraft:nether_sprouts", True)
+    return MinecraftBlockDescriptor.interned("minecraft:nether_sprouts")
 
 
 def NetherWart(age: Optional[Age] = None) -> MinecraftBlockDescriptor:
     """Factory for NetherWart"""
-    return MinecraftBlockDescriptor(
-        "minecraft:nether_wart", True, {BlockStateKeys.Age: age}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:nether_wart", {BlockStateKeys.Age: age}
     )
 
 
 def NetherWartBlock() -> MinecraftBlockDescriptor:
     """Factory for NetherWartBlock"""
-    return MinecraftBlockDescriptor("minecraft:nether_wart_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:nether_wart_block")
 
 
 def NetheriteBlock() -> MinecraftBlockDescriptor:
     """Factory for NetheriteBlock"""
-    return MinecraftBlockDescriptor("minecraft:netherite_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:netherite_block")
 
 
 def Netherrack() -> MinecraftBlockDescriptor:
     """Factory for Netherrack"""
-    return MinecraftBlockDescriptor("minecraft:netherrack", True)
+    return MinecraftBlockDescriptor.interned("minecraft:netherrack")
 
 
 def NormalStoneDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for NormalStoneDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:normal_stone_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -7469,9 +7164,8 @@ def NormalStoneSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for NormalStoneSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:normal_stone_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -7481,9 +7175,8 @@ def NormalStoneStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for NormalStoneStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:normal_stone_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -7493,23 +7186,22 @@ def NormalStoneStairs(
 
 def Noteblock() -> MinecraftBlockDescriptor:
     """Factory for Noteblock"""
-    return MinecraftBlockDescriptor("minecraft:noteblock", True)
+    return MinecraftBlockDescriptor.interned("minecraft:noteblock")
 
 
 def OakDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OakDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oak_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def OakFence() -> MinecraftBlockDescriptor:
     """Factory for OakFence"""
-    return MinecraftBlockDescriptor("minecraft:oak_fence", True)
+    return MinecraftBlockDescriptor.interned("minecraft:oak_fence")
 
 
 def OakHangingSign(
@@ -7519,9 +7211,8 @@ def OakHangingSign(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OakHangingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oak_hanging_sign",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -7536,9 +7227,8 @@ def OakLeaves(
     update_bit: Optional[UpdateBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OakLeaves"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oak_leaves",
-        True,
         {
             BlockStateKeys.PersistentBit: persistent_bit,
             BlockStateKeys.UpdateBit: update_bit,
@@ -7548,20 +7238,20 @@ def OakLeaves(
 
 def OakLog(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for OakLog"""
-    return MinecraftBlockDescriptor(
-        "minecraft:oak_log", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:oak_log", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def OakPlanks() -> MinecraftBlockDescriptor:
     """Factory for OakPlanks"""
-    return MinecraftBlockDescriptor("minecraft:oak_planks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:oak_planks")
 
 
 def OakSapling(age_bit: Optional[AgeBit] = None) -> MinecraftBlockDescriptor:
     """Factory for OakSapling"""
-    return MinecraftBlockDescriptor(
-        "minecraft:oak_sapling", True, {BlockStateKeys.AgeBit: age_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:oak_sapling", {BlockStateKeys.AgeBit: age_bit}
     )
 
 
@@ -7571,9 +7261,8 @@ def OakShelf(
     powered_shelf_type: Optional[int] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OakShelf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oak_shelf",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: cardinal_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -7586,9 +7275,8 @@ def OakSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OakSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oak_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -7598,9 +7286,8 @@ def OakStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OakStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oak_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -7610,8 +7297,8 @@ def OakStairs(
 
 def OakWood(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for OakWood"""
-    return MinecraftBlockDescriptor(
-        "minecraft:oak_wood", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:oak_wood", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -7620,9 +7307,8 @@ def Observer(
     powered_bit: Optional[PoweredBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Observer"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:observer",
-        True,
         {
             BlockStateKeys.MinecraftFacingDirection: facing_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -7632,124 +7318,121 @@ def Observer(
 
 def Obsidian() -> MinecraftBlockDescriptor:
     """Factory for Obsidian"""
-    return MinecraftBlockDescriptor("minecraft:obsidian", True)
+    return MinecraftBlockDescriptor.interned("minecraft:obsidian")
 
 
 def OchreFroglight(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OchreFroglight"""
-    return MinecraftBlockDescriptor(
-        "minecraft:ochre_froglight", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:ochre_froglight", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def OpenEyeblossom() -> MinecraftBlockDescriptor:
     """Factory for OpenEyeblossom"""
-    return MinecraftBlockDescriptor("minecraft:open_eyeblossom", True)
+    return MinecraftBlockDescriptor.interned("minecraft:open_eyeblossom")
 
 
 def OrangeCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for OrangeCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:orange_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def OrangeCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for OrangeCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:orange_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:orange_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def OrangeCarpet() -> MinecraftBlockDescriptor:
     """Factory for OrangeCarpet"""
-    return MinecraftBlockDescriptor("minecraft:orange_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:orange_carpet")
 
 
 def OrangeConcrete() -> MinecraftBlockDescriptor:
     """Factory for OrangeConcrete"""
-    return MinecraftBlockDescriptor("minecraft:orange_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:orange_concrete")
 
 
 def OrangeConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for OrangeConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:orange_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:orange_concrete_powder")
 
 
 def OrangeGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OrangeGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:orange_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def OrangeShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for OrangeShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:orange_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:orange_shulker_box")
 
 
 def OrangeStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for OrangeStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:orange_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:orange_stained_glass")
 
 
 def OrangeStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for OrangeStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:orange_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:orange_stained_glass_pane")
 
 
 def OrangeTerracotta() -> MinecraftBlockDescriptor:
     """Factory for OrangeTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:orange_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:orange_terracotta")
 
 
 def OrangeTulip() -> MinecraftBlockDescriptor:
     """Factory for OrangeTulip"""
-    return MinecraftBlockDescriptor("minecraft:orange_tulip", True)
+    return MinecraftBlockDescriptor.interned("minecraft:orange_tulip")
 
 
 def OrangeWool() -> MinecraftBlockDescriptor:
     """Factory for OrangeWool"""
-    return MinecraftBlockDescriptor("minecraft:orange_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:orange_wool")
 
 
 def OxeyeDaisy() -> MinecraftBlockDescriptor:
     """Factory for OxeyeDaisy"""
-    return MinecraftBlockDescriptor("minecraft:oxeye_daisy", True)
+    return MinecraftBlockDescriptor.interned("minecraft:oxeye_daisy")
 
 
 def OxidizedChiseledCopper() -> MinecraftBlockDescriptor:
     """Factory for OxidizedChiseledCopper"""
-    return MinecraftBlockDescriptor("minecraft:oxidized_chiseled_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:oxidized_chiseled_copper")
 
 
 def OxidizedCopper() -> MinecraftBlockDescriptor:
     """Factory for OxidizedCopper"""
-    return MinecraftBlockDescriptor("minecraft:oxidized_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:oxidized_copper")
 
 
 def OxidizedCopperBars() -> MinecraftBlockDescriptor:
     """Factory for OxidizedCopperBars"""
-    return MinecraftBlockDescriptor("minecraft:oxidized_copper_bars", True)
+    return MinecraftBlockDescriptor.interned("minecraft:oxidized_copper_bars")
 
 
 def OxidizedCopperBulb(
     lit: Optional[Lit] = None, powered_bit: Optional[PoweredBit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for OxidizedCopperBulb"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oxidized_copper_bulb",
-        True,
         {BlockStateKeys.Lit: lit, BlockStateKeys.PoweredBit: powered_bit},
     )
 
@@ -7758,9 +7441,8 @@ def OxidizedCopperChain(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OxidizedCopperChain"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oxidized_copper_chain",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -7769,9 +7451,8 @@ def OxidizedCopperChest(
     cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OxidizedCopperChest"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oxidized_copper_chest",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: cardinal_direction},
     )
 
@@ -7783,9 +7464,8 @@ def OxidizedCopperDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OxidizedCopperDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oxidized_copper_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -7799,25 +7479,23 @@ def OxidizedCopperGolemStatue(
     cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OxidizedCopperGolemStatue"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oxidized_copper_golem_statue",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: cardinal_direction},
     )
 
 
 def OxidizedCopperGrate() -> MinecraftBlockDescriptor:
     """Factory for OxidizedCopperGrate"""
-    return MinecraftBlockDescriptor("minecraft:oxidized_copper_grate", True)
+    return MinecraftBlockDescriptor.interned("minecraft:oxidized_copper_grate")
 
 
 def OxidizedCopperLantern(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OxidizedCopperLantern"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oxidized_copper_lantern",
-        True,
         {BlockStateKeys.Hanging: hanging},
     )
 
@@ -7828,9 +7506,8 @@ def OxidizedCopperTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OxidizedCopperTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oxidized_copper_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -7841,16 +7518,15 @@ def OxidizedCopperTrapdoor(
 
 def OxidizedCutCopper() -> MinecraftBlockDescriptor:
     """Factory for OxidizedCutCopper"""
-    return MinecraftBlockDescriptor("minecraft:oxidized_cut_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:oxidized_cut_copper")
 
 
 def OxidizedCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OxidizedCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oxidized_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -7860,9 +7536,8 @@ def OxidizedCutCopperStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OxidizedCutCopperStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oxidized_cut_copper_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -7874,9 +7549,8 @@ def OxidizedDoubleCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OxidizedDoubleCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oxidized_double_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -7886,9 +7560,8 @@ def OxidizedLightningRod(
     powered_bit: Optional[PoweredBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for OxidizedLightningRod"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:oxidized_lightning_rod",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -7898,24 +7571,24 @@ def OxidizedLightningRod(
 
 def PackedIce() -> MinecraftBlockDescriptor:
     """Factory for PackedIce"""
-    return MinecraftBlockDescriptor("minecraft:packed_ice", True)
+    return MinecraftBlockDescriptor.interned("minecraft:packed_ice")
 
 
 def PackedMud() -> MinecraftBlockDescriptor:
     """Factory for PackedMud"""
-    return MinecraftBlockDescriptor("minecraft:packed_mud", True)
+    return MinecraftBlockDescriptor.interned("minecraft:packed_mud")
 
 
 def PaleHangingMoss(tip: Optional[Tip] = None) -> MinecraftBlockDescriptor:
     """Factory for PaleHangingMoss"""
-    return MinecraftBlockDescriptor(
-        "minecraft:pale_hanging_moss", True, {BlockStateKeys.Tip: tip}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:pale_hanging_moss", {BlockStateKeys.Tip: tip}
     )
 
 
 def PaleMossBlock() -> MinecraftBlockDescriptor:
     """Factory for PaleMossBlock"""
-    return MinecraftBlockDescriptor("minecraft:pale_moss_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:pale_moss_block")
 
 
 def PaleMossCarpet(
@@ -7926,9 +7599,8 @@ def PaleMossCarpet(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleMossCarpet"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_moss_carpet",
-        True,
         {
             BlockStateKeys.PaleMossCarpetSideEast: pale_moss_carpet_side_east,
             BlockStateKeys.PaleMossCarpetSideNorth: pale_moss_carpet_side_north,
@@ -7944,9 +7616,8 @@ def PaleOakButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleOakButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_oak_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -7961,9 +7632,8 @@ def PaleOakDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleOakDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_oak_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -7977,16 +7647,15 @@ def PaleOakDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleOakDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_oak_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def PaleOakFence() -> MinecraftBlockDescriptor:
     """Factory for PaleOakFence"""
-    return MinecraftBlockDescriptor("minecraft:pale_oak_fence", True)
+    return MinecraftBlockDescriptor.interned("minecraft:pale_oak_fence")
 
 
 def PaleOakFenceGate(
@@ -7995,9 +7664,8 @@ def PaleOakFenceGate(
     open_bit: Optional[OpenBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleOakFenceGate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_oak_fence_gate",
-        True,
         {
             BlockStateKeys.InWallBit: in_wall_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -8013,9 +7681,8 @@ def PaleOakHangingSign(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleOakHangingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_oak_hanging_sign",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -8030,9 +7697,8 @@ def PaleOakLeaves(
     update_bit: Optional[UpdateBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleOakLeaves"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_oak_leaves",
-        True,
         {
             BlockStateKeys.PersistentBit: persistent_bit,
             BlockStateKeys.UpdateBit: update_bit,
@@ -8042,31 +7708,30 @@ def PaleOakLeaves(
 
 def PaleOakLog(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for PaleOakLog"""
-    return MinecraftBlockDescriptor(
-        "minecraft:pale_oak_log", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:pale_oak_log", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def PaleOakPlanks() -> MinecraftBlockDescriptor:
     """Factory for PaleOakPlanks"""
-    return MinecraftBlockDescriptor("minecraft:pale_oak_planks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:pale_oak_planks")
 
 
 def PaleOakPressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleOakPressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_oak_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
 
 def PaleOakSapling(age_bit: Optional[AgeBit] = None) -> MinecraftBlockDescriptor:
     """Factory for PaleOakSapling"""
-    return MinecraftBlockDescriptor(
-        "minecraft:pale_oak_sapling", True, {BlockStateKeys.AgeBit: age_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:pale_oak_sapling", {BlockStateKeys.AgeBit: age_bit}
     )
 
 
@@ -8076,9 +7741,8 @@ def PaleOakShelf(
     powered_shelf_type: Optional[int] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleOakShelf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_oak_shelf",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: cardinal_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -8091,9 +7755,8 @@ def PaleOakSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleOakSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_oak_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8103,9 +7766,8 @@ def PaleOakStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleOakStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_oak_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -8117,9 +7779,8 @@ def PaleOakStandingSign(
     ground_sign_direction: Optional[GroundSignDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleOakStandingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_oak_standing_sign",
-        True,
         {BlockStateKeys.GroundSignDirection: ground_sign_direction},
     )
 
@@ -8130,9 +7791,8 @@ def PaleOakTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleOakTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_oak_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -8145,17 +7805,16 @@ def PaleOakWallSign(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PaleOakWallSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pale_oak_wall_sign",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def PaleOakWood(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for PaleOakWood"""
-    return MinecraftBlockDescriptor(
-        "minecraft:pale_oak_wood", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:pale_oak_wood", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -8163,17 +7822,16 @@ def PearlescentFroglight(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PearlescentFroglight"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pearlescent_froglight",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
 
 def Peony(upper_block_bit: Optional[UpperBlockBit] = None) -> MinecraftBlockDescriptor:
     """Factory for Peony"""
-    return MinecraftBlockDescriptor(
-        "minecraft:peony", True, {BlockStateKeys.UpperBlockBit: upper_block_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:peony", {BlockStateKeys.UpperBlockBit: upper_block_bit}
     )
 
 
@@ -8181,9 +7839,8 @@ def PetrifiedOakDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PetrifiedOakDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:petrified_oak_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8192,9 +7849,8 @@ def PetrifiedOakSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PetrifiedOakSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:petrified_oak_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8203,9 +7859,8 @@ def PiglinHead(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PiglinHead"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:piglin_head",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
@@ -8214,42 +7869,40 @@ def PinkCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for PinkCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pink_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def PinkCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for PinkCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:pink_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:pink_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def PinkCarpet() -> MinecraftBlockDescriptor:
     """Factory for PinkCarpet"""
-    return MinecraftBlockDescriptor("minecraft:pink_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:pink_carpet")
 
 
 def PinkConcrete() -> MinecraftBlockDescriptor:
     """Factory for PinkConcrete"""
-    return MinecraftBlockDescriptor("minecraft:pink_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:pink_concrete")
 
 
 def PinkConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for PinkConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:pink_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:pink_concrete_powder")
 
 
 def PinkGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PinkGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pink_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
@@ -8259,9 +7912,8 @@ def PinkPetals(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PinkPetals"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pink_petals",
-        True,
         {
             BlockStateKeys.Growth: growth,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -8271,41 +7923,40 @@ def PinkPetals(
 
 def PinkShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for PinkShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:pink_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:pink_shulker_box")
 
 
 def PinkStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for PinkStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:pink_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:pink_stained_glass")
 
 
 def PinkStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for PinkStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:pink_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:pink_stained_glass_pane")
 
 
 def PinkTerracotta() -> MinecraftBlockDescriptor:
     """Factory for PinkTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:pink_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:pink_terracotta")
 
 
 def PinkTulip() -> MinecraftBlockDescriptor:
     """Factory for PinkTulip"""
-    return MinecraftBlockDescriptor("minecraft:pink_tulip", True)
+    return MinecraftBlockDescriptor.interned("minecraft:pink_tulip")
 
 
 def PinkWool() -> MinecraftBlockDescriptor:
     """Factory for PinkWool"""
-    return MinecraftBlockDescriptor("minecraft:pink_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:pink_wool")
 
 
 def Piston(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Piston"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:piston",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
@@ -8314,9 +7965,8 @@ def PistonArmCollision(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PistonArmCollision"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:piston_arm_collision",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
@@ -8325,9 +7975,8 @@ def PitcherCrop(
     growth: Optional[Growth] = None, upper_block_bit: Optional[UpperBlockBit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for PitcherCrop"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pitcher_crop",
-        True,
         {
             BlockStateKeys.Growth: growth,
             BlockStateKeys.UpperBlockBit: upper_block_bit,
@@ -8339,9 +7988,8 @@ def PitcherPlant(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PitcherPlant"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pitcher_plant",
-        True,
         {BlockStateKeys.UpperBlockBit: upper_block_bit},
     )
 
@@ -8350,16 +7998,15 @@ def PlayerHead(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PlayerHead"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:player_head",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def Podzol() -> MinecraftBlockDescriptor:
     """Factory for Podzol"""
-    return MinecraftBlockDescriptor("minecraft:podzol", True)
+    return MinecraftBlockDescriptor.interned("minecraft:podzol")
 
 
 def PointedDripstone(
@@ -8367,9 +8014,8 @@ def PointedDripstone(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PointedDripstone"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pointed_dripstone",
-        True,
         {
             BlockStateKeys.DripstoneThickness: dripstone_thickness,
             BlockStateKeys.Hanging: hanging,
@@ -8379,16 +8025,15 @@ def PointedDripstone(
 
 def PolishedAndesite() -> MinecraftBlockDescriptor:
     """Factory for PolishedAndesite"""
-    return MinecraftBlockDescriptor("minecraft:polished_andesite", True)
+    return MinecraftBlockDescriptor.interned("minecraft:polished_andesite")
 
 
 def PolishedAndesiteDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedAndesiteDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_andesite_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8397,9 +8042,8 @@ def PolishedAndesiteSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedAndesiteSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_andesite_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8409,9 +8053,8 @@ def PolishedAndesiteStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedAndesiteStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_andesite_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -8423,23 +8066,22 @@ def PolishedBasalt(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedBasalt"""
-    return MinecraftBlockDescriptor(
-        "minecraft:polished_basalt", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:polished_basalt", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def PolishedBlackstone() -> MinecraftBlockDescriptor:
     """Factory for PolishedBlackstone"""
-    return MinecraftBlockDescriptor("minecraft:polished_blackstone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:polished_blackstone")
 
 
 def PolishedBlackstoneBrickDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedBlackstoneBrickDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_blackstone_brick_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8448,9 +8090,8 @@ def PolishedBlackstoneBrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedBlackstoneBrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_blackstone_brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8460,9 +8101,8 @@ def PolishedBlackstoneBrickStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedBlackstoneBrickStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_blackstone_brick_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -8478,9 +8118,8 @@ def PolishedBlackstoneBrickWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedBlackstoneBrickWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_blackstone_brick_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -8493,7 +8132,7 @@ def PolishedBlackstoneBrickWall(
 
 def PolishedBlackstoneBricks() -> MinecraftBlockDescriptor:
     """Factory for PolishedBlackstoneBricks"""
-    return MinecraftBlockDescriptor("minecraft:polished_blackstone_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:polished_blackstone_bricks")
 
 
 def PolishedBlackstoneButton(
@@ -8501,9 +8140,8 @@ def PolishedBlackstoneButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedBlackstoneButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_blackstone_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -8515,9 +8153,8 @@ def PolishedBlackstoneDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedBlackstoneDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_blackstone_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8526,9 +8163,8 @@ def PolishedBlackstonePressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedBlackstonePressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_blackstone_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
@@ -8537,9 +8173,8 @@ def PolishedBlackstoneSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedBlackstoneSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_blackstone_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8549,9 +8184,8 @@ def PolishedBlackstoneStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedBlackstoneStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_blackstone_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -8567,9 +8201,8 @@ def PolishedBlackstoneWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedBlackstoneWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_blackstone_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -8582,16 +8215,15 @@ def PolishedBlackstoneWall(
 
 def PolishedCinnabar() -> MinecraftBlockDescriptor:
     """Factory for PolishedCinnabar"""
-    return MinecraftBlockDescriptor("minecraft:polished_cinnabar", True)
+    return MinecraftBlockDescriptor.interned("minecraft:polished_cinnabar")
 
 
 def PolishedCinnabarSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedCinnabarSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_cinnabar_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8601,9 +8233,8 @@ def PolishedCinnabarStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedCinnabarStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_cinnabar_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -8619,9 +8250,8 @@ def PolishedCinnabarWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedCinnabarWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_cinnabar_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -8634,16 +8264,15 @@ def PolishedCinnabarWall(
 
 def PolishedDeepslate() -> MinecraftBlockDescriptor:
     """Factory for PolishedDeepslate"""
-    return MinecraftBlockDescriptor("minecraft:polished_deepslate", True)
+    return MinecraftBlockDescriptor.interned("minecraft:polished_deepslate")
 
 
 def PolishedDeepslateDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedDeepslateDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_deepslate_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8652,9 +8281,8 @@ def PolishedDeepslateSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedDeepslateSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_deepslate_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8664,9 +8292,8 @@ def PolishedDeepslateStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedDeepslateStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_deepslate_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -8682,9 +8309,8 @@ def PolishedDeepslateWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedDeepslateWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_deepslate_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -8697,16 +8323,15 @@ def PolishedDeepslateWall(
 
 def PolishedDiorite() -> MinecraftBlockDescriptor:
     """Factory for PolishedDiorite"""
-    return MinecraftBlockDescriptor("minecraft:polished_diorite", True)
+    return MinecraftBlockDescriptor.interned("minecraft:polished_diorite")
 
 
 def PolishedDioriteDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedDioriteDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_diorite_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8715,9 +8340,8 @@ def PolishedDioriteSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedDioriteSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_diorite_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8727,9 +8351,8 @@ def PolishedDioriteStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedDioriteStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_diorite_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -8739,16 +8362,15 @@ def PolishedDioriteStairs(
 
 def PolishedGranite() -> MinecraftBlockDescriptor:
     """Factory for PolishedGranite"""
-    return MinecraftBlockDescriptor("minecraft:polished_granite", True)
+    return MinecraftBlockDescriptor.interned("minecraft:polished_granite")
 
 
 def PolishedGraniteDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedGraniteDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_granite_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8757,9 +8379,8 @@ def PolishedGraniteSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedGraniteSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_granite_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8769,9 +8390,8 @@ def PolishedGraniteStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedGraniteStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_granite_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -8781,16 +8401,15 @@ def PolishedGraniteStairs(
 
 def PolishedSulfur() -> MinecraftBlockDescriptor:
     """Factory for PolishedSulfur"""
-    return MinecraftBlockDescriptor("minecraft:polished_sulfur", True)
+    return MinecraftBlockDescriptor.interned("minecraft:polished_sulfur")
 
 
 def PolishedSulfurSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedSulfurSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_sulfur_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8800,9 +8419,8 @@ def PolishedSulfurStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedSulfurStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_sulfur_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -8818,9 +8436,8 @@ def PolishedSulfurWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedSulfurWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_sulfur_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -8833,16 +8450,15 @@ def PolishedSulfurWall(
 
 def PolishedTuff() -> MinecraftBlockDescriptor:
     """Factory for PolishedTuff"""
-    return MinecraftBlockDescriptor("minecraft:polished_tuff", True)
+    return MinecraftBlockDescriptor.interned("minecraft:polished_tuff")
 
 
 def PolishedTuffDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedTuffDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_tuff_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8851,9 +8467,8 @@ def PolishedTuffSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedTuffSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_tuff_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8863,9 +8478,8 @@ def PolishedTuffStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedTuffStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_tuff_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -8881,9 +8495,8 @@ def PolishedTuffWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PolishedTuffWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:polished_tuff_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -8896,26 +8509,26 @@ def PolishedTuffWall(
 
 def Poppy() -> MinecraftBlockDescriptor:
     """Factory for Poppy"""
-    return MinecraftBlockDescriptor("minecraft:poppy", True)
+    return MinecraftBlockDescriptor.interned("minecraft:poppy")
 
 
 def Portal(portal_axis: Optional[PortalAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for Portal"""
-    return MinecraftBlockDescriptor(
-        "minecraft:portal", True, {BlockStateKeys.PortalAxis: portal_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:portal", {BlockStateKeys.PortalAxis: portal_axis}
     )
 
 
 def Potatoes(growth: Optional[Growth] = None) -> MinecraftBlockDescriptor:
     """Factory for Potatoes"""
-    return MinecraftBlockDescriptor(
-        "minecraft:potatoes", True, {BlockStateKeys.Growth: growth}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:potatoes", {BlockStateKeys.Growth: growth}
     )
 
 
 def PowderSnow() -> MinecraftBlockDescriptor:
     """Factory for PowderSnow"""
-    return MinecraftBlockDescriptor("minecraft:powder_snow", True)
+    return MinecraftBlockDescriptor.interned("minecraft:powder_snow")
 
 
 def PoweredComparator(
@@ -8924,9 +8537,8 @@ def PoweredComparator(
     output_subtract_bit: Optional[OutputSubtractBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PoweredComparator"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:powered_comparator",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
             BlockStateKeys.OutputLitBit: output_lit_bit,
@@ -8940,9 +8552,8 @@ def PoweredRepeater(
     repeater_delay: Optional[RepeaterDelay] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PoweredRepeater"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:powered_repeater",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
             BlockStateKeys.RepeaterDelay: repeater_delay,
@@ -8952,16 +8563,15 @@ def PoweredRepeater(
 
 def Prismarine() -> MinecraftBlockDescriptor:
     """Factory for Prismarine"""
-    return MinecraftBlockDescriptor("minecraft:prismarine", True)
+    return MinecraftBlockDescriptor.interned("minecraft:prismarine")
 
 
 def PrismarineBrickDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PrismarineBrickDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:prismarine_brick_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -8970,16 +8580,15 @@ def PrismarineBrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PrismarineBrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:prismarine_brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def PrismarineBricks() -> MinecraftBlockDescriptor:
     """Factory for PrismarineBricks"""
-    return MinecraftBlockDescriptor("minecraft:prismarine_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:prismarine_bricks")
 
 
 def PrismarineBricksStairs(
@@ -8987,9 +8596,8 @@ def PrismarineBricksStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PrismarineBricksStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:prismarine_bricks_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -9001,9 +8609,8 @@ def PrismarineDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PrismarineDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:prismarine_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9012,9 +8619,8 @@ def PrismarineSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PrismarineSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:prismarine_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9024,9 +8630,8 @@ def PrismarineStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PrismarineStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:prismarine_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -9042,9 +8647,8 @@ def PrismarineWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PrismarineWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:prismarine_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -9059,9 +8663,8 @@ def Pumpkin(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Pumpkin"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pumpkin",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
@@ -9070,9 +8673,8 @@ def PumpkinStem(
     facing_direction: Optional[FacingDirection] = None, growth: Optional[Growth] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for PumpkinStem"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:pumpkin_stem",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.Growth: growth,
@@ -9084,75 +8686,73 @@ def PurpleCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for PurpleCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:purple_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def PurpleCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for PurpleCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:purple_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:purple_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def PurpleCarpet() -> MinecraftBlockDescriptor:
     """Factory for PurpleCarpet"""
-    return MinecraftBlockDescriptor("minecraft:purple_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:purple_carpet")
 
 
 def PurpleConcrete() -> MinecraftBlockDescriptor:
     """Factory for PurpleConcrete"""
-    return MinecraftBlockDescriptor("minecraft:purple_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:purple_concrete")
 
 
 def PurpleConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for PurpleConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:purple_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:purple_concrete_powder")
 
 
 def PurpleGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PurpleGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:purple_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def PurpleShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for PurpleShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:purple_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:purple_shulker_box")
 
 
 def PurpleStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for PurpleStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:purple_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:purple_stained_glass")
 
 
 def PurpleStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for PurpleStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:purple_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:purple_stained_glass_pane")
 
 
 def PurpleTerracotta() -> MinecraftBlockDescriptor:
     """Factory for PurpleTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:purple_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:purple_terracotta")
 
 
 def PurpleWool() -> MinecraftBlockDescriptor:
     """Factory for PurpleWool"""
-    return MinecraftBlockDescriptor("minecraft:purple_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:purple_wool")
 
 
 def PurpurBlock(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for PurpurBlock"""
-    return MinecraftBlockDescriptor(
-        "minecraft:purpur_block", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:purpur_block", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -9160,17 +8760,16 @@ def PurpurDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PurpurDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:purpur_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def PurpurPillar(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for PurpurPillar"""
-    return MinecraftBlockDescriptor(
-        "minecraft:purpur_pillar", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:purpur_pillar", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -9178,9 +8777,8 @@ def PurpurSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PurpurSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:purpur_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9190,9 +8788,8 @@ def PurpurStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for PurpurStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:purpur_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -9202,36 +8799,35 @@ def PurpurStairs(
 
 def QuartzBlock(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for QuartzBlock"""
-    return MinecraftBlockDescriptor(
-        "minecraft:quartz_block", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:quartz_block", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def QuartzBricks() -> MinecraftBlockDescriptor:
     """Factory for QuartzBricks"""
-    return MinecraftBlockDescriptor("minecraft:quartz_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:quartz_bricks")
 
 
 def QuartzDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for QuartzDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:quartz_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def QuartzOre() -> MinecraftBlockDescriptor:
     """Factory for QuartzOre"""
-    return MinecraftBlockDescriptor("minecraft:quartz_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:quartz_ore")
 
 
 def QuartzPillar(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for QuartzPillar"""
-    return MinecraftBlockDescriptor(
-        "minecraft:quartz_pillar", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:quartz_pillar", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -9239,9 +8835,8 @@ def QuartzSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for QuartzSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:quartz_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9251,9 +8846,8 @@ def QuartzStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for QuartzStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:quartz_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -9263,98 +8857,94 @@ def QuartzStairs(
 
 def Rail(rail_direction: Optional[RailDirection] = None) -> MinecraftBlockDescriptor:
     """Factory for Rail"""
-    return MinecraftBlockDescriptor(
-        "minecraft:rail", True, {BlockStateKeys.RailDirection: rail_direction}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:rail", {BlockStateKeys.RailDirection: rail_direction}
     )
 
 
 def RawCopperBlock() -> MinecraftBlockDescriptor:
     """Factory for RawCopperBlock"""
-    return MinecraftBlockDescriptor("minecraft:raw_copper_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:raw_copper_block")
 
 
 def RawGoldBlock() -> MinecraftBlockDescriptor:
     """Factory for RawGoldBlock"""
-    return MinecraftBlockDescriptor("minecraft:raw_gold_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:raw_gold_block")
 
 
 def RawIronBlock() -> MinecraftBlockDescriptor:
     """Factory for RawIronBlock"""
-    return MinecraftBlockDescriptor("minecraft:raw_iron_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:raw_iron_block")
 
 
 def RedCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for RedCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:red_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def RedCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for RedCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:red_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:red_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def RedCarpet() -> MinecraftBlockDescriptor:
     """Factory for RedCarpet"""
-    return MinecraftBlockDescriptor("minecraft:red_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:red_carpet")
 
 
 def RedConcrete() -> MinecraftBlockDescriptor:
     """Factory for RedConcrete"""
-    return MinecraftBlockDescriptor("minecraft:red_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:red_concrete")
 
 
 def RedConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for RedConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:red_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:red_concrete_powder")
 
 
 def RedGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RedGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:red_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def RedMushroom() -> MinecraftBlockDescriptor:
     """Factory for RedMushroom"""
-    return MinecraftBlockDescriptor("minecraft:red_mushroom", True)
+    return MinecraftBlockDescriptor.interned("minecraft:red_mushroom")
 
 
 def RedMushroomBlock(
     huge_mushroom_bits: Optional[HugeMushroomBits] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RedMushroomBlock"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:red_mushroom_block",
-        True,
         {BlockStateKeys.HugeMushroomBits: huge_mushroom_bits},
     )
 
 
 def RedNetherBrick() -> MinecraftBlockDescriptor:
     """Factory for RedNetherBrick"""
-    return MinecraftBlockDescriptor("minecraft:red_nether_brick", True)
+    return MinecraftBlockDescriptor.interned("minecraft:red_nether_brick")
 
 
 def RedNetherBrickDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RedNetherBrickDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:red_nether_brick_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9363,9 +8953,8 @@ def RedNetherBrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RedNetherBrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:red_nether_brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9375,9 +8964,8 @@ def RedNetherBrickStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RedNetherBrickStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:red_nether_brick_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -9393,9 +8981,8 @@ def RedNetherBrickWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RedNetherBrickWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:red_nether_brick_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -9408,21 +8995,20 @@ def RedNetherBrickWall(
 
 def RedSand() -> MinecraftBlockDescriptor:
     """Factory for RedSand"""
-    return MinecraftBlockDescriptor("minecraft:red_sand", True)
+    return MinecraftBlockDescriptor.interned("minecraft:red_sand")
 
 
 def RedSandstone() -> MinecraftBlockDescriptor:
     """Factory for RedSandstone"""
-    return MinecraftBlockDescriptor("minecraft:red_sandstone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:red_sandstone")
 
 
 def RedSandstoneDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RedSandstoneDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:red_sandstone_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9431,9 +9017,8 @@ def RedSandstoneSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RedSandstoneSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:red_sandstone_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9443,9 +9028,8 @@ def RedSandstoneStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RedSandstoneStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:red_sandstone_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -9461,9 +9045,8 @@ def RedSandstoneWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RedSandstoneWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:red_sandstone_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -9476,56 +9059,55 @@ def RedSandstoneWall(
 
 def RedShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for RedShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:red_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:red_shulker_box")
 
 
 def RedStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for RedStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:red_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:red_stained_glass")
 
 
 def RedStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for RedStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:red_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:red_stained_glass_pane")
 
 
 def RedTerracotta() -> MinecraftBlockDescriptor:
     """Factory for RedTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:red_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:red_terracotta")
 
 
 def RedTulip() -> MinecraftBlockDescriptor:
     """Factory for RedTulip"""
-    return MinecraftBlockDescriptor("minecraft:red_tulip", True)
+    return MinecraftBlockDescriptor.interned("minecraft:red_tulip")
 
 
 def RedWool() -> MinecraftBlockDescriptor:
     """Factory for RedWool"""
-    return MinecraftBlockDescriptor("minecraft:red_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:red_wool")
 
 
 def RedstoneBlock() -> MinecraftBlockDescriptor:
     """Factory for RedstoneBlock"""
-    return MinecraftBlockDescriptor("minecraft:redstone_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:redstone_block")
 
 
 def RedstoneLamp() -> MinecraftBlockDescriptor:
     """Factory for RedstoneLamp"""
-    return MinecraftBlockDescriptor("minecraft:redstone_lamp", True)
+    return MinecraftBlockDescriptor.interned("minecraft:redstone_lamp")
 
 
 def RedstoneOre() -> MinecraftBlockDescriptor:
     """Factory for RedstoneOre"""
-    return MinecraftBlockDescriptor("minecraft:redstone_ore", True)
+    return MinecraftBlockDescriptor.interned("minecraft:redstone_ore")
 
 
 def RedstoneTorch(
     torch_facing_direction: Optional[TorchFacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RedstoneTorch"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:redstone_torch",
-        True,
         {BlockStateKeys.TorchFacingDirection: torch_facing_direction},
     )
 
@@ -9534,21 +9116,22 @@ def RedstoneWire(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RedstoneWire"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:redstone_wire",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
 
 def Reeds(age: Optional[Age] = None) -> MinecraftBlockDescriptor:
     """Factory for Reeds"""
-    return MinecraftBlockDescriptor("minecraft:reeds", True, {BlockStateKeys.Age: age})
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:reeds", {BlockStateKeys.Age: age}
+    )
 
 
 def ReinforcedDeepslate() -> MinecraftBlockDescriptor:
     """Factory for ReinforcedDeepslate"""
-    return MinecraftBlockDescriptor("minecraft:reinforced_deepslate", True)
+    return MinecraftBlockDescriptor.interned("minecraft:reinforced_deepslate")
 
 
 def RepeatingCommandBlock(
@@ -9556,9 +9139,8 @@ def RepeatingCommandBlock(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RepeatingCommandBlock"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:repeating_command_block",
-        True,
         {
             BlockStateKeys.ConditionalBit: conditional_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -9568,16 +9150,15 @@ def RepeatingCommandBlock(
 
 def ResinBlock() -> MinecraftBlockDescriptor:
     """Factory for ResinBlock"""
-    return MinecraftBlockDescriptor("minecraft:resin_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:resin_block")
 
 
 def ResinBrickDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ResinBrickDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:resin_brick_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9586,9 +9167,8 @@ def ResinBrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ResinBrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:resin_brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9598,9 +9178,8 @@ def ResinBrickStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ResinBrickStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:resin_brick_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -9616,9 +9195,8 @@ def ResinBrickWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ResinBrickWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:resin_brick_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -9631,16 +9209,15 @@ def ResinBrickWall(
 
 def ResinBricks() -> MinecraftBlockDescriptor:
     """Factory for ResinBricks"""
-    return MinecraftBlockDescriptor("minecraft:resin_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:resin_bricks")
 
 
 def ResinClump(
     multi_face_direction_bits: Optional[MultiFaceDirectionBits] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ResinClump"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:resin_clump",
-        True,
         {BlockStateKeys.MultiFaceDirectionBits: multi_face_direction_bits},
     )
 
@@ -9649,9 +9226,8 @@ def RespawnAnchor(
     respawn_anchor_charge: Optional[RespawnAnchorCharge] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RespawnAnchor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:respawn_anchor",
-        True,
         {BlockStateKeys.RespawnAnchorCharge: respawn_anchor_charge},
     )
 
@@ -9660,30 +9236,28 @@ def RoseBush(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for RoseBush"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:rose_bush",
-        True,
         {BlockStateKeys.UpperBlockBit: upper_block_bit},
     )
 
 
 def Sand() -> MinecraftBlockDescriptor:
     """Factory for Sand"""
-    return MinecraftBlockDescriptor("minecraft:sand", True)
+    return MinecraftBlockDescriptor.interned("minecraft:sand")
 
 
 def Sandstone() -> MinecraftBlockDescriptor:
     """Factory for Sandstone"""
-    return MinecraftBlockDescriptor("minecraft:sandstone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:sandstone")
 
 
 def SandstoneDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SandstoneDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sandstone_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9692,9 +9266,8 @@ def SandstoneSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SandstoneSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sandstone_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9704,9 +9277,8 @@ def SandstoneStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SandstoneStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sandstone_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -9722,9 +9294,8 @@ def SandstoneWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SandstoneWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sandstone_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -9740,9 +9311,8 @@ def Scaffolding(
     stability_check: Optional[StabilityCheck] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Scaffolding"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:scaffolding",
-        True,
         {
             BlockStateKeys.Stability: stability,
             BlockStateKeys.StabilityCheck: stability_check,
@@ -9752,13 +9322,13 @@ def Scaffolding(
 
 def Sculk() -> MinecraftBlockDescriptor:
     """Factory for Sculk"""
-    return MinecraftBlockDescriptor("minecraft:sculk", True)
+    return MinecraftBlockDescriptor.interned("minecraft:sculk")
 
 
 def SculkCatalyst(bloom: Optional[Bloom] = None) -> MinecraftBlockDescriptor:
     """Factory for SculkCatalyst"""
-    return MinecraftBlockDescriptor(
-        "minecraft:sculk_catalyst", True, {BlockStateKeys.Bloom: bloom}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:sculk_catalyst", {BlockStateKeys.Bloom: bloom}
     )
 
 
@@ -9766,9 +9336,8 @@ def SculkSensor(
     sculk_sensor_phase: Optional[SculkSensorPhase] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SculkSensor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sculk_sensor",
-        True,
         {BlockStateKeys.SculkSensorPhase: sculk_sensor_phase},
     )
 
@@ -9777,9 +9346,8 @@ def SculkShrieker(
     active: Optional[Active] = None, can_summon: Optional[CanSummon] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for SculkShrieker"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sculk_shrieker",
-        True,
         {BlockStateKeys.Active: active, BlockStateKeys.CanSummon: can_summon},
     )
 
@@ -9788,25 +9356,23 @@ def SculkVein(
     multi_face_direction_bits: Optional[MultiFaceDirectionBits] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SculkVein"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sculk_vein",
-        True,
         {BlockStateKeys.MultiFaceDirectionBits: multi_face_direction_bits},
     )
 
 
 def SeaLantern() -> MinecraftBlockDescriptor:
     """Factory for SeaLantern"""
-    return MinecraftBlockDescriptor("minecraft:sea_lantern", True)
+    return MinecraftBlockDescriptor.interned("minecraft:sea_lantern")
 
 
 def SeaPickle(
     cluster_count: Optional[ClusterCount] = None, dead_bit: Optional[DeadBit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for SeaPickle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sea_pickle",
-        True,
         {
             BlockStateKeys.ClusterCount: cluster_count,
             BlockStateKeys.DeadBit: dead_bit,
@@ -9816,33 +9382,32 @@ def SeaPickle(
 
 def Seagrass(sea_grass_type: Optional[SeaGrassType] = None) -> MinecraftBlockDescriptor:
     """Factory for Seagrass"""
-    return MinecraftBlockDescriptor(
-        "minecraft:seagrass", True, {BlockStateKeys.SeaGrassType: sea_grass_type}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:seagrass", {BlockStateKeys.SeaGrassType: sea_grass_type}
     )
 
 
 def ShortDryGrass() -> MinecraftBlockDescriptor:
     """Factory for ShortDryGrass"""
-    return MinecraftBlockDescriptor("minecraft:short_dry_grass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:short_dry_grass")
 
 
 def ShortGrass() -> MinecraftBlockDescriptor:
     """Factory for ShortGrass"""
-    return MinecraftBlockDescriptor("minecraft:short_grass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:short_grass")
 
 
 def Shroomlight() -> MinecraftBlockDescriptor:
     """Factory for Shroomlight"""
-    return MinecraftBlockDescriptor("minecraft:shroomlight", True)
+    return MinecraftBlockDescriptor.interned("minecraft:shroomlight")
 
 
 def SilverGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SilverGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:silver_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
@@ -9851,25 +9416,23 @@ def SkeletonSkull(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SkeletonSkull"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:skeleton_skull",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def Slime() -> MinecraftBlockDescriptor:
     """Factory for Slime"""
-    return MinecraftBlockDescriptor("minecraft:slime", True)
+    return MinecraftBlockDescriptor.interned("minecraft:slime")
 
 
 def SmallAmethystBud(
     minecraft_block_face: Optional[BlockFace] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SmallAmethystBud"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:small_amethyst_bud",
-        True,
         {BlockStateKeys.MinecraftBlockFace: minecraft_block_face},
     )
 
@@ -9879,9 +9442,8 @@ def SmallDripleafBlock(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SmallDripleafBlock"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:small_dripleaf_block",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
             BlockStateKeys.UpperBlockBit: upper_block_bit,
@@ -9891,29 +9453,28 @@ def SmallDripleafBlock(
 
 def SmithingTable() -> MinecraftBlockDescriptor:
     """Factory for SmithingTable"""
-    return MinecraftBlockDescriptor("minecraft:smithing_table", True)
+    return MinecraftBlockDescriptor.interned("minecraft:smithing_table")
 
 
 def Smoker(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Smoker"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:smoker",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
 
 def SmoothBasalt() -> MinecraftBlockDescriptor:
     """Factory for SmoothBasalt"""
-    return MinecraftBlockDescriptor("minecraft:smooth_basalt", True)
+    return MinecraftBlockDescriptor.interned("minecraft:smooth_basalt")
 
 
 def SmoothQuartz(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for SmoothQuartz"""
-    return MinecraftBlockDescriptor(
-        "minecraft:smooth_quartz", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:smooth_quartz", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -9921,9 +9482,8 @@ def SmoothQuartzDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SmoothQuartzDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:smooth_quartz_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9932,9 +9492,8 @@ def SmoothQuartzSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SmoothQuartzSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:smooth_quartz_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9944,9 +9503,8 @@ def SmoothQuartzStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SmoothQuartzStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:smooth_quartz_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -9956,16 +9514,15 @@ def SmoothQuartzStairs(
 
 def SmoothRedSandstone() -> MinecraftBlockDescriptor:
     """Factory for SmoothRedSandstone"""
-    return MinecraftBlockDescriptor("minecraft:smooth_red_sandstone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:smooth_red_sandstone")
 
 
 def SmoothRedSandstoneDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SmoothRedSandstoneDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:smooth_red_sandstone_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9974,9 +9531,8 @@ def SmoothRedSandstoneSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SmoothRedSandstoneSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:smooth_red_sandstone_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -9986,9 +9542,8 @@ def SmoothRedSandstoneStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SmoothRedSandstoneStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:smooth_red_sandstone_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -9998,16 +9553,15 @@ def SmoothRedSandstoneStairs(
 
 def SmoothSandstone() -> MinecraftBlockDescriptor:
     """Factory for SmoothSandstone"""
-    return MinecraftBlockDescriptor("minecraft:smooth_sandstone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:smooth_sandstone")
 
 
 def SmoothSandstoneDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SmoothSandstoneDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:smooth_sandstone_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -10016,9 +9570,8 @@ def SmoothSandstoneSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SmoothSandstoneSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:smooth_sandstone_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -10028,9 +9581,8 @@ def SmoothSandstoneStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SmoothSandstoneStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:smooth_sandstone_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -10040,16 +9592,15 @@ def SmoothSandstoneStairs(
 
 def SmoothStone() -> MinecraftBlockDescriptor:
     """Factory for SmoothStone"""
-    return MinecraftBlockDescriptor("minecraft:smooth_stone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:smooth_stone")
 
 
 def SmoothStoneDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SmoothStoneDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:smooth_stone_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -10058,9 +9609,8 @@ def SmoothStoneSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SmoothStoneSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:smooth_stone_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -10069,23 +9619,22 @@ def SnifferEgg(
     cracked_state: Optional[CrackedState] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SnifferEgg"""
-    return MinecraftBlockDescriptor(
-        "minecraft:sniffer_egg", True, {BlockStateKeys.CrackedState: cracked_state}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:sniffer_egg", {BlockStateKeys.CrackedState: cracked_state}
     )
 
 
 def Snow() -> MinecraftBlockDescriptor:
     """Factory for Snow"""
-    return MinecraftBlockDescriptor("minecraft:snow", True)
+    return MinecraftBlockDescriptor.interned("minecraft:snow")
 
 
 def SnowLayer(
     covered_bit: Optional[CoveredBit] = None, height: Optional[Height] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for SnowLayer"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:snow_layer",
-        True,
         {BlockStateKeys.CoveredBit: covered_bit, BlockStateKeys.Height: height},
     )
 
@@ -10095,9 +9644,8 @@ def SoulCampfire(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SoulCampfire"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:soul_campfire",
-        True,
         {
             BlockStateKeys.Extinguished: extinguished,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -10107,47 +9655,46 @@ def SoulCampfire(
 
 def SoulFire(age: Optional[Age] = None) -> MinecraftBlockDescriptor:
     """Factory for SoulFire"""
-    return MinecraftBlockDescriptor(
-        "minecraft:soul_fire", True, {BlockStateKeys.Age: age}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:soul_fire", {BlockStateKeys.Age: age}
     )
 
 
 def SoulLantern(hanging: Optional[Hanging] = None) -> MinecraftBlockDescriptor:
     """Factory for SoulLantern"""
-    return MinecraftBlockDescriptor(
-        "minecraft:soul_lantern", True, {BlockStateKeys.Hanging: hanging}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:soul_lantern", {BlockStateKeys.Hanging: hanging}
     )
 
 
 def SoulSand() -> MinecraftBlockDescriptor:
     """Factory for SoulSand"""
-    return MinecraftBlockDescriptor("minecraft:soul_sand", True)
+    return MinecraftBlockDescriptor.interned("minecraft:soul_sand")
 
 
 def SoulSoil() -> MinecraftBlockDescriptor:
     """Factory for SoulSoil"""
-    return MinecraftBlockDescriptor("minecraft:soul_soil", True)
+    return MinecraftBlockDescriptor.interned("minecraft:soul_soil")
 
 
 def SoulTorch(
     torch_facing_direction: Optional[TorchFacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SoulTorch"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:soul_torch",
-        True,
         {BlockStateKeys.TorchFacingDirection: torch_facing_direction},
     )
 
 
 def Sponge() -> MinecraftBlockDescriptor:
     """Factory for Sponge"""
-    return MinecraftBlockDescriptor("minecraft:sponge", True)
+    return MinecraftBlockDescriptor.interned("minecraft:sponge")
 
 
 def SporeBlossom() -> MinecraftBlockDescriptor:
     """Factory for SporeBlossom"""
-    return MinecraftBlockDescriptor("minecraft:spore_blossom", True)
+    return MinecraftBlockDescriptor.interned("minecraft:spore_blossom")
 
 
 def SpruceButton(
@@ -10155,9 +9702,8 @@ def SpruceButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SpruceButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:spruce_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -10172,9 +9718,8 @@ def SpruceDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SpruceDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:spruce_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -10188,16 +9733,15 @@ def SpruceDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SpruceDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:spruce_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def SpruceFence() -> MinecraftBlockDescriptor:
     """Factory for SpruceFence"""
-    return MinecraftBlockDescriptor("minecraft:spruce_fence", True)
+    return MinecraftBlockDescriptor.interned("minecraft:spruce_fence")
 
 
 def SpruceFenceGate(
@@ -10206,9 +9750,8 @@ def SpruceFenceGate(
     open_bit: Optional[OpenBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SpruceFenceGate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:spruce_fence_gate",
-        True,
         {
             BlockStateKeys.InWallBit: in_wall_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -10224,9 +9767,8 @@ def SpruceHangingSign(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SpruceHangingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:spruce_hanging_sign",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -10241,9 +9783,8 @@ def SpruceLeaves(
     update_bit: Optional[UpdateBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SpruceLeaves"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:spruce_leaves",
-        True,
         {
             BlockStateKeys.PersistentBit: persistent_bit,
             BlockStateKeys.UpdateBit: update_bit,
@@ -10253,31 +9794,30 @@ def SpruceLeaves(
 
 def SpruceLog(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for SpruceLog"""
-    return MinecraftBlockDescriptor(
-        "minecraft:spruce_log", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:spruce_log", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def SprucePlanks() -> MinecraftBlockDescriptor:
     """Factory for SprucePlanks"""
-    return MinecraftBlockDescriptor("minecraft:spruce_planks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:spruce_planks")
 
 
 def SprucePressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SprucePressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:spruce_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
 
 def SpruceSapling(age_bit: Optional[AgeBit] = None) -> MinecraftBlockDescriptor:
     """Factory for SpruceSapling"""
-    return MinecraftBlockDescriptor(
-        "minecraft:spruce_sapling", True, {BlockStateKeys.AgeBit: age_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:spruce_sapling", {BlockStateKeys.AgeBit: age_bit}
     )
 
 
@@ -10287,9 +9827,8 @@ def SpruceShelf(
     powered_shelf_type: Optional[int] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SpruceShelf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:spruce_shelf",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: cardinal_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -10302,9 +9841,8 @@ def SpruceSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SpruceSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:spruce_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -10314,9 +9852,8 @@ def SpruceStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SpruceStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:spruce_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -10328,9 +9865,8 @@ def SpruceStandingSign(
     ground_sign_direction: Optional[GroundSignDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SpruceStandingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:spruce_standing_sign",
-        True,
         {BlockStateKeys.GroundSignDirection: ground_sign_direction},
     )
 
@@ -10341,9 +9877,8 @@ def SpruceTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SpruceTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:spruce_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -10356,17 +9891,16 @@ def SpruceWallSign(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SpruceWallSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:spruce_wall_sign",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def SpruceWood(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for SpruceWood"""
-    return MinecraftBlockDescriptor(
-        "minecraft:spruce_wood", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:spruce_wood", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -10374,9 +9908,8 @@ def StandingBanner(
     ground_sign_direction: Optional[GroundSignDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StandingBanner"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:standing_banner",
-        True,
         {BlockStateKeys.GroundSignDirection: ground_sign_direction},
     )
 
@@ -10385,9 +9918,8 @@ def StandingSign(
     ground_sign_direction: Optional[GroundSignDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StandingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:standing_sign",
-        True,
         {BlockStateKeys.GroundSignDirection: ground_sign_direction},
     )
 
@@ -10396,9 +9928,8 @@ def StickyPiston(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StickyPiston"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sticky_piston",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
@@ -10407,25 +9938,23 @@ def StickyPistonArmCollision(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StickyPistonArmCollision"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sticky_piston_arm_collision",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def Stone() -> MinecraftBlockDescriptor:
     """Factory for Stone"""
-    return MinecraftBlockDescriptor("minecraft:stone", True)
+    return MinecraftBlockDescriptor.interned("minecraft:stone")
 
 
 def StoneBrickDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StoneBrickDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stone_brick_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -10434,9 +9963,8 @@ def StoneBrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StoneBrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stone_brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -10446,9 +9974,8 @@ def StoneBrickStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StoneBrickStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stone_brick_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -10464,9 +9991,8 @@ def StoneBrickWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StoneBrickWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stone_brick_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -10479,7 +10005,7 @@ def StoneBrickWall(
 
 def StoneBricks() -> MinecraftBlockDescriptor:
     """Factory for StoneBricks"""
-    return MinecraftBlockDescriptor("minecraft:stone_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:stone_bricks")
 
 
 def StoneButton(
@@ -10487,9 +10013,8 @@ def StoneButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StoneButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stone_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -10501,9 +10026,8 @@ def StonePressurePlate(
     redstone_signal: Optional[RedstoneSignal | None] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StonePressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stone_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
@@ -10513,9 +10037,8 @@ def StoneStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StoneStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stone_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -10527,9 +10050,8 @@ def StonecutterBlock(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StonecutterBlock"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stonecutter_block",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
@@ -10538,9 +10060,8 @@ def StrippedAcaciaLog(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedAcaciaLog"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_acacia_log",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10549,9 +10070,8 @@ def StrippedAcaciaWood(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedAcaciaWood"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_acacia_wood",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10560,9 +10080,8 @@ def StrippedBambooBlock(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedBambooBlock"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_bamboo_block",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10571,9 +10090,8 @@ def StrippedBirchLog(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedBirchLog"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_birch_log",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10582,9 +10100,8 @@ def StrippedBirchWood(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedBirchWood"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_birch_wood",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10593,9 +10110,8 @@ def StrippedCherryLog(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedCherryLog"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_cherry_log",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10604,9 +10120,8 @@ def StrippedCherryWood(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedCherryWood"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_cherry_wood",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10615,9 +10130,8 @@ def StrippedCrimsonHyphae(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedCrimsonHyphae"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_crimson_hyphae",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10626,9 +10140,8 @@ def StrippedCrimsonStem(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedCrimsonStem"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_crimson_stem",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10637,9 +10150,8 @@ def StrippedDarkOakLog(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedDarkOakLog"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_dark_oak_log",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10648,9 +10160,8 @@ def StrippedDarkOakWood(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedDarkOakWood"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_dark_oak_wood",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10659,9 +10170,8 @@ def StrippedJungleLog(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedJungleLog"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_jungle_log",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10670,9 +10180,8 @@ def StrippedJungleWood(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedJungleWood"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_jungle_wood",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10681,9 +10190,8 @@ def StrippedMangroveLog(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedMangroveLog"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_mangrove_log",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10692,9 +10200,8 @@ def StrippedMangroveWood(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedMangroveWood"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_mangrove_wood",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10703,9 +10210,8 @@ def StrippedOakLog(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedOakLog"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_oak_log",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10714,9 +10220,8 @@ def StrippedOakWood(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedOakWood"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_oak_wood",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10725,9 +10230,8 @@ def StrippedPaleOakLog(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedPaleOakLog"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_pale_oak_log",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10736,9 +10240,8 @@ def StrippedPaleOakWood(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedPaleOakWood"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_pale_oak_wood",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10747,9 +10250,8 @@ def StrippedSpruceLog(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedSpruceLog"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_spruce_log",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10758,9 +10260,8 @@ def StrippedSpruceWood(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedSpruceWood"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_spruce_wood",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10769,9 +10270,8 @@ def StrippedWarpedHyphae(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedWarpedHyphae"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_warped_hyphae",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10780,9 +10280,8 @@ def StrippedWarpedStem(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StrippedWarpedStem"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:stripped_warped_stem",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -10791,35 +10290,33 @@ def StructureBlock(
     structure_block_type: Optional[StructureBlockType] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for StructureBlock"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:structure_block",
-        True,
         {BlockStateKeys.StructureBlockType: structure_block_type},
     )
 
 
 def StructureVoid() -> MinecraftBlockDescriptor:
     """Factory for StructureVoid"""
-    return MinecraftBlockDescriptor("minecraft:structure_void", True)
+    return MinecraftBlockDescriptor.interned("minecraft:structure_void")
 
 
 def PotentSulfur() -> MinecraftBlockDescriptor:
     """Factory for PotentSulfur"""
-    return MinecraftBlockDescriptor("minecraft:potent_sulfur", True)
+    return MinecraftBlockDescriptor.interned("minecraft:potent_sulfur")
 
 
 def Sulfur() -> MinecraftBlockDescriptor:
     """Factory for Sulfur"""
-    return MinecraftBlockDescriptor("minecraft:sulfur", True)
+    return MinecraftBlockDescriptor.interned("minecraft:sulfur")
 
 
 def SulfurBrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SulfurBrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sulfur_brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -10829,9 +10326,8 @@ def SulfurBrickStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SulfurBrickStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sulfur_brick_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -10847,9 +10343,8 @@ def SulfurBrickWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SulfurBrickWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sulfur_brick_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -10862,16 +10357,15 @@ def SulfurBrickWall(
 
 def SulfurBricks() -> MinecraftBlockDescriptor:
     """Factory for SulfurBricks"""
-    return MinecraftBlockDescriptor("minecraft:sulfur_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:sulfur_bricks")
 
 
 def SulfurSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SulfurSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sulfur_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -10881,9 +10375,8 @@ def SulfurSpike(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SulfurSpike"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sulfur_spike",
-        True,
         {
             BlockStateKeys.DripstoneThickness: dripstone_thickness,
             BlockStateKeys.Hanging: hanging,
@@ -10896,9 +10389,8 @@ def SulfurStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SulfurStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sulfur_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -10914,9 +10406,8 @@ def SulfurWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SulfurWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sulfur_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -10931,9 +10422,8 @@ def Sunflower(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Sunflower"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:sunflower",
-        True,
         {BlockStateKeys.UpperBlockBit: upper_block_bit},
     )
 
@@ -10943,9 +10433,8 @@ def SuspiciousGravel(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SuspiciousGravel"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:suspicious_gravel",
-        True,
         {
             BlockStateKeys.BrushedProgress: brushed_progress,
             BlockStateKeys.Hanging: hanging,
@@ -10958,9 +10447,8 @@ def SuspiciousSand(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for SuspiciousSand"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:suspicious_sand",
-        True,
         {
             BlockStateKeys.BrushedProgress: brushed_progress,
             BlockStateKeys.Hanging: hanging,
@@ -10970,41 +10458,40 @@ def SuspiciousSand(
 
 def SweetBerryBush(growth: Optional[Growth] = None) -> MinecraftBlockDescriptor:
     """Factory for SweetBerryBush"""
-    return MinecraftBlockDescriptor(
-        "minecraft:sweet_berry_bush", True, {BlockStateKeys.Growth: growth}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:sweet_berry_bush", {BlockStateKeys.Growth: growth}
     )
 
 
 def TallDryGrass() -> MinecraftBlockDescriptor:
     """Factory for TallDryGrass"""
-    return MinecraftBlockDescriptor("minecraft:tall_dry_grass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:tall_dry_grass")
 
 
 def TallGrass(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TallGrass"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:tall_grass",
-        True,
         {BlockStateKeys.UpperBlockBit: upper_block_bit},
     )
 
 
 def Target() -> MinecraftBlockDescriptor:
     """Factory for Target"""
-    return MinecraftBlockDescriptor("minecraft:target", True)
+    return MinecraftBlockDescriptor.interned("minecraft:target")
 
 
 def TintedGlass() -> MinecraftBlockDescriptor:
     """Factory for TintedGlass"""
-    return MinecraftBlockDescriptor("minecraft:tinted_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:tinted_glass")
 
 
 def Tnt(explode_bit: Optional[ExplodeBit] = None) -> MinecraftBlockDescriptor:
     """Factory for Tnt"""
-    return MinecraftBlockDescriptor(
-        "minecraft:tnt", True, {BlockStateKeys.ExplodeBit: explode_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:tnt", {BlockStateKeys.ExplodeBit: explode_bit}
     )
 
 
@@ -11012,22 +10499,21 @@ def Torch(
     torch_facing_direction: Optional[TorchFacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Torch"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:torch",
-        True,
         {BlockStateKeys.TorchFacingDirection: torch_facing_direction},
     )
 
 
 def Torchflower() -> MinecraftBlockDescriptor:
     """Factory for Torchflower"""
-    return MinecraftBlockDescriptor("minecraft:torchflower", True)
+    return MinecraftBlockDescriptor.interned("minecraft:torchflower")
 
 
 def TorchflowerCrop(growth: Optional[Growth] = None) -> MinecraftBlockDescriptor:
     """Factory for TorchflowerCrop"""
-    return MinecraftBlockDescriptor(
-        "minecraft:torchflower_crop", True, {BlockStateKeys.Growth: growth}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:torchflower_crop", {BlockStateKeys.Growth: growth}
     )
 
 
@@ -11037,9 +10523,8 @@ def Trapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Trapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -11052,9 +10537,8 @@ def TrappedChest(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TrappedChest"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:trapped_chest",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction},
     )
 
@@ -11064,9 +10548,8 @@ def TrialSpawner(
     trial_spawner_state: Optional[TrialSpawnerState] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TrialSpawner"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:trial_spawner",
-        True,
         {
             BlockStateKeys.Ominous: ominous,
             BlockStateKeys.TrialSpawnerState: trial_spawner_state,
@@ -11081,9 +10564,8 @@ def TripWire(
     suspended_bit: Optional[SuspendedBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TripWire"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:trip_wire",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.DisarmedBit: disarmed_bit,
@@ -11099,9 +10581,8 @@ def TripwireHook(
     powered_bit: Optional[PoweredBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TripwireHook"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:tripwire_hook",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.Direction: direction,
@@ -11112,21 +10593,20 @@ def TripwireHook(
 
 def TubeCoral() -> MinecraftBlockDescriptor:
     """Factory for TubeCoral"""
-    return MinecraftBlockDescriptor("minecraft:tube_coral", True)
+    return MinecraftBlockDescriptor.interned("minecraft:tube_coral")
 
 
 def TubeCoralBlock() -> MinecraftBlockDescriptor:
     """Factory for TubeCoralBlock"""
-    return MinecraftBlockDescriptor("minecraft:tube_coral_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:tube_coral_block")
 
 
 def TubeCoralFan(
     coral_fan_direction: Optional[CoralFanDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TubeCoralFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:tube_coral_fan",
-        True,
         {BlockStateKeys.CoralFanDirection: coral_fan_direction},
     )
 
@@ -11135,25 +10615,23 @@ def TubeCoralWallFan(
     coral_direction: Optional[CoralDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TubeCoralWallFan"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:tube_coral_wall_fan",
-        True,
         {BlockStateKeys.CoralDirection: coral_direction},
     )
 
 
 def Tuff() -> MinecraftBlockDescriptor:
     """Factory for Tuff"""
-    return MinecraftBlockDescriptor("minecraft:tuff", True)
+    return MinecraftBlockDescriptor.interned("minecraft:tuff")
 
 
 def TuffBrickDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TuffBrickDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:tuff_brick_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -11162,9 +10640,8 @@ def TuffBrickSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TuffBrickSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:tuff_brick_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -11174,9 +10651,8 @@ def TuffBrickStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TuffBrickStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:tuff_brick_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -11192,9 +10668,8 @@ def TuffBrickWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TuffBrickWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:tuff_brick_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -11207,16 +10682,15 @@ def TuffBrickWall(
 
 def TuffBricks() -> MinecraftBlockDescriptor:
     """Factory for TuffBricks"""
-    return MinecraftBlockDescriptor("minecraft:tuff_bricks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:tuff_bricks")
 
 
 def TuffDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TuffDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:tuff_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -11225,9 +10699,8 @@ def TuffSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TuffSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:tuff_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -11237,9 +10710,8 @@ def TuffStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TuffStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:tuff_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -11255,9 +10727,8 @@ def TuffWall(
     wall_post_bit: Optional[WallPostBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TuffWall"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:tuff_wall",
-        True,
         {
             BlockStateKeys.WallConnectionTypeEast: wall_connection_type_east,
             BlockStateKeys.WallConnectionTypeNorth: wall_connection_type_north,
@@ -11273,9 +10744,8 @@ def TurtleEgg(
     turtle_egg_count: Optional[TurtleEggCount] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TurtleEgg"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:turtle_egg",
-        True,
         {
             BlockStateKeys.CrackedState: cracked_state,
             BlockStateKeys.TurtleEggCount: turtle_egg_count,
@@ -11287,17 +10757,16 @@ def TwistingVines(
     twisting_vines_age: Optional[TwistingVinesAge] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for TwistingVines"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:twisting_vines",
-        True,
         {BlockStateKeys.TwistingVinesAge: twisting_vines_age},
     )
 
 
 def UnderwaterTnt(explode_bit: Optional[ExplodeBit] = None) -> MinecraftBlockDescriptor:
     """Factory for UnderwaterTnt"""
-    return MinecraftBlockDescriptor(
-        "minecraft:underwater_tnt", True, {BlockStateKeys.ExplodeBit: explode_bit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:underwater_tnt", {BlockStateKeys.ExplodeBit: explode_bit}
     )
 
 
@@ -11305,30 +10774,28 @@ def UnderwaterTorch(
     torch_facing_direction: Optional[TorchFacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for UnderwaterTorch"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:underwater_torch",
-        True,
         {BlockStateKeys.TorchFacingDirection: torch_facing_direction},
     )
 
 
 def UndyedShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for UndyedShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:undyed_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:undyed_shulker_box")
 
 
 def Unknown() -> MinecraftBlockDescriptor:
     """Factory for Unknown"""
-    return MinecraftBlockDescriptor("minecraft:unknown", True)
+    return MinecraftBlockDescriptor.interned("minecraft:unknown")
 
 
 def UnlitRedstoneTorch(
     torch_facing_direction: Optional[TorchFacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for UnlitRedstoneTorch"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:unlit_redstone_torch",
-        True,
         {BlockStateKeys.TorchFacingDirection: torch_facing_direction},
     )
 
@@ -11339,9 +10806,8 @@ def UnpoweredComparator(
     output_subtract_bit: Optional[OutputSubtractBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for UnpoweredComparator"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:unpowered_comparator",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
             BlockStateKeys.OutputLitBit: output_lit_bit,
@@ -11355,9 +10821,8 @@ def UnpoweredRepeater(
     repeater_delay: Optional[RepeaterDelay] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for UnpoweredRepeater"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:unpowered_repeater",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
             BlockStateKeys.RepeaterDelay: repeater_delay,
@@ -11371,9 +10836,8 @@ def Vault(
     vault_state: Optional[VaultState] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Vault"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:vault",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
             BlockStateKeys.Ominous: ominous,
@@ -11386,9 +10850,8 @@ def VerdantFroglight(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for VerdantFroglight"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:verdant_froglight",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -11397,9 +10860,8 @@ def Vine(
     vine_direction_bits: Optional[VineDirectionBits] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Vine"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:vine",
-        True,
         {BlockStateKeys.VineDirectionBits: vine_direction_bits},
     )
 
@@ -11408,9 +10870,8 @@ def WallBanner(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WallBanner"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:wall_banner",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
@@ -11419,9 +10880,8 @@ def WallSign(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WallSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:wall_sign",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
@@ -11431,9 +10891,8 @@ def WarpedButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WarpedButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:warped_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -11448,9 +10907,8 @@ def WarpedDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WarpedDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:warped_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -11464,16 +10922,15 @@ def WarpedDoubleSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WarpedDoubleSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:warped_double_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def WarpedFence() -> MinecraftBlockDescriptor:
     """Factory for WarpedFence"""
-    return MinecraftBlockDescriptor("minecraft:warped_fence", True)
+    return MinecraftBlockDescriptor.interned("minecraft:warped_fence")
 
 
 def WarpedFenceGate(
@@ -11482,9 +10939,8 @@ def WarpedFenceGate(
     open_bit: Optional[OpenBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WarpedFenceGate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:warped_fence_gate",
-        True,
         {
             BlockStateKeys.InWallBit: in_wall_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -11495,7 +10951,7 @@ def WarpedFenceGate(
 
 def WarpedFungus() -> MinecraftBlockDescriptor:
     """Factory for WarpedFungus"""
-    return MinecraftBlockDescriptor("minecraft:warped_fungus", True)
+    return MinecraftBlockDescriptor.interned("minecraft:warped_fungus")
 
 
 def WarpedHangingSign(
@@ -11505,9 +10961,8 @@ def WarpedHangingSign(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WarpedHangingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:warped_hanging_sign",
-        True,
         {
             BlockStateKeys.AttachedBit: attached_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -11519,35 +10974,34 @@ def WarpedHangingSign(
 
 def WarpedHyphae(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for WarpedHyphae"""
-    return MinecraftBlockDescriptor(
-        "minecraft:warped_hyphae", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:warped_hyphae", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
 def WarpedNylium() -> MinecraftBlockDescriptor:
     """Factory for WarpedNylium"""
-    return MinecraftBlockDescriptor("minecraft:warped_nylium", True)
+    return MinecraftBlockDescriptor.interned("minecraft:warped_nylium")
 
 
 def WarpedPlanks() -> MinecraftBlockDescriptor:
     """Factory for WarpedPlanks"""
-    return MinecraftBlockDescriptor("minecraft:warped_planks", True)
+    return MinecraftBlockDescriptor.interned("minecraft:warped_planks")
 
 
 def WarpedPressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WarpedPressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:warped_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
 
 def WarpedRoots() -> MinecraftBlockDescriptor:
     """Factory for WarpedRoots"""
-    return MinecraftBlockDescriptor("minecraft:warped_roots", True)
+    return MinecraftBlockDescriptor.interned("minecraft:warped_roots")
 
 
 def WarpedShelf(
@@ -11556,9 +11010,8 @@ def WarpedShelf(
     powered_shelf_type: Optional[int] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WarpedShelf"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:warped_shelf",
-        True,
         {
             BlockStateKeys.MinecraftCardinalDirection: cardinal_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -11571,9 +11024,8 @@ def WarpedSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WarpedSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:warped_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -11583,9 +11035,8 @@ def WarpedStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WarpedStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:warped_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -11597,17 +11048,16 @@ def WarpedStandingSign(
     ground_sign_direction: Optional[GroundSignDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WarpedStandingSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:warped_standing_sign",
-        True,
         {BlockStateKeys.GroundSignDirection: ground_sign_direction},
     )
 
 
 def WarpedStem(pillar_axis: Optional[PillarAxis] = None) -> MinecraftBlockDescriptor:
     """Factory for WarpedStem"""
-    return MinecraftBlockDescriptor(
-        "minecraft:warped_stem", True, {BlockStateKeys.PillarAxis: pillar_axis}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:warped_stem", {BlockStateKeys.PillarAxis: pillar_axis}
     )
 
 
@@ -11617,9 +11067,8 @@ def WarpedTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WarpedTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:warped_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -11632,52 +11081,50 @@ def WarpedWallSign(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WarpedWallSign"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:warped_wall_sign",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def WarpedWartBlock() -> MinecraftBlockDescriptor:
     """Factory for WarpedWartBlock"""
-    return MinecraftBlockDescriptor("minecraft:warped_wart_block", True)
+    return MinecraftBlockDescriptor.interned("minecraft:warped_wart_block")
 
 
 def Water(liquid_depth: Optional[LiquidDepth] = None) -> MinecraftBlockDescriptor:
     """Factory for Water"""
-    return MinecraftBlockDescriptor(
-        "minecraft:water", True, {BlockStateKeys.LiquidDepth: liquid_depth}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:water", {BlockStateKeys.LiquidDepth: liquid_depth}
     )
 
 
 def Waterlily() -> MinecraftBlockDescriptor:
     """Factory for Waterlily"""
-    return MinecraftBlockDescriptor("minecraft:waterlily", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waterlily")
 
 
 def WaxedChiseledCopper() -> MinecraftBlockDescriptor:
     """Factory for WaxedChiseledCopper"""
-    return MinecraftBlockDescriptor("minecraft:waxed_chiseled_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_chiseled_copper")
 
 
 def WaxedCopper() -> MinecraftBlockDescriptor:
     """Factory for WaxedCopper"""
-    return MinecraftBlockDescriptor("minecraft:waxed_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_copper")
 
 
 def WaxedCopperBars() -> MinecraftBlockDescriptor:
     """Factory for WaxedCopperBars"""
-    return MinecraftBlockDescriptor("minecraft:waxed_copper_bars", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_copper_bars")
 
 
 def WaxedCopperBulb(
     lit: Optional[Lit] = None, powered_bit: Optional[PoweredBit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedCopperBulb"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_copper_bulb",
-        True,
         {BlockStateKeys.Lit: lit, BlockStateKeys.PoweredBit: powered_bit},
     )
 
@@ -11686,9 +11133,8 @@ def WaxedCopperChain(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedCopperChain"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_copper_chain",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -11700,9 +11146,8 @@ def WaxedCopperDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedCopperDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_copper_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -11716,22 +11161,21 @@ def WaxedCopperGolemStatue(
     cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedCopperGolemStatue"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_copper_golem_statue",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: cardinal_direction},
     )
 
 
 def WaxedCopperGrate() -> MinecraftBlockDescriptor:
     """Factory for WaxedCopperGrate"""
-    return MinecraftBlockDescriptor("minecraft:waxed_copper_grate", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_copper_grate")
 
 
 def WaxedCopperLantern(hanging: Optional[Hanging] = None) -> MinecraftBlockDescriptor:
     """Factory for WaxedCopperLantern"""
-    return MinecraftBlockDescriptor(
-        "minecraft:waxed_copper_lantern", True, {BlockStateKeys.Hanging: hanging}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:waxed_copper_lantern", {BlockStateKeys.Hanging: hanging}
     )
 
 
@@ -11741,9 +11185,8 @@ def WaxedCopperTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedCopperTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_copper_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -11754,16 +11197,15 @@ def WaxedCopperTrapdoor(
 
 def WaxedCutCopper() -> MinecraftBlockDescriptor:
     """Factory for WaxedCutCopper"""
-    return MinecraftBlockDescriptor("minecraft:waxed_cut_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_cut_copper")
 
 
 def WaxedCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -11773,9 +11215,8 @@ def WaxedCutCopperStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedCutCopperStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_cut_copper_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -11787,35 +11228,33 @@ def WaxedDoubleCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedDoubleCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_double_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
 
 def WaxedExposedChiseledCopper() -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedChiseledCopper"""
-    return MinecraftBlockDescriptor("minecraft:waxed_exposed_chiseled_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_exposed_chiseled_copper")
 
 
 def WaxedExposedCopper() -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedCopper"""
-    return MinecraftBlockDescriptor("minecraft:waxed_exposed_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_exposed_copper")
 
 
 def WaxedExposedCopperBars() -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedCopperBars"""
-    return MinecraftBlockDescriptor("minecraft:waxed_exposed_copper_bars", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_exposed_copper_bars")
 
 
 def WaxedExposedCopperBulb(
     lit: Optional[Lit] = None, powered_bit: Optional[PoweredBit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedCopperBulb"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_exposed_copper_bulb",
-        True,
         {BlockStateKeys.Lit: lit, BlockStateKeys.PoweredBit: powered_bit},
     )
 
@@ -11824,9 +11263,8 @@ def WaxedExposedCopperChain(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedCopperChain"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_exposed_copper_chain",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -11838,9 +11276,8 @@ def WaxedExposedCopperDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedCopperDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_exposed_copper_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -11854,25 +11291,23 @@ def WaxedExposedCopperGolemStatue(
     cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedCopperGolemStatue"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_exposed_copper_golem_statue",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: cardinal_direction},
     )
 
 
 def WaxedExposedCopperGrate() -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedCopperGrate"""
-    return MinecraftBlockDescriptor("minecraft:waxed_exposed_copper_grate", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_exposed_copper_grate")
 
 
 def WaxedExposedCopperLantern(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedCopperLantern"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_exposed_copper_lantern",
-        True,
         {BlockStateKeys.Hanging: hanging},
     )
 
@@ -11883,9 +11318,8 @@ def WaxedExposedCopperTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedCopperTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_exposed_copper_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -11896,16 +11330,15 @@ def WaxedExposedCopperTrapdoor(
 
 def WaxedExposedCutCopper() -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedCutCopper"""
-    return MinecraftBlockDescriptor("minecraft:waxed_exposed_cut_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_exposed_cut_copper")
 
 
 def WaxedExposedCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_exposed_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -11915,9 +11348,8 @@ def WaxedExposedCutCopperStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedCutCopperStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_exposed_cut_copper_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -11929,9 +11361,8 @@ def WaxedExposedDoubleCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedDoubleCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_exposed_double_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -11941,9 +11372,8 @@ def WaxedExposedLightningRod(
     powered_bit: Optional[PoweredBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedExposedLightningRod"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_exposed_lightning_rod",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -11956,9 +11386,8 @@ def WaxedLightningRod(
     powered_bit: Optional[PoweredBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedLightningRod"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_lightning_rod",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -11968,26 +11397,25 @@ def WaxedLightningRod(
 
 def WaxedOxidizedChiseledCopper() -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedChiseledCopper"""
-    return MinecraftBlockDescriptor("minecraft:waxed_oxidized_chiseled_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_oxidized_chiseled_copper")
 
 
 def WaxedOxidizedCopper() -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedCopper"""
-    return MinecraftBlockDescriptor("minecraft:waxed_oxidized_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_oxidized_copper")
 
 
 def WaxedOxidizedCopperBars() -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedCopperBars"""
-    return MinecraftBlockDescriptor("minecraft:waxed_oxidized_copper_bars", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_oxidized_copper_bars")
 
 
 def WaxedOxidizedCopperBulb(
     lit: Optional[Lit] = None, powered_bit: Optional[PoweredBit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedCopperBulb"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_oxidized_copper_bulb",
-        True,
         {BlockStateKeys.Lit: lit, BlockStateKeys.PoweredBit: powered_bit},
     )
 
@@ -11996,9 +11424,8 @@ def WaxedOxidizedCopperChain(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedCopperChain"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_oxidized_copper_chain",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -12010,9 +11437,8 @@ def WaxedOxidizedCopperDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedCopperDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_oxidized_copper_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -12026,25 +11452,23 @@ def WaxedOxidizedCopperGolemStatue(
     cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedCopperGolemStatue"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_oxidized_copper_golem_statue",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: cardinal_direction},
     )
 
 
 def WaxedOxidizedCopperGrate() -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedCopperGrate"""
-    return MinecraftBlockDescriptor("minecraft:waxed_oxidized_copper_grate", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_oxidized_copper_grate")
 
 
 def WaxedOxidizedCopperLantern(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedCopperLantern"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_oxidized_copper_lantern",
-        True,
         {BlockStateKeys.Hanging: hanging},
     )
 
@@ -12055,9 +11479,8 @@ def WaxedOxidizedCopperTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedCopperTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_oxidized_copper_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -12068,16 +11491,15 @@ def WaxedOxidizedCopperTrapdoor(
 
 def WaxedOxidizedCutCopper() -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedCutCopper"""
-    return MinecraftBlockDescriptor("minecraft:waxed_oxidized_cut_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_oxidized_cut_copper")
 
 
 def WaxedOxidizedCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_oxidized_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -12087,9 +11509,8 @@ def WaxedOxidizedCutCopperStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedCutCopperStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_oxidized_cut_copper_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -12101,9 +11522,8 @@ def WaxedOxidizedDoubleCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedDoubleCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_oxidized_double_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -12113,9 +11533,8 @@ def WaxedOxidizedLightningRod(
     powered_bit: Optional[PoweredBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedOxidizedLightningRod"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_oxidized_lightning_rod",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -12125,26 +11544,27 @@ def WaxedOxidizedLightningRod(
 
 def WaxedWeatheredChiseledCopper() -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredChiseledCopper"""
-    return MinecraftBlockDescriptor("minecraft:waxed_weathered_chiseled_copper", True)
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:waxed_weathered_chiseled_copper"
+    )
 
 
 def WaxedWeatheredCopper() -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredCopper"""
-    return MinecraftBlockDescriptor("minecraft:waxed_weathered_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_weathered_copper")
 
 
 def WaxedWeatheredCopperBars() -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredCopperBars"""
-    return MinecraftBlockDescriptor("minecraft:waxed_weathered_copper_bars", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_weathered_copper_bars")
 
 
 def WaxedWeatheredCopperBulb(
     lit: Optional[Lit] = None, powered_bit: Optional[PoweredBit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredCopperBulb"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_weathered_copper_bulb",
-        True,
         {BlockStateKeys.Lit: lit, BlockStateKeys.PoweredBit: powered_bit},
     )
 
@@ -12153,9 +11573,8 @@ def WaxedWeatheredCopperChain(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredCopperChain"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_weathered_copper_chain",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -12167,9 +11586,8 @@ def WaxedWeatheredCopperDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredCopperDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_weathered_copper_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -12183,25 +11601,23 @@ def WaxedWeatheredCopperGolemStatue(
     cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredCopperGolemStatue"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_weathered_copper_golem_statue",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: cardinal_direction},
     )
 
 
 def WaxedWeatheredCopperGrate() -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredCopperGrate"""
-    return MinecraftBlockDescriptor("minecraft:waxed_weathered_copper_grate", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_weathered_copper_grate")
 
 
 def WaxedWeatheredCopperLantern(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredCopperLantern"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_weathered_copper_lantern",
-        True,
         {BlockStateKeys.Hanging: hanging},
     )
 
@@ -12212,9 +11628,8 @@ def WaxedWeatheredCopperTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredCopperTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_weathered_copper_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -12225,16 +11640,15 @@ def WaxedWeatheredCopperTrapdoor(
 
 def WaxedWeatheredCutCopper() -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredCutCopper"""
-    return MinecraftBlockDescriptor("minecraft:waxed_weathered_cut_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:waxed_weathered_cut_copper")
 
 
 def WaxedWeatheredCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_weathered_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -12244,9 +11658,8 @@ def WaxedWeatheredCutCopperStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredCutCopperStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_weathered_cut_copper_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -12258,9 +11671,8 @@ def WaxedWeatheredDoubleCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredDoubleCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_weathered_double_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -12270,9 +11682,8 @@ def WaxedWeatheredLightningRod(
     powered_bit: Optional[PoweredBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WaxedWeatheredLightningRod"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:waxed_weathered_lightning_rod",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -12282,26 +11693,25 @@ def WaxedWeatheredLightningRod(
 
 def WeatheredChiseledCopper() -> MinecraftBlockDescriptor:
     """Factory for WeatheredChiseledCopper"""
-    return MinecraftBlockDescriptor("minecraft:weathered_chiseled_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:weathered_chiseled_copper")
 
 
 def WeatheredCopper() -> MinecraftBlockDescriptor:
     """Factory for WeatheredCopper"""
-    return MinecraftBlockDescriptor("minecraft:weathered_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:weathered_copper")
 
 
 def WeatheredCopperBars() -> MinecraftBlockDescriptor:
     """Factory for WeatheredCopperBars"""
-    return MinecraftBlockDescriptor("minecraft:weathered_copper_bars", True)
+    return MinecraftBlockDescriptor.interned("minecraft:weathered_copper_bars")
 
 
 def WeatheredCopperBulb(
     lit: Optional[Lit] = None, powered_bit: Optional[PoweredBit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for WeatheredCopperBulb"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:weathered_copper_bulb",
-        True,
         {BlockStateKeys.Lit: lit, BlockStateKeys.PoweredBit: powered_bit},
     )
 
@@ -12310,9 +11720,8 @@ def WeatheredCopperChain(
     pillar_axis: Optional[PillarAxis] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WeatheredCopperChain"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:weathered_copper_chain",
-        True,
         {BlockStateKeys.PillarAxis: pillar_axis},
     )
 
@@ -12324,9 +11733,8 @@ def WeatheredCopperDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WeatheredCopperDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:weathered_copper_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -12340,25 +11748,23 @@ def WeatheredCopperGolemStatue(
     cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WeatheredCopperGolemStatue"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:weathered_copper_golem_statue",
-        True,
         {BlockStateKeys.MinecraftCardinalDirection: cardinal_direction},
     )
 
 
 def WeatheredCopperGrate() -> MinecraftBlockDescriptor:
     """Factory for WeatheredCopperGrate"""
-    return MinecraftBlockDescriptor("minecraft:weathered_copper_grate", True)
+    return MinecraftBlockDescriptor.interned("minecraft:weathered_copper_grate")
 
 
 def WeatheredCopperLantern(
     hanging: Optional[Hanging] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WeatheredCopperLantern"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:weathered_copper_lantern",
-        True,
         {BlockStateKeys.Hanging: hanging},
     )
 
@@ -12369,9 +11775,8 @@ def WeatheredCopperTrapdoor(
     upside_down_bit: Optional[UpsideDownBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WeatheredCopperTrapdoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:weathered_copper_trapdoor",
-        True,
         {
             BlockStateKeys.Direction: direction,
             BlockStateKeys.OpenBit: open_bit,
@@ -12382,16 +11787,15 @@ def WeatheredCopperTrapdoor(
 
 def WeatheredCutCopper() -> MinecraftBlockDescriptor:
     """Factory for WeatheredCutCopper"""
-    return MinecraftBlockDescriptor("minecraft:weathered_cut_copper", True)
+    return MinecraftBlockDescriptor.interned("minecraft:weathered_cut_copper")
 
 
 def WeatheredCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WeatheredCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:weathered_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -12401,9 +11805,8 @@ def WeatheredCutCopperStairs(
     weirdo_direction: Optional[WeirdoDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WeatheredCutCopperStairs"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:weathered_cut_copper_stairs",
-        True,
         {
             BlockStateKeys.UpsideDownBit: upside_down_bit,
             BlockStateKeys.WeirdoDirection: weirdo_direction,
@@ -12415,9 +11818,8 @@ def WeatheredDoubleCutCopperSlab(
     minecraft_vertical_half: Optional[VerticalHalf] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WeatheredDoubleCutCopperSlab"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:weathered_double_cut_copper_slab",
-        True,
         {BlockStateKeys.MinecraftVerticalHalf: minecraft_vertical_half},
     )
 
@@ -12427,9 +11829,8 @@ def WeatheredLightningRod(
     powered_bit: Optional[PoweredBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WeatheredLightningRod"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:weathered_lightning_rod",
-        True,
         {
             BlockStateKeys.FacingDirection: facing_direction,
             BlockStateKeys.PoweredBit: powered_bit,
@@ -12439,29 +11840,28 @@ def WeatheredLightningRod(
 
 def Web() -> MinecraftBlockDescriptor:
     """Factory for Web"""
-    return MinecraftBlockDescriptor("minecraft:web", True)
+    return MinecraftBlockDescriptor.interned("minecraft:web")
 
 
 def WeepingVines(
     weeping_vines_age: Optional[WeepingVinesAge] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WeepingVines"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:weeping_vines",
-        True,
         {BlockStateKeys.WeepingVinesAge: weeping_vines_age},
     )
 
 
 def WetSponge() -> MinecraftBlockDescriptor:
     """Factory for WetSponge"""
-    return MinecraftBlockDescriptor("minecraft:wet_sponge", True)
+    return MinecraftBlockDescriptor.interned("minecraft:wet_sponge")
 
 
 def Wheat(growth: Optional[Growth] = None) -> MinecraftBlockDescriptor:
     """Factory for Wheat"""
-    return MinecraftBlockDescriptor(
-        "minecraft:wheat", True, {BlockStateKeys.Growth: growth}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:wheat", {BlockStateKeys.Growth: growth}
     )
 
 
@@ -12469,74 +11869,72 @@ def WhiteCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for WhiteCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:white_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def WhiteCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for WhiteCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:white_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:white_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def WhiteCarpet() -> MinecraftBlockDescriptor:
     """Factory for WhiteCarpet"""
-    return MinecraftBlockDescriptor("minecraft:white_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:white_carpet")
 
 
 def WhiteConcrete() -> MinecraftBlockDescriptor:
     """Factory for WhiteConcrete"""
-    return MinecraftBlockDescriptor("minecraft:white_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:white_concrete")
 
 
 def WhiteConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for WhiteConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:white_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:white_concrete_powder")
 
 
 def WhiteGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WhiteGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:white_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def WhiteShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for WhiteShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:white_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:white_shulker_box")
 
 
 def WhiteStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for WhiteStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:white_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:white_stained_glass")
 
 
 def WhiteStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for WhiteStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:white_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:white_stained_glass_pane")
 
 
 def WhiteTerracotta() -> MinecraftBlockDescriptor:
     """Factory for WhiteTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:white_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:white_terracotta")
 
 
 def WhiteTulip() -> MinecraftBlockDescriptor:
     """Factory for WhiteTulip"""
-    return MinecraftBlockDescriptor("minecraft:white_tulip", True)
+    return MinecraftBlockDescriptor.interned("minecraft:white_tulip")
 
 
 def WhiteWool() -> MinecraftBlockDescriptor:
     """Factory for WhiteWool"""
-    return MinecraftBlockDescriptor("minecraft:white_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:white_wool")
 
 
 def Wildflowers(
@@ -12544,9 +11942,8 @@ def Wildflowers(
     minecraft_cardinal_direction: Optional[CardinalDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for Wildflowers"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:wildflowers",
-        True,
         {
             BlockStateKeys.Growth: growth,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -12556,16 +11953,15 @@ def Wildflowers(
 
 def WitherRose() -> MinecraftBlockDescriptor:
     """Factory for WitherRose"""
-    return MinecraftBlockDescriptor("minecraft:wither_rose", True)
+    return MinecraftBlockDescriptor.interned("minecraft:wither_rose")
 
 
 def WitherSkeletonSkull(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WitherSkeletonSkull"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:wither_skeleton_skull",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
@@ -12575,9 +11971,8 @@ def WoodenButton(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WoodenButton"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:wooden_button",
-        True,
         {
             BlockStateKeys.ButtonPressedBit: button_pressed_bit,
             BlockStateKeys.FacingDirection: facing_direction,
@@ -12592,9 +11987,8 @@ def WoodenDoor(
     upper_block_bit: Optional[UpperBlockBit] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WoodenDoor"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:wooden_door",
-        True,
         {
             BlockStateKeys.DoorHingeBit: door_hinge_bit,
             BlockStateKeys.MinecraftCardinalDirection: minecraft_cardinal_direction,
@@ -12608,9 +12002,8 @@ def WoodenPressurePlate(
     redstone_signal: Optional[RedstoneSignal] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for WoodenPressurePlate"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:wooden_pressure_plate",
-        True,
         {BlockStateKeys.RedstoneSignal: redstone_signal},
     )
 
@@ -12619,77 +12012,74 @@ def YellowCandle(
     candles: Optional[Candles] = None, lit: Optional[Lit] = None
 ) -> MinecraftBlockDescriptor:
     """Factory for YellowCandle"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:yellow_candle",
-        True,
         {BlockStateKeys.Candles: candles, BlockStateKeys.Lit: lit},
     )
 
 
 def YellowCandleCake(lit: Optional[Lit] = None) -> MinecraftBlockDescriptor:
     """Factory for YellowCandleCake"""
-    return MinecraftBlockDescriptor(
-        "minecraft:yellow_candle_cake", True, {BlockStateKeys.Lit: lit}
+    return MinecraftBlockDescriptor.interned(
+        "minecraft:yellow_candle_cake", {BlockStateKeys.Lit: lit}
     )
 
 
 def YellowCarpet() -> MinecraftBlockDescriptor:
     """Factory for YellowCarpet"""
-    return MinecraftBlockDescriptor("minecraft:yellow_carpet", True)
+    return MinecraftBlockDescriptor.interned("minecraft:yellow_carpet")
 
 
 def YellowConcrete() -> MinecraftBlockDescriptor:
     """Factory for YellowConcrete"""
-    return MinecraftBlockDescriptor("minecraft:yellow_concrete", True)
+    return MinecraftBlockDescriptor.interned("minecraft:yellow_concrete")
 
 
 def YellowConcretePowder() -> MinecraftBlockDescriptor:
     """Factory for YellowConcretePowder"""
-    return MinecraftBlockDescriptor("minecraft:yellow_concrete_powder", True)
+    return MinecraftBlockDescriptor.interned("minecraft:yellow_concrete_powder")
 
 
 def YellowGlazedTerracotta(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for YellowGlazedTerracotta"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:yellow_glazed_terracotta",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
 
 
 def YellowShulkerBox() -> MinecraftBlockDescriptor:
     """Factory for YellowShulkerBox"""
-    return MinecraftBlockDescriptor("minecraft:yellow_shulker_box", True)
+    return MinecraftBlockDescriptor.interned("minecraft:yellow_shulker_box")
 
 
 def YellowStainedGlass() -> MinecraftBlockDescriptor:
     """Factory for YellowStainedGlass"""
-    return MinecraftBlockDescriptor("minecraft:yellow_stained_glass", True)
+    return MinecraftBlockDescriptor.interned("minecraft:yellow_stained_glass")
 
 
 def YellowStainedGlassPane() -> MinecraftBlockDescriptor:
     """Factory for YellowStainedGlassPane"""
-    return MinecraftBlockDescriptor("minecraft:yellow_stained_glass_pane", True)
+    return MinecraftBlockDescriptor.interned("minecraft:yellow_stained_glass_pane")
 
 
 def YellowTerracotta() -> MinecraftBlockDescriptor:
     """Factory for YellowTerracotta"""
-    return MinecraftBlockDescriptor("minecraft:yellow_terracotta", True)
+    return MinecraftBlockDescriptor.interned("minecraft:yellow_terracotta")
 
 
 def YellowWool() -> MinecraftBlockDescriptor:
     """Factory for YellowWool"""
-    return MinecraftBlockDescriptor("minecraft:yellow_wool", True)
+    return MinecraftBlockDescriptor.interned("minecraft:yellow_wool")
 
 
 def ZombieHead(
     facing_direction: Optional[FacingDirection] = None,
 ) -> MinecraftBlockDescriptor:
     """Factory for ZombieHead"""
-    return MinecraftBlockDescriptor(
+    return MinecraftBlockDescriptor.interned(
         "minecraft:zombie_head",
-        True,
         {BlockStateKeys.FacingDirection: facing_direction},
     )
@@ -6,4103 +6,4123 @@ from anvil.lib.schemas import MinecraftItemDescriptor
 
 
 def AcaciaBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_boat")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_boat")
 
 
 def AcaciaButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_button")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_button")
 
 
 def AcaciaChestBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_chest_boat")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_chest_boat")
 
 
 def AcaciaDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_door")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_door")
 
 
 def AcaciaFence() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_fence")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_fence")
 
 
 def AcaciaFenceGate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_fence_gate")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_fence_gate")
 
 
 def AcaciaHangingSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_hanging_sign")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_hanging_sign")
 
 
 def AcaciaLeaves() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_leaves")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_leaves")
 
 
 def AcaciaLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_log")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_log")
 
 
 def AcaciaPlanks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_planks")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_planks")
 
 
 def AcaciaPressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_pressure_plate")
 
 
 def AcaciaSapling() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_sapling")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_sapling")
 
 
 def AcaciaSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_sign")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_sign")
 
 
 def AcaciaSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_slab")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_slab")
 
 
 def AcaciaStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_stairs")
 
 
 def AcaciaTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_trapdoor")
 
 
 def AcaciaWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:acacia_wood")
+    return MinecraftItemDescriptor.interned("minecraft:acacia_wood")
 
 
 def ActivatorRail() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:activator_rail")
+    return MinecraftItemDescriptor.interned("minecraft:activator_rail")
 
 
 def AllaySpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:allay_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:allay_spawn_egg")
 
 
 def Allium() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:allium")
+    return MinecraftItemDescriptor.interned("minecraft:allium")
 
 
 def Allow() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:allow")
+    return MinecraftItemDescriptor.interned("minecraft:allow")
 
 
 def AmethystBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:amethyst_block")
+    return MinecraftItemDescriptor.interned("minecraft:amethyst_block")
 
 
 def AmethystCluster() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:amethyst_cluster")
+    return MinecraftItemDescriptor.interned("minecraft:amethyst_cluster")
 
 
 def AmethystShard() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:amethyst_shard")
+    return MinecraftItemDescriptor.interned("minecraft:amethyst_shard")
 
 
 def AncientDebris() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ancient_debris")
+    return MinecraftItemDescriptor.interned("minecraft:ancient_debris")
 
 
 def Andesite() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:andesite")
+    return MinecraftItemDescriptor.interned("minecraft:andesite")
 
 
 def AndesiteSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:andesite_slab")
+    return MinecraftItemDescriptor.interned("minecraft:andesite_slab")
 
 
 def AndesiteStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:andesite_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:andesite_stairs")
 
 
 def AndesiteWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:andesite_wall")
+    return MinecraftItemDescriptor.interned("minecraft:andesite_wall")
 
 
 def AnglerPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:angler_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:angler_pottery_sherd")
 
 
 def Anvil() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:anvil")
+    return MinecraftItemDescriptor.interned("minecraft:anvil")
 
 
 def Apple() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:apple")
+    return MinecraftItemDescriptor.interned("minecraft:apple")
 
 
 def ArcherPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:archer_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:archer_pottery_sherd")
 
 
 def ArmadilloScute() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:armadillo_scute")
+    return MinecraftItemDescriptor.interned("minecraft:armadillo_scute")
 
 
 def ArmadilloSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:armadillo_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:armadillo_spawn_egg")
 
 
 def ArmorStand() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:armor_stand")
+    return MinecraftItemDescriptor.interned("minecraft:armor_stand")
 
 
 def ArmsUpPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:arms_up_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:arms_up_pottery_sherd")
 
 
 def Arrow() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:arrow")
+    return MinecraftItemDescriptor.interned("minecraft:arrow")
 
 
 def AxolotlBucket() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:axolotl_bucket")
+    return MinecraftItemDescriptor.interned("minecraft:axolotl_bucket")
 
 
 def AxolotlSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:axolotl_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:axolotl_spawn_egg")
 
 
 def Azalea() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:azalea")
+    return MinecraftItemDescriptor.interned("minecraft:azalea")
 
 
 def AzaleaLeaves() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:azalea_leaves")
+    return MinecraftItemDescriptor.interned("minecraft:azalea_leaves")
 
 
 def AzaleaLeavesFlowered() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:azalea_leaves_flowered")
+    return MinecraftItemDescriptor.interned("minecraft:azalea_leaves_flowered")
 
 
 def AzureBluet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:azure_bluet")
+    return MinecraftItemDescriptor.interned("minecraft:azure_bluet")
 
 
 def BakedPotato() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:baked_potato")
+    return MinecraftItemDescriptor.interned("minecraft:baked_potato")
 
 
 def Bamboo() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo")
 
 
 def BambooBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_block")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_block")
 
 
 def BambooButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_button")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_button")
 
 
 def BambooChestRaft() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_chest_raft")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_chest_raft")
 
 
 def BambooDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_door")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_door")
 
 
 def BambooFence() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_fence")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_fence")
 
 
 def BambooFenceGate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_fence_gate")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_fence_gate")
 
 
 def BambooHangingSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_hanging_sign")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_hanging_sign")
 
 
 def BambooMosaic() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_mosaic")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_mosaic")
 
 
 def BambooMosaicSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_mosaic_slab")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_mosaic_slab")
 
 
 def BambooMosaicStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_mosaic_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_mosaic_stairs")
 
 
 def BambooPlanks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_planks")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_planks")
 
 
 def BambooPressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_pressure_plate")
 
 
 def BambooRaft() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_raft")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_raft")
 
 
 def BambooSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_sign")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_sign")
 
 
 def BambooSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_slab")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_slab")
 
 
 def BambooStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_stairs")
 
 
 def BambooTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bamboo_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:bamboo_trapdoor")
 
 
 def Banner() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:banner")
+    return MinecraftItemDescriptor.interned("minecraft:banner")
 
 
 def Barrel() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:barrel")
+    return MinecraftItemDescriptor.interned("minecraft:barrel")
 
 
 def Barrier() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:barrier")
+    return MinecraftItemDescriptor.interned("minecraft:barrier")
 
 
 def Basalt() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:basalt")
+    return MinecraftItemDescriptor.interned("minecraft:basalt")
 
 
 def BatSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bat_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:bat_spawn_egg")
 
 
 def Beacon() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:beacon")
+    return MinecraftItemDescriptor.interned("minecraft:beacon")
 
 
 def Bed() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bed")
+    return MinecraftItemDescriptor.interned("minecraft:bed")
 
 
 def Bedrock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bedrock")
+    return MinecraftItemDescriptor.interned("minecraft:bedrock")
 
 
 def BeeNest() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bee_nest")
+    return MinecraftItemDescriptor.interned("minecraft:bee_nest")
 
 
 def BeeSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bee_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:bee_spawn_egg")
 
 
 def Beef() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:beef")
+    return MinecraftItemDescriptor.interned("minecraft:beef")
 
 
 def Beehive() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:beehive")
+    return MinecraftItemDescriptor.interned("minecraft:beehive")
 
 
 def Beetroot() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:beetroot")
+    return MinecraftItemDescriptor.interned("minecraft:beetroot")
 
 
 def BeetrootSeeds() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:beetroot_seeds")
+    return MinecraftItemDescriptor.interned("minecraft:beetroot_seeds")
 
 
 def BeetrootSoup() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:beetroot_soup")
+    return MinecraftItemDescriptor.interned("minecraft:beetroot_soup")
 
 
 def Bell() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bell")
+    return MinecraftItemDescriptor.interned("minecraft:bell")
 
 
 def BigDripleaf() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:big_dripleaf")
+    return MinecraftItemDescriptor.interned("minecraft:big_dripleaf")
 
 
 def BirchBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_boat")
+    return MinecraftItemDescriptor.interned("minecraft:birch_boat")
 
 
 def BirchButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_button")
+    return MinecraftItemDescriptor.interned("minecraft:birch_button")
 
 
 def BirchChestBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_chest_boat")
+    return MinecraftItemDescriptor.interned("minecraft:birch_chest_boat")
 
 
 def BirchDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_door")
+    return MinecraftItemDescriptor.interned("minecraft:birch_door")
 
 
 def BirchFence() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_fence")
+    return MinecraftItemDescriptor.interned("minecraft:birch_fence")
 
 
 def BirchFenceGate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_fence_gate")
+    return MinecraftItemDescriptor.interned("minecraft:birch_fence_gate")
 
 
 def BirchHangingSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_hanging_sign")
+    return MinecraftItemDescriptor.interned("minecraft:birch_hanging_sign")
 
 
 def BirchLeaves() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_leaves")
+    return MinecraftItemDescriptor.interned("minecraft:birch_leaves")
 
 
 def BirchLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_log")
+    return MinecraftItemDescriptor.interned("minecraft:birch_log")
 
 
 def BirchPlanks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_planks")
+    return MinecraftItemDescriptor.interned("minecraft:birch_planks")
 
 
 def BirchPressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:birch_pressure_plate")
 
 
 def BirchSapling() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_sapling")
+    return MinecraftItemDescriptor.interned("minecraft:birch_sapling")
 
 
 def BirchSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_sign")
+    return MinecraftItemDescriptor.interned("minecraft:birch_sign")
 
 
 def BirchSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_slab")
+    return MinecraftItemDescriptor.interned("minecraft:birch_slab")
 
 
 def BirchStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:birch_stairs")
 
 
 def BirchTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:birch_trapdoor")
 
 
 def BirchWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:birch_wood")
+    return MinecraftItemDescriptor.interned("minecraft:birch_wood")
 
 
 def BlackBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:black_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:black_bundle")
 
 
 def BlackCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:black_candle")
+    return MinecraftItemDescriptor.interned("minecraft:black_candle")
 
 
 def BlackCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:black_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:black_carpet")
 
 
 def BlackConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:black_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:black_concrete")
 
 
 def BlackConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:black_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:black_concrete_powder")
 
 
 def BlackDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:black_dye")
+    return MinecraftItemDescriptor.interned("minecraft:black_dye")
 
 
 def BlackGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:black_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:black_glazed_terracotta")
 
 
 def BlackHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:black_harness")
+    return MinecraftItemDescriptor.interned("minecraft:black_harness")
 
 
 def BlackShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:black_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:black_shulker_box")
 
 
 def BlackStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:black_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:black_stained_glass")
 
 
 def BlackStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:black_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:black_stained_glass_pane")
 
 
 def BlackTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:black_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:black_terracotta")
 
 
 def BlackWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:black_wool")
+    return MinecraftItemDescriptor.interned("minecraft:black_wool")
 
 
 def Blackstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blackstone")
+    return MinecraftItemDescriptor.interned("minecraft:blackstone")
 
 
 def BlackstoneSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blackstone_slab")
+    return MinecraftItemDescriptor.interned("minecraft:blackstone_slab")
 
 
 def BlackstoneStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blackstone_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:blackstone_stairs")
 
 
 def BlackstoneWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blackstone_wall")
+    return MinecraftItemDescriptor.interned("minecraft:blackstone_wall")
 
 
 def BladePotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blade_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:blade_pottery_sherd")
 
 
 def BlastFurnace() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blast_furnace")
+    return MinecraftItemDescriptor.interned("minecraft:blast_furnace")
 
 
 def BlazePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blaze_powder")
+    return MinecraftItemDescriptor.interned("minecraft:blaze_powder")
 
 
 def BlazeRod() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blaze_rod")
+    return MinecraftItemDescriptor.interned("minecraft:blaze_rod")
 
 
 def BlazeSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blaze_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:blaze_spawn_egg")
 
 
 def BlueBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:blue_bundle")
 
 
 def BlueCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_candle")
+    return MinecraftItemDescriptor.interned("minecraft:blue_candle")
 
 
 def BlueCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:blue_carpet")
 
 
 def BlueConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:blue_concrete")
 
 
 def BlueConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:blue_concrete_powder")
 
 
 def BlueDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_dye")
+    return MinecraftItemDescriptor.interned("minecraft:blue_dye")
 
 
 def BlueEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_egg")
+    return MinecraftItemDescriptor.interned("minecraft:blue_egg")
 
 
 def BlueGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:blue_glazed_terracotta")
 
 
 def BlueHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_harness")
+    return MinecraftItemDescriptor.interned("minecraft:blue_harness")
 
 
 def BlueIce() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_ice")
+    return MinecraftItemDescriptor.interned("minecraft:blue_ice")
 
 
 def BlueOrchid() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_orchid")
+    return MinecraftItemDescriptor.interned("minecraft:blue_orchid")
 
 
 def BlueShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:blue_shulker_box")
 
 
 def BlueStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:blue_stained_glass")
 
 
 def BlueStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:blue_stained_glass_pane")
 
 
 def BlueTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:blue_terracotta")
 
 
 def BlueWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:blue_wool")
+    return MinecraftItemDescriptor.interned("minecraft:blue_wool")
 
 
 def BoggedSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bogged_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:bogged_spawn_egg")
 
 
 def BoltArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bolt_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:bolt_armor_trim_smithing_template"
+    )
 
 
 def Bone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bone")
+    return MinecraftItemDescriptor.interned("minecraft:bone")
 
 
 def BoneBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bone_block")
+    return MinecraftItemDescriptor.interned("minecraft:bone_block")
 
 
 def BoneMeal() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bone_meal")
+    return MinecraftItemDescriptor.interned("minecraft:bone_meal")
 
 
 def Book() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:book")
+    return MinecraftItemDescriptor.interned("minecraft:book")
 
 
 def Bookshelf() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bookshelf")
+    return MinecraftItemDescriptor.interned("minecraft:bookshelf")
 
 
 def BorderBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:border_block")
+    return MinecraftItemDescriptor.interned("minecraft:border_block")
 
 
 def BordureIndentedBannerPattern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bordure_indented_banner_pattern")
+    return MinecraftItemDescriptor.interned("minecraft:bordure_indented_banner_pattern")
 
 
 def Bow() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bow")
+    return MinecraftItemDescriptor.interned("minecraft:bow")
 
 
 def Bowl() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bowl")
+    return MinecraftItemDescriptor.interned("minecraft:bowl")
 
 
 def BrainCoral() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brain_coral")
+    return MinecraftItemDescriptor.interned("minecraft:brain_coral")
 
 
 def BrainCoralBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brain_coral_block")
+    return MinecraftItemDescriptor.interned("minecraft:brain_coral_block")
 
 
 def BrainCoralFan() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brain_coral_fan")
+    return MinecraftItemDescriptor.interned("minecraft:brain_coral_fan")
 
 
 def Bread() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bread")
+    return MinecraftItemDescriptor.interned("minecraft:bread")
 
 
 def BreezeRod() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:breeze_rod")
+    return MinecraftItemDescriptor.interned("minecraft:breeze_rod")
 
 
 def BreezeSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:breeze_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:breeze_spawn_egg")
 
 
 def BrewerPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brewer_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:brewer_pottery_sherd")
 
 
 def BrewingStand() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brewing_stand")
+    return MinecraftItemDescriptor.interned("minecraft:brewing_stand")
 
 
 def Brick() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brick")
+    return MinecraftItemDescriptor.interned("minecraft:brick")
 
 
 def BrickBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brick_block")
+    return MinecraftItemDescriptor.interned("minecraft:brick_block")
 
 
 def BrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:brick_slab")
 
 
 def BrickStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brick_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:brick_stairs")
 
 
 def BrickWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brick_wall")
+    return MinecraftItemDescriptor.interned("minecraft:brick_wall")
 
 
 def BrownBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:brown_bundle")
 
 
 def BrownCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_candle")
+    return MinecraftItemDescriptor.interned("minecraft:brown_candle")
 
 
 def BrownCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:brown_carpet")
 
 
 def BrownConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:brown_concrete")
 
 
 def BrownConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:brown_concrete_powder")
 
 
 def BrownDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_dye")
+    return MinecraftItemDescriptor.interned("minecraft:brown_dye")
 
 
 def BrownEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_egg")
+    return MinecraftItemDescriptor.interned("minecraft:brown_egg")
 
 
 def BrownGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:brown_glazed_terracotta")
 
 
 def BrownHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_harness")
+    return MinecraftItemDescriptor.interned("minecraft:brown_harness")
 
 
 def BrownMushroom() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_mushroom")
+    return MinecraftItemDescriptor.interned("minecraft:brown_mushroom")
 
 
 def BrownMushroomBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_mushroom_block")
+    return MinecraftItemDescriptor.interned("minecraft:brown_mushroom_block")
 
 
 def BrownShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:brown_shulker_box")
 
 
 def BrownStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:brown_stained_glass")
 
 
 def BrownStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:brown_stained_glass_pane")
 
 
 def BrownTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:brown_terracotta")
 
 
 def BrownWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brown_wool")
+    return MinecraftItemDescriptor.interned("minecraft:brown_wool")
 
 
 def Brush() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:brush")
+    return MinecraftItemDescriptor.interned("minecraft:brush")
 
 
 def BubbleCoral() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bubble_coral")
+    return MinecraftItemDescriptor.interned("minecraft:bubble_coral")
 
 
 def BubbleCoralBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bubble_coral_block")
+    return MinecraftItemDescriptor.interned("minecraft:bubble_coral_block")
 
 
 def BubbleCoralFan() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bubble_coral_fan")
+    return MinecraftItemDescriptor.interned("minecraft:bubble_coral_fan")
 
 
 def Bucket() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bucket")
+    return MinecraftItemDescriptor.interned("minecraft:bucket")
 
 
 def BuddingAmethyst() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:budding_amethyst")
+    return MinecraftItemDescriptor.interned("minecraft:budding_amethyst")
 
 
 def Bundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bundle")
+    return MinecraftItemDescriptor.interned("minecraft:bundle")
 
 
 def BurnPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:burn_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:burn_pottery_sherd")
 
 
 def Bush() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:bush")
+    return MinecraftItemDescriptor.interned("minecraft:bush")
 
 
 def Cactus() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cactus")
+    return MinecraftItemDescriptor.interned("minecraft:cactus")
 
 
 def CactusFlower() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cactus_flower")
+    return MinecraftItemDescriptor.interned("minecraft:cactus_flower")
 
 
 def Cake() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cake")
+    return MinecraftItemDescriptor.interned("minecraft:cake")
 
 
 def Calcite() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:calcite")
+    return MinecraftItemDescriptor.interned("minecraft:calcite")
 
 
 def CalibratedSculkSensor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:calibrated_sculk_sensor")
+    return MinecraftItemDescriptor.interned("minecraft:calibrated_sculk_sensor")
 
 
 def CamelHuskSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:camel_husk_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:camel_husk_spawn_egg")
 
 
 def CamelSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:camel_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:camel_spawn_egg")
 
 
 def Campfire() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:campfire")
+    return MinecraftItemDescriptor.interned("minecraft:campfire")
 
 
 def Candle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:candle")
+    return MinecraftItemDescriptor.interned("minecraft:candle")
 
 
 def Carrot() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:carrot")
+    return MinecraftItemDescriptor.interned("minecraft:carrot")
 
 
 def CarrotOnAStick() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:carrot_on_a_stick")
+    return MinecraftItemDescriptor.interned("minecraft:carrot_on_a_stick")
 
 
 def CartographyTable() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cartography_table")
+    return MinecraftItemDescriptor.interned("minecraft:cartography_table")
 
 
 def CarvedPumpkin() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:carved_pumpkin")
+    return MinecraftItemDescriptor.interned("minecraft:carved_pumpkin")
 
 
 def CatSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cat_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:cat_spawn_egg")
 
 
 def Cauldron() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cauldron")
+    return MinecraftItemDescriptor.interned("minecraft:cauldron")
 
 
 def CaveSpiderSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cave_spider_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:cave_spider_spawn_egg")
 
 
 def Chain() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chain")
+    return MinecraftItemDescriptor.interned("minecraft:chain")
 
 
 def ChainCommandBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chain_command_block")
+    return MinecraftItemDescriptor.interned("minecraft:chain_command_block")
 
 
 def ChainmailBoots() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chainmail_boots")
+    return MinecraftItemDescriptor.interned("minecraft:chainmail_boots")
 
 
 def ChainmailChestplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chainmail_chestplate")
+    return MinecraftItemDescriptor.interned("minecraft:chainmail_chestplate")
 
 
 def ChainmailHelmet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chainmail_helmet")
+    return MinecraftItemDescriptor.interned("minecraft:chainmail_helmet")
 
 
 def ChainmailLeggings() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chainmail_leggings")
+    return MinecraftItemDescriptor.interned("minecraft:chainmail_leggings")
 
 
 def Charcoal() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:charcoal")
+    return MinecraftItemDescriptor.interned("minecraft:charcoal")
 
 
 def CherryBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_boat")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_boat")
 
 
 def CherryButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_button")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_button")
 
 
 def CherryChestBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_chest_boat")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_chest_boat")
 
 
 def CherryDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_door")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_door")
 
 
 def CherryFence() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_fence")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_fence")
 
 
 def CherryFenceGate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_fence_gate")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_fence_gate")
 
 
 def CherryHangingSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_hanging_sign")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_hanging_sign")
 
 
 def CherryLeaves() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_leaves")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_leaves")
 
 
 def CherryLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_log")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_log")
 
 
 def CherryPlanks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_planks")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_planks")
 
 
 def CherryPressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_pressure_plate")
 
 
 def CherrySapling() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_sapling")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_sapling")
 
 
 def CherrySign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_sign")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_sign")
 
 
 def CherrySlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_slab")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_slab")
 
 
 def CherryStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_stairs")
 
 
 def CherryTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_trapdoor")
 
 
 def CherryWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cherry_wood")
+    return MinecraftItemDescriptor.interned("minecraft:cherry_wood")
 
 
 def Chest() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chest")
+    return MinecraftItemDescriptor.interned("minecraft:chest")
 
 
 def ChestMinecart() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chest_minecart")
+    return MinecraftItemDescriptor.interned("minecraft:chest_minecart")
 
 
 def Chicken() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chicken")
+    return MinecraftItemDescriptor.interned("minecraft:chicken")
 
 
 def ChickenSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chicken_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:chicken_spawn_egg")
 
 
 def ChippedAnvil() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chipped_anvil")
+    return MinecraftItemDescriptor.interned("minecraft:chipped_anvil")
 
 
 def ChiseledBookshelf() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_bookshelf")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_bookshelf")
 
 
 def ChiseledCinnabar() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_cinnabar")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_cinnabar")
 
 
 def ChiseledCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_copper")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_copper")
 
 
 def ChiseledDeepslate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_deepslate")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_deepslate")
 
 
 def ChiseledNetherBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_nether_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_nether_bricks")
 
 
 def ChiseledPolishedBlackstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_polished_blackstone")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_polished_blackstone")
 
 
 def ChiseledQuartzBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_quartz_block")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_quartz_block")
 
 
 def ChiseledRedSandstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_red_sandstone")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_red_sandstone")
 
 
 def ChiseledResinBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_resin_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_resin_bricks")
 
 
 def ChiseledSandstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_sandstone")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_sandstone")
 
 
 def ChiseledStoneBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_stone_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_stone_bricks")
 
 
 def ChiseledSulfur() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_sulfur")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_sulfur")
 
 
 def ChiseledTuff() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_tuff")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_tuff")
 
 
 def ChiseledTuffBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chiseled_tuff_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:chiseled_tuff_bricks")
 
 
 def ChorusFlower() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chorus_flower")
+    return MinecraftItemDescriptor.interned("minecraft:chorus_flower")
 
 
 def ChorusFruit() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chorus_fruit")
+    return MinecraftItemDescriptor.interned("minecraft:chorus_fruit")
 
 
 def ChorusPlant() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:chorus_plant")
+    return MinecraftItemDescriptor.interned("minecraft:chorus_plant")
 
 
 def Cinnabar() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cinnabar")
+    return MinecraftItemDescriptor.interned("minecraft:cinnabar")
 
 
 def CinnabarBrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cinnabar_brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:cinnabar_brick_slab")
 
 
 def CinnabarBrickStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cinnabar_brick_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:cinnabar_brick_stairs")
 
 
 def CinnabarBrickWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cinnabar_brick_wall")
+    return MinecraftItemDescriptor.interned("minecraft:cinnabar_brick_wall")
 
 
 def CinnabarBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cinnabar_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:cinnabar_bricks")
 
 
 def CinnabarSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cinnabar_slab")
+    return MinecraftItemDescriptor.interned("minecraft:cinnabar_slab")
 
 
 def CinnabarStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cinnabar_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:cinnabar_stairs")
 
 
 def CinnabarWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cinnabar_wall")
+    return MinecraftItemDescriptor.interned("minecraft:cinnabar_wall")
 
 
 def Clay() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:clay")
+    return MinecraftItemDescriptor.interned("minecraft:clay")
 
 
 def ClayBall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:clay_ball")
+    return MinecraftItemDescriptor.interned("minecraft:clay_ball")
 
 
 def Clock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:clock")
+    return MinecraftItemDescriptor.interned("minecraft:clock")
 
 
 def ClosedEyeblossom() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:closed_eyeblossom")
+    return MinecraftItemDescriptor.interned("minecraft:closed_eyeblossom")
 
 
 def Coal() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:coal")
+    return MinecraftItemDescriptor.interned("minecraft:coal")
 
 
 def CoalBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:coal_block")
+    return MinecraftItemDescriptor.interned("minecraft:coal_block")
 
 
 def CoalOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:coal_ore")
+    return MinecraftItemDescriptor.interned("minecraft:coal_ore")
 
 
 def CoarseDirt() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:coarse_dirt")
+    return MinecraftItemDescriptor.interned("minecraft:coarse_dirt")
 
 
 def CoastArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:coast_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:coast_armor_trim_smithing_template"
+    )
 
 
 def CobbledDeepslate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cobbled_deepslate")
+    return MinecraftItemDescriptor.interned("minecraft:cobbled_deepslate")
 
 
 def CobbledDeepslateSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cobbled_deepslate_slab")
+    return MinecraftItemDescriptor.interned("minecraft:cobbled_deepslate_slab")
 
 
 def CobbledDeepslateStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cobbled_deepslate_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:cobbled_deepslate_stairs")
 
 
 def CobbledDeepslateWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cobbled_deepslate_wall")
+    return MinecraftItemDescriptor.interned("minecraft:cobbled_deepslate_wall")
 
 
 def Cobblestone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cobblestone")
+    return MinecraftItemDescriptor.interned("minecraft:cobblestone")
 
 
 def CobblestoneSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cobblestone_slab")
+    return MinecraftItemDescriptor.interned("minecraft:cobblestone_slab")
 
 
 def CobblestoneWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cobblestone_wall")
+    return MinecraftItemDescriptor.interned("minecraft:cobblestone_wall")
 
 
 def CocoaBeans() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cocoa_beans")
+    return MinecraftItemDescriptor.interned("minecraft:cocoa_beans")
 
 
 def Cod() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cod")
+    return MinecraftItemDescriptor.interned("minecraft:cod")
 
 
 def CodBucket() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cod_bucket")
+    return MinecraftItemDescriptor.interned("minecraft:cod_bucket")
 
 
 def CodSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cod_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:cod_spawn_egg")
 
 
 def CommandBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:command_block")
+    return MinecraftItemDescriptor.interned("minecraft:command_block")
 
 
 def CommandBlockMinecart() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:command_block_minecart")
+    return MinecraftItemDescriptor.interned("minecraft:command_block_minecart")
 
 
 def Comparator() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:comparator")
+    return MinecraftItemDescriptor.interned("minecraft:comparator")
 
 
 def Compass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:compass")
+    return MinecraftItemDescriptor.interned("minecraft:compass")
 
 
 def Composter() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:composter")
+    return MinecraftItemDescriptor.interned("minecraft:composter")
 
 
 def Conduit() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:conduit")
+    return MinecraftItemDescriptor.interned("minecraft:conduit")
 
 
 def CookedBeef() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cooked_beef")
+    return MinecraftItemDescriptor.interned("minecraft:cooked_beef")
 
 
 def CookedChicken() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cooked_chicken")
+    return MinecraftItemDescriptor.interned("minecraft:cooked_chicken")
 
 
 def CookedCod() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cooked_cod")
+    return MinecraftItemDescriptor.interned("minecraft:cooked_cod")
 
 
 def CookedMutton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cooked_mutton")
+    return MinecraftItemDescriptor.interned("minecraft:cooked_mutton")
 
 
 def CookedPorkchop() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cooked_porkchop")
+    return MinecraftItemDescriptor.interned("minecraft:cooked_porkchop")
 
 
 def CookedRabbit() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cooked_rabbit")
+    return MinecraftItemDescriptor.interned("minecraft:cooked_rabbit")
 
 
 def CookedSalmon() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cooked_salmon")
+    return MinecraftItemDescriptor.interned("minecraft:cooked_salmon")
 
 
 def Cookie() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cookie")
+    return MinecraftItemDescriptor.interned("minecraft:cookie")
 
 
 def CopperAxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_axe")
+    return MinecraftItemDescriptor.interned("minecraft:copper_axe")
 
 
 def CopperBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_block")
+    return MinecraftItemDescriptor.interned("minecraft:copper_block")
 
 
 def CopperBoots() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_boots")
+    return MinecraftItemDescriptor.interned("minecraft:copper_boots")
 
 
 def CopperBulb() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_bulb")
+    return MinecraftItemDescriptor.interned("minecraft:copper_bulb")
 
 
 def CopperChest() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_chest")
+    return MinecraftItemDescriptor.interned("minecraft:copper_chest")
 
 
 def CopperChestplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_chestplate")
+    return MinecraftItemDescriptor.interned("minecraft:copper_chestplate")
 
 
 def CopperDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_door")
+    return MinecraftItemDescriptor.interned("minecraft:copper_door")
 
 
 def CopperGolemSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_golem_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:copper_golem_spawn_egg")
 
 
 def CopperGrate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_grate")
+    return MinecraftItemDescriptor.interned("minecraft:copper_grate")
 
 
 def CopperHelmet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_helmet")
+    return MinecraftItemDescriptor.interned("minecraft:copper_helmet")
 
 
 def CopperHoe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_hoe")
+    return MinecraftItemDescriptor.interned("minecraft:copper_hoe")
 
 
 def CopperIngot() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_ingot")
+    return MinecraftItemDescriptor.interned("minecraft:copper_ingot")
 
 
 def CopperLeggings() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_leggings")
+    return MinecraftItemDescriptor.interned("minecraft:copper_leggings")
 
 
 def CopperNautilusArmor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_nautilus_armor")
+    return MinecraftItemDescriptor.interned("minecraft:copper_nautilus_armor")
 
 
 def CopperNugget() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_nugget")
+    return MinecraftItemDescriptor.interned("minecraft:copper_nugget")
 
 
 def CopperOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_ore")
+    return MinecraftItemDescriptor.interned("minecraft:copper_ore")
 
 
 def CopperPickaxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_pickaxe")
+    return MinecraftItemDescriptor.interned("minecraft:copper_pickaxe")
 
 
 def CopperShovel() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_shovel")
+    return MinecraftItemDescriptor.interned("minecraft:copper_shovel")
 
 
 def CopperSpear() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_spear")
+    return MinecraftItemDescriptor.interned("minecraft:copper_spear")
 
 
 def CopperSword() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_sword")
+    return MinecraftItemDescriptor.interned("minecraft:copper_sword")
 
 
 def CopperTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:copper_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:copper_trapdoor")
 
 
 def Cornflower() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cornflower")
+    return MinecraftItemDescriptor.interned("minecraft:cornflower")
 
 
 def CowSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cow_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:cow_spawn_egg")
 
 
 def CrackedDeepslateBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cracked_deepslate_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:cracked_deepslate_bricks")
 
 
 def CrackedDeepslateTiles() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cracked_deepslate_tiles")
+    return MinecraftItemDescriptor.interned("minecraft:cracked_deepslate_tiles")
 
 
 def CrackedNetherBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cracked_nether_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:cracked_nether_bricks")
 
 
 def CrackedPolishedBlackstoneBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cracked_polished_blackstone_bricks")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:cracked_polished_blackstone_bricks"
+    )
 
 
 def CrackedStoneBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cracked_stone_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:cracked_stone_bricks")
 
 
 def Crafter() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crafter")
+    return MinecraftItemDescriptor.interned("minecraft:crafter")
 
 
 def CraftingTable() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crafting_table")
+    return MinecraftItemDescriptor.interned("minecraft:crafting_table")
 
 
 def CreakingHeart() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:creaking_heart")
+    return MinecraftItemDescriptor.interned("minecraft:creaking_heart")
 
 
 def CreakingSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:creaking_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:creaking_spawn_egg")
 
 
 def CreeperBannerPattern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:creeper_banner_pattern")
+    return MinecraftItemDescriptor.interned("minecraft:creeper_banner_pattern")
 
 
 def CreeperHead() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:creeper_head")
+    return MinecraftItemDescriptor.interned("minecraft:creeper_head")
 
 
 def CreeperSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:creeper_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:creeper_spawn_egg")
 
 
 def CrimsonButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_button")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_button")
 
 
 def CrimsonDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_door")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_door")
 
 
 def CrimsonFence() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_fence")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_fence")
 
 
 def CrimsonFenceGate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_fence_gate")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_fence_gate")
 
 
 def CrimsonFungus() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_fungus")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_fungus")
 
 
 def CrimsonHangingSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_hanging_sign")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_hanging_sign")
 
 
 def CrimsonHyphae() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_hyphae")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_hyphae")
 
 
 def CrimsonNylium() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_nylium")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_nylium")
 
 
 def CrimsonPlanks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_planks")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_planks")
 
 
 def CrimsonPressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_pressure_plate")
 
 
 def CrimsonRoots() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_roots")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_roots")
 
 
 def CrimsonSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_sign")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_sign")
 
 
 def CrimsonSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_slab")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_slab")
 
 
 def CrimsonStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_stairs")
 
 
 def CrimsonStem() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_stem")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_stem")
 
 
 def CrimsonTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crimson_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:crimson_trapdoor")
 
 
 def Crossbow() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crossbow")
+    return MinecraftItemDescriptor.interned("minecraft:crossbow")
 
 
 def CryingObsidian() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:crying_obsidian")
+    return MinecraftItemDescriptor.interned("minecraft:crying_obsidian")
 
 
 def CutCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cut_copper")
+    return MinecraftItemDescriptor.interned("minecraft:cut_copper")
 
 
 def CutCopperSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cut_copper_slab")
+    return MinecraftItemDescriptor.interned("minecraft:cut_copper_slab")
 
 
 def CutCopperStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cut_copper_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:cut_copper_stairs")
 
 
 def CutRedSandstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cut_red_sandstone")
+    return MinecraftItemDescriptor.interned("minecraft:cut_red_sandstone")
 
 
 def CutRedSandstoneSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cut_red_sandstone_slab")
+    return MinecraftItemDescriptor.interned("minecraft:cut_red_sandstone_slab")
 
 
 def CutSandstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cut_sandstone")
+    return MinecraftItemDescriptor.interned("minecraft:cut_sandstone")
 
 
 def CutSandstoneSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cut_sandstone_slab")
+    return MinecraftItemDescriptor.interned("minecraft:cut_sandstone_slab")
 
 
 def CyanBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cyan_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:cyan_bundle")
 
 
 def CyanCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cyan_candle")
+    return MinecraftItemDescriptor.interned("minecraft:cyan_candle")
 
 
 def CyanCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cyan_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:cyan_carpet")
 
 
 def CyanConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cyan_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:cyan_concrete")
 
 
 def CyanConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cyan_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:cyan_concrete_powder")
 
 
 def CyanDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cyan_dye")
+    return MinecraftItemDescriptor.interned("minecraft:cyan_dye")
 
 
 def CyanGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cyan_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:cyan_glazed_terracotta")
 
 
 def CyanHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cyan_harness")
+    return MinecraftItemDescriptor.interned("minecraft:cyan_harness")
 
 
 def CyanShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cyan_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:cyan_shulker_box")
 
 
 def CyanStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cyan_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:cyan_stained_glass")
 
 
 def CyanStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cyan_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:cyan_stained_glass_pane")
 
 
 def CyanTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cyan_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:cyan_terracotta")
 
 
 def CyanWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:cyan_wool")
+    return MinecraftItemDescriptor.interned("minecraft:cyan_wool")
 
 
 def DamagedAnvil() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:damaged_anvil")
+    return MinecraftItemDescriptor.interned("minecraft:damaged_anvil")
 
 
 def Dandelion() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dandelion")
+    return MinecraftItemDescriptor.interned("minecraft:dandelion")
 
 
 def DangerPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:danger_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:danger_pottery_sherd")
 
 
 def DarkOakBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_boat")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_boat")
 
 
 def DarkOakButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_button")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_button")
 
 
 def DarkOakChestBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_chest_boat")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_chest_boat")
 
 
 def DarkOakDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_door")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_door")
 
 
 def DarkOakFence() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_fence")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_fence")
 
 
 def DarkOakFenceGate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_fence_gate")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_fence_gate")
 
 
 def DarkOakHangingSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_hanging_sign")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_hanging_sign")
 
 
 def DarkOakLeaves() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_leaves")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_leaves")
 
 
 def DarkOakLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_log")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_log")
 
 
 def DarkOakPlanks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_planks")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_planks")
 
 
 def DarkOakPressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_pressure_plate")
 
 
 def DarkOakSapling() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_sapling")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_sapling")
 
 
 def DarkOakSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_sign")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_sign")
 
 
 def DarkOakSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_slab")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_slab")
 
 
 def DarkOakStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_stairs")
 
 
 def DarkOakTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_trapdoor")
 
 
 def DarkOakWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_oak_wood")
+    return MinecraftItemDescriptor.interned("minecraft:dark_oak_wood")
 
 
 def DarkPrismarine() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_prismarine")
+    return MinecraftItemDescriptor.interned("minecraft:dark_prismarine")
 
 
 def DarkPrismarineSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_prismarine_slab")
+    return MinecraftItemDescriptor.interned("minecraft:dark_prismarine_slab")
 
 
 def DarkPrismarineStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dark_prismarine_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:dark_prismarine_stairs")
 
 
 def DaylightDetector() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:daylight_detector")
+    return MinecraftItemDescriptor.interned("minecraft:daylight_detector")
 
 
 def DeadBrainCoral() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_brain_coral")
+    return MinecraftItemDescriptor.interned("minecraft:dead_brain_coral")
 
 
 def DeadBrainCoralBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_brain_coral_block")
+    return MinecraftItemDescriptor.interned("minecraft:dead_brain_coral_block")
 
 
 def DeadBrainCoralFan() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_brain_coral_fan")
+    return MinecraftItemDescriptor.interned("minecraft:dead_brain_coral_fan")
 
 
 def DeadBubbleCoral() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_bubble_coral")
+    return MinecraftItemDescriptor.interned("minecraft:dead_bubble_coral")
 
 
 def DeadBubbleCoralBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_bubble_coral_block")
+    return MinecraftItemDescriptor.interned("minecraft:dead_bubble_coral_block")
 
 
 def DeadBubbleCoralFan() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_bubble_coral_fan")
+    return MinecraftItemDescriptor.interned("minecraft:dead_bubble_coral_fan")
 
 
 def DeadFireCoral() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_fire_coral")
+    return MinecraftItemDescriptor.interned("minecraft:dead_fire_coral")
 
 
 def DeadFireCoralBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_fire_coral_block")
+    return MinecraftItemDescriptor.interned("minecraft:dead_fire_coral_block")
 
 
 def DeadFireCoralFan() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_fire_coral_fan")
+    return MinecraftItemDescriptor.interned("minecraft:dead_fire_coral_fan")
 
 
 def DeadHornCoral() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_horn_coral")
+    return MinecraftItemDescriptor.interned("minecraft:dead_horn_coral")
 
 
 def DeadHornCoralBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_horn_coral_block")
+    return MinecraftItemDescriptor.interned("minecraft:dead_horn_coral_block")
 
 
 def DeadHornCoralFan() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_horn_coral_fan")
+    return MinecraftItemDescriptor.interned("minecraft:dead_horn_coral_fan")
 
 
 def DeadTubeCoral() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_tube_coral")
+    return MinecraftItemDescriptor.interned("minecraft:dead_tube_coral")
 
 
 def DeadTubeCoralBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_tube_coral_block")
+    return MinecraftItemDescriptor.interned("minecraft:dead_tube_coral_block")
 
 
 def DeadTubeCoralFan() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dead_tube_coral_fan")
+    return MinecraftItemDescriptor.interned("minecraft:dead_tube_coral_fan")
 
 
 def Deadbush() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deadbush")
+    return MinecraftItemDescriptor.interned("minecraft:deadbush")
 
 
 def DecoratedPot() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:decorated_pot")
+    return MinecraftItemDescriptor.interned("minecraft:decorated_pot")
 
 
 def Deepslate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate")
 
 
 def DeepslateBrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_brick_slab")
 
 
 def DeepslateBrickStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_brick_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_brick_stairs")
 
 
 def DeepslateBrickWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_brick_wall")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_brick_wall")
 
 
 def DeepslateBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_bricks")
 
 
 def DeepslateCoalOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_coal_ore")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_coal_ore")
 
 
 def DeepslateCopperOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_copper_ore")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_copper_ore")
 
 
 def DeepslateDiamondOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_diamond_ore")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_diamond_ore")
 
 
 def DeepslateEmeraldOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_emerald_ore")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_emerald_ore")
 
 
 def DeepslateGoldOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_gold_ore")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_gold_ore")
 
 
 def DeepslateIronOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_iron_ore")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_iron_ore")
 
 
 def DeepslateLapisOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_lapis_ore")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_lapis_ore")
 
 
 def DeepslateRedstoneOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_redstone_ore")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_redstone_ore")
 
 
 def DeepslateTileSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_tile_slab")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_tile_slab")
 
 
 def DeepslateTileStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_tile_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_tile_stairs")
 
 
 def DeepslateTileWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_tile_wall")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_tile_wall")
 
 
 def DeepslateTiles() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deepslate_tiles")
+    return MinecraftItemDescriptor.interned("minecraft:deepslate_tiles")
 
 
 def Deny() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:deny")
+    return MinecraftItemDescriptor.interned("minecraft:deny")
 
 
 def DetectorRail() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:detector_rail")
+    return MinecraftItemDescriptor.interned("minecraft:detector_rail")
 
 
 def Diamond() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond")
+    return MinecraftItemDescriptor.interned("minecraft:diamond")
 
 
 def DiamondAxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_axe")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_axe")
 
 
 def DiamondBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_block")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_block")
 
 
 def DiamondBoots() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_boots")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_boots")
 
 
 def DiamondChestplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_chestplate")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_chestplate")
 
 
 def DiamondHelmet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_helmet")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_helmet")
 
 
 def DiamondHoe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_hoe")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_hoe")
 
 
 def DiamondHorseArmor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_horse_armor")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_horse_armor")
 
 
 def DiamondLeggings() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_leggings")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_leggings")
 
 
 def DiamondNautilusArmor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_nautilus_armor")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_nautilus_armor")
 
 
 def DiamondOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_ore")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_ore")
 
 
 def DiamondPickaxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_pickaxe")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_pickaxe")
 
 
 def DiamondShovel() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_shovel")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_shovel")
 
 
 def DiamondSpear() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_spear")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_spear")
 
 
 def DiamondSword() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diamond_sword")
+    return MinecraftItemDescriptor.interned("minecraft:diamond_sword")
 
 
 def Diorite() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diorite")
+    return MinecraftItemDescriptor.interned("minecraft:diorite")
 
 
 def DioriteSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diorite_slab")
+    return MinecraftItemDescriptor.interned("minecraft:diorite_slab")
 
 
 def DioriteStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diorite_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:diorite_stairs")
 
 
 def DioriteWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:diorite_wall")
+    return MinecraftItemDescriptor.interned("minecraft:diorite_wall")
 
 
 def Dirt() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dirt")
+    return MinecraftItemDescriptor.interned("minecraft:dirt")
 
 
 def DirtWithRoots() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dirt_with_roots")
+    return MinecraftItemDescriptor.interned("minecraft:dirt_with_roots")
 
 
 def DiscFragment5() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:disc_fragment_5")
+    return MinecraftItemDescriptor.interned("minecraft:disc_fragment_5")
 
 
 def Dispenser() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dispenser")
+    return MinecraftItemDescriptor.interned("minecraft:dispenser")
 
 
 def DolphinSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dolphin_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:dolphin_spawn_egg")
 
 
 def DonkeySpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:donkey_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:donkey_spawn_egg")
 
 
 def DragonBreath() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dragon_breath")
+    return MinecraftItemDescriptor.interned("minecraft:dragon_breath")
 
 
 def DragonEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dragon_egg")
+    return MinecraftItemDescriptor.interned("minecraft:dragon_egg")
 
 
 def DragonHead() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dragon_head")
+    return MinecraftItemDescriptor.interned("minecraft:dragon_head")
 
 
 def DriedGhast() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dried_ghast")
+    return MinecraftItemDescriptor.interned("minecraft:dried_ghast")
 
 
 def DriedKelp() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dried_kelp")
+    return MinecraftItemDescriptor.interned("minecraft:dried_kelp")
 
 
 def DriedKelpBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dried_kelp_block")
+    return MinecraftItemDescriptor.interned("minecraft:dried_kelp_block")
 
 
 def DripstoneBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dripstone_block")
+    return MinecraftItemDescriptor.interned("minecraft:dripstone_block")
 
 
 def Dropper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dropper")
+    return MinecraftItemDescriptor.interned("minecraft:dropper")
 
 
 def DrownedSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:drowned_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:drowned_spawn_egg")
 
 
 def DuneArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:dune_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:dune_armor_trim_smithing_template"
+    )
 
 
 def EchoShard() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:echo_shard")
+    return MinecraftItemDescriptor.interned("minecraft:echo_shard")
 
 
 def Egg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:egg")
+    return MinecraftItemDescriptor.interned("minecraft:egg")
 
 
 def ElderGuardianSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:elder_guardian_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:elder_guardian_spawn_egg")
 
 
 def Elytra() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:elytra")
+    return MinecraftItemDescriptor.interned("minecraft:elytra")
 
 
 def Emerald() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:emerald")
+    return MinecraftItemDescriptor.interned("minecraft:emerald")
 
 
 def EmeraldBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:emerald_block")
+    return MinecraftItemDescriptor.interned("minecraft:emerald_block")
 
 
 def EmeraldOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:emerald_ore")
+    return MinecraftItemDescriptor.interned("minecraft:emerald_ore")
 
 
 def EmptyMap() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:empty_map")
+    return MinecraftItemDescriptor.interned("minecraft:empty_map")
 
 
 def EnchantedBook() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:enchanted_book")
+    return MinecraftItemDescriptor.interned("minecraft:enchanted_book")
 
 
 def EnchantedGoldenApple() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:enchanted_golden_apple")
+    return MinecraftItemDescriptor.interned("minecraft:enchanted_golden_apple")
 
 
 def EnchantingTable() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:enchanting_table")
+    return MinecraftItemDescriptor.interned("minecraft:enchanting_table")
 
 
 def EndBrickStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:end_brick_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:end_brick_stairs")
 
 
 def EndBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:end_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:end_bricks")
 
 
 def EndCrystal() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:end_crystal")
+    return MinecraftItemDescriptor.interned("minecraft:end_crystal")
 
 
 def EndPortalFrame() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:end_portal_frame")
+    return MinecraftItemDescriptor.interned("minecraft:end_portal_frame")
 
 
 def EndRod() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:end_rod")
+    return MinecraftItemDescriptor.interned("minecraft:end_rod")
 
 
 def EndStone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:end_stone")
+    return MinecraftItemDescriptor.interned("minecraft:end_stone")
 
 
 def EndStoneBrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:end_stone_brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:end_stone_brick_slab")
 
 
 def EndStoneBrickWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:end_stone_brick_wall")
+    return MinecraftItemDescriptor.interned("minecraft:end_stone_brick_wall")
 
 
 def EnderChest() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ender_chest")
+    return MinecraftItemDescriptor.interned("minecraft:ender_chest")
 
 
 def EnderDragonSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ender_dragon_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:ender_dragon_spawn_egg")
 
 
 def EnderEye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ender_eye")
+    return MinecraftItemDescriptor.interned("minecraft:ender_eye")
 
 
 def EnderPearl() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ender_pearl")
+    return MinecraftItemDescriptor.interned("minecraft:ender_pearl")
 
 
 def EndermanSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:enderman_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:enderman_spawn_egg")
 
 
 def EndermiteSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:endermite_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:endermite_spawn_egg")
 
 
 def EvokerSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:evoker_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:evoker_spawn_egg")
 
 
 def ExperienceBottle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:experience_bottle")
+    return MinecraftItemDescriptor.interned("minecraft:experience_bottle")
 
 
 def ExplorerPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:explorer_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:explorer_pottery_sherd")
 
 
 def ExposedChiseledCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:exposed_chiseled_copper")
+    return MinecraftItemDescriptor.interned("minecraft:exposed_chiseled_copper")
 
 
 def ExposedCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:exposed_copper")
+    return MinecraftItemDescriptor.interned("minecraft:exposed_copper")
 
 
 def ExposedCopperBulb() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:exposed_copper_bulb")
+    return MinecraftItemDescriptor.interned("minecraft:exposed_copper_bulb")
 
 
 def ExposedCopperChest() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:exposed_copper_chest")
+    return MinecraftItemDescriptor.interned("minecraft:exposed_copper_chest")
 
 
 def ExposedCopperDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:exposed_copper_door")
+    return MinecraftItemDescriptor.interned("minecraft:exposed_copper_door")
 
 
 def ExposedCopperGrate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:exposed_copper_grate")
+    return MinecraftItemDescriptor.interned("minecraft:exposed_copper_grate")
 
 
 def ExposedCopperTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:exposed_copper_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:exposed_copper_trapdoor")
 
 
 def ExposedCutCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:exposed_cut_copper")
+    return MinecraftItemDescriptor.interned("minecraft:exposed_cut_copper")
 
 
 def ExposedCutCopperSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:exposed_cut_copper_slab")
+    return MinecraftItemDescriptor.interned("minecraft:exposed_cut_copper_slab")
 
 
 def ExposedCutCopperStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:exposed_cut_copper_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:exposed_cut_copper_stairs")
 
 
 def EyeArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:eye_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:eye_armor_trim_smithing_template"
+    )
 
 
 def Farmland() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:farmland")
+    return MinecraftItemDescriptor.interned("minecraft:farmland")
 
 
 def Feather() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:feather")
+    return MinecraftItemDescriptor.interned("minecraft:feather")
 
 
 def FenceGate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:fence_gate")
+    return MinecraftItemDescriptor.interned("minecraft:fence_gate")
 
 
 def FermentedSpiderEye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:fermented_spider_eye")
+    return MinecraftItemDescriptor.interned("minecraft:fermented_spider_eye")
 
 
 def Fern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:fern")
+    return MinecraftItemDescriptor.interned("minecraft:fern")
 
 
 def FieldMasonedBannerPattern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:field_masoned_banner_pattern")
+    return MinecraftItemDescriptor.interned("minecraft:field_masoned_banner_pattern")
 
 
 def FilledMap() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:filled_map")
+    return MinecraftItemDescriptor.interned("minecraft:filled_map")
 
 
 def FireCharge() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:fire_charge")
+    return MinecraftItemDescriptor.interned("minecraft:fire_charge")
 
 
 def FireCoral() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:fire_coral")
+    return MinecraftItemDescriptor.interned("minecraft:fire_coral")
 
 
 def FireCoralBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:fire_coral_block")
+    return MinecraftItemDescriptor.interned("minecraft:fire_coral_block")
 
 
 def FireCoralFan() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:fire_coral_fan")
+    return MinecraftItemDescriptor.interned("minecraft:fire_coral_fan")
 
 
 def FireflyBush() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:firefly_bush")
+    return MinecraftItemDescriptor.interned("minecraft:firefly_bush")
 
 
 def FireworkRocket() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:firework_rocket")
+    return MinecraftItemDescriptor.interned("minecraft:firework_rocket")
 
 
 def FireworkStar() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:firework_star")
+    return MinecraftItemDescriptor.interned("minecraft:firework_star")
 
 
 def FishingRod() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:fishing_rod")
+    return MinecraftItemDescriptor.interned("minecraft:fishing_rod")
 
 
 def FletchingTable() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:fletching_table")
+    return MinecraftItemDescriptor.interned("minecraft:fletching_table")
 
 
 def Flint() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:flint")
+    return MinecraftItemDescriptor.interned("minecraft:flint")
 
 
 def FlintAndSteel() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:flint_and_steel")
+    return MinecraftItemDescriptor.interned("minecraft:flint_and_steel")
 
 
 def FlowArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:flow_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:flow_armor_trim_smithing_template"
+    )
 
 
 def FlowBannerPattern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:flow_banner_pattern")
+    return MinecraftItemDescriptor.interned("minecraft:flow_banner_pattern")
 
 
 def FlowPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:flow_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:flow_pottery_sherd")
 
 
 def FlowerBannerPattern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:flower_banner_pattern")
+    return MinecraftItemDescriptor.interned("minecraft:flower_banner_pattern")
 
 
 def FlowerPot() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:flower_pot")
+    return MinecraftItemDescriptor.interned("minecraft:flower_pot")
 
 
 def FloweringAzalea() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:flowering_azalea")
+    return MinecraftItemDescriptor.interned("minecraft:flowering_azalea")
 
 
 def FoxSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:fox_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:fox_spawn_egg")
 
 
 def Frame() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:frame")
+    return MinecraftItemDescriptor.interned("minecraft:frame")
 
 
 def FriendPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:friend_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:friend_pottery_sherd")
 
 
 def FrogSpawn() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:frog_spawn")
+    return MinecraftItemDescriptor.interned("minecraft:frog_spawn")
 
 
 def FrogSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:frog_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:frog_spawn_egg")
 
 
 def FrostedIce() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:frosted_ice")
+    return MinecraftItemDescriptor.interned("minecraft:frosted_ice")
 
 
 def Furnace() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:furnace")
+    return MinecraftItemDescriptor.interned("minecraft:furnace")
 
 
 def GhastSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ghast_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:ghast_spawn_egg")
 
 
 def GhastTear() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ghast_tear")
+    return MinecraftItemDescriptor.interned("minecraft:ghast_tear")
 
 
 def GildedBlackstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gilded_blackstone")
+    return MinecraftItemDescriptor.interned("minecraft:gilded_blackstone")
 
 
 def Glass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:glass")
+    return MinecraftItemDescriptor.interned("minecraft:glass")
 
 
 def GlassBottle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:glass_bottle")
+    return MinecraftItemDescriptor.interned("minecraft:glass_bottle")
 
 
 def GlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:glass_pane")
 
 
 def GlisteringMelonSlice() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:glistering_melon_slice")
+    return MinecraftItemDescriptor.interned("minecraft:glistering_melon_slice")
 
 
 def GlobeBannerPattern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:globe_banner_pattern")
+    return MinecraftItemDescriptor.interned("minecraft:globe_banner_pattern")
 
 
 def GlowBerries() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:glow_berries")
+    return MinecraftItemDescriptor.interned("minecraft:glow_berries")
 
 
 def GlowFrame() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:glow_frame")
+    return MinecraftItemDescriptor.interned("minecraft:glow_frame")
 
 
 def GlowInkSac() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:glow_ink_sac")
+    return MinecraftItemDescriptor.interned("minecraft:glow_ink_sac")
 
 
 def GlowLichen() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:glow_lichen")
+    return MinecraftItemDescriptor.interned("minecraft:glow_lichen")
 
 
 def GlowSquidSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:glow_squid_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:glow_squid_spawn_egg")
 
 
 def Glowstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:glowstone")
+    return MinecraftItemDescriptor.interned("minecraft:glowstone")
 
 
 def GlowstoneDust() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:glowstone_dust")
+    return MinecraftItemDescriptor.interned("minecraft:glowstone_dust")
 
 
 def GoatHorn() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:goat_horn")
+    return MinecraftItemDescriptor.interned("minecraft:goat_horn")
 
 
 def GoatSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:goat_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:goat_spawn_egg")
 
 
 def GoldBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gold_block")
+    return MinecraftItemDescriptor.interned("minecraft:gold_block")
 
 
 def GoldIngot() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gold_ingot")
+    return MinecraftItemDescriptor.interned("minecraft:gold_ingot")
 
 
 def GoldNugget() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gold_nugget")
+    return MinecraftItemDescriptor.interned("minecraft:gold_nugget")
 
 
 def GoldOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gold_ore")
+    return MinecraftItemDescriptor.interned("minecraft:gold_ore")
 
 
 def GoldenDandelion() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_dandelion")
+    return MinecraftItemDescriptor.interned("minecraft:golden_dandelion")
 
 
 def GoldenApple() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_apple")
+    return MinecraftItemDescriptor.interned("minecraft:golden_apple")
 
 
 def GoldenAxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_axe")
+    return MinecraftItemDescriptor.interned("minecraft:golden_axe")
 
 
 def GoldenBoots() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_boots")
+    return MinecraftItemDescriptor.interned("minecraft:golden_boots")
 
 
 def GoldenCarrot() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_carrot")
+    return MinecraftItemDescriptor.interned("minecraft:golden_carrot")
 
 
 def GoldenChestplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_chestplate")
+    return MinecraftItemDescriptor.interned("minecraft:golden_chestplate")
 
 
 def GoldenHelmet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_helmet")
+    return MinecraftItemDescriptor.interned("minecraft:golden_helmet")
 
 
 def GoldenHoe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_hoe")
+    return MinecraftItemDescriptor.interned("minecraft:golden_hoe")
 
 
 def GoldenHorseArmor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_horse_armor")
+    return MinecraftItemDescriptor.interned("minecraft:golden_horse_armor")
 
 
 def GoldenLeggings() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_leggings")
+    return MinecraftItemDescriptor.interned("minecraft:golden_leggings")
 
 
 def GoldenNautilusArmor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_nautilus_armor")
+    return MinecraftItemDescriptor.interned("minecraft:golden_nautilus_armor")
 
 
 def GoldenPickaxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_pickaxe")
+    return MinecraftItemDescriptor.interned("minecraft:golden_pickaxe")
 
 
 def GoldenRail() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_rail")
+    return MinecraftItemDescriptor.interned("minecraft:golden_rail")
 
 
 def GoldenShovel() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_shovel")
+    return MinecraftItemDescriptor.interned("minecraft:golden_shovel")
 
 
 def GoldenSpear() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_spear")
+    return MinecraftItemDescriptor.interned("minecraft:golden_spear")
 
 
 def GoldenSword() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:golden_sword")
+    return MinecraftItemDescriptor.interned("minecraft:golden_sword")
 
 
 def Granite() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:granite")
+    return MinecraftItemDescriptor.interned("minecraft:granite")
 
 
 def GraniteSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:granite_slab")
+    return MinecraftItemDescriptor.interned("minecraft:granite_slab")
 
 
 def GraniteStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:granite_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:granite_stairs")
 
 
 def GraniteWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:granite_wall")
+    return MinecraftItemDescriptor.interned("minecraft:granite_wall")
 
 
 def GrassBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:grass_block")
+    return MinecraftItemDescriptor.interned("minecraft:grass_block")
 
 
 def GrassPath() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:grass_path")
+    return MinecraftItemDescriptor.interned("minecraft:grass_path")
 
 
 def Gravel() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gravel")
+    return MinecraftItemDescriptor.interned("minecraft:gravel")
 
 
 def GrayBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gray_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:gray_bundle")
 
 
 def GrayCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gray_candle")
+    return MinecraftItemDescriptor.interned("minecraft:gray_candle")
 
 
 def GrayCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gray_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:gray_carpet")
 
 
 def GrayConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gray_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:gray_concrete")
 
 
 def GrayConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gray_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:gray_concrete_powder")
 
 
 def GrayDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gray_dye")
+    return MinecraftItemDescriptor.interned("minecraft:gray_dye")
 
 
 def GrayGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gray_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:gray_glazed_terracotta")
 
 
 def GrayHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gray_harness")
+    return MinecraftItemDescriptor.interned("minecraft:gray_harness")
 
 
 def GrayShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gray_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:gray_shulker_box")
 
 
 def GrayStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gray_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:gray_stained_glass")
 
 
 def GrayStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gray_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:gray_stained_glass_pane")
 
 
 def GrayTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gray_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:gray_terracotta")
 
 
 def GrayWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gray_wool")
+    return MinecraftItemDescriptor.interned("minecraft:gray_wool")
 
 
 def GreenBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:green_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:green_bundle")
 
 
 def GreenCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:green_candle")
+    return MinecraftItemDescriptor.interned("minecraft:green_candle")
 
 
 def GreenCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:green_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:green_carpet")
 
 
 def GreenConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:green_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:green_concrete")
 
 
 def GreenConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:green_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:green_concrete_powder")
 
 
 def GreenDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:green_dye")
+    return MinecraftItemDescriptor.interned("minecraft:green_dye")
 
 
 def GreenGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:green_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:green_glazed_terracotta")
 
 
 def GreenHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:green_harness")
+    return MinecraftItemDescriptor.interned("minecraft:green_harness")
 
 
 def GreenShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:green_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:green_shulker_box")
 
 
 def GreenStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:green_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:green_stained_glass")
 
 
 def GreenStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:green_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:green_stained_glass_pane")
 
 
 def GreenTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:green_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:green_terracotta")
 
 
 def GreenWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:green_wool")
+    return MinecraftItemDescriptor.interned("minecraft:green_wool")
 
 
 def Grindstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:grindstone")
+    return MinecraftItemDescriptor.interned("minecraft:grindstone")
 
 
 def GuardianSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:guardian_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:guardian_spawn_egg")
 
 
 def Gunpowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:gunpowder")
+    return MinecraftItemDescriptor.interned("minecraft:gunpowder")
 
 
 def GusterBannerPattern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:guster_banner_pattern")
+    return MinecraftItemDescriptor.interned("minecraft:guster_banner_pattern")
 
 
 def GusterPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:guster_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:guster_pottery_sherd")
 
 
 def HangingRoots() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:hanging_roots")
+    return MinecraftItemDescriptor.interned("minecraft:hanging_roots")
 
 
 def HappyGhastSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:happy_ghast_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:happy_ghast_spawn_egg")
 
 
 def HardenedClay() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:hardened_clay")
+    return MinecraftItemDescriptor.interned("minecraft:hardened_clay")
 
 
 def HayBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:hay_block")
+    return MinecraftItemDescriptor.interned("minecraft:hay_block")
 
 
 def HeartOfTheSea() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:heart_of_the_sea")
+    return MinecraftItemDescriptor.interned("minecraft:heart_of_the_sea")
 
 
 def HeartPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:heart_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:heart_pottery_sherd")
 
 
 def HeartbreakPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:heartbreak_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:heartbreak_pottery_sherd")
 
 
 def HeavyCore() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:heavy_core")
+    return MinecraftItemDescriptor.interned("minecraft:heavy_core")
 
 
 def HeavyWeightedPressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:heavy_weighted_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:heavy_weighted_pressure_plate")
 
 
 def HoglinSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:hoglin_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:hoglin_spawn_egg")
 
 
 def HoneyBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:honey_block")
+    return MinecraftItemDescriptor.interned("minecraft:honey_block")
 
 
 def HoneyBottle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:honey_bottle")
+    return MinecraftItemDescriptor.interned("minecraft:honey_bottle")
 
 
 def Honeycomb() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:honeycomb")
+    return MinecraftItemDescriptor.interned("minecraft:honeycomb")
 
 
 def HoneycombBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:honeycomb_block")
+    return MinecraftItemDescriptor.interned("minecraft:honeycomb_block")
 
 
 def Hopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:hopper")
+    return MinecraftItemDescriptor.interned("minecraft:hopper")
 
 
 def HopperMinecart() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:hopper_minecart")
+    return MinecraftItemDescriptor.interned("minecraft:hopper_minecart")
 
 
 def HornCoral() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:horn_coral")
+    return MinecraftItemDescriptor.interned("minecraft:horn_coral")
 
 
 def HornCoralBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:horn_coral_block")
+    return MinecraftItemDescriptor.interned("minecraft:horn_coral_block")
 
 
 def HornCoralFan() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:horn_coral_fan")
+    return MinecraftItemDescriptor.interned("minecraft:horn_coral_fan")
 
 
 def HorseSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:horse_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:horse_spawn_egg")
 
 
 def HostArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:host_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:host_armor_trim_smithing_template"
+    )
 
 
 def HowlPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:howl_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:howl_pottery_sherd")
 
 
 def HuskSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:husk_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:husk_spawn_egg")
 
 
 def Ice() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ice")
+    return MinecraftItemDescriptor.interned("minecraft:ice")
 
 
 def InfestedChiseledStoneBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:infested_chiseled_stone_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:infested_chiseled_stone_bricks")
 
 
 def InfestedCobblestone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:infested_cobblestone")
+    return MinecraftItemDescriptor.interned("minecraft:infested_cobblestone")
 
 
 def InfestedCrackedStoneBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:infested_cracked_stone_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:infested_cracked_stone_bricks")
 
 
 def InfestedDeepslate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:infested_deepslate")
+    return MinecraftItemDescriptor.interned("minecraft:infested_deepslate")
 
 
 def InfestedMossyStoneBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:infested_mossy_stone_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:infested_mossy_stone_bricks")
 
 
 def InfestedStone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:infested_stone")
+    return MinecraftItemDescriptor.interned("minecraft:infested_stone")
 
 
 def InfestedStoneBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:infested_stone_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:infested_stone_bricks")
 
 
 def InkSac() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ink_sac")
+    return MinecraftItemDescriptor.interned("minecraft:ink_sac")
 
 
 def IronAxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_axe")
+    return MinecraftItemDescriptor.interned("minecraft:iron_axe")
 
 
 def IronBars() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_bars")
+    return MinecraftItemDescriptor.interned("minecraft:iron_bars")
 
 
 def IronBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_block")
+    return MinecraftItemDescriptor.interned("minecraft:iron_block")
 
 
 def IronBoots() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_boots")
+    return MinecraftItemDescriptor.interned("minecraft:iron_boots")
 
 
 def IronChestplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_chestplate")
+    return MinecraftItemDescriptor.interned("minecraft:iron_chestplate")
 
 
 def IronDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_door")
+    return MinecraftItemDescriptor.interned("minecraft:iron_door")
 
 
 def IronGolemSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_golem_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:iron_golem_spawn_egg")
 
 
 def IronHelmet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_helmet")
+    return MinecraftItemDescriptor.interned("minecraft:iron_helmet")
 
 
 def IronHoe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_hoe")
+    return MinecraftItemDescriptor.interned("minecraft:iron_hoe")
 
 
 def IronHorseArmor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_horse_armor")
+    return MinecraftItemDescriptor.interned("minecraft:iron_horse_armor")
 
 
 def IronIngot() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_ingot")
+    return MinecraftItemDescriptor.interned("minecraft:iron_ingot")
 
 
 def IronLeggings() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_leggings")
+    return MinecraftItemDescriptor.interned("minecraft:iron_leggings")
 
 
 def IronNautilusArmor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_nautilus_armor")
+    return MinecraftItemDescriptor.interned("minecraft:iron_nautilus_armor")
 
 
 def IronNugget() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_nugget")
+    return MinecraftItemDescriptor.interned("minecraft:iron_nugget")
 
 
 def IronOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_ore")
+    return MinecraftItemDescriptor.interned("minecraft:iron_ore")
 
 
 def IronPickaxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_pickaxe")
+    return MinecraftItemDescriptor.interned("minecraft:iron_pickaxe")
 
 
 def IronShovel() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_shovel")
+    return MinecraftItemDescriptor.interned("minecraft:iron_shovel")
 
 
 def IronSpear() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_spear")
+    return MinecraftItemDescriptor.interned("minecraft:iron_spear")
 
 
 def IronSword() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_sword")
+    return MinecraftItemDescriptor.interned("minecraft:iron_sword")
 
 
 def IronTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:iron_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:iron_trapdoor")
 
 
 def Jigsaw() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jigsaw")
+    return MinecraftItemDescriptor.interned("minecraft:jigsaw")
 
 
 def Jukebox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jukebox")
+    return MinecraftItemDescriptor.interned("minecraft:jukebox")
 
 
 def JungleBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_boat")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_boat")
 
 
 def JungleButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_button")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_button")
 
 
 def JungleChestBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_chest_boat")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_chest_boat")
 
 
 def JungleDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_door")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_door")
 
 
 def JungleFence() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_fence")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_fence")
 
 
 def JungleFenceGate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_fence_gate")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_fence_gate")
 
 
 def JungleHangingSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_hanging_sign")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_hanging_sign")
 
 
 def JungleLeaves() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_leaves")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_leaves")
 
 
 def JungleLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_log")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_log")
 
 
 def JunglePlanks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_planks")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_planks")
 
 
 def JunglePressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_pressure_plate")
 
 
 def JungleSapling() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_sapling")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_sapling")
 
 
 def JungleSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_sign")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_sign")
 
 
 def JungleSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_slab")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_slab")
 
 
 def JungleStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_stairs")
 
 
 def JungleTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_trapdoor")
 
 
 def JungleWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:jungle_wood")
+    return MinecraftItemDescriptor.interned("minecraft:jungle_wood")
 
 
 def Kelp() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:kelp")
+    return MinecraftItemDescriptor.interned("minecraft:kelp")
 
 
 def Ladder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ladder")
+    return MinecraftItemDescriptor.interned("minecraft:ladder")
 
 
 def Lantern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lantern")
+    return MinecraftItemDescriptor.interned("minecraft:lantern")
 
 
 def LapisBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lapis_block")
+    return MinecraftItemDescriptor.interned("minecraft:lapis_block")
 
 
 def LapisLazuli() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lapis_lazuli")
+    return MinecraftItemDescriptor.interned("minecraft:lapis_lazuli")
 
 
 def LapisOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lapis_ore")
+    return MinecraftItemDescriptor.interned("minecraft:lapis_ore")
 
 
 def LargeAmethystBud() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:large_amethyst_bud")
+    return MinecraftItemDescriptor.interned("minecraft:large_amethyst_bud")
 
 
 def LargeFern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:large_fern")
+    return MinecraftItemDescriptor.interned("minecraft:large_fern")
 
 
 def LavaBucket() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lava_bucket")
+    return MinecraftItemDescriptor.interned("minecraft:lava_bucket")
 
 
 def Lead() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lead")
+    return MinecraftItemDescriptor.interned("minecraft:lead")
 
 
 def LeafLitter() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:leaf_litter")
+    return MinecraftItemDescriptor.interned("minecraft:leaf_litter")
 
 
 def Leather() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:leather")
+    return MinecraftItemDescriptor.interned("minecraft:leather")
 
 
 def LeatherBoots() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:leather_boots")
+    return MinecraftItemDescriptor.interned("minecraft:leather_boots")
 
 
 def LeatherChestplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:leather_chestplate")
+    return MinecraftItemDescriptor.interned("minecraft:leather_chestplate")
 
 
 def LeatherHelmet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:leather_helmet")
+    return MinecraftItemDescriptor.interned("minecraft:leather_helmet")
 
 
 def LeatherHorseArmor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:leather_horse_armor")
+    return MinecraftItemDescriptor.interned("minecraft:leather_horse_armor")
 
 
 def LeatherLeggings() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:leather_leggings")
+    return MinecraftItemDescriptor.interned("minecraft:leather_leggings")
 
 
 def Lectern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lectern")
+    return MinecraftItemDescriptor.interned("minecraft:lectern")
 
 
 def Lever() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lever")
+    return MinecraftItemDescriptor.interned("minecraft:lever")
 
 
 def LightBlock0() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_0")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_0")
 
 
 def LightBlock1() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_1")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_1")
 
 
 def LightBlock10() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_10")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_10")
 
 
 def LightBlock11() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_11")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_11")
 
 
 def LightBlock12() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_12")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_12")
 
 
 def LightBlock13() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_13")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_13")
 
 
 def LightBlock14() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_14")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_14")
 
 
 def LightBlock15() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_15")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_15")
 
 
 def LightBlock2() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_2")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_2")
 
 
 def LightBlock3() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_3")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_3")
 
 
 def LightBlock4() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_4")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_4")
 
 
 def LightBlock5() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_5")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_5")
 
 
 def LightBlock6() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_6")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_6")
 
 
 def LightBlock7() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_7")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_7")
 
 
 def LightBlock8() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_8")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_8")
 
 
 def LightBlock9() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_block_9")
+    return MinecraftItemDescriptor.interned("minecraft:light_block_9")
 
 
 def LightBlueBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_blue_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:light_blue_bundle")
 
 
 def LightBlueCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_blue_candle")
+    return MinecraftItemDescriptor.interned("minecraft:light_blue_candle")
 
 
 def LightBlueCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_blue_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:light_blue_carpet")
 
 
 def LightBlueConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_blue_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:light_blue_concrete")
 
 
 def LightBlueConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_blue_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:light_blue_concrete_powder")
 
 
 def LightBlueDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_blue_dye")
+    return MinecraftItemDescriptor.interned("minecraft:light_blue_dye")
 
 
 def LightBlueGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_blue_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:light_blue_glazed_terracotta")
 
 
 def LightBlueHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_blue_harness")
+    return MinecraftItemDescriptor.interned("minecraft:light_blue_harness")
 
 
 def LightBlueShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_blue_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:light_blue_shulker_box")
 
 
 def LightBlueStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_blue_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:light_blue_stained_glass")
 
 
 def LightBlueStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_blue_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:light_blue_stained_glass_pane")
 
 
 def LightBlueTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_blue_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:light_blue_terracotta")
 
 
 def LightBlueWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_blue_wool")
+    return MinecraftItemDescriptor.interned("minecraft:light_blue_wool")
 
 
 def LightGrayBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_gray_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:light_gray_bundle")
 
 
 def LightGrayCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_gray_candle")
+    return MinecraftItemDescriptor.interned("minecraft:light_gray_candle")
 
 
 def LightGrayCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_gray_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:light_gray_carpet")
 
 
 def LightGrayConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_gray_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:light_gray_concrete")
 
 
 def LightGrayConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_gray_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:light_gray_concrete_powder")
 
 
 def LightGrayDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_gray_dye")
+    return MinecraftItemDescriptor.interned("minecraft:light_gray_dye")
 
 
 def LightGrayHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_gray_harness")
+    return MinecraftItemDescriptor.interned("minecraft:light_gray_harness")
 
 
 def LightGrayShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_gray_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:light_gray_shulker_box")
 
 
 def LightGrayStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_gray_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:light_gray_stained_glass")
 
 
 def LightGrayStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_gray_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:light_gray_stained_glass_pane")
 
 
 def LightGrayTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_gray_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:light_gray_terracotta")
 
 
 def LightGrayWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_gray_wool")
+    return MinecraftItemDescriptor.interned("minecraft:light_gray_wool")
 
 
 def LightWeightedPressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:light_weighted_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:light_weighted_pressure_plate")
 
 
 def LightningRod() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lightning_rod")
+    return MinecraftItemDescriptor.interned("minecraft:lightning_rod")
 
 
 def Lilac() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lilac")
+    return MinecraftItemDescriptor.interned("minecraft:lilac")
 
 
 def LilyOfTheValley() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lily_of_the_valley")
+    return MinecraftItemDescriptor.interned("minecraft:lily_of_the_valley")
 
 
 def LimeBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lime_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:lime_bundle")
 
 
 def LimeCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lime_candle")
+    return MinecraftItemDescriptor.interned("minecraft:lime_candle")
 
 
 def LimeCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lime_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:lime_carpet")
 
 
 def LimeConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lime_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:lime_concrete")
 
 
 def LimeConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lime_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:lime_concrete_powder")
 
 
 def LimeDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lime_dye")
+    return MinecraftItemDescriptor.interned("minecraft:lime_dye")
 
 
 def LimeGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lime_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:lime_glazed_terracotta")
 
 
 def LimeHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lime_harness")
+    return MinecraftItemDescriptor.interned("minecraft:lime_harness")
 
 
 def LimeShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lime_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:lime_shulker_box")
 
 
 def LimeStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lime_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:lime_stained_glass")
 
 
 def LimeStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lime_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:lime_stained_glass_pane")
 
 
 def LimeTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lime_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:lime_terracotta")
 
 
 def LimeWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lime_wool")
+    return MinecraftItemDescriptor.interned("minecraft:lime_wool")
 
 
 def LingeringPotion() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lingering_potion")
+    return MinecraftItemDescriptor.interned("minecraft:lingering_potion")
 
 
 def LitPumpkin() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lit_pumpkin")
+    return MinecraftItemDescriptor.interned("minecraft:lit_pumpkin")
 
 
 def LlamaSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:llama_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:llama_spawn_egg")
 
 
 def Lodestone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lodestone")
+    return MinecraftItemDescriptor.interned("minecraft:lodestone")
 
 
 def LodestoneCompass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:lodestone_compass")
+    return MinecraftItemDescriptor.interned("minecraft:lodestone_compass")
 
 
 def Loom() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:loom")
+    return MinecraftItemDescriptor.interned("minecraft:loom")
 
 
 def Mace() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mace")
+    return MinecraftItemDescriptor.interned("minecraft:mace")
 
 
 def MagentaBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magenta_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:magenta_bundle")
 
 
 def MagentaCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magenta_candle")
+    return MinecraftItemDescriptor.interned("minecraft:magenta_candle")
 
 
 def MagentaCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magenta_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:magenta_carpet")
 
 
 def MagentaConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magenta_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:magenta_concrete")
 
 
 def MagentaConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magenta_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:magenta_concrete_powder")
 
 
 def MagentaDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magenta_dye")
+    return MinecraftItemDescriptor.interned("minecraft:magenta_dye")
 
 
 def MagentaGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magenta_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:magenta_glazed_terracotta")
 
 
 def MagentaHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magenta_harness")
+    return MinecraftItemDescriptor.interned("minecraft:magenta_harness")
 
 
 def MagentaShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magenta_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:magenta_shulker_box")
 
 
 def MagentaStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magenta_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:magenta_stained_glass")
 
 
 def MagentaStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magenta_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:magenta_stained_glass_pane")
 
 
 def MagentaTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magenta_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:magenta_terracotta")
 
 
 def MagentaWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magenta_wool")
+    return MinecraftItemDescriptor.interned("minecraft:magenta_wool")
 
 
 def Magma() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magma")
+    return MinecraftItemDescriptor.interned("minecraft:magma")
 
 
 def MagmaCream() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magma_cream")
+    return MinecraftItemDescriptor.interned("minecraft:magma_cream")
 
 
 def MagmaCubeSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:magma_cube_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:magma_cube_spawn_egg")
 
 
 def MangroveBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_boat")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_boat")
 
 
 def MangroveButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_button")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_button")
 
 
 def MangroveChestBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_chest_boat")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_chest_boat")
 
 
 def MangroveDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_door")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_door")
 
 
 def MangroveFence() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_fence")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_fence")
 
 
 def MangroveFenceGate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_fence_gate")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_fence_gate")
 
 
 def MangroveHangingSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_hanging_sign")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_hanging_sign")
 
 
 def MangroveLeaves() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_leaves")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_leaves")
 
 
 def MangroveLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_log")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_log")
 
 
 def MangrovePlanks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_planks")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_planks")
 
 
 def MangrovePressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_pressure_plate")
 
 
 def MangrovePropagule() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_propagule")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_propagule")
 
 
 def MangroveRoots() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_roots")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_roots")
 
 
 def MangroveSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_sign")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_sign")
 
 
 def MangroveSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_slab")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_slab")
 
 
 def MangroveStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_stairs")
 
 
 def MangroveTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_trapdoor")
 
 
 def MangroveWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mangrove_wood")
+    return MinecraftItemDescriptor.interned("minecraft:mangrove_wood")
 
 
 def MediumAmethystBud() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:medium_amethyst_bud")
+    return MinecraftItemDescriptor.interned("minecraft:medium_amethyst_bud")
 
 
 def MelonBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:melon_block")
+    return MinecraftItemDescriptor.interned("minecraft:melon_block")
 
 
 def MelonSeeds() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:melon_seeds")
+    return MinecraftItemDescriptor.interned("minecraft:melon_seeds")
 
 
 def MelonSlice() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:melon_slice")
+    return MinecraftItemDescriptor.interned("minecraft:melon_slice")
 
 
 def MilkBucket() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:milk_bucket")
+    return MinecraftItemDescriptor.interned("minecraft:milk_bucket")
 
 
 def Minecart() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:minecart")
+    return MinecraftItemDescriptor.interned("minecraft:minecart")
 
 
 def MinerPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:miner_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:miner_pottery_sherd")
 
 
 def MobSpawner() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mob_spawner")
+    return MinecraftItemDescriptor.interned("minecraft:mob_spawner")
 
 
 def MojangBannerPattern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mojang_banner_pattern")
+    return MinecraftItemDescriptor.interned("minecraft:mojang_banner_pattern")
 
 
 def MooshroomSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mooshroom_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:mooshroom_spawn_egg")
 
 
 def MossBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:moss_block")
+    return MinecraftItemDescriptor.interned("minecraft:moss_block")
 
 
 def MossCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:moss_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:moss_carpet")
 
 
 def MossyCobblestone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mossy_cobblestone")
+    return MinecraftItemDescriptor.interned("minecraft:mossy_cobblestone")
 
 
 def MossyCobblestoneSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mossy_cobblestone_slab")
+    return MinecraftItemDescriptor.interned("minecraft:mossy_cobblestone_slab")
 
 
 def MossyCobblestoneStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mossy_cobblestone_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:mossy_cobblestone_stairs")
 
 
 def MossyCobblestoneWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mossy_cobblestone_wall")
+    return MinecraftItemDescriptor.interned("minecraft:mossy_cobblestone_wall")
 
 
 def MossyStoneBrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mossy_stone_brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:mossy_stone_brick_slab")
 
 
 def MossyStoneBrickStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mossy_stone_brick_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:mossy_stone_brick_stairs")
 
 
 def MossyStoneBrickWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mossy_stone_brick_wall")
+    return MinecraftItemDescriptor.interned("minecraft:mossy_stone_brick_wall")
 
 
 def MossyStoneBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mossy_stone_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:mossy_stone_bricks")
 
 
 def MournerPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mourner_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:mourner_pottery_sherd")
 
 
 def Mud() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mud")
+    return MinecraftItemDescriptor.interned("minecraft:mud")
 
 
 def MudBrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mud_brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:mud_brick_slab")
 
 
 def MudBrickStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mud_brick_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:mud_brick_stairs")
 
 
 def MudBrickWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mud_brick_wall")
+    return MinecraftItemDescriptor.interned("minecraft:mud_brick_wall")
 
 
 def MudBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mud_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:mud_bricks")
 
 
 def MuddyMangroveRoots() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:muddy_mangrove_roots")
+    return MinecraftItemDescriptor.interned("minecraft:muddy_mangrove_roots")
 
 
 def MuleSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mule_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:mule_spawn_egg")
 
 
 def MushroomStem() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mushroom_stem")
+    return MinecraftItemDescriptor.interned("minecraft:mushroom_stem")
 
 
 def MushroomStew() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mushroom_stew")
+    return MinecraftItemDescriptor.interned("minecraft:mushroom_stew")
 
 
 def MusicDisc11() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_11")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_11")
 
 
 def MusicDisc13() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_13")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_13")
 
 
 def MusicDisc5() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_5")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_5")
 
 
 def MusicDiscBlocks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_blocks")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_blocks")
 
 
 def MusicDiscBounce() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_bounce")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_bounce")
 
 
 def MusicDiscCat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_cat")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_cat")
 
 
 def MusicDiscChirp() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_chirp")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_chirp")
 
 
 def MusicDiscCreator() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_creator")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_creator")
 
 
 def MusicDiscCreatorMusicBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_creator_music_box")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_creator_music_box")
 
 
 def MusicDiscFar() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_far")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_far")
 
 
 def MusicDiscLavaChicken() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_lava_chicken")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_lava_chicken")
 
 
 def MusicDiscMall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_mall")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_mall")
 
 
 def MusicDiscMellohi() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_mellohi")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_mellohi")
 
 
 def MusicDiscOtherside() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_otherside")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_otherside")
 
 
 def MusicDiscPigstep() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_pigstep")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_pigstep")
 
 
 def MusicDiscPrecipice() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_precipice")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_precipice")
 
 
 def MusicDiscRelic() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_relic")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_relic")
 
 
 def MusicDiscStal() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_stal")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_stal")
 
 
 def MusicDiscStrad() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_strad")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_strad")
 
 
 def MusicDiscTears() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_tears")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_tears")
 
 
 def MusicDiscWait() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_wait")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_wait")
 
 
 def MusicDiscWard() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:music_disc_ward")
+    return MinecraftItemDescriptor.interned("minecraft:music_disc_ward")
 
 
 def Mutton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mutton")
+    return MinecraftItemDescriptor.interned("minecraft:mutton")
 
 
 def Mycelium() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:mycelium")
+    return MinecraftItemDescriptor.interned("minecraft:mycelium")
 
 
 def NameTag() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:name_tag")
+    return MinecraftItemDescriptor.interned("minecraft:name_tag")
 
 
 def NautilusShell() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:nautilus_shell")
+    return MinecraftItemDescriptor.interned("minecraft:nautilus_shell")
 
 
 def NautilusSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:nautilus_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:nautilus_spawn_egg")
 
 
 def NetherBrick() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:nether_brick")
+    return MinecraftItemDescriptor.interned("minecraft:nether_brick")
 
 
 def NetherBrickFence() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:nether_brick_fence")
+    return MinecraftItemDescriptor.interned("minecraft:nether_brick_fence")
 
 
 def NetherBrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:nether_brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:nether_brick_slab")
 
 
 def NetherBrickStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:nether_brick_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:nether_brick_stairs")
 
 
 def NetherBrickWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:nether_brick_wall")
+    return MinecraftItemDescriptor.interned("minecraft:nether_brick_wall")
 
 
 def NetherGoldOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:nether_gold_ore")
+    return MinecraftItemDescriptor.interned("minecraft:nether_gold_ore")
 
 
 def NetherSprouts() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:nether_sprouts")
+    return MinecraftItemDescriptor.interned("minecraft:nether_sprouts")
 
 
 def NetherStar() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:nether_star")
+    return MinecraftItemDescriptor.interned("minecraft:nether_star")
 
 
 def NetherWart() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:nether_wart")
+    return MinecraftItemDescriptor.interned("minecraft:nether_wart")
 
 
 def NetherWartBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:nether_wart_block")
+    return MinecraftItemDescriptor.interned("minecraft:nether_wart_block")
 
 
 def Netherbrick() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherbrick")
+    return MinecraftItemDescriptor.interned("minecraft:netherbrick")
 
 
 def NetheriteAxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_axe")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_axe")
 
 
 def NetheriteBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_block")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_block")
 
 
 def NetheriteBoots() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_boots")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_boots")
 
 
 def NetheriteChestplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_chestplate")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_chestplate")
 
 
 def NetheriteHelmet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_helmet")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_helmet")
 
 
 def NetheriteHoe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_hoe")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_hoe")
 
 
 def NetheriteHorseArmor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_horse_armor")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_horse_armor")
 
 
 def NetheriteIngot() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_ingot")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_ingot")
 
 
 def NetheriteLeggings() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_leggings")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_leggings")
 
 
 def NetheriteNautilusArmor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_nautilus_armor")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_nautilus_armor")
 
 
 def NetheritePickaxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_pickaxe")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_pickaxe")
 
 
 def NetheriteScrap() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_scrap")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_scrap")
 
 
 def NetheriteShovel() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_shovel")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_shovel")
 
 
 def NetheriteSpear() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_spear")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_spear")
 
 
 def NetheriteSword() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_sword")
+    return MinecraftItemDescriptor.interned("minecraft:netherite_sword")
 
 
 def NetheriteUpgradeSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherite_upgrade_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:netherite_upgrade_smithing_template"
+    )
 
 
 def Netherrack() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:netherrack")
+    return MinecraftItemDescriptor.interned("minecraft:netherrack")
 
 
 def NormalStoneSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:normal_stone_slab")
+    return MinecraftItemDescriptor.interned("minecraft:normal_stone_slab")
 
 
 def NormalStoneStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:normal_stone_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:normal_stone_stairs")
 
 
 def Noteblock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:noteblock")
+    return MinecraftItemDescriptor.interned("minecraft:noteblock")
 
 
 def OakBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oak_boat")
+    return MinecraftItemDescriptor.interned("minecraft:oak_boat")
 
 
 def OakChestBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oak_chest_boat")
+    return MinecraftItemDescriptor.interned("minecraft:oak_chest_boat")
 
 
 def OakFence() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oak_fence")
+    return MinecraftItemDescriptor.interned("minecraft:oak_fence")
 
 
 def OakHangingSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oak_hanging_sign")
+    return MinecraftItemDescriptor.interned("minecraft:oak_hanging_sign")
 
 
 def OakLeaves() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oak_leaves")
+    return MinecraftItemDescriptor.interned("minecraft:oak_leaves")
 
 
 def OakLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oak_log")
+    return MinecraftItemDescriptor.interned("minecraft:oak_log")
 
 
 def OakPlanks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oak_planks")
+    return MinecraftItemDescriptor.interned("minecraft:oak_planks")
 
 
 def OakSapling() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oak_sapling")
+    return MinecraftItemDescriptor.interned("minecraft:oak_sapling")
 
 
 def OakSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oak_sign")
+    return MinecraftItemDescriptor.interned("minecraft:oak_sign")
 
 
 def OakSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oak_slab")
+    return MinecraftItemDescriptor.interned("minecraft:oak_slab")
 
 
 def OakStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oak_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:oak_stairs")
 
 
 def OakWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oak_wood")
+    return MinecraftItemDescriptor.interned("minecraft:oak_wood")
 
 
 def Observer() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:observer")
+    return MinecraftItemDescriptor.interned("minecraft:observer")
 
 
 def Obsidian() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:obsidian")
+    return MinecraftItemDescriptor.interned("minecraft:obsidian")
 
 
 def OcelotSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ocelot_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:ocelot_spawn_egg")
 
 
 def OchreFroglight() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ochre_froglight")
+    return MinecraftItemDescriptor.interned("minecraft:ochre_froglight")
 
 
 def OminousBottle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ominous_bottle")
+    return MinecraftItemDescriptor.interned("minecraft:ominous_bottle")
 
 
 def OminousTrialKey() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ominous_trial_key")
+    return MinecraftItemDescriptor.interned("minecraft:ominous_trial_key")
 
 
 def OpenEyeblossom() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:open_eyeblossom")
+    return MinecraftItemDescriptor.interned("minecraft:open_eyeblossom")
 
 
 def OrangeBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:orange_bundle")
 
 
 def OrangeCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_candle")
+    return MinecraftItemDescriptor.interned("minecraft:orange_candle")
 
 
 def OrangeCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:orange_carpet")
 
 
 def OrangeConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:orange_concrete")
 
 
 def OrangeConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:orange_concrete_powder")
 
 
 def OrangeDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_dye")
+    return MinecraftItemDescriptor.interned("minecraft:orange_dye")
 
 
 def OrangeGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:orange_glazed_terracotta")
 
 
 def OrangeHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_harness")
+    return MinecraftItemDescriptor.interned("minecraft:orange_harness")
 
 
 def OrangeShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:orange_shulker_box")
 
 
 def OrangeStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:orange_stained_glass")
 
 
 def OrangeStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:orange_stained_glass_pane")
 
 
 def OrangeTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:orange_terracotta")
 
 
 def OrangeTulip() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_tulip")
+    return MinecraftItemDescriptor.interned("minecraft:orange_tulip")
 
 
 def OrangeWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:orange_wool")
+    return MinecraftItemDescriptor.interned("minecraft:orange_wool")
 
 
 def OxeyeDaisy() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oxeye_daisy")
+    return MinecraftItemDescriptor.interned("minecraft:oxeye_daisy")
 
 
 def OxidizedChiseledCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oxidized_chiseled_copper")
+    return MinecraftItemDescriptor.interned("minecraft:oxidized_chiseled_copper")
 
 
 def OxidizedCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oxidized_copper")
+    return MinecraftItemDescriptor.interned("minecraft:oxidized_copper")
 
 
 def OxidizedCopperBulb() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oxidized_copper_bulb")
+    return MinecraftItemDescriptor.interned("minecraft:oxidized_copper_bulb")
 
 
 def OxidizedCopperChest() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oxidized_copper_chest")
+    return MinecraftItemDescriptor.interned("minecraft:oxidized_copper_chest")
 
 
 def OxidizedCopperDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oxidized_copper_door")
+    return MinecraftItemDescriptor.interned("minecraft:oxidized_copper_door")
 
 
 def OxidizedCopperGrate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oxidized_copper_grate")
+    return MinecraftItemDescriptor.interned("minecraft:oxidized_copper_grate")
 
 
 def OxidizedCopperTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oxidized_copper_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:oxidized_copper_trapdoor")
 
 
 def OxidizedCutCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oxidized_cut_copper")
+    return MinecraftItemDescriptor.interned("minecraft:oxidized_cut_copper")
 
 
 def OxidizedCutCopperSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oxidized_cut_copper_slab")
+    return MinecraftItemDescriptor.interned("minecraft:oxidized_cut_copper_slab")
 
 
 def OxidizedCutCopperStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:oxidized_cut_copper_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:oxidized_cut_copper_stairs")
 
 
 def PackedIce() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:packed_ice")
+    return MinecraftItemDescriptor.interned("minecraft:packed_ice")
 
 
 def PackedMud() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:packed_mud")
+    return MinecraftItemDescriptor.interned("minecraft:packed_mud")
 
 
 def Painting() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:painting")
+    return MinecraftItemDescriptor.interned("minecraft:painting")
 
 
 def PaleHangingMoss() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_hanging_moss")
+    return MinecraftItemDescriptor.interned("minecraft:pale_hanging_moss")
 
 
 def PaleMossBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_moss_block")
+    return MinecraftItemDescriptor.interned("minecraft:pale_moss_block")
 
 
 def PaleMossCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_moss_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:pale_moss_carpet")
 
 
 def PaleOakBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_boat")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_boat")
 
 
 def PaleOakButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_button")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_button")
 
 
 def PaleOakChestBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_chest_boat")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_chest_boat")
 
 
 def PaleOakDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_door")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_door")
 
 
 def PaleOakFence() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_fence")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_fence")
 
 
 def PaleOakFenceGate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_fence_gate")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_fence_gate")
 
 
 def PaleOakHangingSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_hanging_sign")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_hanging_sign")
 
 
 def PaleOakLeaves() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_leaves")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_leaves")
 
 
 def PaleOakLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_log")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_log")
 
 
 def PaleOakPlanks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_planks")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_planks")
 
 
 def PaleOakPressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_pressure_plate")
 
 
 def PaleOakSapling() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_sapling")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_sapling")
 
 
 def PaleOakSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_sign")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_sign")
 
 
 def PaleOakSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_slab")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_slab")
 
 
 def PaleOakStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_stairs")
 
 
 def PaleOakTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_trapdoor")
 
 
 def PaleOakWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pale_oak_wood")
+    return MinecraftItemDescriptor.interned("minecraft:pale_oak_wood")
 
 
 def PandaSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:panda_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:panda_spawn_egg")
 
 
 def Paper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:paper")
+    return MinecraftItemDescriptor.interned("minecraft:paper")
 
 
 def ParchedSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:parched_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:parched_spawn_egg")
 
 
 def ParrotSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:parrot_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:parrot_spawn_egg")
 
 
 def PearlescentFroglight() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pearlescent_froglight")
+    return MinecraftItemDescriptor.interned("minecraft:pearlescent_froglight")
 
 
 def Peony() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:peony")
+    return MinecraftItemDescriptor.interned("minecraft:peony")
 
 
 def PetrifiedOakSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:petrified_oak_slab")
+    return MinecraftItemDescriptor.interned("minecraft:petrified_oak_slab")
 
 
 def PhantomMembrane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:phantom_membrane")
+    return MinecraftItemDescriptor.interned("minecraft:phantom_membrane")
 
 
 def PhantomSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:phantom_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:phantom_spawn_egg")
 
 
 def PigSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pig_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:pig_spawn_egg")
 
 
 def PiglinBannerPattern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:piglin_banner_pattern")
+    return MinecraftItemDescriptor.interned("minecraft:piglin_banner_pattern")
 
 
 def PiglinBruteSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:piglin_brute_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:piglin_brute_spawn_egg")
 
 
 def PiglinHead() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:piglin_head")
+    return MinecraftItemDescriptor.interned("minecraft:piglin_head")
 
 
 def PiglinSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:piglin_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:piglin_spawn_egg")
 
 
 def PillagerSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pillager_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:pillager_spawn_egg")
 
 
 def PinkBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:pink_bundle")
 
 
 def PinkCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_candle")
+    return MinecraftItemDescriptor.interned("minecraft:pink_candle")
 
 
 def PinkCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:pink_carpet")
 
 
 def PinkConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:pink_concrete")
 
 
 def PinkConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:pink_concrete_powder")
 
 
 def PinkDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_dye")
+    return MinecraftItemDescriptor.interned("minecraft:pink_dye")
 
 
 def PinkGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:pink_glazed_terracotta")
 
 
 def PinkHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_harness")
+    return MinecraftItemDescriptor.interned("minecraft:pink_harness")
 
 
 def PinkPetals() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_petals")
+    return MinecraftItemDescriptor.interned("minecraft:pink_petals")
 
 
 def PinkShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:pink_shulker_box")
 
 
 def PinkStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:pink_stained_glass")
 
 
 def PinkStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:pink_stained_glass_pane")
 
 
 def PinkTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:pink_terracotta")
 
 
 def PinkTulip() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_tulip")
+    return MinecraftItemDescriptor.interned("minecraft:pink_tulip")
 
 
 def PinkWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pink_wool")
+    return MinecraftItemDescriptor.interned("minecraft:pink_wool")
 
 
 def Piston() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:piston")
+    return MinecraftItemDescriptor.interned("minecraft:piston")
 
 
 def PitcherPlant() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pitcher_plant")
+    return MinecraftItemDescriptor.interned("minecraft:pitcher_plant")
 
 
 def PitcherPod() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pitcher_pod")
+    return MinecraftItemDescriptor.interned("minecraft:pitcher_pod")
 
 
 def PlayerHead() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:player_head")
+    return MinecraftItemDescriptor.interned("minecraft:player_head")
 
 
 def PlentyPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:plenty_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:plenty_pottery_sherd")
 
 
 def Podzol() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:podzol")
+    return MinecraftItemDescriptor.interned("minecraft:podzol")
 
 
 def PointedDripstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pointed_dripstone")
+    return MinecraftItemDescriptor.interned("minecraft:pointed_dripstone")
 
 
 def PoisonousPotato() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:poisonous_potato")
+    return MinecraftItemDescriptor.interned("minecraft:poisonous_potato")
 
 
 def PolarBearSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polar_bear_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:polar_bear_spawn_egg")
 
 
 def PolishedAndesite() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_andesite")
+    return MinecraftItemDescriptor.interned("minecraft:polished_andesite")
 
 
 def PolishedAndesiteSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_andesite_slab")
+    return MinecraftItemDescriptor.interned("minecraft:polished_andesite_slab")
 
 
 def PolishedAndesiteStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_andesite_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:polished_andesite_stairs")
 
 
 def PolishedBasalt() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_basalt")
+    return MinecraftItemDescriptor.interned("minecraft:polished_basalt")
 
 
 def PolishedBlackstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_blackstone")
+    return MinecraftItemDescriptor.interned("minecraft:polished_blackstone")
 
 
 def PolishedBlackstoneBrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_blackstone_brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:polished_blackstone_brick_slab")
 
 
 def PolishedBlackstoneBrickStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_blackstone_brick_stairs")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:polished_blackstone_brick_stairs"
+    )
 
 
 def PolishedBlackstoneBrickWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_blackstone_brick_wall")
+    return MinecraftItemDescriptor.interned("minecraft:polished_blackstone_brick_wall")
 
 
 def PolishedBlackstoneBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_blackstone_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:polished_blackstone_bricks")
 
 
 def PolishedBlackstoneButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_blackstone_button")
+    return MinecraftItemDescriptor.interned("minecraft:polished_blackstone_button")
 
 
 def PolishedBlackstonePressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_blackstone_pressure_plate")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:polished_blackstone_pressure_plate"
+    )
 
 
 def PolishedBlackstoneSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_blackstone_slab")
+    return MinecraftItemDescriptor.interned("minecraft:polished_blackstone_slab")
 
 
 def PolishedBlackstoneStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_blackstone_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:polished_blackstone_stairs")
 
 
 def PolishedBlackstoneWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_blackstone_wall")
+    return MinecraftItemDescriptor.interned("minecraft:polished_blackstone_wall")
 
 
 def PolishedCinnabar() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_cinnabar")
+    return MinecraftItemDescriptor.interned("minecraft:polished_cinnabar")
 
 
 def PolishedCinnabarSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_cinnabar_slab")
+    return MinecraftItemDescriptor.interned("minecraft:polished_cinnabar_slab")
 
 
 def PolishedCinnabarStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_cinnabar_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:polished_cinnabar_stairs")
 
 
 def PolishedCinnabarWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_cinnabar_wall")
+    return MinecraftItemDescriptor.interned("minecraft:polished_cinnabar_wall")
 
 
 def PolishedDeepslate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_deepslate")
+    return MinecraftItemDescriptor.interned("minecraft:polished_deepslate")
 
 
 def PolishedDeepslateSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_deepslate_slab")
+    return MinecraftItemDescriptor.interned("minecraft:polished_deepslate_slab")
 
 
 def PolishedDeepslateStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_deepslate_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:polished_deepslate_stairs")
 
 
 def PolishedDeepslateWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_deepslate_wall")
+    return MinecraftItemDescriptor.interned("minecraft:polished_deepslate_wall")
 
 
 def PolishedDiorite() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_diorite")
+    return MinecraftItemDescriptor.interned("minecraft:polished_diorite")
 
 
 def PolishedDioriteSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_diorite_slab")
+    return MinecraftItemDescriptor.interned("minecraft:polished_diorite_slab")
 
 
 def PolishedDioriteStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_diorite_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:polished_diorite_stairs")
 
 
 def PolishedGranite() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_granite")
+    return MinecraftItemDescriptor.interned("minecraft:polished_granite")
 
 
 def PolishedGraniteSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_granite_slab")
+    return MinecraftItemDescriptor.interned("minecraft:polished_granite_slab")
 
 
 def PolishedGraniteStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_granite_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:polished_granite_stairs")
 
 
 def PolishedSulfur() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_sulfur")
+    return MinecraftItemDescriptor.interned("minecraft:polished_sulfur")
 
 
 def PolishedSulfurSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_sulfur_slab")
+    return MinecraftItemDescriptor.interned("minecraft:polished_sulfur_slab")
 
 
 def PolishedSulfurStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_sulfur_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:polished_sulfur_stairs")
 
 
 def PolishedSulfurWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_sulfur_wall")
+    return MinecraftItemDescriptor.interned("minecraft:polished_sulfur_wall")
 
 
 def PolishedTuff() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_tuff")
+    return MinecraftItemDescriptor.interned("minecraft:polished_tuff")
 
 
 def PolishedTuffSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_tuff_slab")
+    return MinecraftItemDescriptor.interned("minecraft:polished_tuff_slab")
 
 
 def PolishedTuffStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_tuff_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:polished_tuff_stairs")
 
 
 def PolishedTuffWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:polished_tuff_wall")
+    return MinecraftItemDescriptor.interned("minecraft:polished_tuff_wall")
 
 
 def PoppedChorusFruit() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:popped_chorus_fruit")
+    return MinecraftItemDescriptor.interned("minecraft:popped_chorus_fruit")
 
 
 def Poppy() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:poppy")
+    return MinecraftItemDescriptor.interned("minecraft:poppy")
 
 
 def Porkchop() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:porkchop")
+    return MinecraftItemDescriptor.interned("minecraft:porkchop")
 
 
 def Potato() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:potato")
+    return MinecraftItemDescriptor.interned("minecraft:potato")
 
 
 def PotentSulfur() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:potent_sulfur")
+    return MinecraftItemDescriptor.interned("minecraft:potent_sulfur")
 
 
 def Potion(
@@ -4156,1763 +4176,1791 @@ def Potion(
     ) = None,
 ) -> MinecraftItemDescriptor:
     if potion_addition is not None:
-        return MinecraftItemDescriptor("minecraft:potion_type").set_identifier_data(
-            potion_addition
+        return MinecraftItemDescriptor.interned(
+            "minecraft:potion_type", potion_addition
         )
-    return MinecraftItemDescriptor("minecraft:potion")
+    return MinecraftItemDescriptor.interned("minecraft:potion")
 
 
 def PowderSnowBucket() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:powder_snow_bucket")
+    return MinecraftItemDescriptor.interned("minecraft:powder_snow_bucket")
 
 
 def Prismarine() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:prismarine")
+    return MinecraftItemDescriptor.interned("minecraft:prismarine")
 
 
 def PrismarineBrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:prismarine_brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:prismarine_brick_slab")
 
 
 def PrismarineBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:prismarine_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:prismarine_bricks")
 
 
 def PrismarineBricksStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:prismarine_bricks_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:prismarine_bricks_stairs")
 
 
 def PrismarineCrystals() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:prismarine_crystals")
+    return MinecraftItemDescriptor.interned("minecraft:prismarine_crystals")
 
 
 def PrismarineShard() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:prismarine_shard")
+    return MinecraftItemDescriptor.interned("minecraft:prismarine_shard")
 
 
 def PrismarineSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:prismarine_slab")
+    return MinecraftItemDescriptor.interned("minecraft:prismarine_slab")
 
 
 def PrismarineStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:prismarine_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:prismarine_stairs")
 
 
 def PrismarineWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:prismarine_wall")
+    return MinecraftItemDescriptor.interned("minecraft:prismarine_wall")
 
 
 def PrizePotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:prize_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:prize_pottery_sherd")
 
 
 def Pufferfish() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pufferfish")
+    return MinecraftItemDescriptor.interned("minecraft:pufferfish")
 
 
 def PufferfishBucket() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pufferfish_bucket")
+    return MinecraftItemDescriptor.interned("minecraft:pufferfish_bucket")
 
 
 def PufferfishSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pufferfish_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:pufferfish_spawn_egg")
 
 
 def Pumpkin() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pumpkin")
+    return MinecraftItemDescriptor.interned("minecraft:pumpkin")
 
 
 def PumpkinPie() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pumpkin_pie")
+    return MinecraftItemDescriptor.interned("minecraft:pumpkin_pie")
 
 
 def PumpkinSeeds() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:pumpkin_seeds")
+    return MinecraftItemDescriptor.interned("minecraft:pumpkin_seeds")
 
 
 def PurpleBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purple_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:purple_bundle")
 
 
 def PurpleCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purple_candle")
+    return MinecraftItemDescriptor.interned("minecraft:purple_candle")
 
 
 def PurpleCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purple_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:purple_carpet")
 
 
 def PurpleConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purple_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:purple_concrete")
 
 
 def PurpleConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purple_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:purple_concrete_powder")
 
 
 def PurpleDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purple_dye")
+    return MinecraftItemDescriptor.interned("minecraft:purple_dye")
 
 
 def PurpleGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purple_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:purple_glazed_terracotta")
 
 
 def PurpleHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purple_harness")
+    return MinecraftItemDescriptor.interned("minecraft:purple_harness")
 
 
 def PurpleShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purple_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:purple_shulker_box")
 
 
 def PurpleStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purple_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:purple_stained_glass")
 
 
 def PurpleStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purple_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:purple_stained_glass_pane")
 
 
 def PurpleTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purple_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:purple_terracotta")
 
 
 def PurpleWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purple_wool")
+    return MinecraftItemDescriptor.interned("minecraft:purple_wool")
 
 
 def PurpurBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purpur_block")
+    return MinecraftItemDescriptor.interned("minecraft:purpur_block")
 
 
 def PurpurPillar() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purpur_pillar")
+    return MinecraftItemDescriptor.interned("minecraft:purpur_pillar")
 
 
 def PurpurSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purpur_slab")
+    return MinecraftItemDescriptor.interned("minecraft:purpur_slab")
 
 
 def PurpurStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:purpur_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:purpur_stairs")
 
 
 def Quartz() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:quartz")
+    return MinecraftItemDescriptor.interned("minecraft:quartz")
 
 
 def QuartzBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:quartz_block")
+    return MinecraftItemDescriptor.interned("minecraft:quartz_block")
 
 
 def QuartzBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:quartz_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:quartz_bricks")
 
 
 def QuartzOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:quartz_ore")
+    return MinecraftItemDescriptor.interned("minecraft:quartz_ore")
 
 
 def QuartzPillar() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:quartz_pillar")
+    return MinecraftItemDescriptor.interned("minecraft:quartz_pillar")
 
 
 def QuartzSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:quartz_slab")
+    return MinecraftItemDescriptor.interned("minecraft:quartz_slab")
 
 
 def QuartzStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:quartz_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:quartz_stairs")
 
 
 def Rabbit() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:rabbit")
+    return MinecraftItemDescriptor.interned("minecraft:rabbit")
 
 
 def RabbitFoot() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:rabbit_foot")
+    return MinecraftItemDescriptor.interned("minecraft:rabbit_foot")
 
 
 def RabbitHide() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:rabbit_hide")
+    return MinecraftItemDescriptor.interned("minecraft:rabbit_hide")
 
 
 def RabbitSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:rabbit_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:rabbit_spawn_egg")
 
 
 def RabbitStew() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:rabbit_stew")
+    return MinecraftItemDescriptor.interned("minecraft:rabbit_stew")
 
 
 def Rail() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:rail")
+    return MinecraftItemDescriptor.interned("minecraft:rail")
 
 
 def RaiserArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:raiser_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:raiser_armor_trim_smithing_template"
+    )
 
 
 def RavagerSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ravager_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:ravager_spawn_egg")
 
 
 def RawCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:raw_copper")
+    return MinecraftItemDescriptor.interned("minecraft:raw_copper")
 
 
 def RawCopperBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:raw_copper_block")
+    return MinecraftItemDescriptor.interned("minecraft:raw_copper_block")
 
 
 def RawGold() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:raw_gold")
+    return MinecraftItemDescriptor.interned("minecraft:raw_gold")
 
 
 def RawGoldBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:raw_gold_block")
+    return MinecraftItemDescriptor.interned("minecraft:raw_gold_block")
 
 
 def RawIron() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:raw_iron")
+    return MinecraftItemDescriptor.interned("minecraft:raw_iron")
 
 
 def RawIronBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:raw_iron_block")
+    return MinecraftItemDescriptor.interned("minecraft:raw_iron_block")
 
 
 def RecoveryCompass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:recovery_compass")
+    return MinecraftItemDescriptor.interned("minecraft:recovery_compass")
 
 
 def RedBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:red_bundle")
 
 
 def RedCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_candle")
+    return MinecraftItemDescriptor.interned("minecraft:red_candle")
 
 
 def RedCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:red_carpet")
 
 
 def RedConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:red_concrete")
 
 
 def RedConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:red_concrete_powder")
 
 
 def RedDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_dye")
+    return MinecraftItemDescriptor.interned("minecraft:red_dye")
 
 
 def RedGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:red_glazed_terracotta")
 
 
 def RedHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_harness")
+    return MinecraftItemDescriptor.interned("minecraft:red_harness")
 
 
 def RedMushroom() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_mushroom")
+    return MinecraftItemDescriptor.interned("minecraft:red_mushroom")
 
 
 def RedMushroomBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_mushroom_block")
+    return MinecraftItemDescriptor.interned("minecraft:red_mushroom_block")
 
 
 def RedNetherBrick() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_nether_brick")
+    return MinecraftItemDescriptor.interned("minecraft:red_nether_brick")
 
 
 def RedNetherBrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_nether_brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:red_nether_brick_slab")
 
 
 def RedNetherBrickStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_nether_brick_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:red_nether_brick_stairs")
 
 
 def RedNetherBrickWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_nether_brick_wall")
+    return MinecraftItemDescriptor.interned("minecraft:red_nether_brick_wall")
 
 
 def RedSand() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_sand")
+    return MinecraftItemDescriptor.interned("minecraft:red_sand")
 
 
 def RedSandstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_sandstone")
+    return MinecraftItemDescriptor.interned("minecraft:red_sandstone")
 
 
 def RedSandstoneSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_sandstone_slab")
+    return MinecraftItemDescriptor.interned("minecraft:red_sandstone_slab")
 
 
 def RedSandstoneStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_sandstone_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:red_sandstone_stairs")
 
 
 def RedSandstoneWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_sandstone_wall")
+    return MinecraftItemDescriptor.interned("minecraft:red_sandstone_wall")
 
 
 def RedShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:red_shulker_box")
 
 
 def RedStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:red_stained_glass")
 
 
 def RedStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:red_stained_glass_pane")
 
 
 def RedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:red_terracotta")
 
 
 def RedTulip() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_tulip")
+    return MinecraftItemDescriptor.interned("minecraft:red_tulip")
 
 
 def RedWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:red_wool")
+    return MinecraftItemDescriptor.interned("minecraft:red_wool")
 
 
 def Redstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:redstone")
+    return MinecraftItemDescriptor.interned("minecraft:redstone")
 
 
 def RedstoneBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:redstone_block")
+    return MinecraftItemDescriptor.interned("minecraft:redstone_block")
 
 
 def RedstoneLamp() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:redstone_lamp")
+    return MinecraftItemDescriptor.interned("minecraft:redstone_lamp")
 
 
 def RedstoneOre() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:redstone_ore")
+    return MinecraftItemDescriptor.interned("minecraft:redstone_ore")
 
 
 def RedstoneTorch() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:redstone_torch")
+    return MinecraftItemDescriptor.interned("minecraft:redstone_torch")
 
 
 def ReinforcedDeepslate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:reinforced_deepslate")
+    return MinecraftItemDescriptor.interned("minecraft:reinforced_deepslate")
 
 
 def Repeater() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:repeater")
+    return MinecraftItemDescriptor.interned("minecraft:repeater")
 
 
 def RepeatingCommandBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:repeating_command_block")
+    return MinecraftItemDescriptor.interned("minecraft:repeating_command_block")
 
 
 def ResinBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:resin_block")
+    return MinecraftItemDescriptor.interned("minecraft:resin_block")
 
 
 def ResinBrick() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:resin_brick")
+    return MinecraftItemDescriptor.interned("minecraft:resin_brick")
 
 
 def ResinBrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:resin_brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:resin_brick_slab")
 
 
 def ResinBrickStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:resin_brick_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:resin_brick_stairs")
 
 
 def ResinBrickWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:resin_brick_wall")
+    return MinecraftItemDescriptor.interned("minecraft:resin_brick_wall")
 
 
 def ResinBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:resin_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:resin_bricks")
 
 
 def ResinClump() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:resin_clump")
+    return MinecraftItemDescriptor.interned("minecraft:resin_clump")
 
 
 def RespawnAnchor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:respawn_anchor")
+    return MinecraftItemDescriptor.interned("minecraft:respawn_anchor")
 
 
 def RibArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:rib_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:rib_armor_trim_smithing_template"
+    )
 
 
 def RoseBush() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:rose_bush")
+    return MinecraftItemDescriptor.interned("minecraft:rose_bush")
 
 
 def RottenFlesh() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:rotten_flesh")
+    return MinecraftItemDescriptor.interned("minecraft:rotten_flesh")
 
 
 def Saddle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:saddle")
+    return MinecraftItemDescriptor.interned("minecraft:saddle")
 
 
 def Salmon() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:salmon")
+    return MinecraftItemDescriptor.interned("minecraft:salmon")
 
 
 def SalmonBucket() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:salmon_bucket")
+    return MinecraftItemDescriptor.interned("minecraft:salmon_bucket")
 
 
 def SalmonSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:salmon_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:salmon_spawn_egg")
 
 
 def Sand() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sand")
+    return MinecraftItemDescriptor.interned("minecraft:sand")
 
 
 def Sandstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sandstone")
+    return MinecraftItemDescriptor.interned("minecraft:sandstone")
 
 
 def SandstoneSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sandstone_slab")
+    return MinecraftItemDescriptor.interned("minecraft:sandstone_slab")
 
 
 def SandstoneStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sandstone_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:sandstone_stairs")
 
 
 def SandstoneWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sandstone_wall")
+    return MinecraftItemDescriptor.interned("minecraft:sandstone_wall")
 
 
 def Scaffolding() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:scaffolding")
+    return MinecraftItemDescriptor.interned("minecraft:scaffolding")
 
 
 def ScrapePotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:scrape_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:scrape_pottery_sherd")
 
 
 def Sculk() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sculk")
+    return MinecraftItemDescriptor.interned("minecraft:sculk")
 
 
 def SculkCatalyst() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sculk_catalyst")
+    return MinecraftItemDescriptor.interned("minecraft:sculk_catalyst")
 
 
 def SculkSensor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sculk_sensor")
+    return MinecraftItemDescriptor.interned("minecraft:sculk_sensor")
 
 
 def SculkShrieker() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sculk_shrieker")
+    return MinecraftItemDescriptor.interned("minecraft:sculk_shrieker")
 
 
 def SculkVein() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sculk_vein")
+    return MinecraftItemDescriptor.interned("minecraft:sculk_vein")
 
 
 def SeaLantern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sea_lantern")
+    return MinecraftItemDescriptor.interned("minecraft:sea_lantern")
 
 
 def SeaPickle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sea_pickle")
+    return MinecraftItemDescriptor.interned("minecraft:sea_pickle")
 
 
 def Seagrass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:seagrass")
+    return MinecraftItemDescriptor.interned("minecraft:seagrass")
 
 
 def SentryArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sentry_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:sentry_armor_trim_smithing_template"
+    )
 
 
 def ShaperArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:shaper_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:shaper_armor_trim_smithing_template"
+    )
 
 
 def SheafPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sheaf_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:sheaf_pottery_sherd")
 
 
 def Shears() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:shears")
+    return MinecraftItemDescriptor.interned("minecraft:shears")
 
 
 def SheepSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sheep_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:sheep_spawn_egg")
 
 
 def ShelterPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:shelter_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:shelter_pottery_sherd")
 
 
 def Shield() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:shield")
+    return MinecraftItemDescriptor.interned("minecraft:shield")
 
 
 def ShortDryGrass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:short_dry_grass")
+    return MinecraftItemDescriptor.interned("minecraft:short_dry_grass")
 
 
 def ShortGrass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:short_grass")
+    return MinecraftItemDescriptor.interned("minecraft:short_grass")
 
 
 def Shroomlight() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:shroomlight")
+    return MinecraftItemDescriptor.interned("minecraft:shroomlight")
 
 
 def ShulkerShell() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:shulker_shell")
+    return MinecraftItemDescriptor.interned("minecraft:shulker_shell")
 
 
 def ShulkerSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:shulker_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:shulker_spawn_egg")
 
 
 def SilenceArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:silence_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:silence_armor_trim_smithing_template"
+    )
 
 
 def SilverGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:silver_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:silver_glazed_terracotta")
 
 
 def SilverfishSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:silverfish_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:silverfish_spawn_egg")
 
 
 def SkeletonHorseSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:skeleton_horse_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:skeleton_horse_spawn_egg")
 
 
 def SkeletonSkull() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:skeleton_skull")
+    return MinecraftItemDescriptor.interned("minecraft:skeleton_skull")
 
 
 def SkeletonSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:skeleton_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:skeleton_spawn_egg")
 
 
 def SkullBannerPattern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:skull_banner_pattern")
+    return MinecraftItemDescriptor.interned("minecraft:skull_banner_pattern")
 
 
 def SkullPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:skull_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:skull_pottery_sherd")
 
 
 def Slime() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:slime")
+    return MinecraftItemDescriptor.interned("minecraft:slime")
 
 
 def SlimeBall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:slime_ball")
+    return MinecraftItemDescriptor.interned("minecraft:slime_ball")
 
 
 def SlimeSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:slime_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:slime_spawn_egg")
 
 
 def SmallAmethystBud() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:small_amethyst_bud")
+    return MinecraftItemDescriptor.interned("minecraft:small_amethyst_bud")
 
 
 def SmallDripleafBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:small_dripleaf_block")
+    return MinecraftItemDescriptor.interned("minecraft:small_dripleaf_block")
 
 
 def SmithingTable() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smithing_table")
+    return MinecraftItemDescriptor.interned("minecraft:smithing_table")
 
 
 def Smoker() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smoker")
+    return MinecraftItemDescriptor.interned("minecraft:smoker")
 
 
 def SmoothBasalt() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smooth_basalt")
+    return MinecraftItemDescriptor.interned("minecraft:smooth_basalt")
 
 
 def SmoothQuartz() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smooth_quartz")
+    return MinecraftItemDescriptor.interned("minecraft:smooth_quartz")
 
 
 def SmoothQuartzSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smooth_quartz_slab")
+    return MinecraftItemDescriptor.interned("minecraft:smooth_quartz_slab")
 
 
 def SmoothQuartzStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smooth_quartz_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:smooth_quartz_stairs")
 
 
 def SmoothRedSandstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smooth_red_sandstone")
+    return MinecraftItemDescriptor.interned("minecraft:smooth_red_sandstone")
 
 
 def SmoothRedSandstoneSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smooth_red_sandstone_slab")
+    return MinecraftItemDescriptor.interned("minecraft:smooth_red_sandstone_slab")
 
 
 def SmoothRedSandstoneStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smooth_red_sandstone_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:smooth_red_sandstone_stairs")
 
 
 def SmoothSandstone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smooth_sandstone")
+    return MinecraftItemDescriptor.interned("minecraft:smooth_sandstone")
 
 
 def SmoothSandstoneSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smooth_sandstone_slab")
+    return MinecraftItemDescriptor.interned("minecraft:smooth_sandstone_slab")
 
 
 def SmoothSandstoneStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smooth_sandstone_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:smooth_sandstone_stairs")
 
 
 def SmoothStone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smooth_stone")
+    return MinecraftItemDescriptor.interned("minecraft:smooth_stone")
 
 
 def SmoothStoneSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:smooth_stone_slab")
+    return MinecraftItemDescriptor.interned("minecraft:smooth_stone_slab")
 
 
 def SnifferEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sniffer_egg")
+    return MinecraftItemDescriptor.interned("minecraft:sniffer_egg")
 
 
 def SnifferSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sniffer_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:sniffer_spawn_egg")
 
 
 def SnortPotterySherd() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:snort_pottery_sherd")
+    return MinecraftItemDescriptor.interned("minecraft:snort_pottery_sherd")
 
 
 def SnoutArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:snout_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:snout_armor_trim_smithing_template"
+    )
 
 
 def Snow() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:snow")
+    return MinecraftItemDescriptor.interned("minecraft:snow")
 
 
 def SnowGolemSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:snow_golem_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:snow_golem_spawn_egg")
 
 
 def SnowLayer() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:snow_layer")
+    return MinecraftItemDescriptor.interned("minecraft:snow_layer")
 
 
 def Snowball() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:snowball")
+    return MinecraftItemDescriptor.interned("minecraft:snowball")
 
 
 def SoulCampfire() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:soul_campfire")
+    return MinecraftItemDescriptor.interned("minecraft:soul_campfire")
 
 
 def SoulLantern() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:soul_lantern")
+    return MinecraftItemDescriptor.interned("minecraft:soul_lantern")
 
 
 def SoulSand() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:soul_sand")
+    return MinecraftItemDescriptor.interned("minecraft:soul_sand")
 
 
 def SoulSoil() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:soul_soil")
+    return MinecraftItemDescriptor.interned("minecraft:soul_soil")
 
 
 def SoulTorch() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:soul_torch")
+    return MinecraftItemDescriptor.interned("minecraft:soul_torch")
 
 
 def SpiderEye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spider_eye")
+    return MinecraftItemDescriptor.interned("minecraft:spider_eye")
 
 
 def SpiderSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spider_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:spider_spawn_egg")
 
 
 def SpireArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spire_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:spire_armor_trim_smithing_template"
+    )
 
 
 def SplashPotion() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:splash_potion")
+    return MinecraftItemDescriptor.interned("minecraft:splash_potion")
 
 
 def Sponge() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sponge")
+    return MinecraftItemDescriptor.interned("minecraft:sponge")
 
 
 def SporeBlossom() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spore_blossom")
+    return MinecraftItemDescriptor.interned("minecraft:spore_blossom")
 
 
 def SpruceBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_boat")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_boat")
 
 
 def SpruceButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_button")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_button")
 
 
 def SpruceChestBoat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_chest_boat")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_chest_boat")
 
 
 def SpruceDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_door")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_door")
 
 
 def SpruceFence() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_fence")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_fence")
 
 
 def SpruceFenceGate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_fence_gate")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_fence_gate")
 
 
 def SpruceHangingSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_hanging_sign")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_hanging_sign")
 
 
 def SpruceLeaves() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_leaves")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_leaves")
 
 
 def SpruceLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_log")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_log")
 
 
 def SprucePlanks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_planks")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_planks")
 
 
 def SprucePressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_pressure_plate")
 
 
 def SpruceSapling() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_sapling")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_sapling")
 
 
 def SpruceSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_sign")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_sign")
 
 
 def SpruceSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_slab")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_slab")
 
 
 def SpruceStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_stairs")
 
 
 def SpruceTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_trapdoor")
 
 
 def SpruceWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spruce_wood")
+    return MinecraftItemDescriptor.interned("minecraft:spruce_wood")
 
 
 def Spyglass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:spyglass")
+    return MinecraftItemDescriptor.interned("minecraft:spyglass")
 
 
 def SquidSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:squid_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:squid_spawn_egg")
 
 
 def Stick() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stick")
+    return MinecraftItemDescriptor.interned("minecraft:stick")
 
 
 def StickyPiston() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sticky_piston")
+    return MinecraftItemDescriptor.interned("minecraft:sticky_piston")
 
 
 def Stone() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone")
+    return MinecraftItemDescriptor.interned("minecraft:stone")
 
 
 def StoneAxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone_axe")
+    return MinecraftItemDescriptor.interned("minecraft:stone_axe")
 
 
 def StoneBrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone_brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:stone_brick_slab")
 
 
 def StoneBrickStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone_brick_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:stone_brick_stairs")
 
 
 def StoneBrickWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone_brick_wall")
+    return MinecraftItemDescriptor.interned("minecraft:stone_brick_wall")
 
 
 def StoneBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:stone_bricks")
 
 
 def StoneButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone_button")
+    return MinecraftItemDescriptor.interned("minecraft:stone_button")
 
 
 def StoneHoe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone_hoe")
+    return MinecraftItemDescriptor.interned("minecraft:stone_hoe")
 
 
 def StonePickaxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone_pickaxe")
+    return MinecraftItemDescriptor.interned("minecraft:stone_pickaxe")
 
 
 def StonePressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:stone_pressure_plate")
 
 
 def StoneShovel() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone_shovel")
+    return MinecraftItemDescriptor.interned("minecraft:stone_shovel")
 
 
 def StoneSpear() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone_spear")
+    return MinecraftItemDescriptor.interned("minecraft:stone_spear")
 
 
 def StoneStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:stone_stairs")
 
 
 def StoneSword() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stone_sword")
+    return MinecraftItemDescriptor.interned("minecraft:stone_sword")
 
 
 def StonecutterBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stonecutter_block")
+    return MinecraftItemDescriptor.interned("minecraft:stonecutter_block")
 
 
 def StraySpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stray_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:stray_spawn_egg")
 
 
 def StriderSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:strider_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:strider_spawn_egg")
 
 
 def String() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:string")
+    return MinecraftItemDescriptor.interned("minecraft:string")
 
 
 def StrippedAcaciaLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_acacia_log")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_acacia_log")
 
 
 def StrippedAcaciaWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_acacia_wood")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_acacia_wood")
 
 
 def StrippedBambooBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_bamboo_block")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_bamboo_block")
 
 
 def StrippedBirchLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_birch_log")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_birch_log")
 
 
 def StrippedBirchWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_birch_wood")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_birch_wood")
 
 
 def StrippedCherryLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_cherry_log")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_cherry_log")
 
 
 def StrippedCherryWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_cherry_wood")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_cherry_wood")
 
 
 def StrippedCrimsonHyphae() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_crimson_hyphae")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_crimson_hyphae")
 
 
 def StrippedCrimsonStem() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_crimson_stem")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_crimson_stem")
 
 
 def StrippedDarkOakLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_dark_oak_log")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_dark_oak_log")
 
 
 def StrippedDarkOakWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_dark_oak_wood")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_dark_oak_wood")
 
 
 def StrippedJungleLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_jungle_log")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_jungle_log")
 
 
 def StrippedJungleWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_jungle_wood")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_jungle_wood")
 
 
 def StrippedMangroveLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_mangrove_log")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_mangrove_log")
 
 
 def StrippedMangroveWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_mangrove_wood")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_mangrove_wood")
 
 
 def StrippedOakLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_oak_log")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_oak_log")
 
 
 def StrippedOakWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_oak_wood")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_oak_wood")
 
 
 def StrippedPaleOakLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_pale_oak_log")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_pale_oak_log")
 
 
 def StrippedPaleOakWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_pale_oak_wood")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_pale_oak_wood")
 
 
 def StrippedSpruceLog() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_spruce_log")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_spruce_log")
 
 
 def StrippedSpruceWood() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_spruce_wood")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_spruce_wood")
 
 
 def StrippedWarpedHyphae() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_warped_hyphae")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_warped_hyphae")
 
 
 def StrippedWarpedStem() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:stripped_warped_stem")
+    return MinecraftItemDescriptor.interned("minecraft:stripped_warped_stem")
 
 
 def StructureBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:structure_block")
+    return MinecraftItemDescriptor.interned("minecraft:structure_block")
 
 
 def StructureVoid() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:structure_void")
+    return MinecraftItemDescriptor.interned("minecraft:structure_void")
 
 
 def Sugar() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sugar")
+    return MinecraftItemDescriptor.interned("minecraft:sugar")
 
 
 def SugarCane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sugar_cane")
+    return MinecraftItemDescriptor.interned("minecraft:sugar_cane")
 
 
 def Sulfur() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sulfur")
+    return MinecraftItemDescriptor.interned("minecraft:sulfur")
 
 
 def SulfurBrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sulfur_brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:sulfur_brick_slab")
 
 
 def SulfurBrickStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sulfur_brick_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:sulfur_brick_stairs")
 
 
 def SulfurBrickWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sulfur_brick_wall")
+    return MinecraftItemDescriptor.interned("minecraft:sulfur_brick_wall")
 
 
 def SulfurBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sulfur_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:sulfur_bricks")
 
 
 def SulfurCubeBucket() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sulfur_cube_bucket")
+    return MinecraftItemDescriptor.interned("minecraft:sulfur_cube_bucket")
 
 
 def SulfurCubeSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sulfur_cube_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:sulfur_cube_spawn_egg")
 
 
 def SulfurSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sulfur_slab")
+    return MinecraftItemDescriptor.interned("minecraft:sulfur_slab")
 
 
 def SulfurSpike() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sulfur_spike")
+    return MinecraftItemDescriptor.interned("minecraft:sulfur_spike")
 
 
 def SulfurStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sulfur_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:sulfur_stairs")
 
 
 def SulfurWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sulfur_wall")
+    return MinecraftItemDescriptor.interned("minecraft:sulfur_wall")
 
 
 def Sunflower() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sunflower")
+    return MinecraftItemDescriptor.interned("minecraft:sunflower")
 
 
 def SuspiciousGravel() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:suspicious_gravel")
+    return MinecraftItemDescriptor.interned("minecraft:suspicious_gravel")
 
 
 def SuspiciousSand() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:suspicious_sand")
+    return MinecraftItemDescriptor.interned("minecraft:suspicious_sand")
 
 
 def SuspiciousStew() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:suspicious_stew")
+    return MinecraftItemDescriptor.interned("minecraft:suspicious_stew")
 
 
 def SweetBerries() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:sweet_berries")
+    return MinecraftItemDescriptor.interned("minecraft:sweet_berries")
 
 
 def TadpoleBucket() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tadpole_bucket")
+    return MinecraftItemDescriptor.interned("minecraft:tadpole_bucket")
 
 
 def TadpoleSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tadpole_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:tadpole_spawn_egg")
 
 
 def TallDryGrass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tall_dry_grass")
+    return MinecraftItemDescriptor.interned("minecraft:tall_dry_grass")
 
 
 def TallGrass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tall_grass")
+    return MinecraftItemDescriptor.interned("minecraft:tall_grass")
 
 
 def Target() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:target")
+    return MinecraftItemDescriptor.interned("minecraft:target")
 
 
 def TideArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tide_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:tide_armor_trim_smithing_template"
+    )
 
 
 def TintedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tinted_glass")
+    return MinecraftItemDescriptor.interned("minecraft:tinted_glass")
 
 
 def Tnt() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tnt")
+    return MinecraftItemDescriptor.interned("minecraft:tnt")
 
 
 def TntMinecart() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tnt_minecart")
+    return MinecraftItemDescriptor.interned("minecraft:tnt_minecart")
 
 
 def Torch() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:torch")
+    return MinecraftItemDescriptor.interned("minecraft:torch")
 
 
 def Torchflower() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:torchflower")
+    return MinecraftItemDescriptor.interned("minecraft:torchflower")
 
 
 def TorchflowerSeeds() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:torchflower_seeds")
+    return MinecraftItemDescriptor.interned("minecraft:torchflower_seeds")
 
 
 def TotemOfUndying() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:totem_of_undying")
+    return MinecraftItemDescriptor.interned("minecraft:totem_of_undying")
 
 
 def TraderLlamaSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:trader_llama_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:trader_llama_spawn_egg")
 
 
 def Trapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:trapdoor")
 
 
 def TrappedChest() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:trapped_chest")
+    return MinecraftItemDescriptor.interned("minecraft:trapped_chest")
 
 
 def TrialKey() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:trial_key")
+    return MinecraftItemDescriptor.interned("minecraft:trial_key")
 
 
 def TrialSpawner() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:trial_spawner")
+    return MinecraftItemDescriptor.interned("minecraft:trial_spawner")
 
 
 def Trident() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:trident")
+    return MinecraftItemDescriptor.interned("minecraft:trident")
 
 
 def TripwireHook() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tripwire_hook")
+    return MinecraftItemDescriptor.interned("minecraft:tripwire_hook")
 
 
 def TropicalFish() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tropical_fish")
+    return MinecraftItemDescriptor.interned("minecraft:tropical_fish")
 
 
 def TropicalFishBucket() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tropical_fish_bucket")
+    return MinecraftItemDescriptor.interned("minecraft:tropical_fish_bucket")
 
 
 def TropicalFishSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tropical_fish_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:tropical_fish_spawn_egg")
 
 
 def TubeCoral() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tube_coral")
+    return MinecraftItemDescriptor.interned("minecraft:tube_coral")
 
 
 def TubeCoralBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tube_coral_block")
+    return MinecraftItemDescriptor.interned("minecraft:tube_coral_block")
 
 
 def TubeCoralFan() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tube_coral_fan")
+    return MinecraftItemDescriptor.interned("minecraft:tube_coral_fan")
 
 
 def Tuff() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tuff")
+    return MinecraftItemDescriptor.interned("minecraft:tuff")
 
 
 def TuffBrickSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tuff_brick_slab")
+    return MinecraftItemDescriptor.interned("minecraft:tuff_brick_slab")
 
 
 def TuffBrickStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tuff_brick_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:tuff_brick_stairs")
 
 
 def TuffBrickWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tuff_brick_wall")
+    return MinecraftItemDescriptor.interned("minecraft:tuff_brick_wall")
 
 
 def TuffBricks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tuff_bricks")
+    return MinecraftItemDescriptor.interned("minecraft:tuff_bricks")
 
 
 def TuffSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tuff_slab")
+    return MinecraftItemDescriptor.interned("minecraft:tuff_slab")
 
 
 def TuffStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tuff_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:tuff_stairs")
 
 
 def TuffWall() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:tuff_wall")
+    return MinecraftItemDescriptor.interned("minecraft:tuff_wall")
 
 
 def TurtleEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:turtle_egg")
+    return MinecraftItemDescriptor.interned("minecraft:turtle_egg")
 
 
 def TurtleHelmet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:turtle_helmet")
+    return MinecraftItemDescriptor.interned("minecraft:turtle_helmet")
 
 
 def TurtleScute() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:turtle_scute")
+    return MinecraftItemDescriptor.interned("minecraft:turtle_scute")
 
 
 def TurtleSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:turtle_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:turtle_spawn_egg")
 
 
 def TwistingVines() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:twisting_vines")
+    return MinecraftItemDescriptor.interned("minecraft:twisting_vines")
 
 
 def UndyedShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:undyed_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:undyed_shulker_box")
 
 
 def Vault() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:vault")
+    return MinecraftItemDescriptor.interned("minecraft:vault")
 
 
 def VerdantFroglight() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:verdant_froglight")
+    return MinecraftItemDescriptor.interned("minecraft:verdant_froglight")
 
 
 def VexArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:vex_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:vex_armor_trim_smithing_template"
+    )
 
 
 def VexSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:vex_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:vex_spawn_egg")
 
 
 def VillagerSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:villager_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:villager_spawn_egg")
 
 
 def VindicatorSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:vindicator_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:vindicator_spawn_egg")
 
 
 def Vine() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:vine")
+    return MinecraftItemDescriptor.interned("minecraft:vine")
 
 
 def WanderingTraderSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wandering_trader_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:wandering_trader_spawn_egg")
 
 
 def WardArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:ward_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:ward_armor_trim_smithing_template"
+    )
 
 
 def WardenSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warden_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:warden_spawn_egg")
 
 
 def WarpedButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_button")
+    return MinecraftItemDescriptor.interned("minecraft:warped_button")
 
 
 def WarpedDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_door")
+    return MinecraftItemDescriptor.interned("minecraft:warped_door")
 
 
 def WarpedFence() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_fence")
+    return MinecraftItemDescriptor.interned("minecraft:warped_fence")
 
 
 def WarpedFenceGate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_fence_gate")
+    return MinecraftItemDescriptor.interned("minecraft:warped_fence_gate")
 
 
 def WarpedFungus() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_fungus")
+    return MinecraftItemDescriptor.interned("minecraft:warped_fungus")
 
 
 def WarpedFungusOnAStick() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_fungus_on_a_stick")
+    return MinecraftItemDescriptor.interned("minecraft:warped_fungus_on_a_stick")
 
 
 def WarpedHangingSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_hanging_sign")
+    return MinecraftItemDescriptor.interned("minecraft:warped_hanging_sign")
 
 
 def WarpedHyphae() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_hyphae")
+    return MinecraftItemDescriptor.interned("minecraft:warped_hyphae")
 
 
 def WarpedNylium() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_nylium")
+    return MinecraftItemDescriptor.interned("minecraft:warped_nylium")
 
 
 def WarpedPlanks() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_planks")
+    return MinecraftItemDescriptor.interned("minecraft:warped_planks")
 
 
 def WarpedPressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:warped_pressure_plate")
 
 
 def WarpedRoots() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_roots")
+    return MinecraftItemDescriptor.interned("minecraft:warped_roots")
 
 
 def WarpedSign() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_sign")
+    return MinecraftItemDescriptor.interned("minecraft:warped_sign")
 
 
 def WarpedSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_slab")
+    return MinecraftItemDescriptor.interned("minecraft:warped_slab")
 
 
 def WarpedStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:warped_stairs")
 
 
 def WarpedStem() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_stem")
+    return MinecraftItemDescriptor.interned("minecraft:warped_stem")
 
 
 def WarpedTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:warped_trapdoor")
 
 
 def WarpedWartBlock() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:warped_wart_block")
+    return MinecraftItemDescriptor.interned("minecraft:warped_wart_block")
 
 
 def WaterBucket() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:water_bucket")
+    return MinecraftItemDescriptor.interned("minecraft:water_bucket")
 
 
 def Waterlily() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waterlily")
+    return MinecraftItemDescriptor.interned("minecraft:waterlily")
 
 
 def WaxedChiseledCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_chiseled_copper")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_chiseled_copper")
 
 
 def WaxedCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_copper")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_copper")
 
 
 def WaxedCopperBulb() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_copper_bulb")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_copper_bulb")
 
 
 def WaxedCopperChest() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_copper_chest")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_copper_chest")
 
 
 def WaxedCopperDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_copper_door")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_copper_door")
 
 
 def WaxedCopperGrate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_copper_grate")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_copper_grate")
 
 
 def WaxedCopperTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_copper_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_copper_trapdoor")
 
 
 def WaxedCutCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_cut_copper")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_cut_copper")
 
 
 def WaxedCutCopperSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_cut_copper_slab")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_cut_copper_slab")
 
 
 def WaxedCutCopperStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_cut_copper_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_cut_copper_stairs")
 
 
 def WaxedExposedChiseledCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_exposed_chiseled_copper")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_exposed_chiseled_copper")
 
 
 def WaxedExposedCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_exposed_copper")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_exposed_copper")
 
 
 def WaxedExposedCopperBulb() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_exposed_copper_bulb")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_exposed_copper_bulb")
 
 
 def WaxedExposedCopperChest() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_exposed_copper_chest")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_exposed_copper_chest")
 
 
 def WaxedExposedCopperDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_exposed_copper_door")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_exposed_copper_door")
 
 
 def WaxedExposedCopperGrate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_exposed_copper_grate")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_exposed_copper_grate")
 
 
 def WaxedExposedCopperTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_exposed_copper_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_exposed_copper_trapdoor")
 
 
 def WaxedExposedCutCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_exposed_cut_copper")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_exposed_cut_copper")
 
 
 def WaxedExposedCutCopperSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_exposed_cut_copper_slab")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_exposed_cut_copper_slab")
 
 
 def WaxedExposedCutCopperStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_exposed_cut_copper_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_exposed_cut_copper_stairs")
 
 
 def WaxedOxidizedChiseledCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_oxidized_chiseled_copper")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_oxidized_chiseled_copper")
 
 
 def WaxedOxidizedCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_oxidized_copper")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_oxidized_copper")
 
 
 def WaxedOxidizedCopperBulb() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_oxidized_copper_bulb")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_oxidized_copper_bulb")
 
 
 def WaxedOxidizedCopperChest() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_oxidized_copper_chest")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_oxidized_copper_chest")
 
 
 def WaxedOxidizedCopperDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_oxidized_copper_door")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_oxidized_copper_door")
 
 
 def WaxedOxidizedCopperGrate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_oxidized_copper_grate")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_oxidized_copper_grate")
 
 
 def WaxedOxidizedCopperTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_oxidized_copper_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_oxidized_copper_trapdoor")
 
 
 def WaxedOxidizedCutCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_oxidized_cut_copper")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_oxidized_cut_copper")
 
 
 def WaxedOxidizedCutCopperSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_oxidized_cut_copper_slab")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_oxidized_cut_copper_slab")
 
 
 def WaxedOxidizedCutCopperStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_oxidized_cut_copper_stairs")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:waxed_oxidized_cut_copper_stairs"
+    )
 
 
 def WaxedWeatheredChiseledCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_weathered_chiseled_copper")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_weathered_chiseled_copper")
 
 
 def WaxedWeatheredCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_weathered_copper")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_weathered_copper")
 
 
 def WaxedWeatheredCopperBulb() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_weathered_copper_bulb")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_weathered_copper_bulb")
 
 
 def WaxedWeatheredCopperChest() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_weathered_copper_chest")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_weathered_copper_chest")
 
 
 def WaxedWeatheredCopperDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_weathered_copper_door")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_weathered_copper_door")
 
 
 def WaxedWeatheredCopperGrate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_weathered_copper_grate")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_weathered_copper_grate")
 
 
 def WaxedWeatheredCopperTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_weathered_copper_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_weathered_copper_trapdoor")
 
 
 def WaxedWeatheredCutCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_weathered_cut_copper")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_weathered_cut_copper")
 
 
 def WaxedWeatheredCutCopperSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_weathered_cut_copper_slab")
+    return MinecraftItemDescriptor.interned("minecraft:waxed_weathered_cut_copper_slab")
 
 
 def WaxedWeatheredCutCopperStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:waxed_weathered_cut_copper_stairs")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:waxed_weathered_cut_copper_stairs"
+    )
 
 
 def WayfinderArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wayfinder_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:wayfinder_armor_trim_smithing_template"
+    )
 
 
 def WeatheredChiseledCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:weathered_chiseled_copper")
+    return MinecraftItemDescriptor.interned("minecraft:weathered_chiseled_copper")
 
 
 def WeatheredCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:weathered_copper")
+    return MinecraftItemDescriptor.interned("minecraft:weathered_copper")
 
 
 def WeatheredCopperBulb() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:weathered_copper_bulb")
+    return MinecraftItemDescriptor.interned("minecraft:weathered_copper_bulb")
 
 
 def WeatheredCopperChest() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:weathered_copper_chest")
+    return MinecraftItemDescriptor.interned("minecraft:weathered_copper_chest")
 
 
 def WeatheredCopperDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:weathered_copper_door")
+    return MinecraftItemDescriptor.interned("minecraft:weathered_copper_door")
 
 
 def WeatheredCopperGrate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:weathered_copper_grate")
+    return MinecraftItemDescriptor.interned("minecraft:weathered_copper_grate")
 
 
 def WeatheredCopperTrapdoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:weathered_copper_trapdoor")
+    return MinecraftItemDescriptor.interned("minecraft:weathered_copper_trapdoor")
 
 
 def WeatheredCutCopper() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:weathered_cut_copper")
+    return MinecraftItemDescriptor.interned("minecraft:weathered_cut_copper")
 
 
 def WeatheredCutCopperSlab() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:weathered_cut_copper_slab")
+    return MinecraftItemDescriptor.interned("minecraft:weathered_cut_copper_slab")
 
 
 def WeatheredCutCopperStairs() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:weathered_cut_copper_stairs")
+    return MinecraftItemDescriptor.interned("minecraft:weathered_cut_copper_stairs")
 
 
 def Web() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:web")
+    return MinecraftItemDescriptor.interned("minecraft:web")
 
 
 def WeepingVines() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:weeping_vines")
+    return MinecraftItemDescriptor.interned("minecraft:weeping_vines")
 
 
 def WetSponge() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wet_sponge")
+    return MinecraftItemDescriptor.interned("minecraft:wet_sponge")
 
 
 def Wheat() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wheat")
+    return MinecraftItemDescriptor.interned("minecraft:wheat")
 
 
 def WheatSeeds() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wheat_seeds")
+    return MinecraftItemDescriptor.interned("minecraft:wheat_seeds")
 
 
 def WhiteBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:white_bundle")
 
 
 def WhiteCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_candle")
+    return MinecraftItemDescriptor.interned("minecraft:white_candle")
 
 
 def WhiteCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:white_carpet")
 
 
 def WhiteConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:white_concrete")
 
 
 def WhiteConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:white_concrete_powder")
 
 
 def WhiteDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_dye")
+    return MinecraftItemDescriptor.interned("minecraft:white_dye")
 
 
 def WhiteGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:white_glazed_terracotta")
 
 
 def WhiteHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_harness")
+    return MinecraftItemDescriptor.interned("minecraft:white_harness")
 
 
 def WhiteShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:white_shulker_box")
 
 
 def WhiteStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:white_stained_glass")
 
 
 def WhiteStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:white_stained_glass_pane")
 
 
 def WhiteTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:white_terracotta")
 
 
 def WhiteTulip() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_tulip")
+    return MinecraftItemDescriptor.interned("minecraft:white_tulip")
 
 
 def WhiteWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:white_wool")
+    return MinecraftItemDescriptor.interned("minecraft:white_wool")
 
 
 def WildArmorTrimSmithingTemplate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wild_armor_trim_smithing_template")
+    return MinecraftItemDescriptor.interned(
+        "minecraft:wild_armor_trim_smithing_template"
+    )
 
 
 def Wildflowers() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wildflowers")
+    return MinecraftItemDescriptor.interned("minecraft:wildflowers")
 
 
 def WindCharge() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wind_charge")
+    return MinecraftItemDescriptor.interned("minecraft:wind_charge")
 
 
 def WitchSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:witch_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:witch_spawn_egg")
 
 
 def WitherRose() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wither_rose")
+    return MinecraftItemDescriptor.interned("minecraft:wither_rose")
 
 
 def WitherSkeletonSkull() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wither_skeleton_skull")
+    return MinecraftItemDescriptor.interned("minecraft:wither_skeleton_skull")
 
 
 def WitherSkeletonSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wither_skeleton_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:wither_skeleton_spawn_egg")
 
 
 def WitherSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wither_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:wither_spawn_egg")
 
 
 def WolfArmor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wolf_armor")
+    return MinecraftItemDescriptor.interned("minecraft:wolf_armor")
 
 
 def WolfSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wolf_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:wolf_spawn_egg")
 
 
 def WoodenAxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wooden_axe")
+    return MinecraftItemDescriptor.interned("minecraft:wooden_axe")
 
 
 def WoodenButton() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wooden_button")
+    return MinecraftItemDescriptor.interned("minecraft:wooden_button")
 
 
 def WoodenDoor() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wooden_door")
+    return MinecraftItemDescriptor.interned("minecraft:wooden_door")
 
 
 def WoodenHoe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wooden_hoe")
+    return MinecraftItemDescriptor.interned("minecraft:wooden_hoe")
 
 
 def WoodenPickaxe() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wooden_pickaxe")
+    return MinecraftItemDescriptor.interned("minecraft:wooden_pickaxe")
 
 
 def WoodenPressurePlate() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wooden_pressure_plate")
+    return MinecraftItemDescriptor.interned("minecraft:wooden_pressure_plate")
 
 
 def WoodenShovel() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wooden_shovel")
+    return MinecraftItemDescriptor.interned("minecraft:wooden_shovel")
 
 
 def WoodenSpear() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wooden_spear")
+    return MinecraftItemDescriptor.interned("minecraft:wooden_spear")
 
 
 def WoodenSword() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:wooden_sword")
+    return MinecraftItemDescriptor.interned("minecraft:wooden_sword")
 
 
 def WritableBook() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:writable_book")
+    return MinecraftItemDescriptor.interned("minecraft:writable_book")
 
 
 def YellowBundle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:yellow_bundle")
+    return MinecraftItemDescriptor.interned("minecraft:yellow_bundle")
 
 
 def YellowCandle() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:yellow_candle")
+    return MinecraftItemDescriptor.interned("minecraft:yellow_candle")
 
 
 def YellowCarpet() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:yellow_carpet")
+    return MinecraftItemDescriptor.interned("minecraft:yellow_carpet")
 
 
 def YellowConcrete() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:yellow_concrete")
+    return MinecraftItemDescriptor.interned("minecraft:yellow_concrete")
 
 
 def YellowConcretePowder() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:yellow_concrete_powder")
+    return MinecraftItemDescriptor.interned("minecraft:yellow_concrete_powder")
 
 
 def YellowDye() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:yellow_dye")
+    return MinecraftItemDescriptor.interned("minecraft:yellow_dye")
 
 
 def YellowGlazedTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:yellow_glazed_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:yellow_glazed_terracotta")
 
 
 def YellowHarness() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:yellow_harness")
+    return MinecraftItemDescriptor.interned("minecraft:yellow_harness")
 
 
 def YellowShulkerBox() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:yellow_shulker_box")
+    return MinecraftItemDescriptor.interned("minecraft:yellow_shulker_box")
 
 
 def YellowStainedGlass() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:yellow_stained_glass")
+    return MinecraftItemDescriptor.interned("minecraft:yellow_stained_glass")
 
 
 def YellowStainedGlassPane() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:yellow_stained_glass_pane")
+    return MinecraftItemDescriptor.interned("minecraft:yellow_stained_glass_pane")
 
 
 def YellowTerracotta() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:yellow_terracotta")
+    return MinecraftItemDescriptor.interned("minecraft:yellow_terracotta")
 
 
 def YellowWool() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:yellow_wool")
+    return MinecraftItemDescriptor.interned("minecraft:yellow_wool")
 
 
 def ZoglinSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:zoglin_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:zoglin_spawn_egg")
 
 
 def ZombieHead() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:zombie_head")
+    return MinecraftItemDescriptor.interned("minecraft:zombie_head")
 
 
 def ZombieHorseSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:zombie_horse_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:zombie_horse_spawn_egg")
 
 
 def ZombieNautilusSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:zombie_nautilus_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:zombie_nautilus_spawn_egg")
 
 
 def ZombiePigmanSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:zombie_pigman_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:zombie_pigman_spawn_egg")
 
 
 def ZombieSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:zombie_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:zombie_spawn_egg")
 
 
 def ZombieVillagerSpawnEgg() -> MinecraftItemDescriptor:
-    return MinecraftItemDescriptor("minecraft:zombie_villager_spawn_egg")
+    return MinecraftItemDescriptor.interned("minecraft:zombie_villager_spawn_egg")
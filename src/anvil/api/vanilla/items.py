@@ -1,8 +1,14 @@
 from enum import StrEnum
+from typing import TYPE_CHECKING
 
 from anvil.lib.config import CONFIG
 
-from .factories import minecraft_items as MinecraftItemTypes
+from .factories import LazyFactories
+
+if TYPE_CHECKING:
+    from .factories import minecraft_items as MinecraftItemTypes
+else:
+    MinecraftItemTypes = LazyFactories(f"{__package__}.factories.minecraft_items")
 
 __all__ = ["MinecraftItemTypes", "MinecraftItemTags"]
 
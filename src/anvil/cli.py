@@ -4,9 +4,11 @@ from click_aliases import ClickAliasedGroup
 from .cli_commands.clear_cmd import clear
 from .cli_commands.init_cmd import init
 from .cli_commands.loopback_cmd import loopback
+from .cli_commands.molang_cmd import molang
 from .cli_commands.process_sounds import process_sounds
 from .cli_commands.profile_cmd import profile
 from .cli_commands.build_cmd import build
+from .cli_commands.watch_cmd import watch
 
 
 @click.group(cls=ClickAliasedGroup)
@@ -21,7 +23,9 @@ def cli() -> None:
 
 cli.add_command(init, aliases=["create"])
 cli.add_command(build, aliases=["run"])
+cli.add_command(watch, aliases=["dev"])
 cli.add_command(clear, aliases=["clean"])
 cli.add_command(profile, aliases=["prof"])
 cli.add_command(process_sounds, aliases=["sounds"])
 cli.add_command(loopback, aliases=["lb"])
+cli.add_command(molang)
@@ -12,7 +12,7 @@ from anvil.lib.lib import process_subcommand
     is_flag=True,
     default=False,
     show_default=True,
-    help="Skip archive steps (zip, mcaddon, etc.).",
+    help="Only bundle the scripts and write the pack manifests.",
 )
 @click.option(
     "--noarch",
@@ -77,6 +77,78 @@ from anvil.lib.lib import process_subcommand
     show_default=True,
     help="Compile a clean new build (Clears previous build artifacts).",
 )
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Only rewrite files whose content changed since the previous build.",
+)
+@click.option(
+    "--optimize-molang",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Fold constants and minify the project's Molang expressions.",
+)
+@click.option(
+    "--hoist-molang",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Evaluate Molang subexpressions repeated by a client actor once per frame.",
+)
+@click.option(
+    "--consolidate",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Merge the animation, animation controller, render controller and geometry files of all actors into shared files.",
+)
+@click.option(
+    "--dedupe",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Share one copy of identical geometries, animations and controllers between client actors.",
+)
+@click.option(
+    "--tick-report",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Print the entities and component groups with the highest estimated per tick cost.",
+)
+@click.option(
+    "--permutation-report",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Print the runtime states of each block and how its permutations cover them.",
+)
+@click.option(
+    "--worldgen-report",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Simulate the feature rules and print their placement attempts per chunk.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of workers used to write exported files.",
+)
+@click.option(
+    "--profile",
+    type=click.Choice(["json", "speedscope"]),
+    is_flag=False,
+    flag_value="json",
+    default=None,
+    help="Print a timing report of the build and save it as JSON or speedscope.",
+)
 def build(
     js_only: bool,
     nocompile: bool,
@@ -88,6 +160,16 @@ def build(
     workflow: bool,
     minify: bool,
     clean: bool,
+    incremental: bool,
+    optimize_molang: bool,
+    hoist_molang: bool,
+    consolidate: bool,
+    dedupe: bool,
+    tick_report: bool,
+    permutation_report: bool,
+    worldgen_report: bool,
+    jobs: int,
+    profile: str | None,
 ) -> None:
     if not os.path.exists("anvilconfig.json"):
         click.echo(
@@ -130,6 +212,26 @@ def build(
         command.append("--minify")
     if clean:
         command.append("--clean")
+    if incremental:
+        command.append("--incremental")
+    if optimize_molang:
+        command.append("--optimize-molang")
+    if hoist_molang:
+        command.append("--hoist-molang")
+    if consolidate:
+        command.append("--consolidate")
+    if dedupe:
+        command.append("--dedupe")
+    if tick_report:
+        command.append("--tick-report")
+    if permutation_report:
+        command.append("--permutation-report")
+    if worldgen_report:
+        command.append("--worldgen-report")
+    if jobs > 1:
+        command.append(f"--jobs {jobs}")
+    if profile:
+        command.append(f"--profile {profile}")
 
     process_subcommand(
         " ".join(command),
@@ -0,0 +1,126 @@
+import click
+from click_aliases import ClickAliasedGroup
+
+from anvil.api.logic.molang_ast import MolangSyntaxError
+from anvil.api.logic.molang_eval import (
+    MolangContext,
+    MolangEvaluationError,
+    benchmark,
+    pack_costs,
+)
+
+
+def _values(pairs: tuple[str, ...]) -> dict:
+    values = {}
+    for pair in pairs:
+        name, separator, value = pair.partition("=")
+        if not separator:
+            raise click.BadParameter(f"Expected NAME=VALUE, found '{pair}'.")
+        try:
+            values[name] = float(value)
+        except ValueError:
+            values[name] = value.strip("'")
+    return values
+
+
+@click.group(cls=ClickAliasedGroup, help="Evaluate and measure Molang offline.")
+def molang() -> None:
+    pass
+
+
+@molang.command("eval", help="Evaluate a Molang expression against mock queries.")
+@click.argument("expression")
+@click.option(
+    "--query",
+    "-q",
+    "queries",
+    multiple=True,
+    metavar="NAME=VALUE",
+    help="A query value, such as `-q is_baby=1`.",
+)
+@click.option(
+    "--variable",
+    "-v",
+    "variables",
+    multiple=True,
+    metavar="NAME=VALUE",
+    help="A variable value, such as `-v attack_time=0.5`.",
+)
+@click.option(
+    "--repeat",
+    default=1000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of timed evaluations.",
+)
+def evaluate(
+    expression: str, queries: tuple[str], variables: tuple[str], repeat: int
+) -> None:
+    context = MolangContext(_values(queries), _values(variables))
+    try:
+        result = benchmark(expression, context, repeat)
+    except (MolangSyntaxError, MolangEvaluationError) as error:
+        raise click.ClickException(str(error))
+
+    click.echo(f"Value:      {result.value}")
+    click.echo(f"Operations: {result.cost.operations}")
+    click.echo(f"Queries:    {result.cost.queries}")
+    click.echo(f"Time:       {result.seconds * 1e6:.2f} us")
+
+
+@molang.command(
+    "cost",
+    help="Rank the Molang of the animation and render controllers of packs by estimated cost.",
+)
+@click.argument(
+    "paths", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=True)
+)
+@click.option(
+    "--max-operations",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Fail when an expression is estimated to run more operations.",
+)
+@click.option(
+    "--max-queries",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Fail when an expression is estimated to read more queries.",
+)
+@click.option(
+    "--top",
+    default=10,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Number of expressions listed.",
+)
+def cost(
+    paths: tuple[str],
+    max_operations: int | None,
+    max_queries: int | None,
+    top: int,
+) -> None:
+    costs = pack_costs(list(paths))
+    for location, expression, estimated in costs[:top]:
+        click.echo(
+            f"{estimated.operations:6d} ops {estimated.queries:4d} queries  {location}"
+        )
+        click.echo(
+            f"    {expression if len(expression) <= 100 else expression[:97] + '...'}"
+        )
+
+    over = [
+        (location, estimated)
+        for location, _, estimated in costs
+        if (max_operations is not None and estimated.operations > max_operations)
+        or (max_queries is not None and estimated.queries > max_queries)
+    ]
+    if over:
+        for location, estimated in over:
+            click.echo(
+                click.style(
+                    f"[ERROR]: {location} is over budget ({estimated.operations} operations, {estimated.queries} queries).",
+                    fg="red",
+                )
+            )
+        raise SystemExit(1)
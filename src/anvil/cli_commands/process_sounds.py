@@ -1,30 +1,36 @@
+import hashlib
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable
 
 import click
+import orjson
 
 DEFAULT_TARGET_LUFS = -18
 DEFAULT_SAMPLE_RATE = "32000"
 DEFAULT_QUALITY = "0"
 
+# Files already processed, keyed by output path, see `is_processed`.
+MANIFEST_PATH = Path(".anvil") / "sound_manifest.json"
 
-def process_file(
+
+def ffmpeg_encode(
     input_file: Path,
     output_file: Path,
-    relative_path: Path,
     target_lufs: float,
     sample_rate: str,
     quality: str,
-) -> str:
-
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write to a temporary file first
-    temp_output: Path = output_file.with_suffix(".tmp.ogg")
+) -> None:
+    """Normalizes and encodes one file to mono Vorbis.
 
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails.
+    """
     ffmpeg_cmd: list[str] = [
         "ffmpeg",
+        # Files are encoded in parallel, one thread each.
         "-threads",
         "1",
         "-i",
@@ -45,26 +51,92 @@ def process_file(
         "+bitexact",
         "-flags:a",
         "+bitexact",
-        str(temp_output),
+        str(output_file),
         "-y",
     ]
+    subprocess.run(ffmpeg_cmd, check=True, capture_output=True)
 
+
+def file_hash(path: Path) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def load_manifest() -> dict[str, dict]:
     try:
-        subprocess.run(ffmpeg_cmd, check=True, capture_output=True)
+        return orjson.loads(MANIFEST_PATH.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest: dict[str, dict]) -> None:
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST_PATH.write_bytes(
+        orjson.dumps(manifest, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+    )
+
+
+def is_processed(
+    entry: dict | None,
+    settings: dict,
+    input_file: Path,
+    output_file: Path,
+    source_hash: str,
+) -> bool:
+    """Checks whether a file was already processed with the same settings.
+
+    Parameters:
+        entry (dict | None): The manifest entry of the output file.
+        settings (dict): The LUFS target, sample rate and quality of this run.
+        input_file (Path): The source file.
+        output_file (Path): The file the source is encoded to.
+        source_hash (str): The hash of the source file.
+    """
+    if entry is None or entry.get("settings") != settings:
+        return False
+    if not output_file.exists() or file_hash(output_file) != entry["output"]:
+        return False
+    # A file processed in place is its own output.
+    return input_file == output_file or source_hash == entry["source"]
+
+
+def process_file(
+    input_file: Path,
+    output_file: Path,
+    relative_path: Path,
+    target_lufs: float,
+    sample_rate: str,
+    quality: str,
+    encoder: Callable[[Path, Path, float, str, str], None] = ffmpeg_encode,
+) -> tuple[bool, str]:
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first
+    temp_output: Path = output_file.with_suffix(".tmp.ogg")
+
+    try:
+        encoder(input_file, temp_output, target_lufs, sample_rate, quality)
         # Replace the original file with the processed temp file
         temp_output.replace(output_file)
-        return f"Processed: {relative_path}"
+        return True, f"Processed: {relative_path}"
     except subprocess.CalledProcessError as e:
         if temp_output.exists():
             temp_output.unlink()
-        return f"Error {relative_path}: {e.stderr.decode()}"
+        stderr = e.stderr.decode() if isinstance(e.stderr, bytes) else e.stderr
+        return False, f"Error {relative_path}: {stderr}"
+    except OSError as e:
+        if temp_output.exists():
+            temp_output.unlink()
+        return False, f"Error {relative_path}: {e}"
 
 
 @click.command(
     "process-sounds",
     help="Batch process and normalize audio files in assets/sounds (DESTRUCTIVE: overwrites originals).",
 )
-# Removed threads option
 @click.option(
     "--target-lufs",
     default=DEFAULT_TARGET_LUFS,
@@ -84,9 +156,84 @@ def process_file(
     show_default=True,
     help="Vorbis quality (0-10, higher is better).",
 )
-def process_sounds(target_lufs, sample_rate, quality) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    default=os.cpu_count() or 1,
+    show_default="CPU count",
+    type=click.IntRange(min=1),
+    help="Number of files encoded at once.",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Process every file, even the ones already processed with the same settings.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="List the files that would be processed without changing them.",
+)
+def process_sounds(target_lufs, sample_rate, quality, jobs, force, dry_run) -> None:
     input_root = Path("assets/sounds")
     output_root = Path("assets/sounds")
+    settings = {
+        "target_lufs": target_lufs,
+        "sample_rate": str(sample_rate),
+        "quality": str(quality),
+    }
+    manifest = load_manifest()
+
+    pending: list[tuple[Path, Path, Path, str]] = []
+    skipped = 0
+    for root, _, files in os.walk(input_root):
+        for filename in files:
+            # Temporary outputs left behind by an interrupted run are not sources.
+            if filename.lower().endswith(".tmp.ogg"):
+                continue
+            if filename.lower().endswith((".wav", ".mp3", ".ogg")):
+                input_file: Path = Path(root) / filename
+                # The .ogg encoded from a .wav or .mp3 source is not a source itself.
+                if any(
+                    input_file.with_suffix(extension).exists()
+                    for extension in (".wav", ".mp3")
+                    if input_file.suffix.lower() == ".ogg"
+                ):
+                    continue
+                relative_path: Path = input_file.relative_to(input_root)
+                # Both would be encoded to the same .ogg, the .wav is the better source.
+                if input_file.suffix.lower() == ".mp3" and (
+                    input_file.with_suffix(".wav").exists()
+                ):
+                    click.secho(
+                        f"Skipped: {relative_path}, "
+                        f"{relative_path.with_suffix('.wav')} is encoded to the same .ogg.",
+                        fg="yellow",
+                    )
+                    continue
+                output_file: Path = output_root / relative_path.with_suffix(".ogg")
+                source_hash = file_hash(input_file)
+                entry = manifest.get(output_file.as_posix())
+                if not force and is_processed(
+                    entry, settings, input_file, output_file, source_hash
+                ):
+                    skipped += 1
+                    continue
+                pending.append((input_file, output_file, relative_path, source_hash))
+
+    click.echo(
+        f"{len(pending)} file(s) to process, {skipped} already processed with these settings."
+    )
+    if dry_run:
+        for _, _, relative_path, _ in pending:
+            click.echo(f"Would process: {relative_path}")
+        return
+    if not pending:
+        return
 
     click.secho(
         "WARNING: This operation is DESTRUCTIVE and will overwrite all audio files in assets/sounds!",
@@ -97,18 +244,36 @@ def process_sounds(target_lufs, sample_rate, quality) -> None:
         click.echo("Aborted by user.")
         return
 
-    for root, _, files in os.walk(input_root):
-        for filename in files:
-            if filename.lower().endswith((".wav", ".mp3", ".ogg")):
-                input_file: Path = Path(root) / filename
-                relative_path: Path = input_file.relative_to(input_root)
-                output_file: Path = output_root / relative_path.with_suffix(".ogg")
-                result: str = process_file(
+    failed = 0
+    try:
+        with ThreadPoolExecutor(jobs) as pool:
+            futures = {
+                pool.submit(
+                    process_file,
                     input_file,
                     output_file,
                     relative_path,
                     target_lufs,
                     sample_rate,
                     quality,
-                )
-                print(result)
+                    ffmpeg_encode,
+                ): (output_file, source_hash)
+                for input_file, output_file, relative_path, source_hash in pending
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                success, message = future.result()
+                output_file, source_hash = futures[future]
+                if success:
+                    manifest[output_file.as_posix()] = {
+                        "source": source_hash,
+                        "output": file_hash(output_file),
+                        "settings": settings,
+                    }
+                else:
+                    failed += 1
+                click.echo(f"[{done}/{len(pending)}] {message}")
+    finally:
+        # Files processed before an interruption are not processed again.
+        save_manifest(manifest)
+
+    click.echo(f"Processed {len(pending) - failed} file(s), {failed} failed.")
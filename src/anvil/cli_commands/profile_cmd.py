@@ -28,6 +28,6 @@ def profile() -> None:
         )
         return
     process_subcommand(
-        f"py-spy record -o output\\anvil_trace.json --format speedscope -- python {entry_point}",
+        f"py-spy record -o {os.path.join('output', 'anvil_trace.json')} --format speedscope -- python {entry_point}",
         "Unable to profile the anvil project.",
     )
@@ -0,0 +1,104 @@
+import os
+import time
+
+import click
+
+from anvil.lib.config import Config, ConfigOption, ConfigSection
+from anvil.lib.watch import RESTARTS_WORKER, AnvilWarmWorker, changes, sources
+
+
+@click.command(help="Rebuild the Anvil project whenever its sources change")
+@click.option(
+    "--interval",
+    default=0.5,
+    show_default=True,
+    type=click.FloatRange(min=0.05),
+    help="Seconds between two scans of the project files.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of workers used to write exported files.",
+)
+@click.option(
+    "--minify",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Minify the project's JSON and JavaScript files.",
+)
+def watch(interval: float, jobs: int, minify: bool) -> None:
+    if not os.path.exists("anvilconfig.json"):
+        click.echo(
+            click.style(
+                "No valid Anvil project found, to create a new project run: `anvil create --help`",
+                fg="yellow",
+            )
+        )
+        return None
+
+    config = Config()
+    entry_point = config.get_option(ConfigSection.ANVIL, ConfigOption.ENTRY_POINT)
+    if not entry_point:
+        click.echo(
+            click.style(
+                "\r[INFO]: No entry point found in the Anvil project configuration.",
+                fg="yellow",
+            )
+        )
+        return
+
+    flags = ["--incremental", "--noarch"]
+    if minify:
+        flags.append("--minify")
+    if jobs > 1:
+        flags.extend(["--jobs", str(jobs)])
+
+    AnvilWarmWorker.start(entry_point, flags)
+    files = sources(entry_point)
+    try:
+        AnvilWarmWorker.run()
+        click.echo(click.style("\r[INFO]: Watching for changes...", fg="green"))
+        while True:
+            time.sleep(interval)
+            current = sources(entry_point)
+            if not changes(files, current):
+                continue
+
+            # Wait for editors saving several files to be done.
+            while True:
+                time.sleep(interval)
+                latest = sources(entry_point)
+                if not changes(current, latest):
+                    break
+                current = latest
+            changed = changes(files, current)
+            files = current
+
+            if any(os.path.basename(path) in RESTARTS_WORKER for path in changed):
+                AnvilWarmWorker.restart()
+            click.echo(
+                click.style(
+                    f"\r[INFO]: {len(changed)} file(s) changed, rebuilding.",
+                    fg="green",
+                )
+            )
+            start = time.perf_counter()
+            code = AnvilWarmWorker.run()
+            click.echo(
+                click.style(
+                    f"\r[INFO]: Rebuilt in {time.perf_counter() - start:.2f}s.",
+                    fg="green",
+                )
+                if code == 0
+                else click.style(
+                    "\r[WARN]: Build failed, waiting for changes.", fg="yellow"
+                )
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        AnvilWarmWorker.stop()
@@ -0,0 +1,230 @@
+"""Persistent cache of compiled Blockbench models.
+
+Parsing a .bbmodel file means loading megabytes of JSON and base64 texture data,
+then compiling geometry, animations and textures from scratch. The outputs of the
+previous build are kept in `.anvil/bbmodels`, keyed by the model content hash, the
+Anvil version and the project namespace, so unchanged models are never parsed.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import shutil
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+import orjson
+
+from ..__version__ import __version__
+
+
+class AnvilModelCache:
+    """Compiled outputs of a single .bbmodel file.
+
+    Sections hold JSON content (`geometry`, `animations`, `culling`) and `textures`
+    maps texture names to the extension of a rendered file stored next to the index.
+    """
+
+    _DIRECTORY = os.path.join(".anvil", "bbmodels")
+    # Small top level keys of the model served from the cache without parsing it.
+    SUMMARY_KEYS = (
+        "model_identifier",
+        "meta",
+        "collections",
+        "resolution",
+        "visible_box",
+        "display",
+    )
+
+    def __init__(self, filename: str, path: str, namespace: str) -> None:
+        """Loads the cache of a model, discarding it if the model changed.
+
+        Parameters:
+            filename (str): The name of the model file (without extension).
+            path (str): The path of the .bbmodel file.
+            namespace (str): The project namespace, compiled animations depend on it.
+        """
+        self._filename = filename
+        self._path = path
+        self._namespace = str(namespace)
+        self._dirty = False
+        self._index: dict = {}
+
+        stat = os.stat(path)
+        self._size = stat.st_size
+        self._mtime = stat.st_mtime_ns
+        self._hash: str | None = None
+
+        try:
+            with open(self.index_path(), "rb") as file:
+                index = orjson.loads(file.read())
+        except (OSError, orjson.JSONDecodeError):
+            return
+
+        if (
+            index.get("version") != __version__
+            or index.get("namespace") != self._namespace
+        ):
+            return
+
+        if index.get("size") != self._size or index.get("mtime") != self._mtime:
+            if index.get("hash") != self.content_hash():
+                return
+            # Touched without a content change.
+            index["mtime"] = self._mtime
+            self._dirty = True
+
+        self._index = index
+
+    def index_path(self) -> str:
+        return os.path.join(self._DIRECTORY, f"{self._filename}.json")
+
+    def _textures_directory(self) -> str:
+        return os.path.join(self._DIRECTORY, self._filename)
+
+    def content_hash(self) -> str:
+        if self._hash is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            with open(self._path, "rb") as file:
+                for chunk in iter(lambda: file.read(1 << 20), b""):
+                    hasher.update(chunk)
+            self._hash = hasher.hexdigest()
+        return self._hash
+
+    def is_valid(self) -> bool:
+        """Checks whether the cache matches the current model file."""
+        return bool(self._index)
+
+    @property
+    def summary(self) -> dict:
+        return self._index["summary"]
+
+    def reset(self, bbmodel: dict) -> None:
+        """Starts a new cache for a freshly parsed model."""
+        shutil.rmtree(self._textures_directory(), ignore_errors=True)
+        self._index = {
+            "version": __version__,
+            "namespace": self._namespace,
+            "hash": self.content_hash(),
+            "size": self._size,
+            "mtime": self._mtime,
+            "summary": {
+                "data": copy.deepcopy(
+                    {key: bbmodel[key] for key in self.SUMMARY_KEYS if key in bbmodel}
+                ),
+                "textures": [
+                    texture.get("name").split(".")[0]
+                    for texture in bbmodel.get("textures", [])
+                ],
+                "animations": [
+                    animation.get("name", "animation")
+                    for animation in bbmodel.get("animations", [])
+                ],
+            },
+            "geometry": {},
+            "animations": {},
+            "culling": None,
+            "textures": {},
+        }
+        self._dirty = True
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Builds a section key from JSON serializable parts."""
+        return orjson.dumps(parts).decode("utf-8")
+
+    def get(self, section: str, key: str | None = None) -> Any:
+        if not self._index:
+            return None
+        if key is None:
+            return self._index[section]
+        return self._index[section].get(key)
+
+    def set(self, section: str, key: str | None, value: Any) -> Any:
+        """Stores compiled content and returns it in its cached form.
+
+        The content is normalized the same way it is when exported, so the cached
+        and freshly compiled forms produce identical files.
+        """
+        from anvil.lib.lib import AnvilIO
+
+        if not self._index:
+            return value
+
+        value = orjson.loads(AnvilIO._dump_json_like(value, minify=True))
+        if key is None:
+            self._index[section] = value
+        else:
+            self._index[section][key] = value
+        self._dirty = True
+        return value
+
+    def texture(self, name: str) -> tuple[str, str] | None:
+        """Returns the extension and cached file of a rendered texture, if any."""
+        extension = self.get("textures", name)
+        if extension is None:
+            return None
+
+        path = os.path.join(self._textures_directory(), f"{name}.{extension}")
+        if not os.path.isfile(path):
+            return None
+        return extension, path
+
+    def set_texture(self, name: str, extension: str, data: bytes) -> None:
+        if not self._index:
+            return
+
+        os.makedirs(self._textures_directory(), exist_ok=True)
+        with open(
+            os.path.join(self._textures_directory(), f"{name}.{extension}"), "wb"
+        ) as file:
+            file.write(data)
+        self._index["textures"][name] = extension
+        self._dirty = True
+
+    def save(self) -> None:
+        """Writes the index if anything was added during this build."""
+        if not self._index or not self._dirty:
+            return
+
+        os.makedirs(self._DIRECTORY, exist_ok=True)
+        with open(self.index_path(), "wb") as file:
+            file.write(orjson.dumps(self._index))
+        self._dirty = False
+
+
+class LazyBBModel(Mapping):
+    """A .bbmodel file that is only parsed once a key outside the summary is read."""
+
+    def __init__(self, path: str, summary: dict) -> None:
+        self._path = path
+        self._summary = summary
+        self._data: dict | None = None
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            with open(self._path, "r") as file:
+                self._data = json.load(file)
+        return self._data
+
+    def is_loaded(self) -> bool:
+        return self._data is not None
+
+    def __getitem__(self, key: str) -> Any:
+        if self._data is None and key in AnvilModelCache.SUMMARY_KEYS:
+            # Callers may modify what they read, the summary must stay as cached.
+            return copy.deepcopy(self._summary["data"][key])
+        return self.data[key]
+
+    def __contains__(self, key: object) -> bool:
+        if self._data is None and key in AnvilModelCache.SUMMARY_KEYS:
+            return key in self._summary["data"]
+        return key in self.data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
@@ -0,0 +1,163 @@
+"""Blockbench texture layer blend modes on whole RGBA arrays.
+
+Modes Pillow implements natively are delegated to its compositing and `ImageChops`
+operations. The HSL and divide modes are computed with NumPy, reproducing the float
+arithmetic of `colorsys` so textures are identical to the ones blended pixel by
+pixel.
+"""
+
+import numpy as np
+from PIL import Image, ImageChops
+
+ONE_THIRD = 1.0 / 3.0
+ONE_SIXTH = 1.0 / 6.0
+TWO_THIRD = 2.0 / 3.0
+
+
+def _image(pixels: np.ndarray) -> Image.Image:
+    return Image.fromarray(np.ascontiguousarray(pixels))
+
+
+def alpha_composite(base: np.ndarray, layer: np.ndarray) -> np.ndarray:
+    """Composites `layer` over `base`, as `Image.alpha_composite(base, layer)`."""
+    return np.asarray(Image.alpha_composite(_image(base), _image(layer)))
+
+
+def _luminance(rgba: np.ndarray) -> np.ndarray:
+    """Greyscale conversion of `Image.convert("L")`."""
+    rgb = rgba.astype(np.uint32)
+    return (
+        rgb[..., 0] * 19595 + rgb[..., 1] * 38470 + rgb[..., 2] * 7471 + 0x8000
+    ) >> 16
+
+
+# Separable modes, called with the layer as first image.
+_CHANNEL_OPS = {
+    "multiply": ImageChops.multiply,
+    "screen": ImageChops.screen,
+    "overlay": ImageChops.overlay,
+    "hard_light": ImageChops.hard_light,
+    "add": ImageChops.add,
+    "subtract": lambda l, b: ImageChops.subtract(b, l),
+    "difference": lambda l, b: ImageChops.difference(b, l),
+    "darken": ImageChops.darker,
+    "lighten": ImageChops.lighter,
+}
+
+
+def _rgb_to_hls(rgb: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized `colorsys.rgb_to_hls`."""
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+
+    grey = minc == maxc
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = np.mod(h / 6.0, 1.0)
+
+    return np.where(grey, 0.0, h), l, np.where(grey, 0.0, s)
+
+
+def _hls_value(m1: np.ndarray, m2: np.ndarray, hue: np.ndarray) -> np.ndarray:
+    hue = np.mod(hue, 1.0)
+    return np.where(
+        hue < ONE_SIXTH,
+        m1 + (m2 - m1) * hue * 6.0,
+        np.where(
+            hue < 0.5,
+            m2,
+            np.where(hue < TWO_THIRD, m1 + (m2 - m1) * (TWO_THIRD - hue) * 6.0, m1),
+        ),
+    )
+
+
+def _hls_to_rgb(h: np.ndarray, l: np.ndarray, s: np.ndarray) -> np.ndarray:
+    """Vectorized `colorsys.hls_to_rgb`."""
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+    m1 = 2.0 * l - m2
+    rgb = np.stack(
+        [
+            _hls_value(m1, m2, h + ONE_THIRD),
+            _hls_value(m1, m2, h),
+            _hls_value(m1, m2, h - ONE_THIRD),
+        ],
+        axis=-1,
+    )
+    return np.where((s == 0.0)[..., None], l[..., None], rgb)
+
+
+def _blend_float(mode: str, base: np.ndarray, layer: np.ndarray) -> np.ndarray:
+    cb = base[..., :3] / 255.0
+    ct = layer[..., :3] / 255.0
+    ab = base[..., 3:4] / 255.0
+    at = layer[..., 3:4] / 255.0
+
+    if mode == "divide":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cm = np.where(ct > 0.0, np.minimum(cb / ct, 1.0), 1.0)
+    elif mode in ("color", "hue", "saturation", "luminosity"):
+        h_b, l_b, s_b = _rgb_to_hls(cb)
+        h_t, l_t, s_t = _rgb_to_hls(ct)
+        cm = {
+            "color": lambda: _hls_to_rgb(h_t, l_b, s_t),
+            "hue": lambda: _hls_to_rgb(h_t, l_b, s_b),
+            "saturation": lambda: _hls_to_rgb(h_b, l_b, s_t),
+            "luminosity": lambda: _hls_to_rgb(h_b, l_t, s_b),
+        }[mode]()
+    else:
+        cm = ct
+
+    a_out = at + ab * (1.0 - at)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        c_out = np.where(a_out > 0.0, (cm * at + cb * ab * (1.0 - at)) / a_out, 0.0)
+
+    out = np.empty_like(base)
+    out[..., :3] = np.clip(np.rint(c_out * 255.0), 0, 255)
+    out[..., 3:4] = np.clip(np.rint(a_out * 255.0), 0, 255)
+    return out
+
+
+def blend(mode: str, base: np.ndarray, layer: np.ndarray) -> np.ndarray:
+    """Blends a layer onto a base region of the same size.
+
+    Parameters:
+        mode (str): The Blockbench blend mode, unknown modes are composited normally.
+        base (np.ndarray): The base region, an (height, width, 4) uint8 RGBA array.
+        layer (np.ndarray): The layer region, an (height, width, 4) uint8 RGBA array.
+
+    Returns:
+        np.ndarray: The blended region.
+    """
+    if mode == "default":
+        return alpha_composite(base, layer)
+    if mode == "behind":
+        return alpha_composite(layer, base)
+    if mode == "alpha_mask":
+        mask = _luminance(layer) * layer[..., 3] // 255
+        out = base.copy()
+        out[..., 3] = base[..., 3].astype(np.uint32) * mask // 255
+        return out
+    if mode == "set_opacity":
+        out = base.copy()
+        out[..., 3] = layer[..., 3]
+        return out
+    if mode in _CHANNEL_OPS:
+        blended = layer.copy()
+        blended[..., :3] = _CHANNEL_OPS[mode](
+            _image(layer[..., :3]), _image(base[..., :3])
+        )
+        return alpha_composite(base, blended)
+    return _blend_float(mode, base, layer)
+
+
+def opacity_table(opacity: float) -> np.ndarray:
+    """Lookup table scaling an alpha channel by a layer opacity between 0 and 1."""
+    return np.array([int(alpha * opacity) for alpha in range(256)], dtype=np.uint8)
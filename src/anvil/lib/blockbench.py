@@ -2,17 +2,21 @@ import base64
 import json
 import os
 import re
+import shutil
 from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any, Dict, List, Optional, Union
 
 import click
+import numpy as np
 from packaging.version import Version
 
 from anvil.api.core.enums import BlockFaces
 from anvil.api.core.types import Vector2D, Vector3D
 from anvil.api.logic.molang import Molang
+from anvil.lib.bbmodel_cache import AnvilModelCache, LazyBBModel
+from anvil.lib.blending import blend, opacity_table
 from anvil.lib.config import CONFIG
 from anvil.lib.schemas import AddonObject, JsonSchemes
 
@@ -83,14 +87,25 @@ class BlockCulling(AddonObject):
                 if bone.get("children"):
                     self._build_bones_dict(bone.get("children"))
 
-    def __init__(self, name: str, bbmodel: dict) -> None:
+    def __init__(self, name: str, bbmodel: dict, index: dict | None = None) -> None:
         super().__init__(name)
         self._bbmodel = bbmodel
-        self._groups = {g["uuid"]: g for g in self._bbmodel["groups"]}
-        # self._elements = {e["uuid"]: e for e in self._bbmodel["elements"]}
 
-        self.bones = {}
-        self._build_bones_dict(self._bbmodel["outliner"])
+        if index is None:
+            self._groups = {g["uuid"]: g for g in self._bbmodel["groups"]}
+            # self._elements = {e["uuid"]: e for e in self._bbmodel["elements"]}
+
+            self.bones = {}
+            self._build_bones_dict(self._bbmodel["outliner"])
+            index = {
+                "bones": self.bones,
+                "groups": [g["name"] for g in self._groups.values()],
+            }
+
+        # Bone cube counts and group names, cached with the compiled model.
+        self.index = index
+        self.bones = index["bones"]
+        self._group_names = index["groups"]
 
         self.content(JsonSchemes.block_culling_rules(self.identifier))
 
@@ -103,7 +118,7 @@ class BlockCulling(AddonObject):
         # condition: Literal["same_block", "same_block_permutation", "same_culling_layer"] = "",
         # cull_against_full_and_opaque: bool = False,
     ) -> None:
-        if bone not in list(map(lambda g: g["name"], self._groups.values())):
+        if bone not in self._group_names:
             raise ValueError(
                 f"Bone '{bone}' not found in blockbench model '{self._bbmodel['model_identifier']}'."
             )
@@ -146,6 +161,8 @@ class BlockCulling(AddonObject):
 
 class _Geometry(AddonObject):
     _extension = ".geo.json"
+    _consolidate = "minecraft:geometry"
+    _deduplicate = "definitions"
     _path = os.path.join(CONFIG.RP_PATH, "models", "entity")
 
     def __init__(self, name: str, content: dict) -> None:
@@ -155,6 +172,8 @@ class _Geometry(AddonObject):
 
 class _Animation(AddonObject):
     _extension = ".animations.json"
+    _consolidate = "animations"
+    _deduplicate = "definitions"
     _path = os.path.join(CONFIG.RP_PATH, "animations")
 
     def __init__(self, name: str, content: dict) -> None:
@@ -433,31 +452,77 @@ class Animation:
 
 
 class _AnimationsManager:
-    def __init__(self, name: str, source: str, bbmodel: dict) -> None:
+    def __init__(
+        self,
+        name: str,
+        source: str,
+        bbmodel: dict,
+        cache: AnvilModelCache | None = None,
+    ) -> None:
         self._name = name
+        self._bbmodel = bbmodel
+        self._cache = cache
         self._content = JsonSchemes.animations_rp()
         self._queued = False
         self._source = "actors"  # Original hardcoded? "actors". Defaults to "actors" in signature but overwritten?
         # Original: self._source = "actors" (Line 489)
 
-        self.animations: Dict[str, Animation] = {}
-
-        # Parse all animations immediately
-        for anim_dict in bbmodel.get("animations", []):
-            anim = Animation.from_dict(anim_dict, name)
-            self.animations[anim.name] = anim
+        # Animations are only parsed when queued, most models carry many more
+        # animations than a project uses.
+        if cache is not None:
+            self._animation_names = set(cache.summary["animations"])
+        else:
+            self._animation_names = {
+                anim_dict.get("name", "animation")
+                for anim_dict in bbmodel.get("animations", [])
+            }
+        self._raw_index: Dict[str, dict] | None = None
+        self._parsed: Dict[str, Animation] = {}
+
+    @property
+    def _raw_animations(self) -> Dict[str, dict]:
+        if self._raw_index is None:
+            self._raw_index = {
+                anim_dict.get("name", "animation"): anim_dict
+                for anim_dict in self._bbmodel.get("animations", [])
+            }
+        return self._raw_index
+
+    @property
+    def animations(self) -> Dict[str, Animation]:
+        """All animations of the model, parsing the ones not parsed yet."""
+        for animation_name in self._animation_names:
+            self.animation(animation_name)
+        return dict(self._parsed)
+
+    def animation(self, animation_name: str) -> Optional[Animation]:
+        anim = self._parsed.get(animation_name)
+        if anim is None and animation_name in self._animation_names:
+            anim = Animation.from_dict(self._raw_animations[animation_name], self._name)
+            self._parsed[animation_name] = anim
+        return anim
 
     def queue_animation(self, animation_name: str):
-        anim = self.animations.get(animation_name)
-        if not anim:
+        if animation_name not in self._animation_names:
             raise ValueError(
                 f"Animation '{animation_name}' not found in blockbench model '{self._name}'."
             )
 
-        full_name = f"animation.{CONFIG.NAMESPACE}.{self._name}.{anim.name}"
-        if full_name not in self._content["animations"]:
-            self._content["animations"].update(anim.compile(full_name))
-            self._queued = True
+        full_name = f"animation.{CONFIG.NAMESPACE}.{self._name}.{animation_name}"
+        if full_name in self._content["animations"]:
+            return
+
+        anim_data = (
+            self._cache.get("animations", animation_name) if self._cache else None
+        )
+        if anim_data is None:
+            anim = self.animation(animation_name)
+            anim_data = anim.compile(full_name)[full_name]
+            if self._cache:
+                anim_data = self._cache.set("animations", animation_name, anim_data)
+
+        self._content["animations"][full_name] = anim_data
+        self._queued = True
 
     def __export__(self) -> None:
         if self._queued:
@@ -465,10 +530,17 @@ class _AnimationsManager:
 
 
 class _TexturesManager:
-    def __init__(self, filename: str, source: str, bbmodel: dict) -> None:
+    def __init__(
+        self,
+        filename: str,
+        source: str,
+        bbmodel: dict,
+        cache: AnvilModelCache | None = None,
+    ) -> None:
         config = CONFIG
         self._name = filename
         self._bbmodel = bbmodel
+        self._cache = cache
 
         self._path = os.path.join(
             config.RP_PATH,
@@ -478,16 +550,29 @@ class _TexturesManager:
             source,
             self._name,
         )
-        self._textures = {
-            texture.get("name").split(".")[0]: texture
-            for texture in self._bbmodel["textures"]
-        }
+        if cache is not None:
+            self._texture_names = set(cache.summary["textures"])
+        else:
+            self._texture_names = {
+                texture.get("name").split(".")[0]
+                for texture in self._bbmodel["textures"]
+            }
+        self._textures_index: dict[str, dict] | None = None
         self._queued_textures: dict[str, str | None] = {}
 
+    @property
+    def _textures(self) -> dict[str, dict]:
+        if self._textures_index is None:
+            self._textures_index = {
+                texture.get("name").split(".")[0]: texture
+                for texture in self._bbmodel["textures"]
+            }
+        return self._textures_index
+
     def queue_texture(
         self, texture: str, dest_dir: str | None = None
     ) -> None:
-        if texture in self._textures:
+        if texture in self._texture_names:
             self._queued_textures[texture] = dest_dir
         else:
             raise ValueError(
@@ -495,25 +580,12 @@ class _TexturesManager:
             )
 
     def _blend_layers(self, texture_data: dict):
-        from PIL import Image, ImageChops
+        from PIL import Image
         import io
-        import colorsys
 
         width = texture_data.get("width", 16)
         height = texture_data.get("height", 16)
-        base_img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-
-        blend_ops = {
-            "multiply": ImageChops.multiply,
-            "screen": ImageChops.screen,
-            "overlay": ImageChops.overlay,
-            "hard_light": ImageChops.hard_light,
-            "add": ImageChops.add,
-            "subtract": lambda l, b: ImageChops.subtract(b, l),
-            "difference": lambda l, b: ImageChops.difference(b, l),
-            "darken": ImageChops.darker,
-            "lighten": ImageChops.lighter,
-        }
+        base = np.zeros((height, width, 4), dtype=np.uint8)
 
         for layer in texture_data.get("layers", []):
             if not layer.get("visible", True):
@@ -535,74 +607,31 @@ class _TexturesManager:
                 if new_width != layer_img.width or new_height != layer_img.height:
                     layer_img = layer_img.resize((new_width, new_height), Image.Resampling.NEAREST)
 
+            layer_px = np.array(layer_img)
+
             # Apply opacity directly to the alpha channel
             opacity = layer.get("opacity", 100) / 100.0
             if opacity < 1.0:
-                layer_img.putalpha(layer_img.getchannel("A").point(lambda p: int(p * opacity)))
+                layer_px[..., 3] = opacity_table(opacity)[layer_px[..., 3]]
 
             ox, oy = map(int, layer.get("offset", [0, 0]))
             blend_mode = layer.get("blend_mode", "default")
 
-            # Crop overlapping region to perform fast, native Pillow blending
+            # Blend the overlapping region only
             start_x, end_x = max(0, ox), min(width, ox + layer_img.width)
             start_y, end_y = max(0, oy), min(height, oy + layer_img.height)
 
             if start_x >= end_x or start_y >= end_y:
                 continue
 
-            crop_base = base_img.crop((start_x, start_y, end_x, end_y))
-            crop_layer = layer_img.crop((start_x - ox, start_y - oy, end_x - ox, end_y - oy))
-
-            if blend_mode == "default":
-                blended_region = Image.alpha_composite(crop_base, crop_layer)
-            elif blend_mode == "behind":
-                blended_region = Image.alpha_composite(crop_layer, crop_base)
-            elif blend_mode == "alpha_mask":
-                mask = ImageChops.multiply(crop_layer.convert("L"), crop_layer.getchannel("A"))
-                r, g, b, a = crop_base.split()
-                blended_region = Image.merge("RGBA", (r, g, b, ImageChops.multiply(a, mask)))
-            elif blend_mode == "set_opacity":
-                r, g, b, a = crop_base.split()
-                blended_region = Image.merge("RGBA", (r, g, b, crop_layer.getchannel("A")))
-            elif blend_mode in blend_ops:
-                rgb_base = crop_base.convert("RGB")
-                rgb_layer = crop_layer.convert("RGB")
-                rgb_m = blend_ops[blend_mode](rgb_layer, rgb_base)
-                blended_layer = Image.merge("RGBA", (*rgb_m.split(), crop_layer.getchannel("A")))
-                blended_region = Image.alpha_composite(crop_base, blended_layer)
-            else:
-                # Custom HSL color and divide modes fallback
-                px_b = crop_base.load()
-                px_l = crop_layer.load()
-                blended_region = crop_base.copy()
-                px_out = blended_region.load()
-
-                for y_idx in range(crop_base.height):
-                    for x_idx in range(crop_base.width):
-                        r_b, g_b, b_b, a_b = px_b[x_idx, y_idx]
-                        r_t, g_t, b_t, a_t = px_l[x_idx, y_idx]
-                        
-                        cb = [c / 255.0 for c in (r_b, g_b, b_b)]
-                        ct = [c / 255.0 for c in (r_t, g_t, b_t)]
-                        ab, at = a_b / 255.0, a_t / 255.0
-
-                        if blend_mode == "divide":
-                            cm = [min(b / t, 1.0) if t > 0.0 else 1.0 for b, t in zip(cb, ct)]
-                        elif blend_mode == "color":
-                            h_b, l_b, s_b = colorsys.rgb_to_hls(*cb)
-                            h_t, l_t, s_t = colorsys.rgb_to_hls(*ct)
-                            cm = list(colorsys.hls_to_rgb(h_t, l_b, s_t))
-                        else:
-                            cm = ct
-
-                        a_out = at + ab * (1.0 - at)
-                        c_out = [(m * at + b * ab * (1.0 - at)) / a_out if a_out > 0.0 else 0.0 for m, b in zip(cm, cb)]
-                        
-                        px_out[x_idx, y_idx] = tuple(max(0, min(255, int(round(c * 255.0)))) for c in c_out) + (max(0, min(255, int(round(a_out * 255.0)))),)
-
-            base_img.paste(blended_region, (start_x, start_y))
-
-        return base_img
+            region = (slice(start_y, end_y), slice(start_x, end_x))
+            base[region] = blend(
+                blend_mode,
+                base[region],
+                layer_px[start_y - oy : end_y - oy, start_x - ox : end_x - ox],
+            )
+
+        return Image.fromarray(base)
 
     def __export__(self) -> None:
         from PIL import Image
@@ -611,7 +640,13 @@ class _TexturesManager:
         for texture, dest_dir in self._queued_textures.items():
             path = dest_dir if dest_dir is not None else self._path
             os.makedirs(path, exist_ok=True)
-            
+
+            cached = self._cache.texture(texture) if self._cache else None
+            if cached is not None:
+                ext, cached_path = cached
+                shutil.copyfile(cached_path, os.path.join(path, f"{texture}.{ext}"))
+                continue
+
             tex_data = self._textures[texture]
             if tex_data.get("layers_enabled", False) and tex_data.get("layers"):
                 img = self._blend_layers(tex_data)
@@ -648,11 +683,14 @@ class _TexturesManager:
                     img = img.convert("RGB")
 
                 img.save(out_bytes, format=pil_format)
-                with open(os.path.join(path, f"{texture}.{ext}"), "wb") as file:
-                    file.write(out_bytes.getvalue())
+                image_data = out_bytes.getvalue()
             else:
-                with open(os.path.join(path, f"{texture}.png"), "wb") as file:
-                    file.write(image_data)
+                ext = "png"
+
+            with open(os.path.join(path, f"{texture}.{ext}"), "wb") as file:
+                file.write(image_data)
+            if self._cache:
+                self._cache.set_texture(texture, ext, image_data)
 
 
 
@@ -796,92 +834,166 @@ class Mesh:
             parent=parent,
         )
 
+    @staticmethod
+    def _face_adjacency(
+        flat: np.ndarray, lengths: np.ndarray, vertex_count: int
+    ) -> List[List[int]]:
+        """Neighbors of every face, faces are neighbors when they share two vertices.
+
+        Faces are keyed by the vertex pairs they contain, including quad diagonals
+        since the vertices of a face are not stored in winding order.
+
+        Parameters:
+            flat (np.ndarray): The sorted vertex indexes of every face, concatenated.
+            lengths (np.ndarray): The vertex count of every face.
+            vertex_count (int): The vertex count of the mesh.
+        """
+        face_count = len(lengths)
+        rows = np.repeat(np.arange(face_count), lengths)
+        columns = np.arange(len(flat)) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths
+        )
+        padded = np.full((face_count, int(lengths.max())), -1, dtype=np.int64)
+        padded[rows, columns] = flat
+
+        first, second = np.triu_indices(padded.shape[1], 1)
+        valid = padded[:, second] >= 0
+        keys = (padded[:, first] * vertex_count + padded[:, second])[valid]
+        faces = np.broadcast_to(np.arange(face_count)[:, None], valid.shape)[valid]
+
+        order = np.argsort(keys, kind="stable")
+        keys, faces = keys[order], faces[order]
+
+        # Faces sharing a pair of vertices are consecutive once sorted by pair.
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        sizes = np.diff(np.r_[starts, len(keys)])
+        shared = starts[sizes == 2]
+        sources, targets = [faces[shared]], [faces[shared + 1]]
+        # Pairs shared by more than two faces are rare enough to be expanded one by one.
+        for start, size in zip(starts[sizes > 2].tolist(), sizes[sizes > 2].tolist()):
+            group = faces[start : start + size]
+            sources.append(np.repeat(group, size))
+            targets.append(np.tile(group, size))
+
+        sources = np.concatenate(sources)
+        targets = np.concatenate(targets)
+        links = np.unique(
+            np.concatenate([sources, targets]) * face_count
+            + np.concatenate([targets, sources])
+        )
+        links = links[links // face_count != links % face_count]
+
+        offsets = np.searchsorted(
+            links // face_count, np.arange(face_count + 1)
+        ).tolist()
+        neighbors = (links % face_count).tolist()
+        return [neighbors[offsets[i] : offsets[i + 1]] for i in range(face_count)]
+
     def extract_cuboids(self):
-        # Re-implementation of extract_cuboids using internal data
-        face_verts = {fid: set(face["vertices"]) for fid, face in self.faces.items()}
-
-        vertex_to_faces = defaultdict(list)
-        for fid, face in self.faces.items():
-            for vid in face["vertices"]:
-                vertex_to_faces[vid].append(fid)
-
-        shared_counts = defaultdict(int)
-        for face_list in vertex_to_faces.values():
-            for i in range(len(face_list)):
-                for j in range(i + 1, len(face_list)):
-                    f1, f2 = face_list[i], face_list[j]
-                    if f1 > f2:
-                        f1, f2 = f2, f1
-                    shared_counts[(f1, f2)] += 1
-
-        face_neighbors = {fid: set() for fid in self.faces}
-        for (f1, f2), count in shared_counts.items():
-            if count >= 2:
-                face_neighbors[f1].add(f2)
-                face_neighbors[f2].add(f1)
-
-        all_visited = set()
+        """Splits the mesh into groups of connected faces fitting a Bedrock cube.
+
+        Groups are grown from every connected component, in face order, as long as
+        they use at most 8 vertices and fit in 24 units on every axis.
+        """
+        if not self.faces:
+            return []
+
+        vertex_ids = list(self.vertices)
+        vertex_index = {vid: index for index, vid in enumerate(vertex_ids)}
+        face_ids = list(self.faces)
+        face_vertices = [
+            tuple(sorted({vertex_index[vid] for vid in face["vertices"]}))
+            for face in self.faces.values()
+        ]
+
+        # Bounding box of every face, from a single array of vertex coordinates.
+        coords = np.asarray(
+            [self.vertices[vid] for vid in vertex_ids], dtype=np.float64
+        ).reshape(-1, 3)
+        lengths = np.fromiter(map(len, face_vertices), dtype=np.intp)
+        flat = np.fromiter(
+            (vid for verts in face_vertices for vid in verts), dtype=np.intp
+        )
+        starts = np.cumsum(lengths) - lengths
+        face_boxes = np.hstack(
+            [
+                np.minimum.reduceat(coords[flat], starts),
+                np.maximum.reduceat(coords[flat], starts),
+            ]
+        ).tolist()
+
+        neighbors = self._face_adjacency(flat, lengths, len(vertex_ids))
+        visited = [False] * len(face_ids)
         cuboids = []
-        cuboid_id = 0
 
-        for fid in self.faces:
-            if fid in all_visited:
+        for first in range(len(face_ids)):
+            if visited[first]:
                 continue
 
-            # Extract a connected component of faces
-            original_component = set()
-            stack = [fid]
-            while stack:
-                current = stack.pop()
-                if current not in original_component:
-                    original_component.add(current)
-                    stack.extend(face_neighbors[current] - original_component)
-
-            unvisited = original_component - all_visited
-            while unvisited:
-                seed = next(iter(unvisited))
-                working_faces = set()
-                working_verts = set()
-                working_stack = [seed]
-
-                while working_stack:
-                    current = working_stack.pop()
-                    if current in working_faces:
+            component = [first]
+            in_component = {first}
+            for current in component:
+                for neighbor in neighbors[current]:
+                    if neighbor not in in_component and not visited[neighbor]:
+                        in_component.add(neighbor)
+                        component.append(neighbor)
+
+            for seed in sorted(component):
+                if visited[seed]:
+                    continue
+
+                working_faces = []
+                working_verts: set[int] = set()
+                box = None
+                rejected = set()
+                stack = [seed]
+
+                while stack:
+                    current = stack.pop()
+                    if visited[current] or current in rejected:
                         continue
 
-                    current_verts = face_verts[current]
-                    new_verts = working_verts.union(current_verts)
+                    new_verts = working_verts.union(face_vertices[current])
                     if len(new_verts) > 8:
+                        rejected.add(current)
                         continue
 
-                    coords = [self.vertices[vid] for vid in new_verts]
-                    xs, ys, zs = zip(*coords)
-                    if (
-                        max(xs) - min(xs) > 24
-                        or max(ys) - min(ys) > 24
-                        or max(zs) - min(zs) > 24
-                    ):
+                    x0, y0, z0, x1, y1, z1 = face_boxes[current]
+                    if box is not None:
+                        x0, y0, z0 = min(x0, box[0]), min(y0, box[1]), min(z0, box[2])
+                        x1, y1, z1 = max(x1, box[3]), max(y1, box[4]), max(z1, box[5])
+                    if x1 - x0 > 24 or y1 - y0 > 24 or z1 - z0 > 24:
+                        # The group only grows, a rejected face stays rejected.
+                        rejected.add(current)
                         continue
 
-                    working_faces.add(current)
+                    visited[current] = True
+                    working_faces.append(current)
                     working_verts = new_verts
-                    neighbors = face_neighbors[current] & unvisited
-                    working_stack.extend(neighbors - working_faces)
+                    box = (x0, y0, z0, x1, y1, z1)
+                    stack.extend(
+                        neighbor
+                        for neighbor in neighbors[current]
+                        if not visited[neighbor]
+                    )
 
                 if working_faces:
-                    cuboid = {
-                        "name": f"{self.name}_{cuboid_id}",
-                        "type": "mesh",
-                        "faces": {cfid: self.faces[cfid] for cfid in working_faces},
-                        "vertices": {vid: self.vertices[vid] for vid in working_verts},
-                    }
-                    cuboids.append(cuboid)
-                    cuboid_id += 1
-                    all_visited.update(working_faces)
-                    unvisited.difference_update(working_faces)
+                    cuboids.append(
+                        {
+                            "name": f"{self.name}_{len(cuboids)}",
+                            "type": "mesh",
+                            "faces": {
+                                face_ids[index]: self.faces[face_ids[index]]
+                                for index in sorted(working_faces)
+                            },
+                            "vertices": {
+                                vertex_ids[index]: self.vertices[vertex_ids[index]]
+                                for index in sorted(working_verts)
+                            },
+                        }
+                    )
                 else:
-                    all_visited.add(seed)
-                    unvisited.discard(seed)
+                    visited[seed] = True
 
         return cuboids
 
@@ -1044,17 +1156,25 @@ class Bone:
 
 
 class _ModelManager:
-    def __init__(self, filename, source: str, bbmodel: dict) -> None:
+    def __init__(
+        self,
+        filename,
+        source: str,
+        bbmodel: dict,
+        cache: AnvilModelCache | None = None,
+    ) -> None:
         """Handles loading and managing Blockbench models.
 
         Parameters:
             filename (str): The name of the model file (without extension).
             source (str): The source of the model. Defaults to "actors".
             bbmodel (dict): The Blockbench model data.
+            cache (AnvilModelCache, optional): The compiled model cache. Defaults to None.
         """
 
         self._name = filename
         self._bbmodel = bbmodel
+        self._cache = cache
         self._queued = False
         self._source = source
         self._is_wavefront = self._bbmodel["meta"]["model_format"] == "free"
@@ -1290,23 +1410,31 @@ class _ModelManager:
 
         return content
 
-    def _queue_geometry(self, model_name: str, bones: List[Union[str, dict]]) -> None:
+    def _queue_geometry(
+        self, model_name: str, bones: Optional[List[Union[str, dict]]]
+    ) -> None:
         if model_name in self._queued_geometries:
             return
 
-        content = self.process_geometry_scheme(model_name, self._build_bones(bones))
-        if self._source == BlockBenchSource.BLOCK:
-            self.process_block_display(content)
+        key = AnvilModelCache.key(model_name, self._source, self.bounding_box)
+        content = self._cache.get("geometry", key) if self._cache else None
+        if content is None:
+            self._prepare_model()
+            if bones is None:
+                bones = self._bbmodel["outliner"]
+
+            content = self.process_geometry_scheme(model_name, self._build_bones(bones))
+            if self._source == BlockBenchSource.BLOCK:
+                self.process_block_display(content)
+            if self._cache:
+                content = self._cache.set("geometry", key, content)
 
         self._queued_geometries[model_name] = content
 
     def queue_model(self, collection: Optional[str] = None) -> None:
-        self._prepare_model()
-
         if collection is None:
-            self._queue_geometry(
-                self._bbmodel["model_identifier"], self._bbmodel["outliner"]
-            )
+            # The whole outliner, only read when the geometry is not cached.
+            self._queue_geometry(self._bbmodel["model_identifier"], None)
             return
 
         collection_data = self._resolve_collection(collection)
@@ -1321,7 +1449,10 @@ class _ModelManager:
 
     def block_culling(self) -> BlockCulling:
         if not self._culling:
-            self._culling = BlockCulling(self._name, self._bbmodel)
+            index = self._cache.get("culling") if self._cache else None
+            self._culling = BlockCulling(self._name, self._bbmodel, index)
+            if index is None and self._cache:
+                self._cache.set("culling", None, self._culling.index)
         return self._culling
 
     def __export__(self) -> None:
@@ -1358,7 +1489,10 @@ class _Blockbench:
 
         self._path = os.path.join("assets", "bbmodels", f"{filename}.bbmodel")
 
-        if os.path.exists(self._path):
+        if os.path.exists(self._path) and self._load_cache(filename):
+            # Unchanged since the previous build, parsed only if something is not cached.
+            self.bbmodel = LazyBBModel(self._path, self._cache.summary)
+        elif os.path.exists(self._path):
             with open(self._path, "r") as model:
                 self.bbmodel = json.load(model)
                 if self.bbmodel["model_identifier"] != filename:
@@ -1370,14 +1504,22 @@ class _Blockbench:
                     raise ValueError(
                         f"'{filename}.bbmodel' Blockbench model format version '{self.bbmodel['meta']['format_version']}' is not supported. Please update your models with Blockbench 5.0 or higher to export the model."
                     )
+
+            self._cache.reset(self.bbmodel)
         else:
             raise FileNotFoundError(
                 f"{filename}.bbmodel not found in {os.path.join('assets', 'bbmodels')}. Please ensure the file exists."
             )
 
-        self.model = _ModelManager(filename, source, self.bbmodel)
-        self.animations = _AnimationsManager(filename, source, self.bbmodel)
-        self.textures = _TexturesManager(filename, source, self.bbmodel)
+        self.model = _ModelManager(filename, source, self.bbmodel, self._cache)
+        self.animations = _AnimationsManager(
+            filename, source, self.bbmodel, self._cache
+        )
+        self.textures = _TexturesManager(filename, source, self.bbmodel, self._cache)
+
+    def _load_cache(self, filename: str) -> bool:
+        self._cache = AnvilModelCache(filename, self._path, CONFIG.NAMESPACE)
+        return self._cache.is_valid()
 
     def override_bounding_box(self, bounding_box: Vector2D) -> None:
         self.model.bounding_box = bounding_box
@@ -1389,6 +1531,7 @@ class _Blockbench:
             bb.model.__export__()
             bb.animations.__export__()
             bb.textures.__export__()
+            bb._cache.save()
             if bb.model._is_wavefront:
                 meshes.append(bb.model._name)
         if len(meshes) > 0:
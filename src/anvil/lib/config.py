@@ -9,6 +9,7 @@ import commentjson as json
 
 from anvil.__version__ import __version__
 from anvil.lib.format_versions import MANIFEST_BUILD
+from anvil.lib.incremental import AnvilAssetSync
 from anvil.lib.lib import (
     PREVIEW_COM_MOJANG,
     RELEASE_COM_MOJANG,
@@ -67,6 +68,13 @@ class ConfigOption(StrEnum):
     ENTRY_POINT = "entry_point"
     JS_BUNDLE_SCRIPT = "js_bundle_script"
     MINIFY = "minify"
+    INCREMENTAL = "incremental"
+    ASSET_LINK = "asset_link"
+    OPTIMIZE_MOLANG = "optimize_molang"
+    HOIST_MOLANG = "hoist_molang"
+    ENTITY_TICK_BUDGET = "entity_tick_budget"
+    CONSOLIDATE = "consolidate"
+    DEDUPLICATE = "deduplicate"
 
 
 class ConfigPackageTarget(StrEnum):
@@ -202,6 +210,13 @@ class _AnvilConfig:
     _DATA_MODULE_UUID: str
     _SCRIPT_MODULE_UUID: str
     _MINIFY: bool
+    _INCREMENTAL: bool
+    _ASSET_LINK: str
+    _OPTIMIZE_MOLANG: bool
+    _HOIST_MOLANG: bool
+    _ENTITY_TICK_BUDGET: float
+    _CONSOLIDATE: bool
+    _DEDUPLICATE: bool
 
     def __new__(cls):
         if cls._instance is None:
@@ -361,6 +376,28 @@ class _AnvilConfig:
         self._MINIFY = self._handle_config(
             ConfigSection.ANVIL, ConfigOption.MINIFY, False
         )
+        self._INCREMENTAL = self._handle_config(
+            ConfigSection.ANVIL, ConfigOption.INCREMENTAL, False
+        )
+        self._ASSET_LINK = self._handle_config(
+            ConfigSection.ANVIL, ConfigOption.ASSET_LINK, "copy"
+        )
+        AnvilAssetSync.validate_link(self._ASSET_LINK)
+        self._OPTIMIZE_MOLANG = self._handle_config(
+            ConfigSection.ANVIL, ConfigOption.OPTIMIZE_MOLANG, False
+        )
+        self._HOIST_MOLANG = self._handle_config(
+            ConfigSection.ANVIL, ConfigOption.HOIST_MOLANG, False
+        )
+        self._ENTITY_TICK_BUDGET = self._handle_config(
+            ConfigSection.ANVIL, ConfigOption.ENTITY_TICK_BUDGET, 100
+        )
+        self._CONSOLIDATE = self._handle_config(
+            ConfigSection.ANVIL, ConfigOption.CONSOLIDATE, False
+        )
+        self._DEDUPLICATE = self._handle_config(
+            ConfigSection.ANVIL, ConfigOption.DEDUPLICATE, False
+        )
 
         AnvilValidator.validate_namespace_project_name(
             self.NAMESPACE, self.PROJECT_NAME, self._TARGET == "addon"
@@ -0,0 +1,120 @@
+"""Pack consolidation support.
+
+Animation controllers, animations, render controllers and geometries are written one
+file per actor by default. When consolidation is enabled, these objects hand their
+content over instead of writing it, and the definitions are merged into one file per
+category and format version at the end of the build. Definitions keep their
+identifiers, the game reads them from any file of the category folder.
+"""
+
+from typing import Any
+
+import orjson
+
+from anvil.lib.lib import AnvilIO
+
+CONSOLIDATED_NAME = "consolidated"
+
+
+class AnvilConsolidationError(Exception):
+    """Raised when two merged files define the same identifier differently."""
+
+
+def _identical(first: Any, second: Any) -> bool:
+    return orjson.dumps(first, default=str) == orjson.dumps(second, default=str)
+
+
+class AnvilPackConsolidation:
+    """Merges the definitions of consolidated objects into shared files.
+
+    Objects take part by setting `_consolidate` to the key holding their definitions,
+    such as `animation_controllers`. Dictionaries are merged by identifier, lists such
+    as `minecraft:geometry` by `description.identifier`.
+    """
+
+    _enabled: bool = False
+    # (directory, extension, format version) -> merged file
+    _files: dict[tuple[str, str, str], dict[str, Any]] = {}
+    _sources: dict[tuple[str, str, str], int] = {}
+
+    @classmethod
+    def begin(cls, enabled: bool = True) -> None:
+        cls._enabled = enabled
+        cls._files = {}
+        cls._sources = {}
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def add(cls, directory: str, extension: str, key: str, content: dict) -> None:
+        """Merges the definitions of one file.
+
+        Parameters:
+            directory (str): The category folder the file would be written to.
+            extension (str): The extension of the file, such as `.rc.json`.
+            key (str): The key holding the definitions.
+            content (dict): The content of the file.
+
+        Raises:
+            AnvilConsolidationError: If an identifier is already defined with another content.
+        """
+        format_version = str(content.get("format_version", ""))
+        group = (directory, extension, format_version)
+        merged = cls._files.setdefault(
+            group,
+            {"format_version": content["format_version"]} if format_version else {},
+        )
+        cls._sources[group] = cls._sources.get(group, 0) + 1
+
+        definitions = content.get(key, {})
+        if isinstance(definitions, list):
+            existing = {
+                entry["description"]["identifier"]: entry
+                for entry in merged.setdefault(key, [])
+            }
+            for entry in definitions:
+                identifier = entry["description"]["identifier"]
+                cls._merge(existing, identifier, entry, extension)
+                if existing[identifier] is entry:
+                    merged[key].append(entry)
+            return
+
+        target = merged.setdefault(key, {})
+        for identifier, definition in definitions.items():
+            cls._merge(target, identifier, definition, extension)
+
+    @staticmethod
+    def _merge(target: dict, identifier: str, definition: Any, extension: str) -> None:
+        if identifier not in target:
+            target[identifier] = definition
+        elif not _identical(target[identifier], definition):
+            raise AnvilConsolidationError(
+                f"{identifier} is defined more than once with different content in consolidated {extension} files."
+            )
+
+    @classmethod
+    def flush(cls) -> tuple[int, int]:
+        """Writes the merged files.
+
+        Returns:
+            tuple[int, int]: The number of files merged and the number of files written.
+        """
+        counts: dict[tuple[str, str], int] = {}
+        for directory, extension, _ in cls._files:
+            counts[(directory, extension)] = counts.get((directory, extension), 0) + 1
+
+        index: dict[tuple[str, str], int] = {}
+        for (directory, extension, _), content in cls._files.items():
+            name = CONSOLIDATED_NAME
+            if counts[(directory, extension)] > 1:
+                # One file per format version, numbered in the order they were met.
+                index[(directory, extension)] = index.get((directory, extension), 0) + 1
+                name = f"{name}_{index[(directory, extension)]}"
+            AnvilIO.file(f"{name}{extension}", content, directory, "w")
+
+        merged, written = sum(cls._sources.values()), len(cls._files)
+        cls._files = {}
+        cls._sources = {}
+        return merged, written
@@ -0,0 +1,209 @@
+"""Content addressed deduplication of resource pack definitions.
+
+Actors sharing a Blockbench model or built with the same helpers end up with
+identical geometries, animations, animation controllers and render controllers, each
+under the actor's own identifier. When deduplication is enabled, these definitions and
+the client entities and attachables referencing them are held until the end of the
+export. Every definition body is hashed, the first identifier of each body becomes
+canonical, client references are rewritten to it and the other copies are dropped.
+
+Only definitions referenced by a client entity or an attachable are deduplicated.
+Identifiers Anvil references elsewhere, such as block geometries, are kept with `keep`
+and never dropped. Commands and scripts are not parsed: dropped animations are warned
+about, since a `/playanimation` command must then use their canonical identifier.
+"""
+
+import hashlib
+from typing import Any
+
+import click
+import orjson
+
+# Keys of the client descriptions whose values are definition identifiers.
+_REFERENCES = ("geometry", "animations")
+
+
+def _digest(category: str, body: Any) -> str:
+    payload = orjson.dumps(body, option=orjson.OPT_SORT_KEYS, default=str)
+    return f"{category}:{hashlib.sha1(payload).hexdigest()}"
+
+
+class AnvilDefinitionDedupe:
+    """Keeps one canonical identifier per unique definition body.
+
+    Objects take part through their `_deduplicate` class attribute: `"definitions"`
+    for the files holding definitions, `"references"` for the client files pointing
+    at them. Definition files must also set `_consolidate` to the key holding their
+    definitions.
+    """
+
+    _enabled: bool = False
+    _definitions: list[Any] = []
+    _references: list[Any] = []
+    # Identifiers referenced outside client descriptions, kept until the next flush.
+    _kept: set[str] = set()
+
+    @classmethod
+    def begin(cls, enabled: bool = True) -> None:
+        cls._enabled = enabled
+        cls._definitions = []
+        cls._references = []
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def keep(cls, identifier: str) -> None:
+        """Marks an identifier referenced outside client descriptions, it is never dropped.
+
+        Objects are built before the export begins, so kept identifiers are not reset by `begin`.
+        """
+        cls._kept.add(identifier)
+
+    @classmethod
+    def holds(cls, object: Any) -> bool:
+        """Checks whether an object is held until the end of the export."""
+        return cls._enabled and bool(object._deduplicate)
+
+    @classmethod
+    def hold(cls, object: Any) -> None:
+        if object._deduplicate == "references":
+            cls._references.append(object)
+        else:
+            cls._definitions.append(object)
+
+    @staticmethod
+    def _entries(object: Any) -> list[tuple[str, Any]]:
+        """The `(identifier, body)` pairs of a definition file."""
+        definitions = object._content.get(object._consolidate, {})
+        if isinstance(definitions, list):
+            return [
+                (
+                    entry["description"]["identifier"],
+                    {
+                        **entry,
+                        "description": {
+                            key: value
+                            for key, value in entry["description"].items()
+                            if key != "identifier"
+                        },
+                    },
+                )
+                for entry in definitions
+            ]
+        return list(definitions.items())
+
+    @staticmethod
+    def _descriptions(object: Any) -> list[dict]:
+        return [
+            root["description"]
+            for root in object._content.values()
+            if isinstance(root, dict) and "description" in root
+        ]
+
+    @classmethod
+    def _referenced(cls) -> set[str]:
+        referenced = set()
+        for object in cls._references:
+            for description in cls._descriptions(object):
+                for key in _REFERENCES:
+                    referenced.update(description.get(key, {}).values())
+                for controller in description.get("render_controllers", []):
+                    referenced.update(
+                        controller if isinstance(controller, dict) else [controller]
+                    )
+        return referenced
+
+    @classmethod
+    def aliases(cls) -> dict[str, str]:
+        """Maps every duplicate identifier to its canonical identifier."""
+        referenced = cls._referenced()
+        canonical: dict[str, str] = {}
+        aliases: dict[str, str] = {}
+        for object in cls._definitions:
+            category = f"{type(object)._path}{object._extension}"
+            for identifier, body in cls._entries(object):
+                if identifier not in referenced:
+                    continue
+                digest = _digest(category, body)
+                if identifier in cls._kept:
+                    canonical.setdefault(digest, identifier)
+                    continue
+                original = canonical.setdefault(digest, identifier)
+                if original != identifier:
+                    aliases[identifier] = original
+        return aliases
+
+    @classmethod
+    def _rewrite(cls, object: Any, aliases: dict[str, str]) -> None:
+        for description in cls._descriptions(object):
+            for key in _REFERENCES:
+                references = description.get(key, {})
+                for name, identifier in references.items():
+                    references[name] = aliases.get(identifier, identifier)
+            controllers = description.get("render_controllers", [])
+            for index, controller in enumerate(controllers):
+                if isinstance(controller, dict):
+                    controllers[index] = {
+                        aliases.get(identifier, identifier): condition
+                        for identifier, condition in controller.items()
+                    }
+                else:
+                    controllers[index] = aliases.get(controller, controller)
+
+    @staticmethod
+    def _drop(object: Any, aliases: dict[str, str]) -> bool:
+        """Removes the duplicates of a definition file, returns whether any definition is left."""
+        definitions = object._content.get(object._consolidate, {})
+        if isinstance(definitions, list):
+            kept = [
+                entry
+                for entry in definitions
+                if entry["description"]["identifier"] not in aliases
+            ]
+        else:
+            kept = {
+                identifier: definition
+                for identifier, definition in definitions.items()
+                if identifier not in aliases
+            }
+        # Never mutate the definitions in place, they may be shared with a cache.
+        object._content = {**object._content, object._consolidate: kept}
+        return len(kept) > 0
+
+    @classmethod
+    def flush(cls) -> tuple[int, int]:
+        """Deduplicates and exports the held objects.
+
+        Returns:
+            tuple[int, int]: The number of definitions dropped and of files dropped.
+        """
+        aliases = cls.aliases()
+        animations = [
+            f"{identifier} (now {original})"
+            for identifier, original in aliases.items()
+            if identifier.startswith("animation.")
+        ]
+        if animations:
+            click.echo(
+                click.style(
+                    f"\r[WARN]: Deduplication dropped animations that commands and scripts must play by their canonical identifier: {', '.join(animations)}.",
+                    fg="yellow",
+                )
+            )
+
+        dropped_files = 0
+        for object in cls._references:
+            cls._rewrite(object, aliases)
+            object._write()
+        for object in cls._definitions:
+            if cls._drop(object, aliases):
+                object._write()
+            else:
+                dropped_files += 1
+
+        cls._definitions = []
+        cls._references = []
+        cls._kept = set()
+        return len(aliases), dropped_files
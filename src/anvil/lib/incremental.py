@@ -0,0 +1,417 @@
+"""Incremental build support.
+
+Keeps an on-disk manifest of every file Anvil wrote into the development packs
+during the previous build, so unchanged outputs can be skipped and outputs no
+object produced anymore can be removed. Copied assets are tracked in a separate
+index so unchanged sounds, textures and structures are not copied again.
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+
+import orjson
+
+from ..__version__ import __version__
+
+
+class AnvilBuildManifest:
+    """Tracks output path to content hash across builds.
+
+    The manifest is only consulted while a build is active (see `begin`), and only
+    for files that live under one of the tracked roots, usually the development
+    behavior and resource packs. Everything else is always written.
+    """
+
+    _MANIFEST_DIRECTORY = ".anvil"
+    _MANIFEST_FILE = "build_manifest.json"
+
+    _active: bool = False
+    _roots: tuple[str, ...] = ()
+    _previous: dict[str, dict] = {}
+    _current: dict[str, dict] = {}
+    _skipped: int = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def manifest_path(cls) -> str:
+        """Returns the path of the manifest file, relative to the project root."""
+        return os.path.join(cls._MANIFEST_DIRECTORY, cls._MANIFEST_FILE)
+
+    @classmethod
+    def begin(cls, roots: list[str]) -> None:
+        """Starts an incremental build and loads the previous manifest.
+
+        Parameters:
+            roots (list[str]): The output directories tracked by the manifest.
+        """
+        cls._roots = tuple(os.path.normcase(os.path.realpath(root)) for root in roots)
+        cls._previous = {}
+        cls._current = {}
+        cls._skipped = 0
+        cls._active = True
+
+        if not os.path.isfile(cls.manifest_path()):
+            return
+
+        try:
+            with open(cls.manifest_path(), "rb") as file:
+                data = orjson.loads(file.read())
+        except (OSError, orjson.JSONDecodeError):
+            return
+
+        files = data.get("files", {})
+        if data.get("version") != __version__:
+            # Outputs of another Anvil version are still cleaned up, but never trusted.
+            files = {path: {} for path in files}
+
+        cls._previous = files
+
+    @classmethod
+    def is_active(cls) -> bool:
+        return cls._active
+
+    @classmethod
+    def tracks(cls, path: str) -> bool:
+        """Checks whether a file path is tracked by the active manifest."""
+        if not cls._active:
+            return False
+
+        real_path = os.path.normcase(os.path.realpath(path))
+        return any(real_path.startswith(root + os.sep) for root in cls._roots)
+
+    @staticmethod
+    def digest(payload: str | bytes, skip_tag: bool = False) -> str:
+        """Hashes a normalized file payload.
+
+        The file stamp is left out on purpose, since it contains the build time.
+        """
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(b"\x01" if skip_tag else b"\x00")
+        hasher.update(payload)
+        return hasher.hexdigest()
+
+    @classmethod
+    def is_unchanged(cls, path: str, digest: str) -> bool:
+        """Checks whether the file on disk still holds the given payload.
+
+        A file counts as unchanged when the previous build wrote the same digest and
+        nothing touched the file since.
+        """
+        key = os.path.normpath(path)
+        previous = cls._previous.get(key)
+        if not previous or previous.get("hash") != digest:
+            return False
+
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return False
+
+        if stat.st_size != previous.get("size") or stat.st_mtime_ns != previous.get(
+            "mtime"
+        ):
+            return False
+
+        with cls._lock:
+            cls._current[key] = previous
+            cls._skipped += 1
+        return True
+
+    @classmethod
+    def record(cls, path: str, digest: str) -> None:
+        """Records a file written during the current build."""
+        key = os.path.normpath(path)
+        stat = os.stat(key)
+        with cls._lock:
+            cls._current[key] = {
+                "hash": digest,
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+            }
+
+    @classmethod
+    def _remove_empty_parents(cls, path: str) -> None:
+        directory = os.path.dirname(path)
+        while directory:
+            real_directory = os.path.normcase(os.path.realpath(directory))
+            if real_directory in cls._roots or not any(
+                real_directory.startswith(root + os.sep) for root in cls._roots
+            ):
+                return
+            try:
+                os.rmdir(directory)
+            except OSError:
+                return
+            directory = os.path.dirname(directory)
+
+    @classmethod
+    def finalize(cls) -> tuple[int, int, int]:
+        """Removes orphaned outputs and saves the manifest for the next build.
+
+        Returns:
+            tuple[int, int, int]: The number of written, unchanged and removed files.
+        """
+        removed = 0
+        for path in cls._previous.keys() - cls._current.keys():
+            if not cls.tracks(path):
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            removed += 1
+            cls._remove_empty_parents(path)
+
+        os.makedirs(cls._MANIFEST_DIRECTORY, exist_ok=True)
+        with open(cls.manifest_path(), "wb") as file:
+            file.write(
+                orjson.dumps(
+                    {"version": __version__, "files": cls._current},
+                    option=orjson.OPT_SORT_KEYS,
+                )
+            )
+
+        written = len(cls._current) - cls._skipped
+        skipped = cls._skipped
+
+        cls._active = False
+        cls._previous = {}
+        cls._current = {}
+        cls._skipped = 0
+
+        return written, skipped, removed
+
+
+class AnvilAssetSync:
+    """Defers and deduplicates asset copies made with `Directory.copy_files`.
+
+    While active, copy requests are collected instead of performed. `flush` then
+    copies every destination once, skipping files that already hold the source
+    content according to a persisted index of sizes, modification times and hashes.
+    Files are copied on a thread pool, and can be hard linked or reflinked instead of
+    copied.
+
+    A hard linked asset and its pack copy are the same file: a tool writing into the
+    pack file in place, instead of replacing it, also changes the asset. Anvil itself
+    always replaces pack files.
+    """
+
+    _INDEX_FILE = "asset_index.json"
+    LINK_MODES = ("copy", "hardlink", "reflink")
+
+    _active: bool = False
+    _link: str = "copy"
+    _requests: dict[str, tuple[str, str, os.stat_result]] = {}
+
+    @classmethod
+    def index_path(cls) -> str:
+        """Returns the path of the asset index, relative to the project root."""
+        return os.path.join(AnvilBuildManifest._MANIFEST_DIRECTORY, cls._INDEX_FILE)
+
+    @classmethod
+    def is_active(cls) -> bool:
+        return cls._active
+
+    @classmethod
+    def validate_link(cls, link: str) -> None:
+        """Raises a ValueError if `link` is not one of `LINK_MODES`."""
+        if link not in cls.LINK_MODES:
+            raise ValueError(
+                f"Unknown asset link mode: {link}. Expected one of {', '.join(cls.LINK_MODES)}."
+            )
+
+    @classmethod
+    def begin(cls, link: str = "copy") -> None:
+        """Starts collecting copy requests.
+
+        Parameters:
+            link (str, optional): One of "copy", "hardlink" or "reflink", used by `flush`. Defaults to "copy".
+
+        Raises:
+            ValueError: If the link mode is unknown.
+        """
+        cls.validate_link(link)
+        cls._active = True
+        cls._link = link
+        cls._requests = {}
+
+    @classmethod
+    def submit(cls, source: str, destination: str) -> None:
+        """Queues a copy, the last request for a destination wins.
+
+        Raises:
+            FileNotFoundError: If the source file does not exist.
+        """
+        stat = os.stat(source)
+        key = os.path.normcase(os.path.normpath(destination))
+        cls._requests.pop(key, None)
+        cls._requests[key] = (destination, source, stat)
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _reflink(source: str, destination: str) -> bool:
+        try:
+            import fcntl
+        except ImportError:
+            return False
+
+        FICLONE = 0x40049409
+        try:
+            with open(source, "rb") as source_file, open(
+                destination, "wb"
+            ) as destination_file:
+                fcntl.ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+        except OSError:
+            return False
+        return True
+
+    @classmethod
+    def _transfer(cls, source: str, destination: str, link: str) -> None:
+        os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+        temporary = f"{destination}.anvil-tmp"
+        try:
+            if link == "hardlink":
+                try:
+                    os.link(source, temporary)
+                except OSError:
+                    shutil.copyfile(source, temporary)
+            elif link == "reflink":
+                if not cls._reflink(source, temporary):
+                    shutil.copyfile(source, temporary)
+            else:
+                shutil.copyfile(source, temporary)
+            os.replace(temporary, destination)
+        finally:
+            if os.path.lexists(temporary):
+                os.remove(temporary)
+
+    @classmethod
+    def _sync(
+        cls,
+        destination: str,
+        source: str,
+        stat: os.stat_result,
+        previous: dict,
+        link: str,
+    ) -> tuple[dict, bool]:
+        entry = {
+            "source": os.path.normpath(source),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "hash": None,
+        }
+
+        try:
+            destination_stat = os.stat(destination)
+        except OSError:
+            destination_stat = None
+
+        if destination_stat is not None and destination_stat.st_size == stat.st_size:
+            destination_matches = (
+                previous.get("destination_size") == destination_stat.st_size
+                and previous.get("destination_mtime") == destination_stat.st_mtime_ns
+            )
+            if destination_matches and all(
+                previous.get(key) == entry[key] for key in ("source", "size", "mtime")
+            ):
+                entry["hash"] = previous.get("hash")
+                entry["destination_size"] = destination_stat.st_size
+                entry["destination_mtime"] = destination_stat.st_mtime_ns
+                return entry, False
+
+            # The source was touched or moved, compare contents before copying.
+            entry["hash"] = cls._hash_file(source)
+            if destination_matches and previous.get("hash") is not None:
+                destination_hash = previous["hash"]
+            else:
+                destination_hash = cls._hash_file(destination)
+            if destination_hash == entry["hash"]:
+                entry["destination_size"] = destination_stat.st_size
+                entry["destination_mtime"] = destination_stat.st_mtime_ns
+                return entry, False
+
+        cls._transfer(source, destination, link)
+        destination_stat = os.stat(destination)
+        entry["destination_size"] = destination_stat.st_size
+        entry["destination_mtime"] = destination_stat.st_mtime_ns
+        return entry, True
+
+    @classmethod
+    def flush(
+        cls, link: str | None = None, workers: int | None = None
+    ) -> tuple[int, int]:
+        """Copies every collected asset that changed, then stops collecting.
+
+        Parameters:
+            link (str, optional): One of "copy", "hardlink" or "reflink". Links fall back to copies when the file
+                system does not support them. Defaults to the link mode given to `begin`.
+            workers (int, optional): The number of copy threads. Defaults to a pool sized for I/O.
+
+        Returns:
+            tuple[int, int]: The number of copied and unchanged assets.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        link = link or cls._link
+        cls.validate_link(link)
+
+        requests = list(cls._requests.values())
+        cls._active = False
+        cls._requests = {}
+
+        previous = {}
+        if os.path.isfile(cls.index_path()):
+            try:
+                with open(cls.index_path(), "rb") as file:
+                    data = orjson.loads(file.read())
+                if data.get("version") == __version__:
+                    previous = data.get("files", {})
+            except (OSError, orjson.JSONDecodeError):
+                previous = {}
+
+        workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(workers) as pool:
+            results = [
+                (
+                    os.path.normpath(destination),
+                    pool.submit(
+                        cls._sync,
+                        destination,
+                        source,
+                        stat,
+                        previous.get(os.path.normpath(destination), {}),
+                        link,
+                    ),
+                )
+                for destination, source, stat in requests
+            ]
+
+        files = {}
+        copied = 0
+        for destination, future in results:
+            entry, changed = future.result()
+            files[destination] = entry
+            copied += changed
+
+        os.makedirs(AnvilBuildManifest._MANIFEST_DIRECTORY, exist_ok=True)
+        with open(cls.index_path(), "wb") as file:
+            file.write(
+                orjson.dumps(
+                    {"version": __version__, "files": files},
+                    option=orjson.OPT_SORT_KEYS,
+                )
+            )
+
+        return copied, len(files) - copied
@@ -4,13 +4,18 @@ import inspect
 import os
 import re
 import shutil
+import struct
 import subprocess
 import sys
+import threading
 import zipfile
+import zlib
+from collections import deque
 from datetime import datetime
 from enum import StrEnum
 from functools import wraps
-from typing import Any, Dict, List
+from itertools import islice
+from typing import Any, Callable, Dict, List
 
 import click
 import commentjson
@@ -18,6 +23,8 @@ import orjson
 import requests
 from anvil.api.core.types import RGB, RGB255, RGBA, RGBA255, Color, HexRGB, HexRGBA
 from anvil.lib.format_versions import MANIFEST_BUILD
+from anvil.lib.incremental import AnvilAssetSync, AnvilBuildManifest
+from anvil.lib.profiler import AnvilProfiler
 from packaging.version import Version
 
 from ..__version__ import __version__
@@ -41,6 +48,10 @@ DESKTOP: str = os.path.join(USERPROFILE, "Desktop")
 IMAGE_EXTENSIONS_PRIORITY = [".tga", ".png", ".jpg", ".jpeg"]
 
 
+def _json_identity(value: Any) -> Any:
+    return value
+
+
 class Directory:
     @classmethod
     def create(cls, path: str):
@@ -65,7 +76,17 @@ class Directory:
             new_dir (str): The path to the destination directory.
             target_file (str): The name of the file to be copied.
             rename (str | None, optional): The new name for the copied file. Defaults to None.
+
+        Note:
+            While asset syncing is active, the copy is deferred and skipped if the destination is up to date.
         """
+        if AnvilAssetSync.is_active():
+            AnvilAssetSync.submit(
+                os.path.join(old_dir, target_file),
+                os.path.join(new_dir, rename if rename is not None else target_file),
+            )
+            return
+
         cls.create(new_dir)
         if rename is None:
             shutil.copyfile(
@@ -125,75 +146,127 @@ class AnvilIO:
         }
     )
 
-    @staticmethod
-    def _should_keep_shortened_value(key: str, value) -> bool:
-        if ":" in key:
-            return True
-        return value not in ({}, [], None, "None", "")
+    _PRUNED_VALUES = ({}, [], None, "None", "")
+    _JSON_HANDLERS: dict[type, Callable[[Any], Any]] = {}
 
     @classmethod
     def _normalize_json_like(cls, value: Any) -> Any:
-        if value is None or isinstance(value, (bool, int, float)):
-            return value
+        """Normalizes exported content into JSON compatible data in a single pass.
 
-        if isinstance(value, dict):
-            shortened = {}
+        Empty values are pruned, enums are flattened, backslashes are rewritten and
+        Anvil objects are resolved to their exported form. Each type is dispatched
+        through a handler resolved once, and containers are only copied when
+        something inside them changes.
+        """
+        handler = cls._JSON_HANDLERS.get(value.__class__)
+        if handler is None:
+            handler = cls._resolve_json_handler(value.__class__)
+        return handler(value)
 
-            for key, item in value.items():
-                key_str = key if isinstance(key, str) else str(key)
-                shortened_value = cls._normalize_json_like(item)
-                if cls._should_keep_shortened_value(key_str, shortened_value):
-                    shortened[key_str] = shortened_value
+    @classmethod
+    def _resolve_json_handler(cls, value_type: type) -> Callable[[Any], Any]:
+        handler = cls._find_json_handler(value_type)
+        cls._JSON_HANDLERS[value_type] = handler
+        return handler
 
-            return shortened
+    @classmethod
+    def _find_json_handler(cls, value_type: type) -> Callable[[Any], Any]:
+        normalize = cls._normalize_json_like
+
+        if value_type is type(None) or issubclass(value_type, (bool, int, float)):
+            return _json_identity
+        if issubclass(value_type, dict):
+            return cls._normalize_json_dict
+        if issubclass(value_type, list):
+            return cls._normalize_json_list
+        if issubclass(value_type, tuple):
+            return lambda value: [normalize(item) for item in value]
+        if issubclass(value_type, StrEnum):
+            return lambda value: value.value
+        if value_type is str:
+            return lambda value: value.replace("\\", "/") if "\\" in value else value
+        if issubclass(value_type, str):
+            if any(base.__name__ == "Molang" for base in value_type.__mro__):
+                from anvil.api.logic.molang_ast import MolangOptimizer
+
+                return MolangOptimizer.export
+            # Subclasses such as Molang overload comparison operators, always emit a plain str.
+            return lambda value: str.replace(value, "\\", "/")
 
-        if isinstance(value, list):
-            shortened = []
+        from anvil.api.core.components import Component
+        from anvil.api.core.filters import Filter
 
-            for item in value:
-                shortened_value = cls._normalize_json_like(item)
-                if shortened_value != []:
-                    shortened.append(shortened_value)
+        if issubclass(value_type, Filter):
+            return lambda value: normalize(value.__export_dict__())
+        if issubclass(value_type, Component):
+            return lambda value: normalize(value.__export__())
+        if issubclass(value_type, type):
+            return lambda value: (
+                normalize(value.__component_identifier__())
+                if issubclass(value, Component)
+                else value
+            )
 
-            return shortened
+        class_name = value_type.__name__
 
-        if isinstance(value, tuple):
-            return [cls._normalize_json_like(item) for item in value]
+        if class_name in cls._BLOCK_DESCRIPTOR_NAMES:
+            return lambda value: normalize(value.descriptor())
+        if class_name in cls._IDENTIFIER_NAMES:
+            return lambda value: normalize(value.identifier)
+        if class_name == "LootTable":
+            return lambda value: normalize(value.table_path)
+        if class_name == "_UIElement":
+            return lambda value: normalize(value.queue())
 
-        if isinstance(value, StrEnum):
-            return value.value
+        return _json_identity
 
-        if isinstance(value, str):
-            return value.replace("\\", "/")
+    @classmethod
+    def _normalize_json_dict(cls, value: dict) -> dict:
+        handlers = cls._JSON_HANDLERS
+        pruned = cls._PRUNED_VALUES
+        shortened = None
 
-        from anvil.api.core.filters import Filter
+        for index, (key, item) in enumerate(value.items()):
+            handler = handlers.get(item.__class__)
+            if handler is None:
+                handler = cls._resolve_json_handler(item.__class__)
+            shortened_value = handler(item)
 
-        if isinstance(value, Filter):
-            return cls._normalize_json_like(value.__export_dict__())
+            key_str = key if key.__class__ is str else str(key)
+            keep = ":" in key_str or shortened_value not in pruned
 
-        from anvil.api.core.components import Component
+            if shortened is None:
+                if keep and shortened_value is item and key_str is key:
+                    continue
+                shortened = dict(islice(value.items(), index))
 
-        if isinstance(value, Component):
-            return cls._normalize_json_like(value.__export__())
+            if keep:
+                shortened[key_str] = shortened_value
 
-        if isinstance(value, type) and issubclass(value, Component):
-            return cls._normalize_json_like(value.__component_identifier__())
+        return value if shortened is None else shortened
 
-        class_name = value.__class__.__name__
+    @classmethod
+    def _normalize_json_list(cls, value: list) -> list:
+        handlers = cls._JSON_HANDLERS
+        shortened = None
 
-        if class_name in cls._BLOCK_DESCRIPTOR_NAMES:
-            return cls._normalize_json_like(value.descriptor())
+        for index, item in enumerate(value):
+            handler = handlers.get(item.__class__)
+            if handler is None:
+                handler = cls._resolve_json_handler(item.__class__)
+            shortened_value = handler(item)
 
-        if class_name in cls._IDENTIFIER_NAMES:
-            return cls._normalize_json_like(value.identifier)
+            keep = shortened_value != []
 
-        if class_name == "LootTable":
-            return cls._normalize_json_like(value.table_path)
+            if shortened is None:
+                if keep and shortened_value is item:
+                    continue
+                shortened = list(value[:index])
 
-        if class_name == "_UIElement":
-            return cls._normalize_json_like(value.queue())
+            if keep:
+                shortened.append(shortened_value)
 
-        return value
+        return value if shortened is None else shortened
 
     @classmethod
     def _dump_json_like(cls, content, minify: bool = False) -> bytes:
@@ -224,40 +297,59 @@ class AnvilIO:
         return cls._dump_json_like(content, minify=minify)
 
     @classmethod
-    def file(
+    def render(cls, name: str, content: str | bytes | Dict | List) -> str | bytes:
+        """
+        Renders the content of a file without writing it.
+
+        Parameters:
+            name (str): The name of the file, used to determine its format.
+            content: The content of the file.
+
+        Returns:
+            str | bytes: The serialized payload, without the file metadata tag.
+        """
+        from anvil.lib.config import CONFIG
+
+        type = name.split(".")[-1]
+
+        if type in ["json", "material", "code-workspace"]:
+            return cls._parse_json_like(
+                content, minify=CONFIG._MINIFY or "--minify" in sys.argv
+            )
+
+        return content
+
+    @classmethod
+    def write(
         cls,
         name: str,
-        content: str | bytes | Dict | List,
+        payload: str | bytes,
         directory: str,
         mode: str,
         skip_tag: bool = False,
-        **parameters,
     ):
         """
-        Create or modify a file with the given content.
+        Writes a rendered payload to disk.
 
         Parameters:
             name (str): The name of the file.
-            content: The content of the file.
+            payload (str | bytes): The payload returned by `AnvilIO.render`.
             directory (str): The directory path where the file should be created or modified.
             mode (str): The file mode, either "w" (write) or "a" (append).
             skip_tag (bool, optional): Whether to skip adding the file metadata tag. Defaults to False.
-            *Parameters: Additional StrEnum.
-
-        Note:
-            The file content is converted to the appropriate format based on the file extension.
         """
-
         from anvil.lib.config import CONFIG
 
         Directory.create(directory)
         path = os.path.normpath(os.path.join(directory, name))
         type = name.split(".")[-1]
+        content = payload
 
-        if type in ["json", "material", "code-workspace"]:
-            content = cls._parse_json_like(
-                content, minify=CONFIG._MINIFY or "--minify" in sys.argv
-            )
+        digest = None
+        if "w" in mode and AnvilBuildManifest.tracks(path):
+            digest = AnvilBuildManifest.digest(content, skip_tag)
+            if AnvilBuildManifest.is_unchanged(path, digest):
+                return
 
         if not skip_tag:
             file_stamp = cls._get_file_stamp(name, type, CONFIG.COMPANY)
@@ -270,68 +362,352 @@ class AnvilIO:
             binary_mode = mode if "b" in mode else f"{mode}b"
             with open(path, binary_mode) as file:
                 file.write(content)
+        else:
+            with open(path, mode, encoding="utf-8") as file:
+                file.write(content)
+
+        if digest is not None:
+            AnvilBuildManifest.record(path, digest)
+
+    @classmethod
+    def file(
+        cls,
+        name: str,
+        content: str | bytes | Dict | List,
+        directory: str,
+        mode: str,
+        skip_tag: bool = False,
+        **parameters,
+    ):
+        """
+        Create or modify a file with the given content.
+
+        Parameters:
+            name (str): The name of the file.
+            content: The content of the file.
+            directory (str): The directory path where the file should be created or modified.
+            mode (str): The file mode, either "w" (write) or "a" (append).
+            skip_tag (bool, optional): Whether to skip adding the file metadata tag. Defaults to False.
+            *Parameters: Additional StrEnum.
+
+        Note:
+            The file content is converted to the appropriate format based on the file extension.
+            During incremental builds, tracked files whose payload did not change are left untouched.
+            While the export pipeline is active, the file is rendered right away and written on the pipeline's workers.
+        """
+        payload = cls.render(name, content)
+        AnvilProfiler.add_bytes(payload)
+        if AnvilExportPipeline.is_active():
+            AnvilExportPipeline.submit(name, payload, directory, mode, skip_tag)
             return
 
-        with open(path, mode, encoding="utf-8") as file:
-            file.write(content)
+        cls.write(name, payload, directory, mode, skip_tag)
+
+
+class AnvilExportError(Exception):
+    """Raised when a file of the export pipeline fails to be written."""
+
+    def __init__(self, object: object, error: Exception) -> None:
+        super().__init__(str(error))
+        self.object = object
+        self.error = error
+
+
+class AnvilExportPipeline:
+    """Writes the files of `AnvilIO.file` on a pool of workers.
+
+    Files are still rendered on the calling thread, as soon as they are exported, so
+    their content is the same as in a serial build. Only the writes are handed to the
+    workers, which overlap them with the export of the next objects. Files sharing a
+    path are written in submission order.
+    """
+
+    _active: bool = False
+    _owner: object = None
+    _pool = None
+    _writes: list[tuple] = []
+    _last_write: dict[str, Any] = {}
+
+    @classmethod
+    def is_active(cls) -> bool:
+        return cls._active
+
+    @classmethod
+    def begin(cls, jobs: int) -> None:
+        """Starts writing files on the workers.
+
+        Parameters:
+            jobs (int): The number of write workers.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        cls._active = True
+        cls._owner = None
+        cls._pool = ThreadPoolExecutor(max(1, jobs))
+        cls._writes = []
+        cls._last_write = {}
+
+    @classmethod
+    def set_owner(cls, object: object) -> None:
+        """Sets the object responsible for the next submitted files, used for error reporting."""
+        cls._owner = object
+
+    @classmethod
+    def submit(
+        cls,
+        name: str,
+        payload: str | bytes,
+        directory: str,
+        mode: str,
+        skip_tag: bool = False,
+    ) -> None:
+        path = os.path.normcase(os.path.normpath(os.path.join(directory, name)))
+        previous = cls._last_write.get(path)
+
+        def write():
+            # Workers pick writes up in submission order, the previous one already started.
+            if previous is not None:
+                previous.exception()
+            AnvilIO.write(name, payload, directory, mode, skip_tag)
+
+        future = cls._pool.submit(write)
+        cls._last_write[path] = future
+        cls._writes.append((cls._owner, future))
+
+    @classmethod
+    def flush(cls) -> int:
+        """Waits for every submitted file to be written, then stops the workers.
+
+        Returns:
+            int: The number of files written.
+
+        Raises:
+            AnvilExportError: For the first failing file in submission order.
+        """
+        writes = cls._writes
+        cls._pool.shutdown(wait=True)
+        cls._active = False
+        cls._owner = None
+        cls._pool = None
+        cls._writes = []
+        cls._last_write = {}
+
+        for owner, future in writes:
+            error = future.exception()
+            if error is not None:
+                raise AnvilExportError(owner, error) from error
+        return len(writes)
 
 
 class AnvilArchive:
     _EXCLUDED_EXTENSIONS = {".js.map"}
-    _STORED_EXTENSIONS = {}
+    _STORED_EXTENSIONS = {".ogg", ".png", ".jpg", ".jpeg"}
     _FAST_COMPRESS_LEVEL = 3
+    # Compressed members are shared between the archives of a build, up to this size.
+    _MEMBER_CACHE_LIMIT = 256 * 1024 * 1024
+
+    _member_cache: dict[tuple, tuple[int, bytes]] = {}
+    _member_cache_size: int = 0
+    _member_cache_lock = threading.Lock()
 
     @classmethod
-    def write_entry(
-        cls, ziph: zipfile.ZipFile, file_path: str, archive_path: str
-    ) -> None:
-        file_path_lower = file_path.lower()
-        if any(file_path_lower.endswith(ext) for ext in cls._EXCLUDED_EXTENSIONS):
-            return
+    def _collect_entries(cls, dir_list: dict) -> list[tuple[str, str]]:
+        """Lists the files of a mapping in a deterministic order."""
+        entries = []
+        for source, target in dir_list.items():
+            if os.path.isdir(source):
+                source_root = os.path.realpath(source)
+                for root, directories, files in os.walk(source_root):
+                    directories.sort()
+                    for file_name in sorted(files):
+                        file_path = os.path.join(root, file_name)
+                        relative_path = os.path.relpath(file_path, source_root)
+                        entries.append((file_path, os.path.join(target, relative_path)))
+            else:
+                entries.append((source, os.path.join(target, os.path.basename(source))))
 
+        return [
+            (file_path, archive_path)
+            for file_path, archive_path in entries
+            if not any(
+                file_path.lower().endswith(ext) for ext in cls._EXCLUDED_EXTENSIONS
+            )
+        ]
+
+    @classmethod
+    def _compress_entry(
+        cls,
+        file_path: str,
+        archive_path: str,
+        previous: zipfile.ZipInfo | None,
+    ) -> tuple[zipfile.ZipInfo, bytes | None, tuple]:
+        """Compresses a file into a raw member.
+
+        Returns:
+            tuple[zipfile.ZipInfo, bytes | None, tuple]: The member header, its compressed data, or None when the
+                member of the previous archive can be reused as is, and the member cache key.
+        """
+        zinfo = zipfile.ZipInfo.from_file(file_path, archive_path)
         extension = os.path.splitext(file_path)[1].lower()
-        if extension in cls._STORED_EXTENSIONS:
-            ziph.write(file_path, archive_path, compress_type=zipfile.ZIP_STORED)
-            return
+        zinfo.compress_type = (
+            zipfile.ZIP_STORED
+            if extension in cls._STORED_EXTENSIONS
+            else zipfile.ZIP_DEFLATED
+        )
 
-        ziph.write(
-            file_path,
-            archive_path,
-            compress_type=zipfile.ZIP_DEFLATED,
-            compresslevel=cls._FAST_COMPRESS_LEVEL,
+        stat = os.stat(file_path)
+        key = (
+            os.path.realpath(file_path),
+            stat.st_size,
+            stat.st_mtime_ns,
+            zinfo.compress_type,
         )
+        with cls._member_cache_lock:
+            cached = cls._member_cache.get(key)
+
+        zinfo.file_size = stat.st_size
+        if cached is not None:
+            zinfo.CRC, data = cached
+            zinfo.compress_size = len(data)
+            return zinfo, data, key
+
+        with open(file_path, "rb") as file:
+            raw = file.read()
+        zinfo.CRC = zlib.crc32(raw)
+
+        if (
+            previous is not None
+            and previous.CRC == zinfo.CRC
+            and previous.file_size == zinfo.file_size
+            and previous.compress_type == zinfo.compress_type
+        ):
+            zinfo.compress_size = previous.compress_size
+            return zinfo, None, key
+
+        if zinfo.compress_type == zipfile.ZIP_STORED:
+            data = raw
+        else:
+            compressor = zlib.compressobj(cls._FAST_COMPRESS_LEVEL, zlib.DEFLATED, -15)
+            data = compressor.compress(raw) + compressor.flush()
+        zinfo.compress_size = len(data)
+
+        cls._cache_member(key, zinfo.CRC, data)
+        return zinfo, data, key
+
+    @classmethod
+    def _cache_member(cls, key: tuple, crc: int, data: bytes) -> None:
+        with cls._member_cache_lock:
+            if cls._member_cache_size + len(data) <= cls._MEMBER_CACHE_LIMIT:
+                cls._member_cache[key] = (crc, data)
+                cls._member_cache_size += len(data)
+
+    @staticmethod
+    def _read_raw_member(file, zinfo: zipfile.ZipInfo) -> bytes:
+        file.seek(zinfo.header_offset)
+        header = struct.unpack(
+            zipfile.structFileHeader, file.read(zipfile.sizeFileHeader)
+        )
+        file.seek(
+            zinfo.header_offset + zipfile.sizeFileHeader + header[10] + header[11]
+        )
+        return file.read(zinfo.compress_size)
+
+    @staticmethod
+    def _write_raw_member(
+        zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: bytes
+    ) -> None:
+        zinfo.header_offset = zipf.fp.tell()
+        zipf.fp.write(zinfo.FileHeader())
+        zipf.fp.write(data)
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf.start_dir = zipf.fp.tell()
 
     @classmethod
-    def from_mapping(cls, zip_name, dir_list: dict) -> None:
+    def from_mapping(cls, zip_name, dir_list: dict, workers: int | None = None) -> None:
         """
         Create a ZIP archive containing multiple directories and files.
 
         Parameters:
             zip_name: The name of the ZIP archive.
             dir_list (dict): A dictionary where the keys are source directories and the values are target directories.
+            workers (int, optional): The number of compression threads. Defaults to the number of CPUs.
 
         Note:
             The target directories represent the structure inside the ZIP archive.
+            Entries are compressed in parallel and written in a deterministic order. Already compressed formats
+            are stored, and members of an existing archive at `zip_name` are reused when their source is unchanged.
         """
+        from concurrent.futures import ThreadPoolExecutor
+
+        entries = cls._collect_entries(dir_list)
+        workers = workers or os.cpu_count() or 1
+
+        previous_archive = None
+        previous_members: dict[str, zipfile.ZipInfo] = {}
+        if os.path.isfile(zip_name):
+            try:
+                previous_archive = zipfile.ZipFile(zip_name)
+                previous_members = {
+                    zinfo.filename: zinfo
+                    for zinfo in previous_archive.infolist()
+                    if not zinfo.flag_bits & 0x1
+                }
+            except (OSError, zipfile.BadZipFile):
+                previous_archive = None
 
-        with zipfile.ZipFile(
-            zip_name,
-            "w",
-            compression=zipfile.ZIP_DEFLATED,
-            compresslevel=cls._FAST_COMPRESS_LEVEL,
-        ) as zipf:
-            for source, target in dir_list.items():
-                if os.path.isdir(source):
-                    source_root = os.path.realpath(source)
-                    for root, _, files in os.walk(source_root):
-                        for file_name in files:
-                            file_path = os.path.join(root, file_name)
-                            relative_path = os.path.relpath(file_path, source_root)
-                            archive_path = os.path.join(target, relative_path)
-                            cls.write_entry(zipf, file_path, archive_path)
-                else:
-                    archive_path = os.path.join(target, os.path.basename(source))
-                    cls.write_entry(zipf, source, archive_path)
+        temporary = f"{zip_name}.tmp"
+        try:
+            with zipfile.ZipFile(
+                temporary,
+                "w",
+                compression=zipfile.ZIP_DEFLATED,
+                compresslevel=cls._FAST_COMPRESS_LEVEL,
+            ) as zipf, ThreadPoolExecutor(workers) as pool:
+                pending = deque()
+                entries_iter = iter(entries)
+
+                def fill():
+                    # Bounds the number of compressed members held in memory.
+                    while len(pending) < workers * 4:
+                        entry = next(entries_iter, None)
+                        if entry is None:
+                            return
+                        name = zipfile.ZipInfo(entry[1]).filename
+                        pending.append(
+                            pool.submit(
+                                cls._compress_entry,
+                                *entry,
+                                previous_members.get(name),
+                            )
+                        )
+
+                fill()
+                while pending:
+                    zinfo, data, key = pending.popleft().result()
+                    if data is None:
+                        data = cls._read_raw_member(
+                            previous_archive.fp, previous_members[zinfo.filename]
+                        )
+                        cls._cache_member(key, zinfo.CRC, data)
+                    cls._write_raw_member(zipf, zinfo, data)
+                    fill()
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        finally:
+            if previous_archive is not None:
+                previous_archive.close()
+
+        os.replace(temporary, zip_name)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drops the compressed members kept for archives of the current build."""
+        with cls._member_cache_lock:
+            cls._member_cache = {}
+            cls._member_cache_size = 0
 
     @classmethod
     def marketplace_zip(cls):
@@ -889,6 +1265,55 @@ def process_subcommand(command: str, error_handle: str = "Error"):
         print(f"{error_handle}: {e}")
 
 
+class BackgroundSubcommand:
+    """A subprocess command running alongside the build.
+
+    The output of the command is streamed to the console line by line, prefixed with
+    `label`, while the build goes on. `wait` must be called before anything reads
+    what the command writes.
+    """
+
+    def __init__(self, command: str, error_handle: str = "Error", label: str = ""):
+        """Starts the command.
+
+        Parameters:
+            command (str): The command to execute.
+            error_handle (str, optional): Error message prefix. Defaults to "Error".
+            label (str, optional): Prefix of the streamed output lines. Defaults to "".
+        """
+        self._command = command
+        self._error_handle = error_handle
+        self._label = label
+        self._process = subprocess.Popen(
+            command,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+        )
+        self._reader = threading.Thread(target=self._stream, daemon=True)
+        self._reader.start()
+
+    def _stream(self) -> None:
+        for line in self._process.stdout:
+            click.echo(f"\r{self._label}{line.rstrip()}")
+
+    def wait(self) -> int:
+        """Waits for the command to finish.
+
+        Returns:
+            int: The exit code of the command.
+        """
+        code = self._process.wait()
+        self._reader.join()
+        if code != 0:
+            print(
+                f"{self._error_handle}: {subprocess.CalledProcessError(code, self._command)}"
+            )
+        return code
+
+
 def salt_from_str(s: str) -> int:
     """Generates a hash value from a string for use as a random seed.
 
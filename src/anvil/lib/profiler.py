@@ -0,0 +1,274 @@
+"""Build profiling support.
+
+Times the stages of a build and the export of every object type, and counts the
+bytes each object type produces. The report is printed as a table and saved as
+JSON, or in the speedscope format to be inspected on https://www.speedscope.app.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+import click
+import orjson
+
+from ..__version__ import __version__
+
+
+class AnvilProfiler:
+    """Collects timings for the current build.
+
+    Every hook is a no-op until `begin` is called, so instrumented code pays close to
+    nothing when profiling is off.
+    """
+
+    FORMATS = ("json", "speedscope")
+    _OUTPUT_DIRECTORY = "output"
+
+    _active: bool = False
+    _start: float = 0.0
+    _stages: dict[str, float] = {}
+    _stage_bytes: dict[str, int] = {}
+    _stack: list[str] = []
+    _objects: dict[str, list] = {}
+    _current: str | None = None
+    _frames: dict[str, int] = {}
+    _events: list[tuple[str, int, float]] = []
+    _lock = threading.Lock()
+    _null = nullcontext()
+
+    @classmethod
+    def begin(cls) -> None:
+        """Starts profiling, the build time is measured from this point."""
+        cls._active = True
+        cls._start = time.perf_counter()
+        cls._stages = {}
+        cls._stage_bytes = {}
+        cls._stack = []
+        cls._objects = {}
+        cls._current = None
+        cls._frames = {}
+        cls._events = []
+
+    @classmethod
+    def is_active(cls) -> bool:
+        return cls._active
+
+    @classmethod
+    def _event(cls, kind: str, name: str, at: float) -> None:
+        frame = cls._frames.setdefault(name, len(cls._frames))
+        cls._events.append((kind, frame, at - cls._start))
+
+    @classmethod
+    @contextmanager
+    def _measure_stage(cls, name: str):
+        start = time.perf_counter()
+        cls._stack.append(name)
+        cls._event("O", name, start)
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            cls._event("C", name, end)
+            cls._stack.pop()
+            cls._stages[name] = cls._stages.get(name, 0.0) + end - start
+
+    @classmethod
+    def stage(cls, name: str):
+        """Returns a context manager timing a build stage.
+
+        Parameters:
+            name (str): The name of the stage, stages sharing a name are summed.
+        """
+        if not cls._active:
+            return cls._null
+        return cls._measure_stage(name)
+
+    @classmethod
+    @contextmanager
+    def _measure_object(cls, object_type: str):
+        previous = cls._current
+        cls._current = object_type
+        start = time.perf_counter()
+        cls._event("O", object_type, start)
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            cls._event("C", object_type, end)
+            cls._current = previous
+            stats = cls._objects.setdefault(object_type, [0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += end - start
+
+    @classmethod
+    def object(cls, object: object):
+        """Returns a context manager timing the export of an object, grouped by type."""
+        if not cls._active:
+            return cls._null
+        return cls._measure_object(object.__class__.__name__)
+
+    @classmethod
+    def add_bytes(cls, payload: str | bytes) -> None:
+        """Attributes a rendered file to the object being exported, or to the current stage.
+
+        Parameters:
+            payload (str | bytes): The rendered file.
+        """
+        if not cls._active:
+            return
+
+        size = len(payload.encode("utf-8") if isinstance(payload, str) else payload)
+        with cls._lock:
+            object_type = cls._current
+            if object_type is not None:
+                cls._objects.setdefault(object_type, [0, 0.0, 0])[2] += size
+            else:
+                stage = cls._stack[-1] if cls._stack else "other"
+                cls._stage_bytes[stage] = cls._stage_bytes.get(stage, 0) + size
+
+    @classmethod
+    def to_dict(cls) -> dict:
+        """Returns the aggregated report."""
+        total = time.perf_counter() - cls._start
+        return {
+            "version": __version__,
+            "total": total,
+            "stages": [
+                {
+                    "name": name,
+                    "seconds": seconds,
+                    "bytes": cls._stage_bytes.get(name, 0),
+                }
+                for name, seconds in cls._stages.items()
+            ],
+            "objects": [
+                {"type": name, "count": count, "seconds": seconds, "bytes": size}
+                for name, (count, seconds, size) in sorted(
+                    cls._objects.items(), key=lambda item: -item[1][1]
+                )
+            ],
+        }
+
+    @classmethod
+    def to_speedscope(cls) -> dict:
+        """Returns the recorded stages and objects as an evented speedscope profile."""
+        end = time.perf_counter() - cls._start
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": f"anvil {__version__}",
+            "name": "anvil build",
+            "activeProfileIndex": 0,
+            "shared": {"frames": [{"name": name} for name in cls._frames]},
+            "profiles": [
+                {
+                    "type": "evented",
+                    "name": "anvil build",
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": end,
+                    "events": [
+                        {"type": kind, "frame": frame, "at": at}
+                        for kind, frame, at in cls._events
+                    ],
+                }
+            ],
+        }
+
+    @staticmethod
+    def _table(headers: list[str], rows: list[list[str]]) -> str:
+        widths = [
+            max(len(str(row[index])) for row in [headers, *rows])
+            for index in range(len(headers))
+        ]
+        lines = []
+        for row in [headers, *rows]:
+            cells = [str(row[0]).ljust(widths[0])]
+            cells += [
+                str(cell).rjust(width) for cell, width in zip(row[1:], widths[1:])
+            ]
+            lines.append("  ".join(cells))
+        lines.insert(1, "  ".join("-" * width for width in widths))
+        return "\n".join(lines)
+
+    @classmethod
+    def finish(cls, format: str = "json") -> str:
+        """Prints the report, saves it to the output directory and stops profiling.
+
+        Parameters:
+            format (str, optional): Either "json" or "speedscope". Defaults to "json".
+
+        Returns:
+            str: The path of the saved report.
+        """
+        if format not in cls.FORMATS:
+            raise ValueError(
+                f"Unknown profile format: {format}. Expected one of {', '.join(cls.FORMATS)}."
+            )
+
+        report = cls.to_dict()
+        total = report["total"] or 1.0
+
+        stage_rows = [
+            [
+                stage["name"],
+                f"{stage['seconds']:.3f}",
+                f"{stage['seconds'] / total * 100:.1f}",
+                f"{stage['bytes']:,}",
+            ]
+            for stage in report["stages"]
+        ]
+        untracked = report["total"] - sum(
+            stage["seconds"] for stage in report["stages"]
+        )
+        stage_rows.append(
+            [
+                "project script and other",
+                f"{untracked:.3f}",
+                f"{untracked / total * 100:.1f}",
+                "",
+            ]
+        )
+        object_rows = [
+            [
+                item["type"],
+                str(item["count"]),
+                f"{item['seconds']:.3f}",
+                f"{item['seconds'] / total * 100:.1f}",
+                f"{item['bytes']:,}",
+            ]
+            for item in report["objects"]
+        ]
+
+        click.echo(
+            click.style(
+                f"\r[INFO]: Build profile, {report['total']:.3f} s in total.",
+                fg="cyan",
+            )
+        )
+        click.echo(cls._table(["Stage", "Time (s)", "%", "Bytes"], stage_rows))
+        if object_rows:
+            click.echo()
+            click.echo(
+                cls._table(
+                    ["Object type", "Count", "Time (s)", "%", "Bytes"], object_rows
+                )
+            )
+
+        if format == "speedscope":
+            data = cls.to_speedscope()
+            name = "anvil_profile.speedscope.json"
+        else:
+            data = report
+            name = "anvil_profile.json"
+
+        os.makedirs(cls._OUTPUT_DIRECTORY, exist_ok=True)
+        path = os.path.join(cls._OUTPUT_DIRECTORY, name)
+        with open(path, "wb") as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+        click.echo(click.style(f"\r[INFO]: Build profile saved to {path}.", fg="green"))
+
+        cls._active = False
+        return path
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
 import traceback
 import uuid
+from types import MappingProxyType
 from typing import Dict, Mapping
 
 from anvil.api.core.types import Identifier, Vector2D
 from anvil.lib.config import CONFIG, ConfigPackageTarget
+from anvil.lib.consolidation import AnvilPackConsolidation
+from anvil.lib.dedupe import AnvilDefinitionDedupe
 from anvil.lib.format_versions import *
 from anvil.lib.lib import APPDATA, AnvilIO, salt_from_str
 from anvil.lib.templater import load_file
@@ -794,10 +798,43 @@ class JsonSchemes:
         )
 
 
+# Interned descriptors kept per descriptor class, the oldest ones are dropped beyond.
+_INTERN_LIMIT = 4096
+
+
+def _intern(cache: dict, key: tuple, descriptor: AddonDescriptor) -> None:
+    """Freezes a descriptor and shares it under `key`."""
+    if len(cache) >= _INTERN_LIMIT:
+        del cache[next(iter(cache))]
+    descriptor._frozen = True
+    cache[key] = descriptor
+
+
+def _frozen_setattr(self: AddonDescriptor, name: str, value) -> None:
+    if self._frozen:
+        raise AttributeError(
+            f"Interned {self._object_type} '{self.identifier}' is shared and cannot be changed."
+        )
+    object.__setattr__(self, name, value)
+
+
+def _frozen_deepcopy(self: AddonDescriptor, memo: dict) -> AddonDescriptor:
+    # Interned descriptors cannot change, copies of the content holding them share them.
+    if self._frozen:
+        return self
+    target = self.__class__.__new__(self.__class__)
+    memo[id(self)] = target
+    for name, value in self.__dict__.items():
+        object.__setattr__(target, name, copy.deepcopy(value, memo))
+    return target
+
+
 class AddonDescriptor:
     """An object representing an addon descriptor with validation for names and namespaces."""
 
     _object_type = "addon_descriptor"
+    # Interned descriptors are shared between every call of a vanilla factory.
+    _frozen = False
 
     def _validate_name(
         self, name: str, is_vanilla: bool = False, is_vanilla_allowed: bool = False
@@ -896,9 +933,19 @@ class AddonDescriptor:
 
         Parameters:
             data (any): The data to be set for the addon object.
+
+        Returns:
+            The addon object, or a copy of it if the object is interned.
         """
-        self._data = data
-        return self
+        target = self._thaw() if self._frozen else self
+        target._data = data
+        return target
+
+    def _thaw(self):
+        """Returns a copy of an interned descriptor that can be changed."""
+        target = copy.copy(self)
+        object.__setattr__(target, "_frozen", False)
+        return target
 
     def __export__(self):
         """
@@ -945,6 +992,10 @@ class AddonObject(AddonDescriptor):
     _extension = ".json"
     _path = ""
     _object_type = "addon_object"
+    # Key of the definitions merged into shared files when the pack is consolidated.
+    _consolidate: str | None = None
+    # Role in the deduplication of resource pack definitions, "definitions" or "references".
+    _deduplicate: str | None = None
 
     def __init__(self, name: str, is_vanilla: bool = False) -> None:
         """
@@ -993,6 +1044,19 @@ class AddonObject(AddonDescriptor):
         Exports the addon object after potentially shortening its content and replacing backslashes.
         Logs the event and writes the object to a file.
         """
+        if AnvilDefinitionDedupe.holds(self):
+            AnvilDefinitionDedupe.hold(self)
+            return
+        self._write()
+
+    def _write(self):
+        """Writes the content of the addon object, or merges it when the pack is consolidated."""
+        if self._consolidate and AnvilPackConsolidation.is_enabled():
+            AnvilPackConsolidation.add(
+                type(self)._path, self._extension, self._consolidate, self._content
+            )
+            return
+
         path = self._path.removeprefix(CONFIG.RP_PATH).removeprefix(CONFIG.BP_PATH)
         path = os.path.join(path, f"{self._name}{self._extension}")
         if len(path) > 80:
@@ -1010,6 +1074,46 @@ class MinecraftAddonObject(AddonDescriptor):
 
 class MinecraftBlockDescriptor(AddonDescriptor):
     _object_type = "Block Descriptor"
+    _interned: dict[tuple, MinecraftBlockDescriptor] = {}
+    __setattr__ = _frozen_setattr
+    __deepcopy__ = _frozen_deepcopy
+
+    @classmethod
+    def interned(
+        cls,
+        name: str,
+        states: Mapping[str, str | int | float | bool | None] | None = None,
+        tags: set[str] | None = None,
+    ) -> MinecraftBlockDescriptor:
+        """Returns the shared descriptor of a vanilla block.
+
+        Descriptors with the same identifier, states and tags are the same read-only
+        instance, they compare and hash by identity. The last `_INTERN_LIMIT` ones are
+        kept.
+
+        Parameters:
+            name (str): The identifier of the vanilla block.
+            states (Mapping[str, str | int | float | bool | None], optional): The block states, None values are left out. Defaults to None.
+            tags (set[str], optional): The block tags. Defaults to None.
+        """
+        key = (
+            name,
+            (
+                tuple(
+                    sorted((str(k), str(v)) for k, v in states.items() if v is not None)
+                )
+                if states
+                else ()
+            ),
+            frozenset(tags) if tags else frozenset(),
+        )
+        descriptor = cls._interned.get(key)
+        if descriptor is None:
+            descriptor = cls(name, True, dict(key[1]))
+            descriptor._states = MappingProxyType(descriptor._states)
+            descriptor._tags = key[2]
+            _intern(cls._interned, key, descriptor)
+        return descriptor
 
     def __init__(
         self,
@@ -1028,6 +1132,12 @@ class MinecraftBlockDescriptor(AddonDescriptor):
                     self._states[str(k)] = str(v)
         self._tags = tags if tags is not None else set()
 
+    def _thaw(self):
+        target = super()._thaw()
+        target._states = dict(self._states)
+        target._tags = set(self._tags)
+        return target
+
     @property
     def tags(self) -> set[str]:
         """Returns the tags associated with the block."""
@@ -1036,7 +1146,8 @@ class MinecraftBlockDescriptor(AddonDescriptor):
     @property
     def states(self) -> Mapping[str, str | int | float | bool]:
         """Returns a string representation of the block states."""
-        return self._states
+        # Interned states are read-only and exported as a copy.
+        return dict(self._states) if self._frozen else self._states
 
     def descriptor(self) -> Identifier | dict:
         if len(self.states) > 0 or len(self._tags) > 0:
@@ -1129,12 +1240,34 @@ class NoiseBlockSpecifier:
 
 class MinecraftItemDescriptor(AddonDescriptor):
     _object_type = "Item Descriptor"
+    _interned: dict[tuple, MinecraftItemDescriptor] = {}
+    __setattr__ = _frozen_setattr
+    __deepcopy__ = _frozen_deepcopy
 
     def __init__(
         self, name: str, is_vanilla: bool = False, is_vanilla_allowed: bool = True
     ) -> None:
         super().__init__(name, is_vanilla, is_vanilla_allowed)
 
+    @classmethod
+    def interned(cls, name: str, data: str | None = None) -> MinecraftItemDescriptor:
+        """Returns the shared descriptor of a vanilla item.
+
+        Descriptors with the same identifier and data are the same read-only instance,
+        they compare and hash by identity. The last `_INTERN_LIMIT` ones are kept.
+
+        Parameters:
+            name (str): The identifier of the vanilla item.
+            data (str, optional): The identifier data, such as a potion type. Defaults to None.
+        """
+        key = (name, data)
+        descriptor = cls._interned.get(key)
+        if descriptor is None:
+            descriptor = cls(name, True)
+            descriptor._data = data
+            _intern(cls._interned, key, descriptor)
+        return descriptor
+
 
 class MinecraftBiomeDescriptor(AddonDescriptor):
     _object_type = "Biome Descriptor"
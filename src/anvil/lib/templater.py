@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 import os
 import re
+import threading
+from collections import OrderedDict
 from typing import Any, Callable, Dict
 
 _TOKEN_RE = re.compile(r"\{\{\s*([A-Za-z_]\w*)\s*(?:\|([A-Za-z_]\w*))?\s*\}\}")
@@ -18,6 +20,213 @@ _TEMPLATES_DIR = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates"
 )
 
+# Maximum number of compiled templates kept per process.
+_CACHE_SIZE = 128
+
+# Slots are marked in the JSON skeleton with private use characters, which never
+# appear in the shipped templates.
+_SLOT_OPEN = "\ue000"
+_SLOT_CLOSE = "\ue001"
+_SLOT_RE = re.compile(f"{_SLOT_OPEN}(\\d+){_SLOT_CLOSE}")
+
+# Characters that would be interpreted by the JSON decoder if substituted inside a
+# string literal.
+_UNSAFE_IN_STRING_RE = re.compile(r'["\\\x00-\x1f]')
+
+
+class _StringSlot:
+    """A JSON string or key holding one or more substitution slots."""
+
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: list[str | int]) -> None:
+        self.parts = parts
+
+
+class _CompiledTemplate:
+    """A template split into literal text and substitution tokens.
+
+    JSON templates additionally get a parsed skeleton, built on first use, in which
+    every token is a slot. Filling the skeleton produces a fresh object on every
+    call, so callers are free to mutate the result.
+    """
+
+    __slots__ = ("parts", "tokens", "bare_slots", "_skeleton", "_compiled_skeleton")
+
+    def __init__(self, text: str) -> None:
+        self.parts: list[str | int] = []
+        self.tokens: list[tuple[str, str | None, str]] = []
+
+        position = 0
+        for match in _TOKEN_RE.finditer(text):
+            if match.start() > position:
+                self.parts.append(text[position : match.start()])
+            self.parts.append(len(self.tokens))
+            self.tokens.append((match.group(1), match.group(2), match.group(0)))
+            position = match.end()
+        if position < len(text):
+            self.parts.append(text[position:])
+
+        self.bare_slots: set[int] = set()
+        self._skeleton: Any = None
+        self._compiled_skeleton = False
+
+    def render_tokens(self, vars: Dict[str, object], on_missing: str) -> list[str]:
+        rendered = []
+        for var_name, filter_name, raw in self.tokens:
+            if var_name not in vars:
+                if on_missing == "keep":
+                    rendered.append(raw)
+                    continue
+                if on_missing == "empty":
+                    rendered.append("")
+                    continue
+                raise KeyError(f"Missing variable: {var_name}")
+            value = vars[var_name]
+            if filter_name:
+                filter_func = _DEFAULT_FILTERS.get(filter_name)
+                if not filter_func:
+                    raise ValueError(f"Unknown filter: {filter_name}")
+                rendered.append(str(filter_func(value)))
+            else:
+                # Apply dquote filter by default
+                rendered.append(str(value).replace("'", '"'))
+        return rendered
+
+    def render_text(self, rendered: list[str]) -> str:
+        return "".join(
+            part if part.__class__ is str else rendered[part] for part in self.parts
+        )
+
+    def skeleton(self) -> Any:
+        """Returns the parsed JSON skeleton, or None if the template has none.
+
+        Templates whose tokens cannot be expressed as slots, for instance tokens
+        that splice structure into the document, are always rendered as text.
+        """
+        if not self._compiled_skeleton:
+            self._compiled_skeleton = True
+            try:
+                self._skeleton = _compile_node(
+                    json.loads(self._marked_text()), self.bare_slots
+                )
+            except ValueError:
+                self._skeleton = None
+        return self._skeleton
+
+    def _marked_text(self) -> str:
+        text = []
+        in_string = False
+        escaped = False
+        for part in self.parts:
+            if part.__class__ is not str:
+                marker = f"{_SLOT_OPEN}{part}{_SLOT_CLOSE}"
+                if in_string:
+                    text.append(marker)
+                else:
+                    self.bare_slots.add(part)
+                    text.append(f'"{marker}"')
+                continue
+            for char in part:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = in_string
+                elif char == '"':
+                    in_string = not in_string
+            text.append(part)
+        return "".join(text)
+
+
+def _compile_node(node: Any, bare: set[int], is_key: bool = False) -> Any:
+    if isinstance(node, dict):
+        return {
+            _compile_node(key, bare, True): _compile_node(value, bare)
+            for key, value in node.items()
+        }
+    if isinstance(node, list):
+        return [_compile_node(item, bare) for item in node]
+    if isinstance(node, str) and _SLOT_OPEN in node:
+        parts = [
+            int(part) if index % 2 else part
+            for index, part in enumerate(_SLOT_RE.split(node))
+            if part
+        ]
+        if is_key and any(part in bare for part in parts if part.__class__ is int):
+            raise ValueError("Bare slots cannot be used as keys.")
+        return _StringSlot(parts)
+    return node
+
+
+class _SkeletonMismatch(Exception):
+    """Raised when a filled value would not match the text rendering."""
+
+
+def _fill(node: Any, rendered: list[str], bare: set[int]) -> Any:
+    cls = node.__class__
+    if cls is dict:
+        return {
+            _fill(key, rendered, bare): _fill(value, rendered, bare)
+            for key, value in node.items()
+        }
+    if cls is list:
+        return [_fill(item, rendered, bare) for item in node]
+    if cls is _StringSlot:
+        parts = node.parts
+        if len(parts) == 1 and parts[0].__class__ is int and parts[0] in bare:
+            try:
+                return json.loads(rendered[parts[0]])
+            except ValueError:
+                raise _SkeletonMismatch from None
+        text = []
+        for part in parts:
+            if part.__class__ is str:
+                text.append(part)
+                continue
+            value = rendered[part]
+            if _UNSAFE_IN_STRING_RE.search(value):
+                raise _SkeletonMismatch
+            text.append(value)
+        return "".join(text)
+    return node
+
+
+_cache: OrderedDict[str, tuple[int, int, _CompiledTemplate]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def clear_cache() -> None:
+    """Drops every compiled template, forcing them to be read again on next use."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _compiled(path: str) -> _CompiledTemplate:
+    # Shipped templates never change during a run, user templates are checked
+    # against their modification time so edits are picked up.
+    if path.startswith(_TEMPLATES_DIR + os.sep):
+        stamp = (0, 0)
+    else:
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        entry = _cache.get(path)
+        if entry is not None and entry[:2] == stamp:
+            _cache.move_to_end(path)
+            return entry[2]
+
+    with open(path, "r", encoding="utf-8") as file:
+        template = _CompiledTemplate(file.read())
+
+    with _cache_lock:
+        _cache[path] = (*stamp, template)
+        _cache.move_to_end(path)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+
+    return template
+
 
 def load_file(
     file_path: str,
@@ -26,29 +235,16 @@ def load_file(
     on_missing: str = "empty",  # "keep" | "empty" | "error"
     is_json: bool = False,
 ) -> Any:
-    def replace(match: re.Match) -> str:
-        var_name, filter_name = match.group(1), match.group(2)
-        if var_name not in vars:
-            if on_missing == "keep":
-                return match.group(0)
-            if on_missing == "empty":
-                return ""
-            raise KeyError(f"Missing variable: {var_name}")
-        value = vars[var_name]
-        if filter_name:
-            filter_func = _DEFAULT_FILTERS.get(filter_name)
-            if not filter_func:
-                raise ValueError(f"Unknown filter: {filter_name}")
-            return str(filter_func(value))
-        # Apply dquote filter by default
-        return str(value).replace("'", '"')
-
-    with open(os.path.join(_TEMPLATES_DIR, file_path), "r", encoding="utf-8") as file:
-        text = file.read()
-
-    result = _TOKEN_RE.sub(replace, text)
+    template = _compiled(os.path.normpath(os.path.join(_TEMPLATES_DIR, file_path)))
+    rendered = template.render_tokens(vars, on_missing)
 
     if is_json:
-        return json.loads(result)
+        skeleton = template.skeleton()
+        if skeleton is not None:
+            try:
+                return _fill(skeleton, rendered, template.bare_slots)
+            except _SkeletonMismatch:
+                pass
+        return json.loads(template.render_text(rendered))
 
-    return str(result)
+    return template.render_text(rendered)
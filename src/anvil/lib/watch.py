@@ -0,0 +1,213 @@
+"""Warm build workers for `anvil watch`.
+
+Most of a small build is spent importing the `anvil.api` tree, the vanilla factories
+and the actor components alone are tens of thousands of lines. The registries of the
+API are class level state, so a build cannot be run twice in the same interpreter.
+Instead, a worker process imports the API ahead of time and waits on its standard
+input, the next build only has to run the entry point. A new worker is warmed up as
+soon as a build ends, while the project is being edited.
+
+Builds run incrementally, only the outputs whose content changed are written, and
+Blockbench models are read from the parse cache of the project.
+"""
+
+import contextlib
+import importlib
+import io
+import os
+import runpy
+import subprocess
+import sys
+
+# Modules imported by a worker before it waits for a build.
+WARM_MODULES = (
+    "anvil.api.core.core",
+    "anvil.api.actors.actors",
+    "anvil.api.actors.components",
+    "anvil.api.blocks.blocks",
+    "anvil.api.items.items",
+    "anvil.api.vanilla.factories.minecraft_blocks",
+    "anvil.api.vanilla.factories.minecraft_items",
+    "anvil.api.vanilla.factories.minecraft_entities",
+    "anvil.lib.blockbench",
+)
+WATCHED = ("assets", "scripts", "anvilconfig.json")
+# Extensions watched in the folder of the entry point, which also holds build outputs.
+SOURCES = (".py",)
+IGNORED = (
+    "output",
+    "world",
+    ".anvil",
+    "node_modules",
+    "__pycache__",
+    ".git",
+    ".venv",
+    "venv",
+)
+# Changes to these files invalidate the configuration a worker loaded while warming up.
+RESTARTS_WORKER = ("anvilconfig.json",)
+
+
+def snapshot(
+    roots: tuple[str, ...] = WATCHED,
+    ignored: tuple[str, ...] = IGNORED,
+    suffixes: tuple[str, ...] | None = None,
+) -> dict[str, tuple[int, int]]:
+    """Lists the modification time and size of every file under the watched paths.
+
+    Parameters:
+        roots (tuple[str, ...], optional): Files and folders to watch. Defaults to WATCHED.
+        ignored (tuple[str, ...], optional): Folder names never entered. Defaults to IGNORED.
+        suffixes (tuple[str, ...], optional): Only lists the files of folders ending with one of these. Defaults to None, every file.
+
+    Returns:
+        dict[str, tuple[int, int]]: The `(mtime_ns, size)` of each file path.
+    """
+    files = {}
+    for root in roots:
+        if os.path.isfile(root):
+            stat = os.stat(root)
+            files[root] = (stat.st_mtime_ns, stat.st_size)
+            continue
+        for directory, folders, names in os.walk(root):
+            folders[:] = [folder for folder in folders if folder not in ignored]
+            for name in names:
+                if suffixes is not None and not name.endswith(suffixes):
+                    continue
+                path = os.path.normpath(os.path.join(directory, name))
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    # Removed between the listing and the stat.
+                    continue
+                files[path] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def sources(entry_point: str) -> dict[str, tuple[int, int]]:
+    """Snapshots the watched paths and the Python modules next to the entry point."""
+    root = os.path.dirname(entry_point) or "."
+    return snapshot() | snapshot((root,), suffixes=SOURCES)
+
+
+def changes(
+    before: dict[str, tuple[int, int]], after: dict[str, tuple[int, int]]
+) -> list[str]:
+    """Lists the files added, modified or removed between two snapshots."""
+    return sorted(
+        path
+        for path in before.keys() | after.keys()
+        if before.get(path) != after.get(path)
+    )
+
+
+class AnvilWarmWorker:
+    """Keeps one warmed up build process ready."""
+
+    _entry_point: str = ""
+    _flags: list[str] = []
+    _process: subprocess.Popen | None = None
+
+    @classmethod
+    def start(cls, entry_point: str, flags: list[str]) -> None:
+        cls._entry_point = entry_point
+        cls._flags = flags
+        cls._spawn()
+
+    @classmethod
+    def _spawn(cls) -> None:
+        cls._process = subprocess.Popen(
+            [sys.executable, "-m", "anvil.lib.watch", cls._entry_point, *cls._flags],
+            stdin=subprocess.PIPE,
+            text=True,
+        )
+
+    @classmethod
+    def restart(cls) -> None:
+        cls.stop()
+        cls._spawn()
+
+    @classmethod
+    def run(cls) -> int:
+        """Builds the project in the warm worker and warms up the next one.
+
+        Returns:
+            int: The exit code of the build.
+        """
+        process = cls._process
+        process.stdin.write("build\n")
+        process.stdin.close()
+        code = process.wait()
+        cls._spawn()
+        return code
+
+    @classmethod
+    def stop(cls) -> None:
+        if cls._process is not None and cls._process.poll() is None:
+            # Closing the input of an idle worker lets it exit without building.
+            cls._process.stdin.close()
+            try:
+                cls._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                cls._process.kill()
+        cls._process = None
+
+
+def warm_up(modules: tuple[str, ...] = WARM_MODULES) -> tuple[bool, str, list]:
+    """Imports the API before a build is asked for.
+
+    The API loads the project configuration on import, which prints the banner, may
+    prompt for missing options and checks for new versions once a day. The banner is
+    kept for the build, prompts fail instead of reading the build signal, and the
+    version check is returned to be run with the build.
+
+    Parameters:
+        modules (tuple[str, ...], optional): The modules to import. Defaults to WARM_MODULES.
+
+    Returns:
+        tuple[bool, str, list]: Whether every module was imported, what the imports
+            printed, and the configurations whose version check was put off.
+    """
+    output = io.StringIO()
+    checks = []
+    stdin = sys.stdin
+    sys.stdin = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            from anvil.lib.config import _AnvilConfig
+
+            check = _AnvilConfig._check_new_versions
+            _AnvilConfig._check_new_versions = lambda config: checks.append(config)
+            try:
+                for module in modules:
+                    importlib.import_module(module)
+            finally:
+                _AnvilConfig._check_new_versions = check
+    except BaseException:
+        # Outside a project or with an invalid configuration, `Config` exits.
+        return False, output.getvalue(), checks
+    finally:
+        sys.stdin = stdin
+    return True, output.getvalue(), checks
+
+
+def work(entry_point: str, flags: list[str]) -> None:
+    """Warms up the API, then runs the entry point once told to."""
+    sys.argv = [entry_point, *flags]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(entry_point)))
+    warm, output, checks = warm_up()
+
+    if not sys.stdin.readline():
+        return
+    if not warm:
+        # The failed imports may have left the configuration half loaded, the build
+        # runs cold and reports the error itself.
+        sys.exit(subprocess.call([sys.executable, entry_point, *flags]))
+    sys.stdout.write(output)
+    for config in checks:
+        config._check_new_versions()
+    runpy.run_path(entry_point, run_name="__main__")
+
+
+if __name__ == "__main__":
+    work(sys.argv[1], sys.argv[2:])
@@ -147,3 +147,91 @@ def test_entity_filter_redstone_strength():
     filt = Filter.redstone_strength_at_position(15)
     assert filt.test == "redstone_strength_at_position"
     assert filt.value == 15
+
+
+def test_entity_repeated_molang_is_hoisted(monkeypatch):
+    from anvil.api.actors.actors import Entity
+    from anvil.api.logic.molang_hoist import MolangHoister
+
+    monkeypatch.setattr(MolangHoister, "_hoisted", {})
+    monkeypatch.setattr(MolangHoister, "_usage", {})
+
+    entity = Entity("hoisted_entity")
+    description = entity.client.description
+    render_controller = description.render_controller("default")
+    render_controller.part_visibility("head", "q.is_baby && q.health > 5")
+    render_controller.part_visibility("arm", "!(query.is_baby && query.health > 5)")
+    controller = description.animation_controller("walk", animate=True)
+    controller.add_state("default").transition("moving", "q.anim_time > 1")
+    controller.add_state("moving").transition("default", "q.is_baby && q.health > 5")
+
+    scripts = description._description["description"]["scripts"]
+    MolangHoister.hoist(
+        description.identifier, description._molang_sites(), scripts["pre_animation"]
+    )
+
+    assert scripts["pre_animation"] == ["v.anvil_cse_0=q.is_baby&&q.health>5;"]
+    part_visibility = render_controller._controller[
+        render_controller.controller_identifier
+    ]["part_visibility"]
+    assert part_visibility == [{"head": "v.anvil_cse_0"}, {"arm": "!v.anvil_cse_0"}]
+    states = controller._controller_states
+    assert states[0].__export__()["default"]["transitions"] == [
+        {"moving": "q.anim_time > 1"}
+    ]
+    assert states[1].__export__()["moving"]["transitions"] == [
+        {"default": "v.anvil_cse_0"}
+    ]
+    assert MolangHoister.summary() == (1, 2, 1)
+
+    # Every build starts from an empty summary.
+    MolangHoister.enable(False)
+    assert MolangHoister.summary() == (0, 0, 0)
+    assert not MolangHoister.is_enabled()
+
+
+def test_entity_tick_cost_ranks_entities_and_groups(monkeypatch):
+    from anvil.api.actors.actors import Entity
+    from anvil.api.actors.components import (
+        EntityBreathable,
+        EntityEnvironmentSensor,
+        EntityPhysics,
+        EntityTickWorld,
+    )
+    from anvil.api.actors.tick_cost import AnvilTickCost, filter_tests
+    from anvil.api.core.filters import Filter
+
+    monkeypatch.setattr(AnvilTickCost, "_entities", {})
+
+    light = Entity("light_entity")
+    light.server.components.add(EntityPhysics(), EntityBreathable())
+
+    heavy = Entity("heavy_entity")
+    heavy.server.components.add(EntityPhysics())
+    sensor = EntityEnvironmentSensor()
+    sensor.trigger(
+        "on_tagged",
+        Filter.all_of([Filter.has_tag("a"), Filter.any_of([Filter.has_tag("b")])]),
+    )
+    heavy.server.component_group("sensing").add(sensor)
+    heavy.server.component_group("loader").add(EntityTickWorld(radius=2))
+
+    for entity in (light, heavy):
+        AnvilTickCost.record(
+            entity.identifier,
+            entity.server._components,
+            entity.server._component_groups,
+        )
+
+    assert filter_tests(sensor._component["triggers"][0]["filters"]) == 2
+    ranking = AnvilTickCost.ranking()
+    assert [identifier for identifier, _ in ranking] == [
+        heavy.identifier,
+        light.identifier,
+    ]
+    assert ranking[0][1] == 1.0 + 250.0
+    assert ranking[1][1] == 1.2
+    assert AnvilTickCost.group_ranking()[0][:2] == (heavy.identifier, "loader")
+    assert AnvilTickCost.over_budget(100) == [(heavy.identifier, 251.0)]
+    assert AnvilTickCost.over_budget(0) == []
+    assert "heavy_entity" in AnvilTickCost.report(100)
@@ -0,0 +1,81 @@
+import os
+import zipfile
+
+import pytest
+from anvil.lib import lib
+from anvil.lib.lib import AnvilArchive
+
+
+def _write(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(data)
+
+
+@pytest.fixture
+def pack(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    AnvilArchive.clear_cache()
+    _write(os.path.join("RP", "textures", "b.png"), b"\x89PNG" + bytes(range(256)))
+    _write(os.path.join("RP", "manifest.json"), b'{"format_version": 2}' * 50)
+    _write(os.path.join("RP", "sounds", "a.ogg"), b"OggS" * 100)
+    _write(os.path.join("BP", "scripts", "main.js"), b"console.log(1);" * 20)
+    _write(os.path.join("BP", "scripts", "main.js.map"), b"{}")
+    _write(os.path.join("world", "level.dat"), b"level" * 10)
+    yield
+    AnvilArchive.clear_cache()
+
+
+MAPPING = {
+    "RP": "RP_test",
+    "BP": "BP_test",
+    os.path.join("world", "level.dat"): "",
+}
+
+
+def test_archive_members(pack):
+    AnvilArchive.from_mapping("test.mcaddon", MAPPING, workers=4)
+
+    with zipfile.ZipFile("test.mcaddon") as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == [
+            "RP_test/manifest.json",
+            "RP_test/sounds/a.ogg",
+            "RP_test/textures/b.png",
+            "BP_test/scripts/main.js",
+            "level.dat",
+        ]
+        types = {info.filename: info.compress_type for info in archive.infolist()}
+        assert types["RP_test/sounds/a.ogg"] == zipfile.ZIP_STORED
+        assert types["RP_test/textures/b.png"] == zipfile.ZIP_STORED
+        assert types["RP_test/manifest.json"] == zipfile.ZIP_DEFLATED
+        assert archive.read("RP_test/manifest.json") == b'{"format_version": 2}' * 50
+
+
+def test_archive_reuses_unchanged_members(pack, monkeypatch):
+    AnvilArchive.from_mapping("test.mcaddon", MAPPING)
+    with open("test.mcaddon", "rb") as file:
+        first = file.read()
+
+    AnvilArchive.clear_cache()
+    compressed = []
+    compressobj = lib.zlib.compressobj
+    monkeypatch.setattr(
+        lib.zlib,
+        "compressobj",
+        lambda *args: compressed.append(args) or compressobj(*args),
+    )
+
+    AnvilArchive.from_mapping("test.mcaddon", MAPPING)
+    with open("test.mcaddon", "rb") as file:
+        assert file.read() == first
+    assert compressed == []
+
+    _write(os.path.join("BP", "scripts", "main.js"), b"console.log(2);" * 20)
+    AnvilArchive.from_mapping("test.mcaddon", MAPPING)
+
+    assert len(compressed) == 1
+    with zipfile.ZipFile("test.mcaddon") as archive:
+        assert archive.testzip() is None
+        assert archive.read("BP_test/scripts/main.js") == b"console.log(2);" * 20
+    assert not os.path.exists("test.mcaddon.tmp")
@@ -0,0 +1,130 @@
+import os
+
+import pytest
+from anvil.lib.incremental import AnvilAssetSync
+from anvil.lib.lib import Directory
+
+
+def _write(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(data)
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def _touch(path: str) -> None:
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _sync(link: str = "copy") -> tuple[int, int]:
+    AnvilAssetSync.begin()
+    Directory.copy_files(os.path.join("assets", "sounds"), "RP", "a.ogg")
+    Directory.copy_files(os.path.join("assets", "sounds"), "RP", "b.ogg")
+    Directory.copy_files(os.path.join("assets", "sounds"), "RP", "b.ogg")
+    return AnvilAssetSync.flush(link, workers=2)
+
+
+@pytest.fixture
+def assets(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write(os.path.join("assets", "sounds", "a.ogg"), b"a" * 64)
+    _write(os.path.join("assets", "sounds", "b.ogg"), b"b" * 64)
+
+
+def test_copies_are_deduplicated_and_skipped_when_unchanged(assets):
+    assert _sync() == (2, 0)
+    assert not AnvilAssetSync.is_active()
+    assert _read(os.path.join("RP", "b.ogg")) == b"b" * 64
+
+    mtime = os.stat(os.path.join("RP", "a.ogg")).st_mtime_ns
+    assert _sync() == (0, 2)
+    assert os.stat(os.path.join("RP", "a.ogg")).st_mtime_ns == mtime
+
+
+def test_changed_assets_are_copied_again(assets):
+    _sync()
+
+    # Touched without a content change.
+    _touch(os.path.join("assets", "sounds", "a.ogg"))
+    # Same size, different content.
+    _write(os.path.join("assets", "sounds", "b.ogg"), b"c" * 64)
+    _touch(os.path.join("assets", "sounds", "b.ogg"))
+
+    assert _sync() == (1, 1)
+    assert _read(os.path.join("RP", "b.ogg")) == b"c" * 64
+
+    # Destination modified outside of Anvil.
+    _write(os.path.join("RP", "a.ogg"), b"z" * 64)
+    _touch(os.path.join("RP", "a.ogg"))
+
+    assert _sync() == (1, 1)
+    assert _read(os.path.join("RP", "a.ogg")) == b"a" * 64
+
+
+def test_hardlinked_assets(assets):
+    _sync("hardlink")
+
+    assert os.path.samefile(
+        os.path.join("assets", "sounds", "a.ogg"), os.path.join("RP", "a.ogg")
+    )
+
+
+def test_hardlinked_assets_share_in_place_writes(assets):
+    _sync("hardlink")
+
+    # A tool truncating the pack copy also writes into the asset.
+    _write(os.path.join("RP", "a.ogg"), b"z" * 64)
+    assert _read(os.path.join("assets", "sounds", "a.ogg")) == b"z" * 64
+
+    # Replacing the pack copy, as Anvil does, leaves the asset alone.
+    _write(os.path.join("RP", "b.ogg.new"), b"z" * 64)
+    os.replace(os.path.join("RP", "b.ogg.new"), os.path.join("RP", "b.ogg"))
+    assert _read(os.path.join("assets", "sounds", "b.ogg")) == b"b" * 64
+
+
+def test_unknown_link_mode_fails_before_export():
+    with pytest.raises(ValueError):
+        AnvilAssetSync.begin("symlink")
+    assert not AnvilAssetSync.is_active()
+
+
+def test_missing_sources_fail_at_the_call_site(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    AnvilAssetSync.begin()
+    with pytest.raises(FileNotFoundError):
+        Directory.copy_files("assets", "RP", "missing.png")
+
+    assert AnvilAssetSync.flush() == (0, 0)
+    with pytest.raises(ValueError):
+        AnvilAssetSync.flush("symlink")
+
+
+def test_ui_textures_queued_before_the_export_are_collected(tmp_path, monkeypatch):
+    from unittest.mock import MagicMock
+
+    import anvil.lib.config
+
+    monkeypatch.chdir(tmp_path)
+    config = MagicMock()
+    config.RP_PATH = "RP"
+    monkeypatch.setattr(anvil.lib.config, "CONFIG", config)
+    from anvil.api.ui import ui
+
+    monkeypatch.setattr(ui, "CONFIG", config)
+    _write(os.path.join("assets", "textures", "ui", "icon.png"), b"png")
+
+    # The sync starts with the Anvil instance, before screens queue their elements.
+    AnvilAssetSync.begin()
+    element = ui._UIElement("icon").texture("icon")
+    element.queue()
+    element.queue()
+    assert not os.path.exists(os.path.join("RP", "textures", "ui", "icon.png"))
+
+    assert AnvilAssetSync.flush() == (1, 0)
+    assert _read(os.path.join("RP", "textures", "ui", "icon.png")) == b"png"
@@ -119,3 +119,236 @@ def test_texture_layer_blending():
                 pm_e = (round(r_e * a_e / 255.0), round(g_e * a_e / 255.0), round(b_e * a_e / 255.0), a_e)
                 
                 assert pm_a == pm_e, f"Mismatch at ({x}, {y}): {pm_a} != {pm_e}"
+
+
+def _animation(name, rotation=10):
+    return {
+        "name": name,
+        "loop": "loop",
+        "length": 1.0,
+        "animators": {
+            "bone": {
+                "name": "head",
+                "keyframes": [
+                    {
+                        "channel": "rotation",
+                        "time": time,
+                        "interpolation": "linear",
+                        "data_points": [{"x": rotation, "y": 0, "z": 0}],
+                    }
+                    for time in (0, 0.5, 1.0)
+                ],
+            }
+        },
+    }
+
+
+def test_animations_are_parsed_on_queue(monkeypatch):
+    import anvil.lib.blockbench as blockbench
+    import pytest
+    from anvil.lib.blockbench import Animation, _AnimationsManager
+
+    monkeypatch.setattr(blockbench, "CONFIG", mock_config)
+    parsed = []
+    from_dict = Animation.from_dict.__func__
+
+    def tracked_from_dict(cls, data, model_name):
+        parsed.append(data["name"])
+        return from_dict(cls, data, model_name)
+
+    monkeypatch.setattr(Animation, "from_dict", classmethod(tracked_from_dict))
+
+    bbmodel = {"animations": [_animation("walk"), _animation("idle", 20)]}
+    manager = _AnimationsManager("lazy_model", "actors", bbmodel)
+    assert parsed == []
+
+    manager.queue_animation("walk")
+    manager.queue_animation("walk")
+    assert parsed == ["walk"]
+
+    walk = manager._content["animations"]["animation.testns.lazy_model.walk"]
+    assert walk["loop"] is True
+    assert walk["bones"]["head"]["rotation"] == {
+        0.0: [-10, 0, 0],
+        0.5: [-10, 0, 0],
+        1.0: [-10, 0, 0],
+    }
+
+    # Managers do not share compiled animations.
+    other = _AnimationsManager("lazy_model", "actors", bbmodel)
+    other.queue_animation("walk")
+    other_walk = other._content["animations"]["animation.testns.lazy_model.walk"]
+    assert other_walk == walk and other_walk is not walk
+
+    with pytest.raises(ValueError):
+        manager.queue_animation("run")
+
+
+def _png(color):
+    image = Image.new("RGBA", (4, 4), color)
+    out = io.BytesIO()
+    image.save(out, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(out.getvalue()).decode()
+
+
+def _cached_model(name):
+    face = {"uv": [0, 0, 4, 4], "texture": 0}
+    return {
+        "meta": {"format_version": "5.0", "model_format": "bedrock", "box_uv": False},
+        "name": name,
+        "model_identifier": name,
+        "visible_box": [1, 1, 0],
+        "resolution": {"width": 16, "height": 16},
+        "elements": [
+            {
+                "name": "cube",
+                "type": "cube",
+                "uuid": "cube-uuid",
+                "from": [-4, 0, -4],
+                "to": [4, 8, 4],
+                "origin": [0, 0, 0],
+                "faces": {
+                    side: dict(face)
+                    for side in ("north", "east", "south", "west", "up", "down")
+                },
+            }
+        ],
+        "groups": [{"name": "body", "uuid": "body-uuid", "origin": [0, 0, 0]}],
+        "outliner": [{"uuid": "body-uuid", "children": ["cube-uuid"]}],
+        "textures": [{"name": "skin.png", "source": _png((255, 0, 0, 255))}],
+        "animations": [_animation("walk"), _animation("idle", 20)],
+    }
+
+
+def _build_cached_model(name):
+    from anvil.lib.blockbench import _Blockbench
+    from anvil.lib.lib import AnvilIO
+
+    _Blockbench._loaded_blockbench_models.clear()
+    bb = _Blockbench(name)
+    bb.model.queue_model()
+    bb.model.block_culling()
+    bb.animations.queue_animation("walk")
+    bb.textures.queue_texture("skin")
+    bb.textures.__export__()
+    bb._cache.save()
+
+    with open(os.path.join(bb.textures._path, "skin.png"), "rb") as file:
+        texture = file.read()
+    return bb, {
+        "geometry": AnvilIO._dump_json_like(
+            bb.model._queued_geometries, minify=True
+        ),
+        "animations": AnvilIO._dump_json_like(
+            bb.animations._content, minify=True
+        ),
+        "culling": bb.model._culling.index,
+        "texture": texture,
+    }
+
+
+def test_compiled_models_are_cached_on_disk(tmp_path, monkeypatch):
+    import json
+
+    import anvil.lib.blockbench as blockbench
+    from anvil.lib.bbmodel_cache import LazyBBModel
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(blockbench, "CONFIG", mock_config)
+    monkeypatch.setattr(blockbench._Blockbench, "_loaded_blockbench_models", {})
+
+    os.makedirs(os.path.join("assets", "bbmodels"))
+    path = os.path.join("assets", "bbmodels", "cached_mob.bbmodel")
+    with open(path, "w") as file:
+        json.dump(_cached_model("cached_mob"), file)
+
+    bb, first = _build_cached_model("cached_mob")
+    assert isinstance(bb.bbmodel, dict)
+
+    # Nothing is parsed or compiled when the model did not change.
+    bb, second = _build_cached_model("cached_mob")
+    assert isinstance(bb.bbmodel, LazyBBModel)
+    assert not bb.bbmodel.is_loaded()
+    assert second == first
+
+    # Changing the model discards its cache.
+    model = _cached_model("cached_mob")
+    model["textures"][0]["source"] = _png((0, 0, 255, 255))
+    with open(path, "w") as file:
+        json.dump(model, file)
+
+    bb, third = _build_cached_model("cached_mob")
+    assert isinstance(bb.bbmodel, dict)
+    assert third["geometry"] == first["geometry"]
+    assert third["texture"] != first["texture"]
+
+
+def test_blend_modes_match_per_pixel_blending():
+    import colorsys
+
+    import numpy as np
+    from anvil.lib.blending import blend
+
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 256, (6, 6, 4), dtype=np.uint8)
+    layer = rng.integers(0, 256, (6, 6, 4), dtype=np.uint8)
+    base[0, :, :3] = 128
+    layer[1, :, 3] = 0
+
+    expected = Image.alpha_composite(Image.fromarray(base), Image.fromarray(layer))
+    assert np.array_equal(blend("default", base, layer), np.asarray(expected))
+
+    def reference(mode, b_px, t_px):
+        cb = [c / 255.0 for c in b_px[:3]]
+        ct = [c / 255.0 for c in t_px[:3]]
+        ab, at = b_px[3] / 255.0, t_px[3] / 255.0
+        h_b, l_b, s_b = colorsys.rgb_to_hls(*cb)
+        h_t, l_t, s_t = colorsys.rgb_to_hls(*ct)
+        cm = {
+            "color": lambda: colorsys.hls_to_rgb(h_t, l_b, s_t),
+            "hue": lambda: colorsys.hls_to_rgb(h_t, l_b, s_b),
+            "saturation": lambda: colorsys.hls_to_rgb(h_b, l_b, s_t),
+            "luminosity": lambda: colorsys.hls_to_rgb(h_b, l_t, s_b),
+            "divide": lambda: [min(b / t, 1.0) if t > 0.0 else 1.0 for b, t in zip(cb, ct)],
+        }[mode]()
+        a_out = at + ab * (1.0 - at)
+        c_out = [(m * at + b * ab * (1.0 - at)) / a_out if a_out > 0.0 else 0.0 for m, b in zip(cm, cb)]
+        return [max(0, min(255, int(round(c * 255.0)))) for c in [*c_out, a_out]]
+
+    for mode in ("color", "hue", "saturation", "luminosity", "divide"):
+        blended = blend(mode, base, layer)
+        for y in range(6):
+            for x in range(6):
+                assert list(blended[y, x]) == reference(
+                    mode, base[y, x].tolist(), layer[y, x].tolist()
+                ), (mode, x, y)
+
+
+def test_mesh_cuboids_are_extracted_per_box():
+    from anvil.lib.blockbench import Mesh
+
+    vertices, faces = {}, {}
+
+    def add_box(x, size):
+        corners = {}
+        for dx in (0, 1):
+            for dy in (0, 1):
+                for dz in (0, 1):
+                    corners[(dx, dy, dz)] = f"v{len(vertices)}"
+                    vertices[f"v{len(vertices)}"] = [x + dx * size, dy * size, dz * size]
+        for axis in range(3):
+            for side in (1, 0):
+                keys = [key for corner, key in corners.items() if corner[axis] == side]
+                faces[f"f{len(faces)}"] = {"vertices": keys[::-1], "uv": {}}
+
+    add_box(0, 4)
+    add_box(10, 4)
+    # Every face is larger than 24 units, none of them can be exported.
+    add_box(20, 30)
+
+    cuboids = Mesh.from_dict({"name": "mesh", "vertices": vertices, "faces": faces}).extract_cuboids()
+
+    assert [cuboid["name"] for cuboid in cuboids] == ["mesh_0", "mesh_1"]
+    assert list(cuboids[0]["faces"]) == [f"f{i}" for i in range(6)]
+    assert list(cuboids[1]["faces"]) == [f"f{i}" for i in range(6, 12)]
+    assert list(cuboids[1]["vertices"]) == [f"v{i}" for i in range(8, 16)]
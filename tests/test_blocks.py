@@ -1,3 +1,6 @@
+import copy
+
+import pytest
 from anvil.api.vanilla.factories.minecraft_blocks import (
     Cinnabar,
     CinnabarBrickSlab,
@@ -15,6 +18,9 @@ from anvil.api.blocks.components import (
     BlockEmbeddedVisual,
 )
 from anvil.api.core.enums import PlacementDirectionTrait
+from anvil.api.vanilla.blocks import MinecraftBlockTypes
+from anvil.api.vanilla.factories import LazyFactories
+from anvil.lib.schemas import MinecraftBlockDescriptor
 
 
 def test_new_blocks():
@@ -82,3 +88,134 @@ def test_new_block_components():
     assert ev.identifier == "minecraft:embedded_visual"
     ev.n_way_visual_rotation(y="minecraft:sixteen_way_rotation")
     assert ev._component["geometry"]["n_way_visual_rotation"] == {"y": "minecraft:sixteen_way_rotation"}
+
+
+def test_block_permutation_analysis():
+    from anvil.api.blocks.blocks import Block
+    from anvil.api.blocks.permutations import AnvilBlockPermutations
+
+    lamp = Block("lamp")
+    lamp.server.description.add_state("test:color", [0, 1, 2, 3])
+    lamp.server.description.add_state("test:lit", [False, True])
+    lamp.server.description.add_state("test:level", list(range(16)))
+    lamp.server.description.traits.placement_direction(
+        traits=[PlacementDirectionTrait.CardinalDirection]
+    )
+    lamp.server.permutation("q.block_state('minecraft:cardinal_direction') == 'north'")
+    lamp.server.permutation("q.block_state('test:lit')")
+    lamp.server.permutation("q.block_state('test:lit') && q.block_state('test:color') == 2")
+    lamp.server.permutation("q.block_state('test:color') == 7")
+    lamp.server.permutation("q.is_sneaking")
+    record = lambda: AnvilBlockPermutations.record(
+        "test:lamp",
+        lamp.server.description._description["description"]["states"],
+        lamp.server.description.traits.export,
+        [permutation._condition for permutation in lamp.server._permutations],
+    )
+
+    # Ordinary builds only count the states.
+    AnvilBlockPermutations.enable(False)
+    result = record()
+    assert result.states == 4 * 2 * 16 * 4
+    assert not result.analyzed and result.unreachable == []
+
+    AnvilBlockPermutations.enable()
+    result = record()
+
+    assert result.states == 4 * 2 * 16 * 4
+    assert result.permutations == 5
+    assert result.unreachable == [3]
+    assert result.overlapping == [(0, 1), (0, 2), (1, 2)]
+    # Lit north blocks and lit blocks of color 2, for every level.
+    assert result.overlapping_states == 7 * 16
+    assert result.skipped == [4]
+    assert "test:lamp" in AnvilBlockPermutations.report()
+    AnvilBlockPermutations.enable(False)
+
+
+def test_block_permutation_analysis_reads_boolean_literals(monkeypatch):
+    from unittest.mock import MagicMock
+
+    from anvil.api.blocks.blocks import Block
+    from anvil.api.blocks.permutations import AnvilBlockPermutations
+    from anvil.api.logic.molang import Query
+
+    config = MagicMock()
+    config.NAMESPACE = "test"
+    monkeypatch.setattr("anvil.api.logic.molang.CONFIG", config)
+    lamp = Block("lamp")
+    lamp.server.description.add_state("test:lit", [False, True])
+    # Written as `q.block_state('test:lit') == true` by the builder.
+    lamp.server.permutation(Query.BlockState("lit") == True)
+    lamp.server.permutation(Query.BlockState("lit") == False)
+    lamp.server.permutation(Query.BlockState("lit") != False)
+
+    AnvilBlockPermutations.enable()
+    result = AnvilBlockPermutations.record(
+        "test:lamp",
+        lamp.server.description._description["description"]["states"],
+        lamp.server.description.traits.export,
+        [permutation._condition for permutation in lamp.server._permutations],
+    )
+    AnvilBlockPermutations.enable(False)
+
+    assert str(lamp.server._permutations[0]._condition).endswith("== true")
+    assert result.skipped == []
+    assert result.unreachable == []
+    assert result.overlapping == [(0, 2)]
+
+
+def test_vanilla_block_factories_load_lazily():
+    factories = LazyFactories("anvil.api.vanilla.factories.minecraft_blocks")
+    assert factories._module is None
+
+    stairs = factories.CinnabarBrickStairs(weirdo_direction="1")
+    assert stairs.identifier == "minecraft:cinnabar_brick_stairs"
+    assert factories.CinnabarBrickStairs is CinnabarBrickStairs
+    assert "CinnabarBrickStairs" in vars(factories)
+    assert "Stone" in dir(factories)
+
+    assert isinstance(MinecraftBlockTypes, LazyFactories)
+    assert str(MinecraftBlockTypes.Air()) == "minecraft:air"
+
+
+def test_vanilla_block_descriptors_are_interned():
+    slab = CinnabarBrickSlab(minecraft_vertical_half="top")
+    assert slab is CinnabarBrickSlab(minecraft_vertical_half="top")
+    assert slab is not CinnabarBrickSlab(minecraft_vertical_half="bottom")
+    assert Cinnabar() is MinecraftBlockTypes.Cinnabar()
+    assert {slab: 1}[CinnabarBrickSlab(minecraft_vertical_half="top")] == 1
+
+    # The states of a shared descriptor cannot be changed through it.
+    slab.states["minecraft:vertical_half"] = "bottom"
+    assert slab.descriptor() == {
+        "name": "minecraft:cinnabar_brick_slab",
+        "states": {"minecraft:vertical_half": "top"},
+        "tags": [],
+    }
+    with pytest.raises(TypeError):
+        slab._states["minecraft:vertical_half"] = "bottom"
+    with pytest.raises(AttributeError):
+        slab._tags = {"stone"}
+
+    assert copy.deepcopy({"block": slab})["block"] is slab
+
+    # The order of the states does not matter.
+    states = {"minecraft:vertical_half": "top", "minecraft:color": "red"}
+    descriptor = MinecraftBlockDescriptor.interned("minecraft:wool", states)
+    assert descriptor is MinecraftBlockDescriptor.interned(
+        "minecraft:wool", dict(reversed(states.items()))
+    )
+
+
+def test_vanilla_block_descriptor_cache_is_bounded(monkeypatch):
+    import anvil.lib.schemas
+
+    monkeypatch.setattr(MinecraftBlockDescriptor, "_interned", {})
+    monkeypatch.setattr(anvil.lib.schemas, "_INTERN_LIMIT", 2)
+    first = MinecraftBlockDescriptor.interned("minecraft:stone")
+    MinecraftBlockDescriptor.interned("minecraft:dirt")
+    MinecraftBlockDescriptor.interned("minecraft:sand")
+
+    assert len(MinecraftBlockDescriptor._interned) == 2
+    assert first is not MinecraftBlockDescriptor.interned("minecraft:stone")
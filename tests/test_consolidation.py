@@ -0,0 +1,104 @@
+import os
+from unittest.mock import MagicMock
+
+import commentjson
+import pytest
+
+import anvil.lib.config
+from anvil.lib.consolidation import AnvilConsolidationError, AnvilPackConsolidation
+
+
+@pytest.fixture(autouse=True)
+def mock_config(monkeypatch):
+    config = MagicMock()
+    config._MINIFY = False
+    config.COMPANY = "StarkTMA"
+    monkeypatch.setattr(anvil.lib.config, "CONFIG", config)
+    AnvilPackConsolidation.begin()
+    yield config
+    AnvilPackConsolidation.begin(False)
+
+
+def _geometry(identifier: str) -> dict:
+    return {"description": {"identifier": identifier}, "bones": []}
+
+
+def _read(path: str) -> dict:
+    with open(path, encoding="utf-8") as file:
+        return commentjson.load(file)
+
+
+def test_consolidation_merges_definitions_per_format_version(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    controllers = os.path.join("RP", "render_controllers")
+    models = os.path.join("RP", "models", "entity")
+
+    for name in ("zombie", "skeleton", "creeper"):
+        AnvilPackConsolidation.add(
+            controllers,
+            ".rc.json",
+            "render_controllers",
+            {
+                "format_version": "1.10.0",
+                "render_controllers": {
+                    f"controller.render.{name}": {"geometry": "Geometry.default"}
+                },
+            },
+        )
+    AnvilPackConsolidation.add(
+        models,
+        ".geo.json",
+        "minecraft:geometry",
+        {"format_version": "1.12.0", "minecraft:geometry": [_geometry("geometry.a")]},
+    )
+    # An identical definition is merged once.
+    AnvilPackConsolidation.add(
+        models,
+        ".geo.json",
+        "minecraft:geometry",
+        {
+            "format_version": "1.12.0",
+            "minecraft:geometry": [_geometry("geometry.a"), _geometry("geometry.b")],
+        },
+    )
+    AnvilPackConsolidation.add(
+        models,
+        ".geo.json",
+        "minecraft:geometry",
+        {"format_version": "1.16.0", "minecraft:geometry": [_geometry("geometry.c")]},
+    )
+
+    assert AnvilPackConsolidation.flush() == (6, 3)
+
+    merged = _read(os.path.join(controllers, "consolidated.rc.json"))
+    assert merged["format_version"] == "1.10.0"
+    assert list(merged["render_controllers"]) == [
+        "controller.render.zombie",
+        "controller.render.skeleton",
+        "controller.render.creeper",
+    ]
+    first = _read(os.path.join(models, "consolidated_1.geo.json"))
+    assert [g["description"]["identifier"] for g in first["minecraft:geometry"]] == [
+        "geometry.a",
+        "geometry.b",
+    ]
+    second = _read(os.path.join(models, "consolidated_2.geo.json"))
+    assert second["format_version"] == "1.16.0"
+
+
+def test_consolidation_rejects_colliding_identifiers():
+    content = {
+        "format_version": "1.10.0",
+        "animations": {"animation.a": {"loop": True}},
+    }
+    AnvilPackConsolidation.add("BP", ".animation.json", "animations", content)
+    with pytest.raises(AnvilConsolidationError):
+        AnvilPackConsolidation.add(
+            "BP",
+            ".animation.json",
+            "animations",
+            {
+                "format_version": "1.10.0",
+                "animations": {"animation.a": {"loop": False}},
+            },
+        )
@@ -0,0 +1,186 @@
+import os
+from unittest.mock import MagicMock
+
+import commentjson
+import pytest
+
+import anvil.lib.config
+from anvil.api.actors._animation_controllers import RPAnimationControllers
+from anvil.api.actors._render_controller import RenderControllers
+from anvil.api.actors.actors import Entity, _EntityClient
+from anvil.api.core.core import ANVIL
+from anvil.lib.blockbench import _Animation, _Blockbench, _Geometry
+from anvil.lib.dedupe import AnvilDefinitionDedupe
+
+
+@pytest.fixture(autouse=True)
+def mock_config(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = MagicMock()
+    config._MINIFY = False
+    config.COMPANY = "StarkTMA"
+    config.NAMESPACE = "test"
+    config.PROJECT_NAME = "dedupe"
+    config.RP_PATH = "RP"
+    config.BP_PATH = "BP"
+    for module in (
+        anvil.lib.config,
+        anvil.lib.schemas,
+        anvil.lib.blockbench,
+        anvil.api.actors.actors,
+        anvil.api.actors._render_controller,
+        anvil.api.actors._animation_controllers,
+    ):
+        monkeypatch.setattr(module, "CONFIG", config)
+    monkeypatch.setattr(ANVIL, "_objects_list", [])
+    monkeypatch.setattr(_Blockbench, "_loaded_blockbench_models", {})
+    monkeypatch.setattr(AnvilDefinitionDedupe, "_kept", set())
+    AnvilDefinitionDedupe.begin()
+    yield config
+    AnvilDefinitionDedupe.begin(False)
+
+
+def _bbmodel(name: str, width: int = 64) -> dict:
+    group, cube = f"{name}-group", f"{name}-cube"
+    return {
+        "meta": {"format_version": "5.0", "model_format": "bedrock"},
+        "model_identifier": name,
+        "resolution": {"width": width, "height": 64},
+        "visible_box": [1, 2, 0],
+        "elements": [
+            {
+                "uuid": cube,
+                "type": "cube",
+                "name": "body",
+                "from": [-4, 0, -2],
+                "to": [4, 12, 2],
+                "box_uv": True,
+                "uv_offset": [0, 0],
+            }
+        ],
+        "groups": [{"uuid": group, "name": "body", "origin": [0, 0, 0]}],
+        "outliner": [{"uuid": group, "children": [cube]}],
+        "textures": [],
+        "animations": [
+            {
+                "name": "walk",
+                "loop": "loop",
+                "length": 1.0,
+                "animators": {
+                    group: {
+                        "name": "body",
+                        "keyframes": [
+                            {
+                                "channel": "rotation",
+                                "time": time,
+                                "interpolation": "linear",
+                                "data_points": [{"x": 10 * time, "y": 0, "z": 0}],
+                            }
+                            for time in (0, 1)
+                        ],
+                    }
+                },
+            }
+        ],
+    }
+
+
+def _entity(name: str, model: str) -> Entity:
+    entity = Entity(name)
+    description = entity.client.description
+    description.geometry(model)
+    description.animation(model, "walk")
+    description._description["description"]["textures"]["default"] = "textures/mob"
+    description.render_controller("default").geometry(model).textures("default")
+    controller = description.animation_controller("move", animate=True)
+    controller.add_state("default").animation("walk")
+    entity.client.queue()
+    return entity
+
+
+def _export() -> tuple[int, int]:
+    # As in a build, client entities queue their controllers while exported.
+    _Blockbench.__export__()
+    for object in ANVIL._objects_list:
+        object.__export__()
+    return AnvilDefinitionDedupe.flush()
+
+
+def _read(cls: type, name: str) -> dict:
+    path = os.path.join(cls._path, f"{name}{cls._extension}")
+    if not os.path.exists(path):
+        path = os.path.join(cls._path, "actors", f"{name}{cls._extension}")
+    with open(path, encoding="utf-8") as file:
+        return commentjson.load(file)
+
+
+def _files(cls: type, *subdirectory: str) -> list[str]:
+    return sorted(os.listdir(os.path.join(cls._path, *subdirectory)))
+
+
+def _write_models(*models: tuple[str, int]) -> None:
+    os.makedirs(os.path.join("assets", "bbmodels"))
+    for name, width in models:
+        with open(os.path.join("assets", "bbmodels", f"{name}.bbmodel"), "w") as file:
+            commentjson.dump(_bbmodel(name, width), file)
+
+
+def test_dedupe_rewrites_client_entities(capsys):
+    # The husk model is a copy of the zombie model, the drowned one differs.
+    _write_models(("zombie", 64), ("husk", 64), ("drowned", 32))
+    _entity("zombie", "zombie")
+    _entity("husk", "husk")
+    _entity("drowned", "drowned")
+    # Shares the zombie model, so its render and animation controllers are copies.
+    _entity("zombie_villager", "zombie")
+
+    # The husk geometry, the husk and drowned animations, the zombie villager render
+    # controller and every animation controller but the zombie one.
+    assert _export() == (7, 7)
+
+    husk = _read(_EntityClient, "husk")["minecraft:client_entity"]["description"]
+    assert husk["geometry"] == {"husk": "geometry.test.zombie"}
+    assert husk["animations"] == {
+        "walk": "animation.test.zombie.walk",
+        "move": "controller.animation.test.zombie.move",
+    }
+    assert husk["render_controllers"] == ["controller.render.test.husk.default"]
+    villager = _read(_EntityClient, "zombie_villager")["minecraft:client_entity"]
+    assert villager["description"]["render_controllers"] == [
+        "controller.render.test.zombie.default"
+    ]
+    assert villager["description"]["animations"]["move"] == (
+        "controller.animation.test.zombie.move"
+    )
+    drowned = _read(_EntityClient, "drowned")["minecraft:client_entity"]
+    # A different texture size is a different geometry, not a different animation.
+    assert drowned["description"]["geometry"] == {"drowned": "geometry.test.drowned"}
+    assert drowned["description"]["animations"]["walk"] == "animation.test.zombie.walk"
+
+    assert _files(_Geometry, "actors") == ["drowned.geo.json", "zombie.geo.json"]
+    assert _files(_Animation, "actors") == ["zombie.animations.json"]
+    assert _files(RenderControllers) == [
+        "drowned.rc.json",
+        "husk.rc.json",
+        "zombie.rc.json",
+    ]
+    assert _files(RPAnimationControllers) == ["zombie.rp_ac.json"]
+
+    # Commands and scripts playing the dropped animation must be updated.
+    assert "animation.test.husk.walk (now animation.test.zombie.walk)" in (
+        capsys.readouterr().out
+    )
+
+
+def test_dedupe_keeps_identifiers_referenced_outside_client_entities():
+    _write_models(("zombie", 64), ("husk", 64))
+    _entity("zombie", "zombie")
+    _entity("husk", "husk")
+    # As a block geometry component does.
+    AnvilDefinitionDedupe.keep("geometry.test.husk")
+
+    _export()
+
+    husk = _read(_EntityClient, "husk")["minecraft:client_entity"]["description"]
+    assert husk["geometry"] == {"husk": "geometry.test.husk"}
+    assert _files(_Geometry, "actors") == ["husk.geo.json", "zombie.geo.json"]
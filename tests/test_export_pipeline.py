@@ -0,0 +1,124 @@
+import os
+import sys
+from unittest.mock import MagicMock
+
+import anvil.lib.config
+import pytest
+from anvil.lib.lib import (
+    AnvilExportError,
+    AnvilExportPipeline,
+    AnvilIO,
+    BackgroundSubcommand,
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_config(monkeypatch):
+    config = MagicMock()
+    config._MINIFY = False
+    config.COMPANY = "StarkTMA"
+    monkeypatch.setattr(anvil.lib.config, "CONFIG", config)
+    return config
+
+
+def _export(directory: str):
+    for index in range(50):
+        AnvilIO.file(
+            f"object_{index}.json",
+            {"format_version": "1.21.0", "values": list(range(index)), "empty": {}},
+            os.path.join(directory, f"group_{index % 4}"),
+            "w",
+            True,
+        )
+    AnvilIO.file("en_US.lang", "a=1\n", directory, "w", True)
+    AnvilIO.file("en_US.lang", "b=2\n", directory, "a", True)
+    AnvilIO.file("en_US.lang", "c=3\n", directory, "a", True)
+
+
+def _read_tree(directory: str) -> dict[str, bytes]:
+    files = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            with open(path, "rb") as file:
+                files[os.path.relpath(path, directory)] = file.read()
+    return files
+
+
+def test_parallel_export_matches_serial_export(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    _export("serial")
+
+    AnvilExportPipeline.begin(4)
+    _export("parallel")
+    assert AnvilExportPipeline.flush() == 53
+
+    assert not AnvilExportPipeline.is_active()
+    assert _read_tree("parallel") == _read_tree("serial")
+    assert _read_tree("parallel")["en_US.lang"] == b"a=1\nb=2\nc=3\n"
+
+
+def test_parallel_export_reports_failing_object(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "blocked").write_text("")
+
+    class Unserializable:
+        pass
+
+    owner = object()
+    AnvilExportPipeline.begin(2)
+    AnvilIO.file("valid.json", {"value": 1}, "out", "w", True)
+    # Files are rendered when exported, on the calling thread.
+    with pytest.raises(TypeError):
+        AnvilIO.file("invalid.json", {"value": Unserializable()}, "out", "w", True)
+    AnvilExportPipeline.set_owner(owner)
+    AnvilIO.file("unwritable.json", {"value": 1}, "blocked", "w", True)
+
+    with pytest.raises(AnvilExportError) as error:
+        AnvilExportPipeline.flush()
+
+    assert error.value.object is owner
+    assert os.path.isfile(os.path.join("out", "valid.json"))
+
+
+def _export_ui(directory: str):
+    from anvil.api.ui.ui import _UIElement
+
+    shared = _UIElement("shared")
+    shared.binding.binding_name("#hud_title_text_string")
+    shared.controls("label").text("title")
+    for index in range(8):
+        AnvilIO.file(
+            f"screen_{index}.json",
+            {"namespace": f"screen_{index}", "controls": [shared]},
+            os.path.join(directory, "ui"),
+            "w",
+            True,
+        )
+
+
+def test_parallel_export_matches_serial_shared_ui_elements(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    _export_ui("serial")
+
+    AnvilExportPipeline.begin(4)
+    _export_ui("parallel")
+    AnvilExportPipeline.flush()
+
+    # Every export of the element appends its bindings again, in file order.
+    assert _read_tree("parallel") == _read_tree("serial")
+
+
+def test_background_subcommand_streams_output(capsys):
+    script = "import sys; print('bundled'); sys.exit(3)"
+    command = BackgroundSubcommand(
+        f'"{sys.executable}" -c "{script}"', "Building scripts error", "[JS]: "
+    )
+    assert command.wait() == 3
+
+    output = capsys.readouterr().out
+    assert "[JS]: bundled" in output
+    assert "Building scripts error:" in output
+    assert "exit status 3" in output
@@ -0,0 +1,82 @@
+from unittest.mock import MagicMock
+
+# Set up mock config to avoid exit(1) during class definition imports
+mock_config = MagicMock()
+mock_config.BP_PATH = "dummy_bp_path"
+mock_config.RP_PATH = "dummy_rp_path"
+mock_config.NAMESPACE = "test"
+
+import anvil.lib.config
+
+anvil.lib.config.CONFIG = mock_config
+
+import pytest
+from anvil.api.core.enums import FeatureRulePlacementPass
+from anvil.api.features.density import pass_totals, simulate
+from anvil.api.features.feature_rule import FeatureRule
+from anvil.api.features.features import CoordinateRange, ScatterFeature
+
+
+def test_feature_density_multiplies_nested_scatters():
+    patch = ScatterFeature("patch", "minecraft:grass")
+    patch.distribution(
+        8,
+        50,
+        CoordinateRange("uniform", (0, 15)),
+        0,
+        CoordinateRange("uniform", (0, 15)),
+        "xyz",
+    )
+    rule = FeatureRule("patch_rule", patch, FeatureRulePlacementPass.SurfacePass)
+    rule.distribution(
+        4,
+        (1, 2),
+        CoordinateRange("fixed_grid", (0, 31), 0, 8),
+        "q.heightmap(v.worldx, v.worldz)",
+        CoordinateRange("gaussian", (0, 15)),
+        "xzy",
+    )
+    ore = FeatureRule(
+        "ore_rule", "minecraft:ore", FeatureRulePlacementPass.UndergroundPass
+    )
+    ore.distribution(
+        "math.random_integer(1, 5)",
+        100,
+        CoordinateRange("uniform", (0, 15)),
+        0,
+        CoordinateRange("triangle", (0, 15)),
+        "xyz",
+    )
+
+    results = simulate([ore, rule], [patch], chunks=20_000, seed=1)
+
+    assert [result.identifier for result in results] == [
+        rule.identifier,
+        ore.identifier,
+    ]
+    # 4 iterations half the time, each scattering 8 positions half the time.
+    assert results[0].attempts == pytest.approx(8, rel=0.05)
+    # Every iteration scatters independently, 8 times Binomial(4, 0.5) per chunk.
+    assert results[0].deviation == pytest.approx(96**0.5, rel=0.05)
+    assert results[0].peak == 32
+    # Two of the four grid columns lie in the next chunk.
+    assert results[0].outside_chunk == pytest.approx(0.5)
+    assert results[1].attempts == pytest.approx(3, rel=0.05)
+    assert results[1].outside_chunk == 0
+    assert list(pass_totals(results)) == ["surface_pass", "underground_pass"]
+
+
+def test_feature_density_approximates_large_nested_scatters(monkeypatch):
+    import anvil.api.features.density as density
+
+    patch = ScatterFeature("wide_patch", "minecraft:grass")
+    patch.distribution(8, 50, 0, 0, 0, "xyz")
+    rule = FeatureRule("wide_rule", patch, FeatureRulePlacementPass.SurfacePass)
+    rule.distribution(64, 100, 0, 0, 0, "xyz")
+
+    monkeypatch.setattr(density, "_MAX_NESTED_DRAWS", 1_000)
+    (result,) = simulate([rule], [patch], chunks=20_000, seed=1)
+
+    # 8 times Binomial(64, 0.5) per chunk.
+    assert result.attempts == pytest.approx(256, rel=0.05)
+    assert result.deviation == pytest.approx(32, rel=0.1)
@@ -0,0 +1,56 @@
+import os
+from unittest.mock import MagicMock
+
+from PIL import Image, ImageFont
+
+import anvil.api.ui.font as font_module
+from anvil.api.ui.font import Fonts
+
+
+def _project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = MagicMock()
+    config.RP_PATH = str(tmp_path / "RP")
+    monkeypatch.setattr(font_module, "CONFIG", config)
+
+    ui = tmp_path / "assets" / "textures" / "ui"
+    ui.mkdir(parents=True)
+    (ui / "test.ttf").write_bytes(ImageFont.load_default(20).path.getvalue())
+    monkeypatch.setattr(font_module, "_BACKUP_FONT", str(ui / "test.ttf"))
+    return ui
+
+
+def test_font_atlas_is_encoded_once_and_cached(tmp_path, monkeypatch):
+    ui = _project(tmp_path, monkeypatch)
+    saves = []
+    save = Image.Image.save
+    monkeypatch.setattr(
+        Image.Image, "save", lambda self, path: saves.append(path) or save(self, path)
+    )
+
+    fonts = Fonts("test", 16)
+    fonts.generate_font()
+    assert saves == [os.path.join("assets", "textures", "ui", "default8.png")]
+    assert Image.open(ui / "default8.png").size == (256, 256)
+
+    # Unchanged fonts are not regenerated, a new character size is.
+    Fonts("test", 16).generate_font()
+    assert len(saves) == 1
+    Fonts("test", 32).generate_font()
+    assert len(saves) == 2
+    assert Image.open(ui / "default8.png").size == (512, 512)
+
+
+def test_font_glyph_pages(tmp_path, monkeypatch):
+    ui = _project(tmp_path, monkeypatch)
+
+    fonts = Fonts("test", 16).generate_glyph_pages([0x00, 0xE1], jobs=2)
+    assert fonts._glyph_pages == ["glyph_00.png", "glyph_E1.png"]
+    assert Image.open(ui / "glyph_00.png").size == (256, 256)
+    # The first page holds ASCII, "A" is drawn in the cell of U+0041.
+    cell = Image.open(ui / "glyph_00.png").crop((16, 64, 32, 80))
+    assert cell.getbbox() is not None
+
+    modified = os.path.getmtime(ui / "glyph_E1.png")
+    Fonts("test", 16).generate_glyph_pages([0xE1])
+    assert os.path.getmtime(ui / "glyph_E1.png") == modified
@@ -0,0 +1,74 @@
+import os
+from unittest.mock import MagicMock
+
+import anvil.lib.config
+import pytest
+from anvil.lib.incremental import AnvilBuildManifest
+from anvil.lib.lib import AnvilIO
+
+
+@pytest.fixture(autouse=True)
+def mock_config(monkeypatch):
+    config = MagicMock()
+    config._MINIFY = False
+    config.COMPANY = "StarkTMA"
+    monkeypatch.setattr(anvil.lib.config, "CONFIG", config)
+    return config
+
+
+def _build(pack: str, files: dict[str, dict]):
+    AnvilBuildManifest.begin([pack])
+    for name, content in files.items():
+        AnvilIO.file(name, content, pack, "w")
+    return AnvilBuildManifest.finalize()
+
+
+def test_unchanged_files_are_not_rewritten(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pack = "BP"
+
+    assert _build(pack, {"a.json": {"value": 1}, "b.json": {"value": 2}}) == (2, 0, 0)
+    assert os.path.isfile(AnvilBuildManifest.manifest_path())
+
+    stat_a = os.stat(os.path.join(pack, "a.json"))
+    assert _build(pack, {"a.json": {"value": 1}, "b.json": {"value": 3}}) == (1, 1, 0)
+    assert os.stat(os.path.join(pack, "a.json")).st_mtime_ns == stat_a.st_mtime_ns
+
+    with open(os.path.join(pack, "b.json"), encoding="utf-8") as file:
+        assert '"value": 3' in file.read()
+
+
+def test_orphaned_outputs_are_removed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pack = "RP"
+
+    AnvilBuildManifest.begin([pack])
+    AnvilIO.file("kept.json", {"value": 1}, pack, "w")
+    AnvilIO.file("gone.json", {"value": 1}, os.path.join(pack, "entity"), "w")
+    AnvilBuildManifest.finalize()
+
+    assert _build(pack, {"kept.json": {"value": 1}}) == (0, 1, 1)
+    assert os.path.isfile(os.path.join(pack, "kept.json"))
+    assert not os.path.exists(os.path.join(pack, "entity"))
+
+
+def test_externally_modified_files_are_rewritten(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pack = "BP"
+
+    _build(pack, {"a.json": {"value": 1}})
+    with open(os.path.join(pack, "a.json"), "w", encoding="utf-8") as file:
+        file.write("{}")
+
+    assert _build(pack, {"a.json": {"value": 1}}) == (1, 0, 0)
+
+
+def test_untracked_paths_are_always_written(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    AnvilBuildManifest.begin(["BP"])
+    AnvilIO.file("outside.json", {"value": 1}, "other", "w")
+
+    assert not AnvilBuildManifest.tracks(os.path.join("other", "outside.json"))
+    assert AnvilBuildManifest.finalize() == (0, 0, 0)
+    assert os.path.isfile(tmp_path / "other" / "outside.json")
@@ -1,5 +1,9 @@
 import pytest
-from anvil.api.vanilla.factories.minecraft_items import SulfurSpike, MusicDiscBounce
+from anvil.api.vanilla.factories.minecraft_items import (
+    SulfurSpike,
+    MusicDiscBounce,
+    Potion,
+)
 from anvil.api.vanilla.items import MinecraftItemTags
 from anvil.api.items.components import ItemUseModifiers
 
@@ -24,3 +28,19 @@ def test_use_modifiers_start_using():
     # Verify start_using parameter in ItemUseModifiers
     mod = ItemUseModifiers(use_duration=2.0, start_using="always")
     assert mod._component["start_using"] == "always"
+
+
+def test_vanilla_item_descriptors_are_interned():
+    assert SulfurSpike() is SulfurSpike()
+    assert Potion("awkward") is Potion("awkward")
+    assert Potion("awkward") is not Potion("thick")
+    assert str(Potion("awkward")) == "minecraft:potion_type:awkward"
+    assert len({SulfurSpike(), SulfurSpike(), Potion()}) == 2
+
+    # Setting data on a shared descriptor returns a copy.
+    thick = Potion().set_identifier_data("thick")
+    assert str(thick) == "minecraft:potion:thick"
+    assert str(Potion()) == "minecraft:potion"
+    with pytest.raises(AttributeError):
+        Potion()._data = "thick"
+    assert str(Potion()) == "minecraft:potion"
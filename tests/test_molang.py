@@ -1281,3 +1281,107 @@ def test_arrow_operator_with_molang():
         arrow_operator(Molang("context.other"), Molang("q.is_alive"))
         == "(context.other) -> (q.is_alive)"
     )
+
+
+def test_molang_optimizer_folds_and_minifies():
+    from anvil.api.logic.molang_ast import optimize
+
+    assert optimize("(1 + 2) * 3") == "9"
+    assert optimize("((query.is_baby && variable.x) || (q.a > 1))") == (
+        "q.is_baby&&v.x||q.a>1"
+    )
+    assert optimize("math.clamp(query.x, 0, 1) * (4 / 2)") == "math.clamp(q.x,0,1)*2"
+    assert optimize("(1 + q.a) * 2") == "(1+q.a)*2"
+    assert optimize("(2 > 1) ? v.a : v.b") == "v.a"
+    # Mixing ?? and ?: without parentheses is ambiguous, left as is.
+    assert optimize("a ?? b ? c : d") == "a ?? b ? c : d"
+    assert optimize("q.x +") == "q.x +"
+    # Molang has no exponent notation, small and large constants keep their value.
+    assert optimize("v.a * 0.00000000000000000001") == "v.a*0.00000000000000000001"
+    assert optimize("v.a * (0.0000001 / 4)") == "v.a*0.000000025"
+    assert optimize("v.a * 100000000000000000000") == "v.a*100000000000000000000"
+
+
+def test_molang_optimizer_is_opt_in(monkeypatch):
+    from anvil.api.logic.molang_ast import MolangOptimizer
+    from anvil.lib.lib import AnvilIO
+
+    content = {"a": Molang("(query.x + 1)"), "b": "(query.x + 1)"}
+    monkeypatch.setattr(MolangOptimizer, "_enabled", False)
+    assert AnvilIO._dump_json_like(content, minify=True) == (
+        b'{"a":"(query.x + 1)","b":"(query.x + 1)"}'
+    )
+
+    monkeypatch.setattr(MolangOptimizer, "_enabled", True)
+    assert AnvilIO._dump_json_like(content, minify=True) == (
+        b'{"a":"q.x+1","b":"(query.x + 1)"}'
+    )
+
+
+def test_molang_evaluator_runs_builder_expressions():
+    from anvil.api.logic.molang_eval import MolangContext, evaluate
+
+    context = MolangContext(
+        queries={"health": 12, "is_baby": 1, "list": [1, 2, 3]},
+        variables={"other": MolangContext(queries={"health": 3})},
+    )
+    assert evaluate(Math.clamp(Query.Health(), 0, 5), context) == 5
+    assert evaluate(Query.IsBaby() & (Query.Health() > 10), context) == 1
+    assert evaluate("q.health > 20 ? 1 : (v.missing ?? 7)", context) == 7
+    assert evaluate("v.other -> q.health", context) == 3
+    assert evaluate("math.cos(180) + math.lerp(0, 10, 0.5)", context) == 4
+    assert (
+        evaluate(
+            "t.a = 0; loop(10, {t.a = t.a + 1; (t.a >= 4) ? break;}); return t.a;",
+            context,
+        )
+        == 4
+    )
+    assert (
+        evaluate(
+            "v.sum = 0; for_each(t.e, q.list, {v.sum = v.sum + t.e;}); return v.sum;",
+            context,
+        )
+        == 6
+    )
+    # Variables are kept on the context, temporary variables are not.
+    assert evaluate("v.sum + (t.a ?? 1)", context) == 7
+    assert evaluate("!false", context) == 1
+    assert evaluate("1 == true && TRUE != false", context) == 1
+    assert evaluate((Query.IsBaby() == True) & (Query.Health() == False), context) == 0
+
+
+def test_molang_evaluator_counts_cost():
+    from anvil.api.logic.molang_eval import (
+        MolangContext,
+        MolangCost,
+        benchmark,
+        cost,
+        pack_costs,
+    )
+
+    expression = "q.health * 2 + math.sin(q.anim_time * 90)"
+    result = benchmark(expression, MolangContext(queries={"health": 12}), repeat=5)
+    assert result.value == 24
+    assert result.cost == MolangCost(operations=4, queries=2)
+    assert cost(expression) == result.cost
+    # Loops with a literal count are unrolled.
+    assert cost("loop(3, {v.x = v.x + q.health;})") == MolangCost(7, 3)
+
+
+def test_molang_pack_costs(tmp_path):
+    from anvil.api.logic.molang_eval import MolangCost, pack_costs
+
+    controllers = tmp_path / "animation_controllers"
+    controllers.mkdir()
+    (controllers / "mob.json").write_text(
+        '{"animation_controllers": {"controller.animation.mob": {"states": {'
+        '"default": {"transitions": [{"walk": "q.modified_move_speed > 0.1 && !q.is_baby"}],'
+        '"on_entry": ["/say hi", "v.x = 1;"]}}}}}'
+    )
+
+    costs = pack_costs([str(tmp_path)])
+    assert [(expression, estimated) for _, expression, estimated in costs] == [
+        ("q.modified_move_speed > 0.1 && !q.is_baby", MolangCost(3, 2)),
+        ("v.x = 1;", MolangCost(1, 0)),
+    ]
@@ -0,0 +1,95 @@
+import importlib
+import subprocess
+
+from click.testing import CliRunner
+
+sounds_module = importlib.import_module("anvil.cli_commands.process_sounds")
+
+
+def _stub_encoder(calls):
+    def encode(input_file, output_file, target_lufs, sample_rate, quality):
+        calls.append(input_file.name)
+        data = input_file.read_bytes()
+        if data == b"broken":
+            raise subprocess.CalledProcessError(1, "ffmpeg", stderr=b"invalid data")
+        # Encoding an already normalized file gives the same bytes.
+        if not data.startswith(b"ogg:"):
+            data = f"ogg:{target_lufs}:".encode() + data
+        output_file.write_bytes(data)
+
+    return encode
+
+
+def _invoke(*args):
+    return CliRunner().invoke(sounds_module.process_sounds, list(args), input="y\n")
+
+
+def test_process_sounds_skips_processed_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    monkeypatch.setattr(sounds_module, "ffmpeg_encode", _stub_encoder(calls))
+
+    sounds = tmp_path / "assets" / "sounds"
+    (sounds / "mobs").mkdir(parents=True)
+    (sounds / "mobs" / "hurt.wav").write_bytes(b"wav")
+    (sounds / "step.ogg").write_bytes(b"raw")
+
+    result = _invoke("--jobs", "2")
+    assert result.exit_code == 0, result.output
+    assert sorted(calls) == ["hurt.wav", "step.ogg"]
+    assert (sounds / "mobs" / "hurt.ogg").read_bytes() == b"ogg:-18.0:wav"
+    assert (sounds / "step.ogg").read_bytes() == b"ogg:-18.0:raw"
+    assert "[2/2]" in result.output
+    assert not list(sounds.rglob("*.tmp.ogg"))
+
+    # Processed files, in place or not, are skipped until a setting changes.
+    calls.clear()
+    result = _invoke()
+    assert calls == []
+    assert "0 file(s) to process, 2 already processed" in result.output
+
+    (sounds / "mobs" / "hurt.wav").write_bytes(b"new wav")
+    result = _invoke("--dry-run")
+    assert "Would process: " in result.output
+    assert calls == []
+
+    _invoke("--target-lufs", "-16")
+    assert sorted(calls) == ["hurt.wav", "step.ogg"]
+
+
+def test_process_sounds_reports_failures(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    monkeypatch.setattr(sounds_module, "ffmpeg_encode", _stub_encoder(calls))
+
+    sounds = tmp_path / "assets" / "sounds"
+    sounds.mkdir(parents=True)
+    (sounds / "broken.wav").write_bytes(b"broken")
+    (sounds / "fine.wav").write_bytes(b"fine")
+
+    result = _invoke()
+    assert "Error broken.wav: invalid data" in result.output
+    assert "Processed 1 file(s), 1 failed." in result.output
+
+    # Only the failed file is attempted again.
+    calls.clear()
+    _invoke()
+    assert calls == ["broken.wav"]
+
+
+def test_process_sounds_prefers_wav_sources(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    monkeypatch.setattr(sounds_module, "ffmpeg_encode", _stub_encoder(calls))
+
+    sounds = tmp_path / "assets" / "sounds"
+    sounds.mkdir(parents=True)
+    (sounds / "roar.wav").write_bytes(b"wav")
+    (sounds / "roar.mp3").write_bytes(b"mp3")
+
+    result = _invoke()
+    assert result.exit_code == 0, result.output
+    assert calls == ["roar.wav"]
+    assert "Skipped: roar.mp3" in result.output
+    assert "1 file(s) to process" in result.output
+    assert (sounds / "roar.ogg").read_bytes() == b"ogg:-18.0:wav"
@@ -0,0 +1,101 @@
+import os
+from unittest.mock import MagicMock
+
+import anvil.lib.config
+import orjson
+import pytest
+from anvil.lib.lib import AnvilExportPipeline, AnvilIO
+from anvil.lib.profiler import AnvilProfiler
+
+
+@pytest.fixture(autouse=True)
+def mock_config(monkeypatch):
+    config = MagicMock()
+    config._MINIFY = True
+    config.COMPANY = "StarkTMA"
+    monkeypatch.setattr(anvil.lib.config, "CONFIG", config)
+    monkeypatch.setattr(AnvilProfiler, "_active", False)
+    return config
+
+
+class Entity:
+    pass
+
+
+class Block:
+    pass
+
+
+def _profile_build(jobs: int = 1) -> dict:
+    AnvilProfiler.begin()
+    with AnvilProfiler.stage("pack art"):
+        AnvilIO.file("art.json", {"a": 1}, "out", "w", True)
+
+    if jobs > 1:
+        AnvilExportPipeline.begin(jobs)
+
+    with AnvilProfiler.stage("export"):
+        for object in [Entity(), Entity(), Block()]:
+            AnvilExportPipeline.set_owner(object)
+            with AnvilProfiler.object(object):
+                AnvilIO.file(
+                    f"{id(object)}.json",
+                    {"type": object.__class__.__name__},
+                    "out",
+                    "w",
+                    True,
+                )
+
+    if jobs > 1:
+        AnvilExportPipeline.flush()
+
+    return AnvilProfiler.to_dict()
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_profiler_aggregates_stages_and_objects(tmp_path, monkeypatch, jobs):
+    monkeypatch.chdir(tmp_path)
+
+    report = _profile_build(jobs)
+
+    assert [stage["name"] for stage in report["stages"]] == ["pack art", "export"]
+    assert report["stages"][0]["bytes"] == len(b'{"a":1}')
+    objects = {item["type"]: item for item in report["objects"]}
+    assert objects["Entity"]["count"] == 2
+    assert objects["Entity"]["bytes"] == 2 * len(b'{"type":"Entity"}')
+    assert objects["Block"]["bytes"] == len(b'{"type":"Block"}')
+
+
+@pytest.mark.parametrize("format", ["json", "speedscope"])
+def test_profiler_saves_report(tmp_path, monkeypatch, format):
+    monkeypatch.chdir(tmp_path)
+
+    _profile_build()
+    path = AnvilProfiler.finish(format)
+
+    assert not AnvilProfiler.is_active()
+    with open(path, "rb") as file:
+        data = orjson.loads(file.read())
+
+    if format == "json":
+        assert os.path.basename(path) == "anvil_profile.json"
+        assert {item["type"] for item in data["objects"]} == {"Entity", "Block"}
+    else:
+        events = data["profiles"][0]["events"]
+        assert [event["type"] for event in events].count("O") == 5
+        assert [event["type"] for event in events].count("C") == 5
+        assert [frame["name"] for frame in data["shared"]["frames"]] == [
+            "pack art",
+            "export",
+            "Entity",
+            "Block",
+        ]
+
+
+def test_profiler_hooks_are_inert_when_inactive():
+    assert not AnvilProfiler.is_active()
+
+    with AnvilProfiler.stage("export"), AnvilProfiler.object(Entity()):
+        AnvilProfiler.add_bytes(b"data")
+
+    assert AnvilProfiler.stage("export") is AnvilProfiler.object(Block())
@@ -0,0 +1,55 @@
+from enum import StrEnum
+
+from anvil.api.logic.molang import Molang
+from anvil.lib.lib import AnvilIO
+
+
+class _Slot(StrEnum):
+    Main = "slot.weapon.mainhand"
+
+
+def test_normalize_prunes_empty_values():
+    content = {
+        "a": {},
+        "b": [],
+        "c": None,
+        "d": "None",
+        "e": "",
+        "minecraft:kept": {},
+        "list": [[], 1, {}, ()],
+        "path": "textures\\entity\\mob",
+        "enum": _Slot.Main,
+        "tuple": (1, [], "a\\b"),
+        3: 0,
+    }
+
+    assert AnvilIO._normalize_json_like(content) == {
+        "minecraft:kept": {},
+        "list": [1, {}],
+        "path": "textures/entity/mob",
+        "enum": "slot.weapon.mainhand",
+        "tuple": [1, [], "a/b"],
+        "3": 0,
+    }
+
+
+def test_normalize_does_not_copy_normalized_content():
+    content = {"a": {"b": [1, 2.5, "c", True]}, "d": ["e", {"f": 1}]}
+
+    assert AnvilIO._normalize_json_like(content) is content
+
+
+def test_normalize_emits_plain_strings_for_molang():
+    normalized = AnvilIO._normalize_json_like(
+        {"condition": Molang("q.is_baby"), "list": [Molang("q.health")]}
+    )
+
+    assert normalized == {"condition": "q.is_baby", "list": ["q.health"]}
+    assert type(normalized["condition"]) is str
+    assert type(normalized["list"][0]) is str
+
+
+def test_dump_non_string_enum_keys():
+    assert AnvilIO._dump_json_like({_Slot.Main: 1}, minify=True) == (
+        b'{"slot.weapon.mainhand":1}'
+    )
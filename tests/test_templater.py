@@ -0,0 +1,73 @@
+import os
+
+import pytest
+from anvil.lib import templater
+from anvil.lib.templater import load_file
+
+
+@pytest.fixture(autouse=True)
+def clear_template_cache():
+    templater.clear_cache()
+    yield
+    templater.clear_cache()
+
+
+def _write(path, text: str) -> str:
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_json_templates_return_fresh_objects():
+    first = load_file("server_block.jsont", {"format_version": "1.21.90"}, is_json=True)
+    first["minecraft:block"]["components"]["minecraft:test"] = {}
+
+    second = load_file(
+        "server_block.jsont", {"format_version": "1.21.90"}, is_json=True
+    )
+
+    assert second == {
+        "format_version": "1.21.90",
+        "minecraft:block": {"description": {}, "components": {}, "permutations": []},
+    }
+
+
+def test_json_slots_match_text_substitution(tmp_path):
+    path = _write(
+        tmp_path / "slots.jsont",
+        '{"version": {{ version }}, "name": "pack.{{ name }}", "{{ key }}": "{{ path|path }}"}',
+    )
+
+    assert load_file(
+        path,
+        {"version": [1, 0, 0], "name": "test", "key": "k", "path": "a\\b"},
+        is_json=True,
+    ) == {"version": [1, 0, 0], "name": "pack.test", "k": "a/b"}
+
+    # Values that are not valid in a slot fall back to plain text substitution.
+    assert load_file(path, {"version": 1, "name": 'a", "b": "c'}, is_json=True) == {
+        "version": 1,
+        "name": "pack.a",
+        "b": "c",
+        "": "",
+    }
+
+
+def test_user_templates_are_reloaded_when_edited(tmp_path):
+    path = _write(tmp_path / "user.jsont", "{{ a }}")
+    assert load_file(path, {"a": 1}) == "1"
+
+    _write(tmp_path / "user.jsont", "{{ a }}-{{ a }}")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_file(path, {"a": 1}) == "1-1"
+
+
+def test_template_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(templater, "_CACHE_SIZE", 2)
+
+    paths = [_write(tmp_path / f"{index}.jsont", str(index)) for index in range(3)]
+    for path in paths:
+        load_file(path)
+
+    assert list(templater._cache) == [os.path.normpath(path) for path in paths[1:]]
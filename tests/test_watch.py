@@ -0,0 +1,94 @@
+import os
+
+import anvil
+from anvil.lib.watch import AnvilWarmWorker, changes, snapshot, sources, warm_up
+
+
+def test_watch_snapshot_detects_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "assets" / "textures").mkdir(parents=True)
+    (tmp_path / "assets" / "node_modules").mkdir()
+    (tmp_path / "assets" / "textures" / "stone.png").write_bytes(b"png")
+    (tmp_path / "assets" / "node_modules" / "ignored.js").write_text("")
+    (tmp_path / "anvilconfig.json").write_text("{}")
+
+    before = snapshot(("assets", "scripts", "anvilconfig.json"))
+    assert sorted(before) == [
+        "anvilconfig.json",
+        os.path.join("assets", "textures", "stone.png"),
+    ]
+
+    (tmp_path / "assets" / "textures" / "stone.png").write_bytes(b"png2")
+    (tmp_path / "assets" / "textures" / "dirt.png").write_bytes(b"png")
+    os.remove(tmp_path / "anvilconfig.json")
+    assert changes(before, snapshot(("assets", "scripts", "anvilconfig.json"))) == [
+        "anvilconfig.json",
+        os.path.join("assets", "textures", "dirt.png"),
+        os.path.join("assets", "textures", "stone.png"),
+    ]
+
+
+def test_watch_sources_include_entry_point_modules(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src" / "items").mkdir(parents=True)
+    (tmp_path / "src" / "main.py").write_text("")
+    (tmp_path / "src" / "items" / "sword.py").write_text("")
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "icon.png").write_bytes(b"png")
+    (tmp_path / "main.py").write_text("")
+    # Written by the build next to an entry point at the project root.
+    (tmp_path / "package.json").write_text("{}")
+
+    assert sorted(sources(os.path.join("src", "main.py"))) == [
+        os.path.join("assets", "icon.png"),
+        os.path.join("src", "items", "sword.py"),
+        os.path.join("src", "main.py"),
+    ]
+    assert sorted(sources("main.py")) == [
+        os.path.join("assets", "icon.png"),
+        "main.py",
+        os.path.join("src", "items", "sword.py"),
+        os.path.join("src", "main.py"),
+    ]
+
+
+def test_warm_worker_runs_entry_point_once_per_build(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # The worker imports anvil from a project folder, not from the source tree.
+    source = os.path.dirname(os.path.dirname(anvil.__file__))
+    monkeypatch.setenv(
+        "PYTHONPATH",
+        os.pathsep.join(filter(None, [source, os.environ.get("PYTHONPATH")])),
+    )
+    (tmp_path / "main.py").write_text(
+        "import sys\n"
+        "with open('builds.txt', 'a') as file:\n"
+        "    file.write(' '.join(sys.argv[1:]) + '\\n')\n"
+    )
+
+    AnvilWarmWorker.start("main.py", ["--incremental"])
+    try:
+        assert AnvilWarmWorker.run() == 0
+        assert AnvilWarmWorker.run() == 0
+    finally:
+        AnvilWarmWorker.stop()
+
+    # Outside a project the warm up fails, the builds run cold. The worker warmed up
+    # after the last build exits without building.
+    assert (tmp_path / "builds.txt").read_text() == "--incremental\n--incremental\n"
+
+
+def test_warm_up_holds_back_the_configuration(tmp_path, monkeypatch, capsys):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / "warm_banner.py").write_text(
+        "from anvil.lib.config import _AnvilConfig\n"
+        "print('banner')\n"
+        "_AnvilConfig._check_new_versions('config')\n"
+    )
+    (tmp_path / "warm_prompt.py").write_text("input('Missing option: ')\n")
+    (tmp_path / "warm_exit.py").write_text("exit(1)\n")
+
+    assert warm_up(("warm_banner",)) == (True, "banner\n", ["config"])
+    assert warm_up(("warm_prompt",)) == (False, "Missing option: ", [])
+    assert warm_up(("warm_exit",)) == (False, "", [])
+    assert capsys.readouterr().out == ""